@@ -39,7 +39,7 @@ logger = logging.getLogger(__name__)
 logger.info("애플리케이션 시작")
 
 # 라우트 임포트
-from app.routes import auth, dashboard, resource
+from app.routes import auth, dashboard, resource, jobs, fleet
 from app.routes.service_advisor import service_advisor_bp
 
 # 블루프린트 등록
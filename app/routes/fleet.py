@@ -0,0 +1,210 @@
+from flask import jsonify, request
+from flask_login import login_required, current_user
+from app import app
+from app.services.fleet_manager import (
+    TASK_FAILED, authorize_accounts, get_account_owner_id, get_fleet_manager, list_organization_accounts
+)
+from app.services.job_manager import ACTIVE_STATUSES, get_job_manager, new_job_id
+from app.services.s3_storage import S3Storage
+from app.services.service_advisor.common.history_storage import AdvisorHistoryStorage
+import logging
+
+# 로깅 설정
+logger = logging.getLogger('fleet')
+logger.setLevel(logging.INFO)
+
+# 플릿 실행 작업 종류
+FLEET_JOB_KIND = 'fleet_run'
+
+def get_user_run(run_id):
+    """현재 사용자의 플릿 실행을 가져옵니다. 다른 사용자의 실행이면 None을 반환합니다."""
+    run = get_fleet_manager().store.get_run(run_id)
+    if not run or run['user_id'] != current_user.get_id():
+        return None
+    return run
+
+def get_user_run_account(run_id, account_id):
+    """현재 사용자의 플릿 실행에 속한 계정을 가져옵니다. 없으면 None을 반환합니다."""
+    run = get_user_run(run_id)
+    if not run:
+        return None
+    for account in get_fleet_manager().store.get_accounts(run_id):
+        if account['account_id'] == account_id:
+            return dict(account, owner_id=get_account_owner_id(run['user_id'], account_id))
+    return None
+
+def submit_fleet_job(run_id, expected_job_id=None, previous_finished=False):
+    """
+    실행을 새 작업 ID에 원자적으로 할당한 뒤 플릿 실행 작업을 제출합니다.
+    다른 요청이 먼저 할당했으면 제출하지 않고 None을 반환합니다.
+    """
+    store = get_fleet_manager().store
+    job_id = new_job_id()
+    if not store.claim_run(run_id, expected_job_id, job_id, previous_finished=previous_finished):
+        return None
+
+    try:
+        get_job_manager().submit(FLEET_JOB_KIND, current_user.get_id(),
+                                 {'run_id': run_id, 'previous_job_id': expected_job_id}, job_id=job_id)
+    except Exception:
+        # 제출되지 않은 작업에 할당된 채 진행 중으로 남지 않도록 실패 처리
+        store.set_run_status(run_id, TASK_FAILED, finished=True)
+        raise
+    return job_id
+
+@app.route('/fleet/runs', methods=['POST'])
+@login_required
+def fleet_create_run():
+    """
+    플릿 실행 생성
+    계정 목록은 role_arns(역할 ARN 목록) 또는 organization({'role_arn'(필수), 'member_role_name'})으로 지정합니다.
+    계정은 사용자가 등록한 역할의 계정이거나 그 계정의 조직에 속해야 합니다.
+    """
+    if not request.is_json:
+        return jsonify({'status': 'error', 'message': '잘못된 요청 형식입니다.'}), 400
+
+    request_data = request.get_json()
+    owner_role_arn = current_user.get_role_arn()
+    try:
+        organization = request_data.get('organization')
+        if organization is not None:
+            # Organizations 조회는 요청한 관리 계정 역할로만 실행 (서버 기본 자격 증명 사용 안 함)
+            if not isinstance(organization, dict) or not organization.get('role_arn'):
+                return jsonify({'status': 'error', 'message': 'organization.role_arn은 필수입니다.'}), 400
+            # 관리 계정 역할이 사용자 계정(또는 조직)에 속하면 조회한 멤버 계정도 사용자 조직의 계정
+            authorize_accounts(owner_role_arn, [organization])
+            accounts = list_organization_accounts(
+                role_arn=organization['role_arn'],
+                member_role_name=organization.get('member_role_name')
+            )
+        else:
+            accounts = [{'role_arn': role_arn} for role_arn in request_data.get('role_arns') or []]
+            authorize_accounts(owner_role_arn, accounts)
+
+        run_id = get_fleet_manager().create_run(
+            current_user.get_id(),
+            accounts,
+            services=request_data.get('services'),
+            scan_services=request_data.get('scan_services'),
+            region=app.config.get('AWS_DEFAULT_REGION', 'ap-northeast-2'),
+            regions=request_data.get('regions')
+        )
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except PermissionError as e:
+        logger.warning(f"사용자 {current_user.get_id()}의 플릿 계정 거부: {str(e)}")
+        return jsonify({'status': 'error', 'message': str(e)}), 403
+    except Exception as e:
+        logger.error(f"플릿 실행 생성 중 오류 발생: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'플릿 실행 생성 중 오류가 발생했습니다: {str(e)}'}), 500
+
+    job_id = submit_fleet_job(run_id)
+    if not job_id:
+        return jsonify({'status': 'error', 'message': '플릿 실행이 이미 진행 중입니다.', 'run_id': run_id}), 409
+    logger.info(f"사용자 {current_user.get_id()}의 플릿 실행 시작: {run_id} (작업 {job_id})")
+    return jsonify({
+        'status': 'success',
+        'run_id': run_id,
+        'job_id': job_id,
+        'status_url': f'/jobs/{job_id}',
+        'rollup_url': f'/fleet/runs/{run_id}'
+    }), 202
+
+@app.route('/fleet/runs')
+@login_required
+def fleet_list_runs():
+    """플릿 실행 목록 조회"""
+    runs = get_fleet_manager().store.list_runs(current_user.get_id(), limit=request.args.get('limit', 20, type=int))
+    return jsonify({'runs': runs})
+
+@app.route('/fleet/runs/<run_id>')
+@login_required
+def fleet_run_rollup(run_id):
+    """플릿 실행의 계정별 결과와 전체 합계 조회"""
+    if not get_user_run(run_id):
+        return jsonify({'status': 'error', 'message': '플릿 실행을 찾을 수 없습니다.'}), 404
+    rollup = get_fleet_manager().get_rollup(run_id)
+    # 계정별 수집 데이터 조회 경로 (검사 결과는 /fleet/runs/<run_id>/accounts/<account_id>/checks/<service>/<check_id>)
+    for account in rollup['accounts']:
+        account['collection_url'] = (f"/fleet/runs/{run_id}/accounts/{account['account_id']}/collection"
+                                     if account['collection_id'] else None)
+    return jsonify(rollup)
+
+@app.route('/fleet/runs/<run_id>/accounts/<account_id>/collection')
+@login_required
+def fleet_account_collection(run_id, account_id):
+    """플릿 실행 계정의 수집 메타데이터 조회 (서비스별 요약 포함)"""
+    account = get_user_run_account(run_id, account_id)
+    if not account or not account['collection_saved']:
+        return jsonify({'status': 'error', 'message': '플릿 계정의 수집 데이터를 찾을 수 없습니다.'}), 404
+
+    metadata, _ = S3Storage().get_collection_metadata(account['owner_id'], account['collection_id'])
+    if metadata is None:
+        return jsonify({'status': 'error', 'message': '플릿 계정의 수집 데이터를 찾을 수 없습니다.'}), 404
+    return jsonify({'status': 'success', 'account_id': account_id, 'collection_id': account['collection_id'],
+                    'metadata': metadata})
+
+@app.route('/fleet/runs/<run_id>/accounts/<account_id>/collection/<service_key>')
+@login_required
+def fleet_account_service_data(run_id, account_id, service_key):
+    """플릿 실행 계정의 서비스 수집 데이터 조회"""
+    account = get_user_run_account(run_id, account_id)
+    if not account or not account['collection_saved']:
+        return jsonify({'status': 'error', 'message': '플릿 계정의 수집 데이터를 찾을 수 없습니다.'}), 404
+
+    service_data = S3Storage().get_service_data(account['owner_id'], account['collection_id'], service_key)
+    if service_data is None:
+        return jsonify({'status': 'error', 'message': f'서비스 {service_key}의 데이터를 찾을 수 없습니다.'}), 404
+    return jsonify({'status': 'success', 'account_id': account_id, 'service': service_key, 'data': service_data})
+
+@app.route('/fleet/runs/<run_id>/accounts/<account_id>/checks/<service_name>/<check_id>')
+@login_required
+def fleet_account_check_result(run_id, account_id, service_name, check_id):
+    """플릿 실행 계정의 최신 검사 결과 조회"""
+    account = get_user_run_account(run_id, account_id)
+    if not account:
+        return jsonify({'status': 'error', 'message': '플릿 계정을 찾을 수 없습니다.'}), 404
+
+    result = AdvisorHistoryStorage().get_latest_check_result(
+        username=account['owner_id'],
+        service_name=service_name,
+        check_id=check_id
+    )
+    if not result or 'result' not in result:
+        return jsonify({'status': 'error', 'message': '검사 기록을 찾을 수 없습니다.'}), 404
+    return jsonify({'status': 'success', 'account_id': account_id,
+                    'timestamp': (result.get('metadata') or {}).get('timestamp'), 'result': result['result']})
+
+@app.route('/fleet/runs/<run_id>/resume', methods=['POST'])
+@login_required
+def fleet_resume_run(run_id):
+    """중단되거나 일부 실패한 플릿 실행을 이어서 실행 (성공한 작업은 다시 실행하지 않음)"""
+    run = get_user_run(run_id)
+    if not run:
+        return jsonify({'status': 'error', 'message': '플릿 실행을 찾을 수 없습니다.'}), 404
+
+    job_status = get_job_manager().get_status(run['job_id']) if run['job_id'] else None
+    if job_status and job_status['status'] in ACTIVE_STATUSES:
+        return jsonify({'status': 'error', 'message': '플릿 실행이 이미 진행 중입니다.', 'job_id': run['job_id']}), 409
+
+    # 이전 작업이 끝났으면 워커 종료 등으로 실행 상태가 진행 중으로 남아 있어도 이어서 실행
+    job_id = submit_fleet_job(run_id, expected_job_id=run['job_id'], previous_finished=job_status is not None)
+    if not job_id:
+        return jsonify({'status': 'error', 'message': '플릿 실행이 이미 진행 중입니다.', 'run_id': run_id}), 409
+    logger.info(f"사용자 {current_user.get_id()}의 플릿 실행 재개: {run_id} (작업 {job_id})")
+    return jsonify({'status': 'success', 'run_id': run_id, 'job_id': job_id, 'status_url': f'/jobs/{job_id}'}), 202
+
+def run_fleet_job(job):
+    """플릿 실행 작업 처리 함수 (중단된 실행도 같은 함수로 남은 작업만 이어서 실행)"""
+    # 이전 작업이 아직 실행 중이면 그 작업이 실행 중인 작업 단위는 다시 실행하지 않음
+    previous_job_id = job.params.get('previous_job_id')
+    previous = get_job_manager().get_status(previous_job_id) if previous_job_id else None
+    return get_fleet_manager().run(
+        job.params['run_id'],
+        cancel_event=job.cancel_event,
+        on_progress=job.update_progress,
+        reset_running=not (previous and previous['status'] in ACTIVE_STATUSES)
+    )
+
+# 플릿 실행 작업 처리 함수 등록
+get_job_manager().register(FLEET_JOB_KIND, run_fleet_job)
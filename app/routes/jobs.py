@@ -0,0 +1,59 @@
+from flask import jsonify
+from flask_login import login_required, current_user
+from app import app
+from app.services.job_manager import ACTIVE_STATUSES, get_job_manager
+import logging
+
+# 로깅 설정
+logger = logging.getLogger('jobs')
+logger.setLevel(logging.INFO)
+
+def get_user_job_status(job_id):
+    """현재 사용자의 작업 상태를 가져옵니다. 다른 사용자의 작업이면 None을 반환합니다."""
+    job_status = get_job_manager().get_status(job_id)
+    if not job_status or job_status['user_id'] != current_user.get_id():
+        return None
+    return job_status
+
+@app.route('/jobs/<job_id>')
+@login_required
+def job_status(job_id):
+    """작업 상태 조회"""
+    job_status = get_user_job_status(job_id)
+    if not job_status:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job_status)
+
+@app.route('/jobs/<job_id>/result')
+@login_required
+def job_result(job_id):
+    """작업 결과 조회"""
+    job_status = get_user_job_status(job_id)
+    if not job_status:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+
+    # 아직 끝나지 않은 작업은 상태만 반환
+    if job_status['status'] in ACTIVE_STATUSES:
+        return jsonify({'job_id': job_id, 'status': job_status['status'], 'result': None}), 202
+
+    return jsonify({
+        'job_id': job_id,
+        'status': job_status['status'],
+        'error': job_status['error'],
+        'result': get_job_manager().get_result(job_id)
+    })
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+@login_required
+def job_cancel(job_id):
+    """작업 취소"""
+    job_status = get_user_job_status(job_id)
+    if not job_status:
+        return jsonify({'status': 'error', 'message': '작업을 찾을 수 없습니다.'}), 404
+
+    if job_status['status'] not in ACTIVE_STATUSES:
+        return jsonify({'status': 'error', 'message': '이미 종료된 작업입니다.', 'job_status': job_status['status']}), 409
+
+    status = get_job_manager().cancel(job_id)
+    logger.info(f"사용자 {current_user.get_id()}의 작업 취소 요청: {job_id}")
+    return jsonify({'status': 'success', 'message': '작업 취소를 요청했습니다.', 'job_status': status})
@@ -3,31 +3,42 @@ from flask_login import login_required, current_user
 from app import app
 from app.services.aws_services import collect_service_data, get_available_services, get_service_data, list_collections
 from app.services.s3_storage import S3Storage
-from datetime import datetime
+from app.services.job_manager import ACTIVE_STATUSES, STATUS_CANCELLED, get_job_manager
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
 import json
 import logging
+import threading
+import time
 import uuid
 
 # 로깅 설정
 logger = logging.getLogger('resource')
 logger.setLevel(logging.INFO)
 
-# 수집 상태를 세션별로 추적하기 위한 딕셔너리
-collection_statuses = {}
+# 데이터 수집 작업 종류
+COLLECTION_JOB_KIND = 'resource_collection'
 
-# 기본 수집 상태 템플릿
-def get_default_status():
-    return {
-        'is_collecting': False,
-        'current_service': None,
-        'completed_services': [],
-        'total_services': 0,
-        'error': None,
-        'all_services_data': {},
-        'collection_id': None,
-        'selected_services': [],
-        'last_collection_time': 0
-    }
+# 서비스 아이콘 매핑
+SERVICE_ICONS = {
+    'ec2': 'fa-server',
+    's3': 'fa-database',
+    'rds': 'fa-database',
+    'lambda': 'fa-code',
+    'cloudwatch': 'fa-chart-line',
+    'iam': 'fa-users',
+    'dynamodb': 'fa-table',
+    'ecs': 'fa-docker',
+    'eks': 'fa-cubes',
+    'sns': 'fa-bell',
+    'sqs': 'fa-envelope',
+    'apigateway': 'fa-network-wired',
+    'elasticache': 'fa-memory',
+    'route53': 'fa-globe'
+}
+
+# 서비스 정보 화면에 섹션 템플릿(templates/resource/sections)이 있는 서비스 (표시 순서)
+SERVICE_SECTIONS = ['ec2', 's3', 'rds', 'lambda', 'iam']
 
 @app.route('/resource/collections')
 @login_required
@@ -41,30 +52,12 @@ def resource_collections_view():
     # 사용 가능한 서비스 목록 가져오기
     services = get_available_services()
     
-    # 서비스 아이콘 매핑
-    service_icons = {
-        'ec2': 'fa-server',
-        's3': 'fa-database',
-        'rds': 'fa-database',
-        'lambda': 'fa-code',
-        'cloudwatch': 'fa-chart-line',
-        'iam': 'fa-users',
-        'dynamodb': 'fa-table',
-        'ecs': 'fa-docker',
-        'eks': 'fa-cubes',
-        'sns': 'fa-bell',
-        'sqs': 'fa-envelope',
-        'apigateway': 'fa-network-wired',
-        'elasticache': 'fa-memory',
-        'route53': 'fa-globe'
-    }
-    
     # 서비스 정보 구성
     services_with_icons = {}
     for service_key, service_name in services.items():
         services_with_icons[service_key] = {
             'name': service_name,
-            'icon': service_icons.get(service_key, 'fa-cloud')
+            'icon': SERVICE_ICONS.get(service_key, 'fa-cloud')
         }
     
     return render_template('resource/collections.html',
@@ -74,22 +67,39 @@ def resource_collections_view():
 @app.route('/resource/service/<collection_id>')
 @login_required
 def resource_service_view(collection_id):
-    """특정 수집 데이터의 서비스 정보 보기"""
+    """특정 수집 데이터의 서비스 정보 보기 (활성 서비스만 불러오고 나머지는 펼칠 때 JSON으로 불러옴)"""
     user_id = current_user.get_id()
     
     try:
-        # S3에서 해당 수집 데이터 로드
+        # 메타데이터로 활성 서비스 결정 (?service=, 없으면 표시 순서상 첫 서비스)
         s3_storage = S3Storage()
-        collection_data = s3_storage.get_collection_data(user_id, collection_id)
+        metadata, _ = s3_storage.get_collection_metadata(user_id, collection_id)
+        if metadata is None:
+            flash('요청한 수집 데이터를 찾을 수 없습니다.')
+            return redirect(url_for('resource_collections_view'))
+        
+        selected_services = metadata.get('selected_services', [])
+        section_services = [service_key for service_key in SERVICE_SECTIONS if service_key in selected_services]
+        active_service = request.args.get('service')
+        if active_service not in section_services:
+            active_service = section_services[0] if section_services else None
+        
+        # 활성 서비스 데이터만 로드
+        collection_data = s3_storage.get_collection_data(user_id, collection_id,
+                                                         services=[active_service] if active_service else [])
         
         if collection_data and 'metadata' in collection_data and 'services_data' in collection_data:
             # 서비스 데이터 표시
             return render_template('resource/service_view.html',
                                   services=get_available_services(),
+                                  service_icons=SERVICE_ICONS,
+                                  service_sections=SERVICE_SECTIONS,
+                                  service_summaries=metadata.get('services', {}),
                                   all_services_data=collection_data['services_data'],
-                                  selected_services=collection_data['metadata'].get('selected_services', []),
+                                  lazy_services=[service_key for service_key in section_services if service_key != active_service],
+                                  selected_services=selected_services,
                                   collection_id=collection_id,
-                                  collection_timestamp=collection_data['metadata'].get('timestamp'))
+                                  collection_timestamp=metadata.get('timestamp'))
         else:
             flash('요청한 수집 데이터를 찾을 수 없습니다.')
             return redirect(url_for('resource_collections_view'))
@@ -98,6 +108,28 @@ def resource_service_view(collection_id):
         flash(f'서비스 정보 로드 중 오류가 발생했습니다: {str(e)}')
         return redirect(url_for('resource_collections_view'))
 
+@app.route('/resource/service/<collection_id>/<service_key>/data')
+@login_required
+def resource_service_data(collection_id, service_key):
+    """수집 데이터의 서비스 하나를 JSON으로 반환 (서비스 정보 화면의 지연 로딩용, 섹션 HTML 포함)"""
+    user_id = current_user.get_id()
+    
+    try:
+        service_data = S3Storage().get_service_data(user_id, collection_id, service_key)
+        if service_data is None:
+            return jsonify({'status': 'error', 'message': f'서비스 {service_key}의 데이터를 찾을 수 없습니다.'}), 404
+        
+        html = ''
+        if service_key in SERVICE_SECTIONS:
+            html = render_template(f'resource/sections/{service_key}.html',
+                                   all_services_data={service_key: service_data},
+                                   selected_services=[service_key])
+        
+        return jsonify({'status': 'success', 'service': service_key, 'data': service_data, 'html': html})
+    except Exception as e:
+        logger.error(f"서비스 데이터 로드 중 오류 발생: {str(e)}")
+        return jsonify({'status': 'error', 'message': f'서비스 데이터 로드 중 오류가 발생했습니다: {str(e)}'}), 500
+
 @app.route('/resource/start_collection', methods=['POST'])
 @login_required
 def resource_start_collection():
@@ -108,26 +140,15 @@ def resource_start_collection():
         
         region = app.config.get('AWS_DEFAULT_REGION', 'ap-northeast-2')
         user_id = current_user.get_id()
-        session_id = get_session_id()
-        
-        # 세션의 수집 상태 가져오기 또는 생성
-        if session_id not in collection_statuses:
-            collection_statuses[session_id] = get_default_status()
-        
-        status = collection_statuses[session_id]
+        job_manager = get_job_manager()
         
-        # 이미 수집 중인 경우 중복 요청 방지
-        if status['is_collecting']:
+        # 이미 수집 중인 경우 중복 요청 방지 (다른 워커 프로세스에서 시작한 수집 포함)
+        active_job = job_manager.find_active(COLLECTION_JOB_KIND, user_id)
+        if active_job:
             logger.warning(f"이미 데이터 수집이 진행 중입니다. 사용자: {user_id}")
+            session['resource_job_id'] = active_job['job_id']
             return jsonify({'status': 'error', 'message': '이미 데이터 수집이 진행 중입니다. 완료될 때까지 기다려주세요.'}), 409
         
-        # 항상 새로운 수집을 시작할 수 있도록 상태 완전히 초기화
-        status['is_collecting'] = False
-        status['last_collection_time'] = datetime.now().timestamp()
-        status['all_services_data'] = {}
-        status['completed_services'] = []
-        status['current_service'] = None
-        
         # 요청 데이터 확인
         if not request.is_json:
             return jsonify({'status': 'error', 'message': '잘못된 요청 형식입니다.'}), 400
@@ -139,29 +160,23 @@ def resource_start_collection():
         if not selected_services:
             return jsonify({'status': 'error', 'message': '최소한 하나 이상의 서비스를 선택해야 합니다.'}), 400
         
-        # 수집 상태를 먼저 설정하여 중복 요청 방지
-        status['is_collecting'] = True
-        status['selected_services'] = selected_services
-        status['total_services'] = len(selected_services)
-        status['collection_id'] = str(uuid.uuid4())[:8]
+        # 수집 리전 (요청에 없으면 설정값, 둘 다 없으면 기본 리전만)
+        regions = request_data.get('regions') or Config.COLLECTION_REGIONS or None
+        if regions is not None and (not isinstance(regions, list) or not all(isinstance(r, str) for r in regions)):
+            return jsonify({'status': 'error', 'message': '리전 목록 형식이 올바르지 않습니다.'}), 400
         
-        # 데이터 수집 시작 (백그라운드 스레드에서)
-        import threading
-        thread = threading.Thread(
-            target=collect_data,
-            kwargs={
-                'region': region,
-                'user_id': user_id,
-                'session_id': session_id,
-                'selected_services': selected_services,
-                'auth_type': auth_type,
-                'auth_params': auth_params
-            }
-        )
-        thread.daemon = True
-        thread.start()
+        # 데이터 수집 작업 제출 (작업 스레드에서 실행)
+        job_id = job_manager.submit(COLLECTION_JOB_KIND, user_id, {
+            'region': region,
+            'regions': regions,
+            'selected_services': selected_services,
+            'auth_type': auth_type,
+            'role_arn': auth_params.get('role_arn') if auth_params else None,
+            'collection_id': str(uuid.uuid4())[:8]
+        })
+        session['resource_job_id'] = job_id
         
-        return jsonify({'status': 'success', 'message': '데이터 수집이 시작되었습니다.'}), 200
+        return jsonify({'status': 'success', 'message': '데이터 수집이 시작되었습니다.', 'job_id': job_id}), 200
     except Exception as e:
         logger.error(f"요청 처리 중 오류 발생: {str(e)}")
         return jsonify({'status': 'error', 'message': f'요청 처리 중 오류가 발생했습니다: {str(e)}'}), 500
@@ -169,10 +184,10 @@ def resource_start_collection():
 @app.route('/resource/collection_status')
 @login_required
 def resource_collection_status():
-    session_id = get_session_id()
+    job_status = get_collection_job_status()
     
-    # 세션의 수집 상태가 없으면 기본 상태 반환
-    if session_id not in collection_statuses:
+    # 수집 작업이 없으면 기본 상태 반환
+    if not job_status:
         return jsonify({
             'is_collecting': False,
             'current_service': None,
@@ -180,29 +195,52 @@ def resource_collection_status():
             'total_services': 0,
             'error': None,
             'progress': 0,
-            'selected_services': []
+            'selected_services': [],
+            'running_services': [],
+            'failed_services': []
         })
     
-    # 세션의 수집 상태 가져오기
-    status = collection_statuses[session_id]
+    progress_data = job_status['progress']
+    selected_services = progress_data.get('selected_services', [])
+    completed_services = progress_data.get('completed_services', [])
+    failed_services = progress_data.get('failed_services', [])
+    total_services = len(selected_services)
     
-    # 진행률 계산
+    # 진행률 계산 (실패한 서비스도 끝난 것으로 계산)
     progress = 0
-    if status['total_services'] > 0:
-        unique_completed = len(set(status['completed_services']))
-        progress = min(int(unique_completed / status['total_services'] * 100), 100)
+    if total_services > 0:
+        progress = min(int(len(set(completed_services) | set(failed_services)) / total_services * 100), 100)
+    
+    error = job_status['error']
+    if job_status['status'] == STATUS_CANCELLED:
+        error = '데이터 수집이 취소되었습니다.'
     
     # 선택된 서비스 목록도 함께 반환
     return jsonify({
-        'is_collecting': status['is_collecting'],
-        'current_service': status['current_service'],
-        'completed_services': status['completed_services'],
-        'total_services': status['total_services'],
-        'error': status['error'],
+        'is_collecting': job_status['status'] in ACTIVE_STATUSES,
+        'current_service': progress_data.get('current_service'),
+        'completed_services': completed_services,
+        'total_services': total_services,
+        'error': error,
         'progress': progress,
-        'selected_services': status.get('selected_services', [])
+        'selected_services': selected_services,
+        'running_services': progress_data.get('running_services', []),
+        'failed_services': failed_services,
+        'job_id': job_status['job_id'],
+        'job_status': job_status['status']
     })
 
+@app.route('/resource/cancel_collection', methods=['POST'])
+@login_required
+def resource_cancel_collection():
+    """진행 중인 데이터 수집 취소"""
+    job_status = get_collection_job_status()
+    if not job_status or job_status['status'] not in ACTIVE_STATUSES:
+        return jsonify({'status': 'error', 'message': '진행 중인 데이터 수집이 없습니다.'}), 404
+    
+    status = get_job_manager().cancel(job_status['job_id'])
+    return jsonify({'status': 'success', 'message': '데이터 수집 취소를 요청했습니다.', 'job_status': status})
+
 @app.route('/resource/collections/<collection_id>', methods=['DELETE'])
 @login_required
 def resource_delete_collection(collection_id):
@@ -230,118 +268,150 @@ def resource_delete_collection(collection_id):
             'message': f'수집 데이터 삭제 중 오류가 발생했습니다: {str(e)}'
         }), 500
 
-def get_session_id():
-    """현재 세션의 고유 ID를 생성하거나 가져옵니다."""
-    if 'resource_session_id' not in session:
-        session['resource_session_id'] = str(uuid.uuid4())
-    return session['resource_session_id']
+def get_collection_job_status():
+    """현재 사용자의 마지막 데이터 수집 작업 상태를 가져옵니다."""
+    user_id = current_user.get_id()
+    job_manager = get_job_manager()
+    
+    # 세션에 작업 ID가 없으면 (다른 세션에서 시작한 경우) 진행 중인 작업 조회
+    job_id = session.get('resource_job_id')
+    job_status = job_manager.get_status(job_id) if job_id else None
+    if not job_status or job_status['user_id'] != user_id:
+        job_status = job_manager.find_active(COLLECTION_JOB_KIND, user_id)
+    return job_status
 
-def collect_data(region, user_id, session_id, selected_services=None, auth_type='access_key', auth_params=None):
-    """데이터 수집 함수"""
-    # 세션의 수집 상태 가져오기
-    if session_id not in collection_statuses:
-        collection_statuses[session_id] = get_default_status()
+def collect_data(job):
+    """
+    데이터 수집 작업 처리 함수
+    선택된 서비스를 동시에 수집하고(최대 Config.COLLECTION_MAX_CONCURRENT_SERVICES개), 서비스마다 끝나는 즉시 저장과
+    진행 상태를 기록합니다. 한 서비스의 오류는 다른 서비스에 영향을 주지 않으며, 마지막에 수집 메타데이터를 기록합니다.
+    """
+    params = job.params
+    user_id = job.user_id
+    region = params.get('region')
+    selected_services = params.get('selected_services') or []
+    collection_id = params.get('collection_id') or str(uuid.uuid4())[:8]
     
-    status = collection_statuses[session_id]
+    s3_storage = S3Storage()
+    service_summaries = {}  # 저장된 서비스별 카탈로그 요약
+    service_timings = {}    # 서비스별 수집/저장 시간(초)
+    running_services = []
+    completed_services = []
+    failed_services = []
+    progress_lock = threading.Lock()  # 진행 상태 목록과 기록 순서 보호
     
-    # 선택된 서비스가 없으면 오류 로그 기록
-    if not selected_services:
-        logger.error("선택된 서비스가 없습니다. 데이터 수집을 중단합니다.")
-        status['is_collecting'] = False
-        status['error'] = "선택된 서비스가 없습니다."
-        return
-    
-    logger.info(f"데이터 수집 시작: 사용자={user_id}, 서비스={selected_services}")
+    def publish_progress():
+        """진행 상태 전체를 기록합니다. (progress_lock을 잡은 상태에서 호출)"""
+        job.update_progress(
+            current_service=running_services[0] if running_services else None,
+            running_services=list(running_services),
+            completed_services=list(completed_services),
+            failed_services=list(failed_services)
+        )
     
-    try:
-        # 선택된 서비스만 수집
-        for service_key in selected_services:
-            # 현재 수집 중인 서비스 업데이트
-            status['current_service'] = service_key
-            
-            logger.info(f"서비스 데이터 수집 시작: {service_key}")
-            
-            # 간소화된 데이터 수집 호출
+    def collect_one(service_key):
+        """서비스 하나를 수집하고 바로 저장합니다. 오류는 이 서비스의 실패로만 기록합니다."""
+        # 시작 전에 취소 요청 확인 (이미 실행 중인 서비스는 끝까지 수집)
+        if job.is_cancelled():
+            return
+        
+        with progress_lock:
+            running_services.append(service_key)
+            publish_progress()
+        
+        logger.info(f"서비스 데이터 수집 시작: {service_key}")
+        started_at = time.time()
+        summary, error = None, None
+        try:
             result = collect_service_data(
                 username=user_id,
                 service_name=service_key,
                 region=region,
-                auth_type=auth_type,
-                role_arn=auth_params.get('role_arn') if auth_params else None
-            )
-            
-            # 결과 처리
-            if result and result.get('success'):
-                status['all_services_data'][service_key] = result.get('result', {})
-                status['completed_services'].append(service_key)
-                logger.info(f"서비스 데이터 수집 완료: {service_key}")
-            else:
-                logger.warning(f"서비스 데이터 수집 실패: {service_key} - {result.get('error', '알 수 없는 오류')}")
-        
-        # 수집 완료
-        status['current_service'] = None
-        status['is_collecting'] = False
-        logger.info(f"모든 서비스 데이터 수집 완료: {len(status['completed_services'])}개 서비스")
-        
-        # S3에 수집 데이터 저장
-        try:
-            # 수집된 데이터 확인
-            data_to_save = status['all_services_data']
-            
-            # 데이터가 비어있는지 확인
-            if not data_to_save:
-                logger.warning(f"저장할 데이터가 없습니다!")
-                return
-            
-            # 데이터가 비어있으면 빈 객체라도 저장
-            for service_key in selected_services:
-                if service_key not in data_to_save:
-                    logger.warning(f"서비스 {service_key}의 데이터가 없어 빈 객체로 저장합니다.")
-                    data_to_save[service_key] = {"status": "collected", "data": {}}
-            
-            # S3에 저장
-            s3_storage = S3Storage()
-            collection_id = status['collection_id']
-            save_result = s3_storage.save_collection_data(
-                user_id=user_id,
+                auth_type=params.get('auth_type'),
+                role_arn=params.get('role_arn'),
                 collection_id=collection_id,
-                data=data_to_save,
-                selected_services=selected_services
+                regions=params.get('regions')
             )
-            
-            if save_result:
-                logger.info(f"수집 데이터를 S3에 성공적으로 저장했습니다.")
-                
-                # 수집 직후 데이터를 명시적으로 캐시에 저장
-                try:
-                    # 메타데이터 캐시에 저장
-                    metadata = {
-                        'user_id': user_id,
-                        'collection_id': collection_id,
-                        'timestamp': datetime.now().isoformat(),
-                        'selected_services': selected_services
-                    }
-                    s3_storage._set_in_cache('metadata', user_id, metadata, collection_id)
-                    
-                    # 서비스 데이터 캐시에 저장
-                    s3_storage._set_in_cache('data', user_id, data_to_save, collection_id, 'all')
-                    
-                    # 컬렉션 목록 캐시 무효화 (새로운 컬렉션이 추가되었으므로)
-                    s3_storage._invalidate_cache('collections', user_id)
-                    
-                    logger.info(f"수집 데이터를 캐시에 직접 저장 완료")
-                except Exception as cache_err:
-                    logger.warning(f"캐시 저장 중 오류 (무시): {str(cache_err)}")
+            if result and result.get('success'):
+                summary = s3_storage.save_service_data(user_id, collection_id, service_key, result.get('result', {}))
+                if summary is None:
+                    error = '수집 데이터 저장 실패'
             else:
-                logger.error(f"S3에 데이터 저장 실패")
+                error = (result or {}).get('error', '알 수 없는 오류')
         except Exception as e:
-            logger.error(f"S3에 데이터 저장 중 오류 발생: {str(e)}")
+            error = str(e)
+        elapsed = round(time.time() - started_at, 2)
         
-    except Exception as e:
-        error_msg = str(e)
-        status['error'] = error_msg
-        status['is_collecting'] = False
-        logger.error(f"데이터 수집 중 오류 발생: {error_msg}")
+        with progress_lock:
+            running_services.remove(service_key)
+            service_timings[service_key] = elapsed
+            if error is None:
+                service_summaries[service_key] = summary
+                completed_services.append(service_key)
+                logger.info(f"서비스 데이터 수집 완료: {service_key} ({elapsed}초)")
+            else:
+                failed_services.append(service_key)
+                logger.warning(f"서비스 데이터 수집 실패: {service_key} ({elapsed}초) - {error}")
+            publish_progress()
+    
+    job.update_progress(
+        current_service=None,
+        running_services=[],
+        completed_services=completed_services,
+        failed_services=failed_services,
+        selected_services=selected_services,
+        collection_id=collection_id
+    )
+    
+    # 선택된 서비스가 없으면 오류
+    if not selected_services:
+        logger.error("선택된 서비스가 없습니다. 데이터 수집을 중단합니다.")
+        raise ValueError("선택된 서비스가 없습니다.")
+    
+    max_workers = max(1, min(Config.COLLECTION_MAX_CONCURRENT_SERVICES, len(selected_services)))
+    logger.info(f"데이터 수집 시작: 사용자={user_id}, 수집 ID={collection_id}, 서비스={selected_services}, 리전={params.get('regions') or region}, 동시 수집={max_workers}")
+    
+    # 선택된 서비스 동시 수집
+    started_at = time.time()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='resource-collect') as executor:
+        list(executor.map(collect_one, selected_services))
+    elapsed = round(time.time() - started_at, 2)
+    
+    if job.is_cancelled():
+        logger.info(f"데이터 수집 취소: 사용자={user_id}, 완료된 서비스={completed_services}")
+        job.update_progress(current_service=None, running_services=[])
+        # 이미 저장한 서비스 데이터 정리
+        if service_summaries:
+            s3_storage.delete_collection(user_id, collection_id)
+        return {'collection_id': None, 'completed_services': completed_services, 'failed_services': failed_services,
+                'service_timings': service_timings}
+    
+    # 수집 완료
+    slowest = max(service_timings.values()) if service_timings else 0
+    logger.info(f"모든 서비스 데이터 수집 완료: {len(completed_services)}개 서비스, 전체 {elapsed}초 (가장 느린 서비스 {slowest}초)")
+    
+    # 데이터가 비어있는지 확인
+    if not service_summaries:
+        logger.warning(f"저장할 데이터가 없습니다!")
+        return {'collection_id': None, 'completed_services': completed_services, 'failed_services': failed_services,
+                'service_timings': service_timings}
+    
+    # 수집 메타데이터와 카탈로그 기록 (통합 데이터는 서비스별 파일로 구성)
+    saved = s3_storage.finalize_collection(user_id, collection_id, service_summaries, selected_services)
+    if saved:
+        logger.info(f"수집 데이터를 S3에 성공적으로 저장했습니다.")
+    else:
+        logger.error(f"S3에 데이터 저장 실패")
+    
+    return {
+        'collection_id': collection_id if saved else None,
+        'completed_services': completed_services,
+        'failed_services': failed_services,
+        'service_timings': service_timings
+    }
+
+# 데이터 수집 작업 처리 함수 등록
+get_job_manager().register(COLLECTION_JOB_KIND, collect_data)
 
 def get_user_collections(user_id):
     """사용자의 수집 데이터 목록을 안전하게 가져옵니다."""
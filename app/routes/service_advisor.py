@@ -6,10 +6,20 @@ import io
 from datetime import datetime
 from app.services.service_advisor.advisor_factory import ServiceAdvisorFactory
 from app.services.service_advisor.common.history_storage import AdvisorHistoryStorage
+from app.services.service_advisor.common.scan_snapshot import scan_scope
+from app.services.service_advisor.common.scan_executor import get_scan_executor
+from app.services.job_manager import get_job_manager
 from functools import wraps
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 service_advisor_bp = Blueprint('service_advisor', __name__)
 
+# 서비스 전체 스캔 작업 종류
+SCAN_JOB_KIND = 'advisor_scan'
+
 def service_advisor_access_required(f):
     """
     서비스 어드바이저 접근 권한을 확인하는 데코레이터
@@ -143,7 +153,7 @@ def run_service_check(service_name):
 @service_advisor_bp.route('/<service_name>/scan', methods=['POST'])
 @service_advisor_access_required
 def ec2_scan(service_name):
-    """서비스 전체 스캔을 실행합니다."""
+    """서비스 전체 스캔 작업을 제출합니다. 스캔은 작업 스레드에서 실행되고 상태는 /jobs/<job_id>로 조회합니다."""
     current_app.logger.info(f"사용자 {current_user.username}이 {service_name} 서비스 전체 스캔을 실행합니다.")
     
     advisor_factory = ServiceAdvisorFactory()
@@ -153,38 +163,79 @@ def ec2_scan(service_name):
         return jsonify({'error': f'서비스 {service_name}에 대한 어드바이저를 찾을 수 없습니다.'}), 404
     
     try:
-        # AWS 자격증명 정보 설정
-        role_arn = current_user.get_role_arn()
-        
-        # 모든 검사 실행
-        checks = advisor.get_available_checks()
-        results = {}
-        
-        for check in checks:
-            check_id = check.get('id')
-            result = advisor.run_check(check_id, role_arn=role_arn)
-            results[check_id] = result
-            
-            # 검사 결과 저장
-            history_storage = AdvisorHistoryStorage()
-            history_storage.save_check_result(
-                username=current_user.username,
-                service_name=service_name,
-                check_id=check_id,
-                result=result
-            )
-        
-        current_app.logger.info(f"사용자 {current_user.username}의 {service_name} 서비스 전체 스캔 완료")
+        job_id = get_job_manager().submit(SCAN_JOB_KIND, current_user.get_id(), {
+            'service_name': service_name,
+            'username': current_user.username,
+            'role_arn': current_user.get_role_arn()
+        })
         
         return jsonify({
             'success': True,
-            'message': f'{service_name} 서비스 스캔이 완료되었습니다.',
+            'message': f'{service_name} 서비스 스캔을 시작했습니다.',
+            'job_id': job_id,
+            'status_url': f'/jobs/{job_id}',
+            'result_url': f'/jobs/{job_id}/result',
             'redirect_url': f'/advisor/{service_name}'
-        })
+        }), 202
     except Exception as e:
-        current_app.logger.error(f"사용자 {current_user.username}의 {service_name} 스캔 중 오류 발생: {str(e)}")
+        current_app.logger.error(f"사용자 {current_user.username}의 {service_name} 스캔 제출 중 오류 발생: {str(e)}")
         return jsonify({'error': f'스캔 중 오류가 발생했습니다: {str(e)}'}), 500
 
+def run_scan_job(job):
+    """서비스 전체 스캔 작업 처리 함수"""
+    service_name = job.params['service_name']
+    username = job.params['username']
+    role_arn = job.params.get('role_arn')
+    
+    advisor = ServiceAdvisorFactory().get_advisor(service_name)
+    if not advisor:
+        raise ValueError(f'서비스 {service_name}에 대한 어드바이저를 찾을 수 없습니다.')
+    
+    # 모든 검사 동시 실행 (스캔 동안 같은 describe_* 조회 결과를 검사 간에 공유)
+    check_ids = [check.get('id') for check in advisor.get_available_checks()]
+    history_storage = AdvisorHistoryStorage()
+    completed_checks = []
+    progress_lock = threading.Lock()
+    job.update_progress(total_checks=len(check_ids), completed_checks=[])
+    
+    def persist(check_id, result):
+        # 검사 결과 저장 (작업 스레드에서 실행되므로 current_user 대신 username 사용)
+        history_storage.save_check_result(
+            username=username,
+            service_name=service_name,
+            check_id=check_id,
+            result=result
+        )
+        with progress_lock:
+            completed_checks.append(check_id)
+            job.update_progress(completed_checks=list(completed_checks))
+    
+    with scan_scope(role_arn):
+        results = get_scan_executor().run_scan(
+            advisor,
+            check_ids,
+            role_arn=role_arn,
+            persist=persist,
+            cancel_event=job.cancel_event
+        )
+    
+    timed_out = [check_id for check_id, result in results.items() if result.get('timed_out')]
+    if timed_out:
+        logger.warning(f"사용자 {username}의 {service_name} 스캔 중 제한 시간 초과 검사: {timed_out}")
+    
+    logger.info(f"사용자 {username}의 {service_name} 서비스 전체 스캔 완료")
+    
+    return {
+        'service_name': service_name,
+        'redirect_url': f'/advisor/{service_name}',
+        'checks': {check_id: result.get('status') for check_id, result in results.items()},
+        'timed_out_checks': timed_out,
+        'cancelled_checks': [check_id for check_id, result in results.items() if result.get('cancelled')]
+    }
+
+# 스캔 작업 처리 함수 등록
+get_job_manager().register(SCAN_JOB_KIND, run_scan_job)
+
 @service_advisor_bp.route('/services')
 @service_advisor_access_required
 def get_available_services():
@@ -200,20 +251,25 @@ def service_advisor_history():
     """서비스 어드바이저 검사 기록을 표시합니다."""
     service_name = request.args.get('service_name')
     limit = int(request.args.get('limit', 100))  # 기본값을 100으로 증가
+    cursor = request.args.get('cursor')
     
     current_app.logger.info(f"사용자 {current_user.username}이 서비스 어드바이저 기록을 조회합니다.")
     
-    # 기록 조회
+    # 기록 조회 (매니페스트 기반 페이지 조회)
     history_storage = AdvisorHistoryStorage()
-    history_list = history_storage.get_check_history(
+    history_page = history_storage.get_check_history_page(
         username=current_user.username,
         service_name=service_name,
-        limit=limit
+        limit=limit,
+        cursor=cursor
     )
     
     return render_template(
         'service_advisor/common/history.html',
-        history_list=history_list,
+        history_list=history_page['items'],
+        next_cursor=history_page['next_cursor'],
+        is_first_page=not cursor,
+        limit=limit,
         service_name=service_name,
         base_url='/advisor'
     )
@@ -388,24 +444,22 @@ def export_multiple_pdf():
         history_storage = AdvisorHistoryStorage()
         advisor_factory = ServiceAdvisorFactory()
         
+        # 최신 결과 색인으로 결과가 있는 항목만 골라 본문을 동시에 조회
+        items = [(item.get('service_name'), item.get('check_id')) for item in check_items]
+        latest_results = history_storage.get_latest_check_results(current_user.username, items)
+        
         check_results = []
+        service_checks = {}
         
-        for item in check_items:
-            service_name = item.get('service_name')
-            check_id = item.get('check_id')
-            
-            # 최신 검사 결과 조회
-            result = history_storage.get_latest_check_result(
-                username=current_user.username,
-                service_name=service_name,
-                check_id=check_id
-            )
+        for service_name, check_id in items:
+            result = latest_results.get((service_name, check_id))
             
             if result and 'result' in result and 'metadata' in result:
-                # 검사 정보 가져오기
-                advisor = advisor_factory.get_advisor(service_name)
-                checks = advisor.get_available_checks()
-                check_info = next((check for check in checks if check.get('id') == check_id), {})
+                # 검사 정보 가져오기 (서비스별로 한 번만 조회)
+                if service_name not in service_checks:
+                    advisor = advisor_factory.get_advisor(service_name)
+                    service_checks[service_name] = advisor.get_available_checks()
+                check_info = next((check for check in service_checks[service_name] if check.get('id') == check_id), {})
                 
                 check_results.append({
                     'result': result.get('result', {}),
@@ -468,26 +522,21 @@ def check_results_status():
     
     current_app.logger.info(f"사용자 {current_user.username}이 {len(check_items)}개의 검사 항목 상태를 확인합니다.")
     
+    # 최신 결과 색인 한 번 읽기로 모든 항목의 결과 유무 확인
     history_storage = AdvisorHistoryStorage()
+    items = [(item.get('service_name'), item.get('check_id')) for item in check_items]
+    latest_statuses = history_storage.get_latest_status_batch(current_user.username, items)
     results_status = []
     
-    for item in check_items:
-        service_name = item.get('service_name')
-        check_id = item.get('check_id')
-        
-        # 최신 검사 결과 조회
-        result = history_storage.get_latest_check_result(
-            username=current_user.username,
-            service_name=service_name,
-            check_id=check_id
-        )
+    for service_name, check_id in items:
+        status = latest_statuses.get((service_name, check_id))
         
-        if result and 'result' in result and 'metadata' in result:
+        if status:
             results_status.append({
                 'service_name': service_name,
                 'check_id': check_id,
                 'has_result': True,
-                'timestamp': result.get('metadata', {}).get('timestamp')
+                'timestamp': status.get('timestamp')
             })
         else:
             results_status.append({
@@ -0,0 +1,156 @@
+"""
+프로세스 전역 boto3 클라이언트 풀
+
+boto3 클라이언트는 생성할 때마다 서비스 모델 JSON을 로드하고 새로운 HTTP 연결 풀을 만듭니다.
+이 모듈은 (자격 증명 식별자, 서비스, 리전) 단위로 클라이언트를 한 번만 생성하여
+프로세스 전체에서 재사용하고, 오랫동안 사용되지 않은 클라이언트는 정리합니다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClientPool:
+    """
+    스레드 안전한 boto3 클라이언트 풀
+    """
+
+    def __init__(self, max_pool_connections: int = None, idle_timeout: int = None):
+        """
+        클라이언트 풀 초기화
+
+        Args:
+            max_pool_connections: 클라이언트별 최대 HTTP 연결 수 (기본값: Config에서 가져옴)
+            idle_timeout: 미사용 클라이언트 제거 기준 시간(초) (기본값: Config에서 가져옴)
+        """
+        self.max_pool_connections = max_pool_connections or Config.AWS_CLIENT_MAX_POOL_CONNECTIONS
+        self.idle_timeout = idle_timeout or Config.AWS_CLIENT_IDLE_TIMEOUT
+        self.client_config = BotoConfig(max_pool_connections=self.max_pool_connections)
+
+        self._clients: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+        self._default_session = None
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get_client(self, service_name: str, region_name: str = None,
+                   session: Optional[boto3.Session] = None, identity: str = None) -> Any:
+        """
+        풀에서 클라이언트를 가져오거나 새로 생성합니다.
+
+        Args:
+            service_name: AWS 서비스 이름 (ec2, s3, iam 등)
+            region_name: AWS 리전 이름 (없으면 세션의 리전 사용)
+            session: 클라이언트를 생성할 세션 (없으면 기본 자격 증명 세션 사용)
+            identity: 자격 증명 식별자 (없으면 세션의 액세스 키로 계산)
+
+        Returns:
+            boto3 클라이언트 객체
+        """
+        session = session or self.get_default_session()
+        region = region_name or session.region_name or Config.AWS_REGION
+        key = (identity or self.get_identity(session), service_name, region)
+
+        with self._lock:
+            self._sweep_idle_clients()
+
+            entry = self._clients.get(key)
+            if entry:
+                entry['last_used'] = time.time()
+                self._stats['hits'] += 1
+                return entry['client']
+
+            # 같은 세션에서 동시에 클라이언트를 생성하면 안전하지 않으므로 잠금 안에서 생성
+            client = session.client(service_name, region_name=region, config=self.client_config)
+            self._clients[key] = {'client': client, 'last_used': time.time()}
+            self._stats['misses'] += 1
+            logger.debug(f"클라이언트 풀에 {service_name} 클라이언트 추가 (region: {region})")
+            return client
+
+    def invalidate(self, identity: str) -> None:
+        """
+        특정 자격 증명 식별자로 생성된 클라이언트를 모두 제거합니다.
+
+        Args:
+            identity: 자격 증명 식별자
+        """
+        with self._lock:
+            for key in [k for k in self._clients if k[0] == identity]:
+                del self._clients[key]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        풀 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 히트/미스/제거 횟수와 현재 클라이언트 수
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._clients))
+
+    def get_default_session(self) -> boto3.Session:
+        """.env 파일의 자격 증명을 사용하는 기본 세션을 반환합니다."""
+        with self._lock:
+            if self._default_session is None:
+                if Config.AWS_ACCESS_KEY and Config.AWS_SECRET_KEY:
+                    self._default_session = boto3.Session(
+                        aws_access_key_id=Config.AWS_ACCESS_KEY,
+                        aws_secret_access_key=Config.AWS_SECRET_KEY,
+                        region_name=Config.AWS_REGION
+                    )
+                else:
+                    self._default_session = boto3.Session(region_name=Config.AWS_REGION)
+            return self._default_session
+
+    def get_identity(self, session: boto3.Session) -> str:
+        """세션 자격 증명의 액세스 키로 식별자를 계산합니다. 브로커가 발급한 세션은 역할 ARN을 사용합니다."""
+        identity = getattr(session, 'credential_identity', None)
+        if identity:
+            return identity
+        credentials = session.get_credentials()
+        if credentials is None:
+            return 'anonymous'
+        return hashlib.sha256(credentials.access_key.encode('utf-8')).hexdigest()[:16]
+
+    def _sweep_idle_clients(self) -> None:
+        """idle_timeout 동안 사용되지 않은 클라이언트를 제거합니다. (잠금 안에서 호출)"""
+        now = time.time()
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+
+        expired = [key for key, entry in self._clients.items()
+                   if now - entry['last_used'] > self.idle_timeout]
+        for key in expired:
+            del self._clients[key]
+        if expired:
+            self._stats['evictions'] += len(expired)
+            logger.debug(f"미사용 클라이언트 {len(expired)}개 제거")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> AWSClientPool:
+    """
+    프로세스 전역 클라이언트 풀을 반환합니다.
+
+    Returns:
+        AWSClientPool: 클라이언트 풀 객체
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = AWSClientPool()
+    return _pool
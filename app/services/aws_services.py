@@ -4,14 +4,16 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 from app.services.resource.collector_factory import CollectorFactory
-from app.services.resource.common.data_storage import ResourceDataStorage
+from app.services.resource.common.data_storage import get_resource_data_storage
+from app.services.credential_broker import get_credential_broker
 
 logger = logging.getLogger(__name__)
 
 def collect_service_data(username: str, service_name: str, region: str, 
-                        auth_type: str = 'access_key', role_arn: str = None) -> Dict[str, Any]:
+                        auth_type: str = 'access_key', role_arn: str = None,
+                        collection_id: str = None, regions: Optional[List[str]] = None) -> Dict[str, Any]:
     """
-    AWS 서비스 데이터 수집
+    AWS 서비스 데이터 수집 (저장은 호출한 수집 작업이 수집 ID 하나로 서비스마다 한 번 수행)
     
     Args:
         username: 사용자 ID
@@ -19,16 +21,18 @@ def collect_service_data(username: str, service_name: str, region: str,
         region: AWS 리전
         auth_type: 인증 유형 ('access_key' 또는 'role_arn')
         role_arn: AWS 역할 ARN (선택 사항)
+        collection_id: 수집 ID (선택 사항, 없으면 생성)
+        regions: 수집할 리전 목록 (선택 사항, 있으면 리전마다 병렬 수집 후 합침)
     
     Returns:
         Dict[str, Any]: 수집 결과
     """
     try:
-        # 수집 ID 생성
-        collection_id = str(uuid.uuid4())
+        # 수집 ID (수집 작업에서 전달받은 ID를 로그에도 사용)
+        collection_id = collection_id or str(uuid.uuid4())
         log_prefix = f"[{collection_id}] "
         
-        logger.info(f"{log_prefix}데이터 수집 시작: 사용자={username}, 서비스={service_name}, 리전={region}")
+        logger.info(f"{log_prefix}데이터 수집 시작: 사용자={username}, 서비스={service_name}, 리전={regions or region}")
         
         # 간소화된 세션 생성
         import boto3
@@ -41,30 +45,14 @@ def collect_service_data(username: str, service_name: str, region: str,
             region_name=region or Config.AWS_REGION
         )
         
-        # 역할 ARN이 제공된 경우 해당 역할로 임시 자격 증명 생성
+        # 역할 ARN이 제공된 경우 캐시된 역할 자격 증명 세션 사용
         if auth_type == 'role_arn' and role_arn:
-            sts_client = session.client('sts')
-            response = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=f"CollectionSession-{collection_id}"
-            )
-            
-            credentials = response['Credentials']
-            session = boto3.Session(
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken'],
-                region_name=region or Config.AWS_REGION
-            )
+            session = get_credential_broker().get_session(role_arn, region_name=region or Config.AWS_REGION)
         
         # 수집기 생성 및 데이터 수집
         try:
-            collector = CollectorFactory.get_collector(service_name, region=region, session=session)
-            result = collector.collect(collection_id=collection_id)
-            
-            # 수집 결과 저장
-            storage = ResourceDataStorage(region=region)
-            storage.save_resource_data(username, service_name, collection_id, result)
+            collector = CollectorFactory.get_collector(service_name, region=region, session=session, regions=regions)
+            result = collector.collect_regions(collection_id=collection_id)
             
             # 수집 결과 반환
             return {
@@ -124,7 +112,7 @@ def get_service_data(username: str, service_name: str, collection_id: str) -> Op
         Optional[Dict[str, Any]]: 저장된 서비스 데이터 또는 None
     """
     try:
-        storage = ResourceDataStorage()
+        storage = get_resource_data_storage()
         return storage.get_resource_data(username, service_name, collection_id)
     except Exception as e:
         logger.error(f"서비스 데이터 조회 중 오류 발생: {str(e)}")
@@ -143,7 +131,7 @@ def list_collections(username: str, service_name: Optional[str] = None, limit: i
         List[Dict[str, Any]]: 수집 목록
     """
     try:
-        storage = ResourceDataStorage()
+        storage = get_resource_data_storage()
         return storage.list_collections(username, service_name, limit)
     except Exception as e:
         logger.error(f"수집 목록 조회 중 오류 발생: {str(e)}")
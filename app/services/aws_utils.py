@@ -1,5 +1,5 @@
-import boto3
 from typing import Dict, Optional, Tuple
+from app.services.credential_broker import get_credential_broker
 
 def get_credentials_from_access_key(access_key: str, secret_key: str) -> Dict:
     """
@@ -13,28 +13,22 @@ def get_credentials_from_access_key(access_key: str, secret_key: str) -> Dict:
 def get_credentials_from_role_arn(role_arn: str, session_name: str = "AssumeRoleSession") -> Dict:
     """
     ARN을 사용하여 STS를 통해 역할을 수임하고 임시 자격 증명을 반환합니다.
+    같은 역할의 자격 증명은 자격 증명 브로커에 캐시되어 재사용됩니다.
     
     Args:
         role_arn: 수임할 역할의 ARN
-        session_name: 세션 이름 (기본값: "AssumeRoleSession")
+        session_name: 세션 이름 (브로커가 공통 세션 이름을 사용하므로 무시됨)
         
     Returns:
         임시 자격 증명을 포함하는 딕셔너리
     """
     try:
-        # 기본 자격 증명 공급자 체인 사용
-        sts_client = boto3.client('sts')
-            
-        assumed_role = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName=session_name
-        )
-        
-        credentials = assumed_role['Credentials']
+        # 캐시된 역할 자격 증명 사용 (만료가 가까우면 브로커가 갱신)
+        credentials = get_credential_broker().get_credentials(role_arn)
         return {
-            'aws_access_key_id': credentials['AccessKeyId'],
-            'aws_secret_access_key': credentials['SecretAccessKey'],
-            'aws_session_token': credentials['SessionToken']
+            'aws_access_key_id': credentials['access_key'],
+            'aws_secret_access_key': credentials['secret_key'],
+            'aws_session_token': credentials['token']
         }
     except Exception as e:
         raise Exception(f"역할 수임 중 오류 발생: {str(e)}")
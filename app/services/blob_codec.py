@@ -0,0 +1,208 @@
+"""
+S3 JSON 객체 직렬화/압축
+
+수집 데이터와 검사 기록은 저장 전에 "테스트" 직렬화를 한 번 더 하고, datetime 변환을 위해 데이터를 다시 순회하며,
+반복이 많은 JSON을 압축 없이 저장합니다.
+이 모듈은 datetime을 처리하는 인코더로 한 번만 직렬화하고, 인코딩된 조각을 바로 압축 스트림에 써서
+Content-Encoding과 함께 저장합니다. 읽을 때는 Content-Encoding(또는 압축 매직 바이트)을 보고 자동으로 해제하므로
+압축 없이 저장된 기존 객체도 그대로 읽을 수 있습니다.
+"""
+import gzip
+import io
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from config import Config
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 사항 (설치되지 않으면 gzip 사용)
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 이보다 작은 본문은 압축하지 않음 (메타데이터처럼 작은 객체는 압축 이득이 없음)
+COMPRESS_MIN_BYTES = 1024
+
+# 압축 매직 바이트 (Content-Encoding 없이 저장된 압축 객체 판별용)
+_GZIP_MAGIC = b'\x1f\x8b'
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _default(obj: Any) -> Any:
+    """JSON 기본 인코더가 처리하지 못하는 값을 변환합니다."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# 한글을 그대로 저장하는 datetime 인식 인코더 (스레드 간 공유 가능)
+_ENCODER = json.JSONEncoder(default=_default, ensure_ascii=False)
+
+
+def dumps(data: Any) -> str:
+    """
+    datetime을 ISO 문자열로 바꾸며 JSON 문자열로 직렬화합니다.
+
+    Args:
+        data: 직렬화할 데이터
+
+    Returns:
+        str: JSON 문자열
+    """
+    return _ENCODER.encode(data)
+
+
+def iterencode(data: Any) -> Iterable[str]:
+    """
+    datetime을 ISO 문자열로 바꾸며 JSON 조각을 순서대로 생성합니다.
+
+    Args:
+        data: 직렬화할 데이터
+
+    Returns:
+        Iterable[str]: JSON 문자열 조각
+    """
+    return _ENCODER.iterencode(data)
+
+
+def encode_chunks(chunks: Iterable[str], compression: str = None) -> Tuple[bytes, Dict[str, str], int]:
+    """
+    JSON 조각을 UTF-8로 인코딩하면서 압축 스트림에 씁니다.
+
+    Args:
+        chunks: JSON 문자열 조각
+        compression: 압축 방식 ('gzip', 'zstd', 'none') (기본값: Config에서 가져옴)
+
+    Returns:
+        Tuple[bytes, Dict[str, str], int]: (저장할 본문, put_object 추가 파라미터, 압축 전 크기)
+    """
+    compression = _resolve_compression(compression or Config.STORAGE_COMPRESSION)
+    raw = io.BytesIO()
+    compressed = io.BytesIO()
+    writer = None
+    raw_size = 0
+
+    for chunk in chunks:
+        encoded = chunk.encode('utf-8')
+        raw_size += len(encoded)
+        if writer is None:
+            raw.write(encoded)
+            # 최소 크기를 넘으면 그때부터 압축 스트림으로 전환
+            if compression != 'none' and raw_size >= COMPRESS_MIN_BYTES:
+                writer = _open_writer(compression, compressed)
+                writer.write(raw.getvalue())
+        else:
+            writer.write(encoded)
+
+    if writer is None:
+        return raw.getvalue(), {}, raw_size
+
+    writer.close()
+    return compressed.getvalue(), {'ContentEncoding': compression}, raw_size
+
+
+def encode_json(data: Any, compression: str = None) -> Tuple[bytes, Dict[str, str], int]:
+    """
+    데이터를 한 번에 직렬화하고 압축합니다.
+
+    Args:
+        data: 직렬화할 데이터
+        compression: 압축 방식 (기본값: Config에서 가져옴)
+
+    Returns:
+        Tuple[bytes, Dict[str, str], int]: (저장할 본문, put_object 추가 파라미터, 압축 전 크기)
+    """
+    return encode_chunks(iterencode(data), compression)
+
+
+def put_json(s3_client, bucket_name: str, key: str, data: Any, content_type: str = 'application/json; charset=utf-8',
+             compression: str = None) -> int:
+    """
+    데이터를 직렬화/압축하여 S3에 저장합니다.
+
+    Args:
+        s3_client: S3 클라이언트
+        bucket_name: 버킷 이름
+        key: S3 객체 키
+        data: 저장할 데이터
+        content_type: 콘텐츠 유형
+        compression: 압축 방식 (기본값: Config에서 가져옴)
+
+    Returns:
+        int: 압축 전 크기(바이트)
+    """
+    body, params, raw_size = encode_json(data, compression)
+    s3_client.put_object(Bucket=bucket_name, Key=key, Body=body, ContentType=content_type, **params)
+    return raw_size
+
+
+def read_body(response: Dict[str, Any]) -> bytes:
+    """
+    get_object 응답 본문을 읽고 압축되어 있으면 해제합니다.
+
+    Args:
+        response: get_object 응답
+
+    Returns:
+        bytes: 압축 해제된 본문
+    """
+    return decode_body(response['Body'].read(), response.get('ContentEncoding'))
+
+
+def decode_body(body, content_encoding: Optional[str] = None) -> bytes:
+    """
+    저장된 본문이 압축되어 있으면 해제합니다.
+
+    Args:
+        body: 저장된 본문 (bytes 또는 mmap 등 버퍼)
+        content_encoding: 객체의 Content-Encoding
+
+    Returns:
+        bytes: 압축 해제된 본문
+    """
+    encoding = (content_encoding or '').lower()
+
+    if encoding == 'gzip' or (not encoding and body[:2] == _GZIP_MAGIC):
+        return gzip.decompress(body)
+    if encoding == 'zstd' or (not encoding and body[:4] == _ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 객체를 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    return bytes(body)
+
+
+def load_json(response: Dict[str, Any]) -> Any:
+    """
+    get_object 응답 본문을 JSON으로 읽습니다. 압축 여부와 관계없이 읽을 수 있습니다.
+
+    Args:
+        response: get_object 응답
+
+    Returns:
+        Any: JSON 데이터
+    """
+    return json.loads(read_body(response).decode('utf-8'))
+
+
+def _resolve_compression(compression: str) -> str:
+    """압축 방식을 확인합니다. zstd를 사용할 수 없으면 gzip을 사용합니다."""
+    compression = compression.lower()
+    if compression == 'zstd' and zstandard is None:
+        logger.warning("zstandard 패키지가 설치되지 않아 gzip으로 압축합니다.")
+        return 'gzip'
+    if compression not in ('gzip', 'zstd', 'none'):
+        logger.warning(f"알 수 없는 압축 방식 {compression}, gzip으로 압축합니다.")
+        return 'gzip'
+    return compression
+
+
+def _open_writer(compression: str, target: io.BytesIO):
+    """압축 스트림 작성기를 엽니다."""
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=3).stream_writer(target, closefd=False)
+    return gzip.GzipFile(fileobj=target, mode='wb', compresslevel=6, mtime=0)
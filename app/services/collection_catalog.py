@@ -0,0 +1,133 @@
+"""
+사용자별 수집 카탈로그
+
+수집 목록 화면은 수집마다 metadata.json을 GET(리소스 저장소는 서비스 목록 조회용 LIST까지)하므로
+사용자가 보관한 수집이 늘어날수록 느려집니다.
+이 모듈은 사용자별 카탈로그 문서 하나에 수집 ID, 시각, 서비스 목록, 서비스별 크기와 요약 개수를 보관하고
+수집 저장/삭제 시 갱신하여 목록을 GET 한 번으로 제공합니다.
+"""
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from app.services.s3_conditional_write import conditional_rewrite, supports_conditional_writes
+
+logger = logging.getLogger(__name__)
+
+# 카탈로그 문서 형식 버전
+CATALOG_VERSION = 1
+
+
+class CollectionCatalog:
+    """
+    S3 객체 하나에 저장되는 사용자별 수집 카탈로그
+    """
+
+    def __init__(self, s3_client, bucket_name: str, catalog_key: str):
+        """
+        수집 카탈로그 초기화
+
+        Args:
+            s3_client: S3 클라이언트
+            bucket_name: 버킷 이름
+            catalog_key: 카탈로그 문서 키
+        """
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.catalog_key = catalog_key
+        self._conditional_writes = supports_conditional_writes(s3_client)
+
+    def list(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        카탈로그의 수집 목록을 최신순으로 반환합니다.
+
+        Returns:
+            Optional[List[Dict[str, Any]]]: 수집 목록 (카탈로그가 없으면 None)
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.catalog_key)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise
+
+        catalog = json.loads(response['Body'].read().decode('utf-8'))
+        collections = list(catalog.get('collections', {}).values())
+        collections.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        return collections
+
+    def update(self, collection_id: str, fields: Dict[str, Any] = None,
+               services: Dict[str, Dict[str, Any]] = None) -> None:
+        """
+        수집 항목을 추가하거나 갱신합니다. 서비스 정보는 기존 항목에 병합됩니다.
+
+        Args:
+            collection_id: 수집 ID
+            fields: 덮어쓸 항목 필드 (예: timestamp)
+            services: {서비스 이름: summarize_service 결과}
+        """
+        def apply(catalog: Dict[str, Any]) -> None:
+            entry = catalog['collections'].setdefault(collection_id, {'collection_id': collection_id, 'services': {}})
+            entry.update(fields or {})
+            entry.setdefault('services', {}).update(services or {})
+            # 서비스 정보가 있으면 서비스 목록을 함께 유지
+            if entry['services']:
+                entry['selected_services'] = sorted(set(entry.get('selected_services', [])) | set(entry['services']))
+
+        self._rewrite(apply)
+
+    def remove(self, collection_id: str) -> None:
+        """
+        수집 항목을 삭제합니다.
+
+        Args:
+            collection_id: 수집 ID
+        """
+        self._rewrite(lambda catalog: catalog['collections'].pop(collection_id, None))
+
+    def replace(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        카탈로그 전체를 주어진 항목으로 바꿉니다. (재구성용)
+
+        Args:
+            entries: 수집 항목 목록
+        """
+        def apply(catalog: Dict[str, Any]) -> None:
+            catalog['collections'] = {entry['collection_id']: entry for entry in entries}
+
+        self._rewrite(apply)
+
+    def _rewrite(self, apply) -> None:
+        """카탈로그를 읽어 apply로 수정한 뒤 조건부 쓰기로 저장합니다."""
+        def build(body: Optional[bytes]) -> bytes:
+            catalog = json.loads(body.decode('utf-8')) if body else {}
+            catalog.setdefault('collections', {})
+            catalog['version'] = CATALOG_VERSION
+            apply(catalog)
+            return json.dumps(catalog, ensure_ascii=False).encode('utf-8')
+
+        conditional_rewrite(self.s3_client, self.bucket_name, self.catalog_key, build,
+                            'application/json; charset=utf-8', conditional=self._conditional_writes)
+
+
+def summarize_service(service_data: Any, size: int) -> Dict[str, Any]:
+    """
+    서비스 수집 데이터의 카탈로그 요약을 만듭니다.
+
+    Args:
+        service_data: 서비스 수집 데이터
+        size: 직렬화된 데이터 크기(바이트)
+
+    Returns:
+        Dict[str, Any]: {'size': 크기, 'counts': 요약의 숫자 항목, 'error': 수집 오류 메시지 (있을 때)}
+    """
+    summary = {'size': size, 'counts': {}}
+    if isinstance(service_data, dict):
+        for name, value in (service_data.get('summary') or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                summary['counts'][name] = value
+        if service_data.get('error'):
+            summary['error'] = str(service_data['error'])
+    return summary
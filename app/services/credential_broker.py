@@ -0,0 +1,219 @@
+"""
+STS 역할 수임 자격 증명 브로커
+
+어드바이저 요청이나 리소스 수집마다 sts.assume_role을 호출하면 매번 STS 왕복이 추가되고,
+여러 사용자가 동시에 검사를 실행할 때 STS 스로틀링이 발생합니다.
+이 모듈은 Role ARN 단위로 임시 자격 증명을 캐시하고, 만료 전에 백그라운드에서 갱신하며,
+같은 역할에 대한 동시 갱신 요청을 하나로 합칩니다.
+"""
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+
+from config import Config
+from app.services.aws_client_pool import get_client_pool
+
+logger = logging.getLogger(__name__)
+
+ROLE_SESSION_NAME = 'ServiceAdvisorSession'
+
+# 남은 유효 시간이 이보다 짧으면 요청 스레드에서 즉시 갱신 (botocore 필수 갱신 기준과 동일)
+MANDATORY_REFRESH_SECONDS = 600
+
+
+class CredentialBroker:
+    """
+    Role ARN 단위로 임시 자격 증명을 캐시하고 갱신하는 스레드 안전한 브로커
+    """
+
+    def __init__(self, duration: int = None, refresh_window: int = None):
+        """
+        자격 증명 브로커 초기화
+
+        Args:
+            duration: 역할 수임 자격 증명 유효 시간(초) (기본값: Config에서 가져옴)
+            refresh_window: 만료 몇 초 전부터 백그라운드 갱신을 시작할지 (기본값: Config에서 가져옴)
+        """
+        self.duration = duration or Config.STS_ASSUME_ROLE_DURATION
+        self.refresh_window = refresh_window or Config.STS_REFRESH_WINDOW
+
+        self._credentials: Dict[str, Dict[str, Any]] = {}
+        self._sessions: Dict[tuple, boto3.Session] = {}
+        self._role_locks: Dict[str, threading.Lock] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'background_refreshes': 0, 'errors': 0}
+
+    def get_credentials(self, role_arn: str) -> Dict[str, str]:
+        """
+        역할의 임시 자격 증명을 반환합니다. 캐시에 유효한 자격 증명이 있으면 STS를 호출하지 않습니다.
+
+        Args:
+            role_arn: 수임할 역할의 ARN
+
+        Returns:
+            Dict[str, str]: access_key, secret_key, token, expiry_time(ISO 8601)을 포함하는 딕셔너리
+        """
+        metadata, remaining = self._get_cached(role_arn)
+
+        if remaining > MANDATORY_REFRESH_SECONDS:
+            self._increment('hits')
+            if remaining <= self.refresh_window:
+                self._schedule_background_refresh(role_arn)
+            return metadata
+
+        self._increment('misses')
+        with self._get_role_lock(role_arn):
+            # 잠금을 기다리는 동안 다른 스레드가 이미 갱신했을 수 있음
+            metadata, remaining = self._get_cached(role_arn)
+            if remaining > MANDATORY_REFRESH_SECONDS:
+                return metadata
+            return self._assume_role(role_arn)
+
+    def get_session(self, role_arn: str, region_name: str = None) -> boto3.Session:
+        """
+        만료 전에 자동으로 갱신되는 자격 증명을 사용하는 세션을 반환합니다.
+
+        Args:
+            role_arn: 수임할 역할의 ARN
+            region_name: 세션 기본 리전 (기본값: Config에서 가져옴)
+
+        Returns:
+            boto3.Session: 역할 자격 증명 세션
+        """
+        region = region_name or Config.AWS_REGION
+        key = (role_arn, region)
+
+        with self._lock:
+            session = self._sessions.get(key)
+        if session:
+            return session
+
+        credentials = RefreshableCredentials.create_from_metadata(
+            metadata=self.get_credentials(role_arn),
+            refresh_using=lambda: self.get_credentials(role_arn),
+            method='sts-assume-role'
+        )
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = credentials
+        session = boto3.Session(botocore_session=botocore_session, region_name=region)
+        # 클라이언트 풀이 갱신 후에도 같은 클라이언트를 재사용하도록 역할 ARN을 식별자로 지정
+        session.credential_identity = role_arn
+
+        with self._lock:
+            return self._sessions.setdefault(key, session)
+
+    def invalidate(self, role_arn: str) -> None:
+        """
+        역할의 캐시된 자격 증명과 세션, 클라이언트를 제거합니다.
+
+        Args:
+            role_arn: 역할 ARN
+        """
+        with self._lock:
+            self._credentials.pop(role_arn, None)
+            for key in [k for k in self._sessions if k[0] == role_arn]:
+                del self._sessions[key]
+        get_client_pool().invalidate(role_arn)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        브로커 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 히트/미스/갱신 횟수와 캐시된 역할 수
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._credentials))
+
+    def _assume_role(self, role_arn: str) -> Dict[str, str]:
+        """STS로 역할을 수임하고 캐시를 갱신합니다. (역할 잠금 안에서 호출)"""
+        sts_client = get_client_pool().get_client('sts', region_name=Config.AWS_REGION)
+        try:
+            response = sts_client.assume_role(
+                RoleArn=role_arn,
+                RoleSessionName=ROLE_SESSION_NAME,
+                DurationSeconds=self.duration
+            )
+        except Exception:
+            self._increment('errors')
+            raise
+
+        credentials = response['Credentials']
+        metadata = {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': credentials['Expiration'].isoformat()
+        }
+        with self._lock:
+            self._credentials[role_arn] = metadata
+            self._stats['refreshes'] += 1
+
+        logger.info(f"Role 전환 성공: {response['AssumedRoleUser']['Arn']} (만료: {metadata['expiry_time']})")
+        return metadata
+
+    def _schedule_background_refresh(self, role_arn: str) -> None:
+        """만료가 가까운 자격 증명을 백그라운드 스레드에서 갱신합니다. 역할당 하나만 실행됩니다."""
+        with self._lock:
+            if role_arn in self._refreshing:
+                return
+            self._refreshing.add(role_arn)
+            self._stats['background_refreshes'] += 1
+
+        def refresh():
+            try:
+                with self._get_role_lock(role_arn):
+                    if self._get_cached(role_arn)[1] <= self.refresh_window:
+                        self._assume_role(role_arn)
+            except Exception as e:
+                logger.warning(f"자격 증명 백그라운드 갱신 실패 ({role_arn}): {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(role_arn)
+
+        thread = threading.Thread(target=refresh, name=f"credential-refresh-{role_arn}")
+        thread.daemon = True
+        thread.start()
+
+    def _get_cached(self, role_arn: str) -> Tuple[Optional[Dict[str, str]], float]:
+        """캐시된 자격 증명과 남은 유효 시간(초)을 반환합니다. 캐시에 없으면 (None, 0)을 반환합니다."""
+        with self._lock:
+            metadata = self._credentials.get(role_arn)
+        if not metadata:
+            return None, 0
+        expiration = datetime.fromisoformat(metadata['expiry_time'])
+        return metadata, (expiration - datetime.now(timezone.utc)).total_seconds()
+
+    def _get_role_lock(self, role_arn: str) -> threading.Lock:
+        """역할별 갱신 잠금을 반환합니다."""
+        with self._lock:
+            return self._role_locks.setdefault(role_arn, threading.Lock())
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_credential_broker() -> CredentialBroker:
+    """
+    프로세스 전역 자격 증명 브로커를 반환합니다.
+
+    Returns:
+        CredentialBroker: 자격 증명 브로커 객체
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = CredentialBroker()
+    return _broker
@@ -0,0 +1,268 @@
+"""
+S3 객체 로컬 디스크 캐시
+
+메모리 캐시는 워커 프로세스마다 따로 있고 재시작하면 비워지므로, 메모리 캐시를 놓치거나 워커가 새로 뜰 때마다
+수집 데이터(all_services.json)와 검사 결과를 S3에서 다시 내려받습니다.
+이 모듈은 S3 객체 본문을 내용 해시(SHA-256) 이름의 파일로 디스크에 저장하고, 객체 키 → (ETag, 인코딩, 해시) 색인을
+SQLite에 두어 같은 호스트의 모든 워커 프로세스가 함께 사용합니다.
+- 같은 본문(예: 검사 결과의 latest.json과 아카이브)은 파일 하나만 저장
+- 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 객체부터 제거 (LRU)
+- 본문은 mmap으로 읽어 복사 없이 압축 해제/파싱에 전달
+"""
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from config import Config
+from app.services.sqlite_util import ClosingConnection
+
+logger = logging.getLogger(__name__)
+
+# 마지막 사용 시각 갱신 간격(초) (읽을 때마다 색인에 쓰지 않도록)
+TOUCH_INTERVAL = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    object_key TEXT PRIMARY KEY,
+    etag TEXT,
+    content_encoding TEXT,
+    digest TEXT NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_objects_digest ON objects (digest);
+CREATE INDEX IF NOT EXISTS idx_objects_accessed ON objects (accessed_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+class DiskCache:
+    """
+    내용 주소 방식으로 S3 객체 본문을 저장하는 프로세스 간 공유 디스크 캐시
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = None):
+        """
+        디스크 캐시 초기화
+
+        Args:
+            directory: 캐시 디렉토리 (기본값: Config에서 가져옴)
+            max_bytes: 본문 파일 크기 합계 상한(바이트) (기본값: Config에서 가져옴)
+        """
+        self.directory = directory or Config.DISK_CACHE_DIR
+        self.max_bytes = max_bytes or Config.DISK_CACHE_MAX_BYTES
+        self.index_path = os.path.join(self.directory, 'index.sqlite3')
+        os.makedirs(os.path.join(self.directory, 'blobs'), exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def lookup(self, bucket_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        객체의 캐시 항목을 조회합니다.
+
+        Args:
+            bucket_name: 버킷 이름
+            key: S3 객체 키
+
+        Returns:
+            Optional[Dict[str, Any]]: {'etag', 'content_encoding', 'digest'} 또는 None
+        """
+        object_key = f"{bucket_name}/{key}"
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT etag, content_encoding, digest, accessed_at FROM objects WHERE object_key = ?', (object_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row['accessed_at'] < now - TOUCH_INTERVAL:
+                conn.execute('UPDATE objects SET accessed_at = ? WHERE object_key = ?', (now, object_key))
+        return {'etag': row['etag'], 'content_encoding': row['content_encoding'], 'digest': row['digest']}
+
+    @contextmanager
+    def open_body(self, bucket_name: str, key: str, entry: Dict[str, Any]) -> Iterator[Optional[Any]]:
+        """
+        캐시된 본문을 읽기 전용 mmap으로 엽니다. 다른 프로세스가 제거한 경우 항목을 지우고 None을 돌려줍니다.
+
+        Args:
+            bucket_name: 버킷 이름
+            key: S3 객체 키
+            entry: lookup 결과
+
+        Returns:
+            Iterator[Optional[Any]]: 본문 버퍼 (mmap 또는 빈 bytes) 또는 None
+        """
+        try:
+            f = open(self._blob_path(entry['digest']), 'rb')
+        except FileNotFoundError:
+            self.discard(bucket_name, key)
+            yield None
+            return
+
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+
+    def put(self, bucket_name: str, key: str, body: bytes, etag: Optional[str], content_encoding: Optional[str]) -> None:
+        """
+        객체 본문을 저장합니다. 같은 내용의 본문 파일이 이미 있으면 색인만 추가합니다.
+
+        Args:
+            bucket_name: 버킷 이름
+            key: S3 객체 키
+            body: S3에 저장된 그대로의 본문 (압축 상태)
+            etag: 객체 ETag
+            content_encoding: 객체 Content-Encoding
+        """
+        if len(body) > self.max_bytes:
+            return
+
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+        object_key = f"{bucket_name}/{key}"
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            previous = conn.execute('SELECT digest FROM objects WHERE object_key = ?', (object_key,)).fetchone()
+            conn.execute('INSERT OR IGNORE INTO blobs (digest, size) VALUES (?, ?)', (digest, len(body)))
+            conn.execute(
+                'INSERT OR REPLACE INTO objects (object_key, etag, content_encoding, digest, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (object_key, etag, content_encoding, digest, time.time())
+            )
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM blobs').fetchone()[0]
+
+        if total > self.max_bytes:
+            self._evict(total)
+        elif previous is not None and previous['digest'] != digest:
+            # 객체가 바뀌어 이전 본문을 더 이상 참조하지 않을 수 있음
+            self._remove_orphans()
+
+    def discard(self, bucket_name: str, key: str) -> None:
+        """
+        객체의 캐시 항목을 제거합니다.
+
+        Args:
+            bucket_name: 버킷 이름
+            key: S3 객체 키
+        """
+        with self._connect() as conn:
+            conn.execute('DELETE FROM objects WHERE object_key = ?', (f"{bucket_name}/{key}",))
+        self._remove_orphans()
+
+    def discard_prefix(self, bucket_name: str, prefix: str) -> None:
+        """
+        키 접두사로 시작하는 객체의 캐시 항목을 모두 제거합니다.
+
+        Args:
+            bucket_name: 버킷 이름
+            prefix: S3 키 접두사
+        """
+        object_prefix = f"{bucket_name}/{prefix}"
+        with self._connect() as conn:
+            conn.execute('DELETE FROM objects WHERE substr(object_key, 1, ?) = ?', (len(object_prefix), object_prefix))
+        self._remove_orphans()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        디스크 캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 객체 수, 본문 파일 수, 사용 중인 크기, 상한
+        """
+        with self._connect() as conn:
+            objects = conn.execute('SELECT COUNT(*) FROM objects').fetchone()[0]
+            blobs, total = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs').fetchone()
+        return {'objects': objects, 'blobs': blobs, 'bytes': total, 'max_bytes': self.max_bytes}
+
+    def _evict(self, total: int) -> None:
+        """가장 오래 사용하지 않은 객체부터 제거하여 크기 합계를 상한 아래로 줄입니다."""
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                'SELECT o.object_key, o.digest, b.size FROM objects o JOIN blobs b ON o.digest = b.digest '
+                'ORDER BY o.accessed_at'
+            ).fetchall()
+            evicted, freed_digests = 0, set()
+            for row in rows:
+                if total <= self.max_bytes:
+                    break
+                conn.execute('DELETE FROM objects WHERE object_key = ?', (row['object_key'],))
+                evicted += 1
+                # 다른 객체가 같은 본문을 참조하지 않으면 본문 크기만큼 줄어듦
+                if row['digest'] not in freed_digests and conn.execute(
+                        'SELECT 1 FROM objects WHERE digest = ? LIMIT 1', (row['digest'],)).fetchone() is None:
+                    freed_digests.add(row['digest'])
+                    total -= row['size']
+        logger.info(f"디스크 캐시 정리: 객체 {evicted}개 제거")
+        self._remove_orphans()
+
+    def _remove_orphans(self) -> None:
+        """어떤 객체도 참조하지 않는 본문 파일을 삭제합니다."""
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            digests = [row['digest'] for row in conn.execute(
+                'SELECT digest FROM blobs WHERE digest NOT IN (SELECT digest FROM objects)'
+            ).fetchall()]
+            conn.executemany('DELETE FROM blobs WHERE digest = ?', [(digest,) for digest in digests])
+
+        for digest in digests:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _blob_path(self, digest: str) -> str:
+        """본문 파일 경로 (해시 앞 2자리로 디렉토리 분산)"""
+        return os.path.join(self.directory, 'blobs', digest[:2], digest)
+
+    def _connect(self) -> ClosingConnection:
+        """연결을 생성합니다. 작업마다 새 연결을 사용하므로 스레드/프로세스 간에 공유하지 않습니다."""
+        conn = sqlite3.connect(self.index_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return ClosingConnection(conn)
+
+
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """
+    프로세스 전역 디스크 캐시를 반환합니다.
+
+    Returns:
+        Optional[DiskCache]: 디스크 캐시 객체 (Config.DISK_CACHE_MAX_BYTES가 0이거나 로컬 저장소 백엔드면 None)
+    """
+    global _disk_cache
+    if Config.DISK_CACHE_MAX_BYTES <= 0 or (Config.STORAGE_BACKEND or 's3').lower() != 's3':
+        return None
+    if _disk_cache is None:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                _disk_cache = DiskCache()
+    return _disk_cache
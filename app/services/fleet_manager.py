@@ -0,0 +1,765 @@
+"""
+멀티 계정 플릿 수집/검사
+
+사용자마다 역할 ARN이 하나뿐이라 계정이 많으면 계정마다 로그인해서 수집과 검사를 따로 실행해야 합니다.
+이 모듈은 계정 목록(역할 ARN 목록 또는 Organizations 계정 목록)을 받아 계정별 리소스 수집과
+서비스 어드바이저 검사를 작업 단위(계정 × 서비스)로 나누어 로컬 SQLite 저장소에 기록하고,
+프로세스 전역 스레드 풀에서 계정별 동시 실행 수를 제한하며 실행합니다.
+- 결과는 계정별 소유자 ID(사용자 ID@계정 ID)로 기존 수집/검사 기록 저장소에 저장
+- 작업 단위 상태가 남아 있으므로 중단된 실행은 끝나지 않은 작업만 이어서 실행
+- 작업 결과 요약으로 계정 전체 롤업 제공
+"""
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+from app.services.aws_client_pool import get_client_pool
+from app.services.aws_services import collect_service_data
+from app.services.credential_broker import get_credential_broker
+from app.services.s3_storage import S3Storage
+from app.services.sqlite_util import ClosingConnection
+from app.services.service_advisor.advisor_factory import ServiceAdvisorFactory
+from app.services.service_advisor.common.history_storage import AdvisorHistoryStorage
+from app.services.service_advisor.common.scan_executor import ScanExecutor
+from app.services.service_advisor.common.scan_snapshot import scan_scope
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류 (리소스 수집 / 서비스 어드바이저 검사)
+TASK_COLLECT = 'collect'
+TASK_SCAN = 'scan'
+
+# 작업 상태
+TASK_PENDING = 'pending'
+TASK_RUNNING = 'running'
+TASK_SUCCEEDED = 'succeeded'
+TASK_FAILED = 'failed'
+TASK_CANCELLED = 'cancelled'
+
+# 실행 상태 (작업 상태 + 작업 제출 후 시작 전 / 일부 계정/작업만 성공한 경우)
+RUN_QUEUED = 'queued'
+RUN_PARTIAL = 'partial'
+
+ROLE_ARN_PATTERN = re.compile(r'^arn:aws[\w-]*:iam::(\d{12}):role/.+$')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fleet_runs (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT,
+    job_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_fleet_runs_user ON fleet_runs (user_id, created_at);
+CREATE TABLE IF NOT EXISTS fleet_accounts (
+    run_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    name TEXT,
+    role_arn TEXT NOT NULL,
+    collection_id TEXT,
+    collection_saved INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, account_id)
+);
+CREATE TABLE IF NOT EXISTS fleet_tasks (
+    run_id TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    task_type TEXT NOT NULL,
+    service_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    started_at REAL,
+    finished_at REAL,
+    PRIMARY KEY (run_id, account_id, task_type, service_name)
+);
+CREATE INDEX IF NOT EXISTS idx_fleet_tasks_status ON fleet_tasks (run_id, status);
+"""
+
+
+def get_account_id(role_arn: str) -> str:
+    """
+    역할 ARN에서 계정 ID를 추출합니다.
+
+    Args:
+        role_arn: AWS 역할 ARN
+
+    Returns:
+        str: 12자리 계정 ID
+
+    Raises:
+        ValueError: 역할 ARN 형식이 올바르지 않은 경우
+    """
+    match = ROLE_ARN_PATTERN.match(role_arn or '')
+    if not match:
+        raise ValueError(f"올바르지 않은 역할 ARN: {role_arn}")
+    return match.group(1)
+
+
+def get_account_owner_id(user_id: str, account_id: str) -> str:
+    """
+    계정별 결과를 저장할 소유자 ID를 반환합니다. (수집/검사 기록 저장소의 사용자 ID 자리에 사용)
+
+    Args:
+        user_id: 플릿을 실행한 사용자 ID
+        account_id: 계정 ID
+
+    Returns:
+        str: 소유자 ID
+    """
+    return f"{user_id}@{account_id}"
+
+
+def list_organization_accounts(role_arn: str, member_role_name: str = None) -> List[Dict[str, str]]:
+    """
+    Organizations의 활성 계정 목록을 조회하고 계정마다 수임할 멤버 역할 ARN을 만듭니다.
+    사용자 요청으로 조회하므로 프로세스 기본 자격 증명은 사용하지 않습니다.
+
+    Args:
+        role_arn: 관리 계정에서 organizations:ListAccounts 권한이 있는 역할 ARN
+        member_role_name: 멤버 계정에서 수임할 역할 이름 (기본값: Config에서 가져옴)
+
+    Returns:
+        List[Dict[str, str]]: [{'account_id', 'name', 'role_arn'}]
+
+    Raises:
+        ValueError: 역할 ARN이 없거나 형식이 올바르지 않은 경우
+    """
+    get_account_id(role_arn)
+    member_role_name = member_role_name or Config.FLEET_MEMBER_ROLE_NAME
+    session = get_credential_broker().get_session(role_arn)
+    # Organizations API는 us-east-1 엔드포인트만 제공
+    client = get_client_pool().get_client('organizations', region_name='us-east-1', session=session)
+
+    accounts = []
+    for page in client.get_paginator('list_accounts').paginate():
+        for account in page.get('Accounts', []):
+            if account.get('Status') != 'ACTIVE':
+                continue
+            accounts.append({
+                'account_id': account['Id'],
+                'name': account.get('Name'),
+                'role_arn': f"arn:aws:iam::{account['Id']}:role/{member_role_name}"
+            })
+    logger.info(f"Organizations 활성 계정 {len(accounts)}개 조회")
+    return accounts
+
+
+def authorize_accounts(owner_role_arn: str, accounts: List[Dict[str, str]]) -> None:
+    """
+    플릿 계정이 사용자가 등록한 역할의 계정이거나 그 계정의 조직에 속하는지 확인합니다.
+    서버 자격 증명으로 사용자와 관계없는 계정의 역할을 수임하지 않도록 계정 목록을 받을 때마다 확인합니다.
+
+    Args:
+        owner_role_arn: 사용자가 등록한 역할 ARN
+        accounts: [{'role_arn'}] (역할 ARN의 계정 ID로 확인)
+
+    Raises:
+        ValueError: 역할 ARN 형식이 올바르지 않은 경우
+        PermissionError: 등록된 역할이 없거나, 사용자의 계정/조직에 속하지 않는 계정이 있는 경우
+    """
+    if not owner_role_arn:
+        raise PermissionError("등록된 역할 ARN이 없어 플릿을 실행할 수 없습니다.")
+    owner_account_id = get_account_id(owner_role_arn)
+
+    outside = {get_account_id(account.get('role_arn')) for account in accounts} - {owner_account_id}
+    if outside:
+        # 다른 계정은 사용자 역할로 조회한 조직 계정 목록에 있어야 함
+        try:
+            outside -= {account['account_id'] for account in list_organization_accounts(owner_role_arn)}
+        except Exception as e:
+            logger.warning(f"사용자 조직 계정 조회 실패 ({owner_account_id}): {str(e)}")
+    if outside:
+        raise PermissionError(f"사용자의 계정이나 조직에 속하지 않는 계정입니다: {', '.join(sorted(outside))}")
+
+
+class FleetStore:
+    """
+    SQLite 기반 플릿 실행 저장소 (실행/계정/작업 단위 상태를 여러 프로세스에서 공유)
+    """
+
+    def __init__(self, path: str = None):
+        """
+        플릿 실행 저장소 초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본값: Config에서 가져옴)
+        """
+        self.path = path or Config.FLEET_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def create_run(self, user_id: str, accounts: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+        """
+        실행과 계정별 작업을 생성합니다.
+
+        Args:
+            user_id: 사용자 ID
+            accounts: [{'account_id', 'name', 'role_arn'}]
+            params: 실행 파라미터 (services, scan_services, region, regions)
+
+        Returns:
+            str: 실행 ID
+        """
+        run_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        services = params.get('services') or []
+        scan_services = params.get('scan_services') or []
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO fleet_runs (id, user_id, status, params, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (run_id, user_id, TASK_PENDING, json.dumps(params, default=str), now, now)
+            )
+            for account in accounts:
+                conn.execute(
+                    'INSERT INTO fleet_accounts (run_id, account_id, name, role_arn, collection_id) VALUES (?, ?, ?, ?, ?)',
+                    (run_id, account['account_id'], account.get('name'), account['role_arn'],
+                     str(uuid.uuid4())[:8] if services else None)
+                )
+                conn.executemany(
+                    'INSERT INTO fleet_tasks (run_id, account_id, task_type, service_name, status) VALUES (?, ?, ?, ?, ?)',
+                    [(run_id, account['account_id'], TASK_COLLECT, service, TASK_PENDING) for service in services] +
+                    [(run_id, account['account_id'], TASK_SCAN, service, TASK_PENDING) for service in scan_services]
+                )
+        return run_id
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        실행 정보를 반환합니다.
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 실행 정보 (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM fleet_runs WHERE id = ?', (run_id,)).fetchone()
+        if not row:
+            return None
+        run = dict(row)
+        run['params'] = json.loads(run['params']) if run['params'] else {}
+        return run
+
+    def list_runs(self, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        사용자의 최근 실행 목록을 반환합니다.
+
+        Args:
+            user_id: 사용자 ID
+            limit: 최대 개수
+
+        Returns:
+            List[Dict[str, Any]]: 실행 정보 목록 (최신순)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT r.*, (SELECT COUNT(*) FROM fleet_accounts a WHERE a.run_id = r.id) AS account_count '
+                'FROM fleet_runs r WHERE r.user_id = ? ORDER BY r.created_at DESC LIMIT ?',
+                (user_id, limit)
+            ).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run['params'] = json.loads(run['params']) if run['params'] else {}
+            runs.append(run)
+        return runs
+
+    def get_accounts(self, run_id: str) -> List[Dict[str, Any]]:
+        """실행의 계정 목록을 반환합니다."""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT * FROM fleet_accounts WHERE run_id = ? ORDER BY rowid', (run_id,)).fetchall()
+        return [dict(row, collection_saved=bool(row['collection_saved'])) for row in rows]
+
+    def get_tasks(self, run_id: str, statuses: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        실행의 작업 목록을 반환합니다.
+
+        Args:
+            run_id: 실행 ID
+            statuses: 작업 상태 필터 (없으면 전체)
+
+        Returns:
+            List[Dict[str, Any]]: 작업 목록 (생성 순서)
+        """
+        query = 'SELECT * FROM fleet_tasks WHERE run_id = ?'
+        args = [run_id]
+        if statuses:
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            args.extend(statuses)
+        with self._connect() as conn:
+            rows = conn.execute(query + ' ORDER BY rowid', args).fetchall()
+        tasks = []
+        for row in rows:
+            task = dict(row)
+            task['result'] = json.loads(task['result']) if task['result'] else None
+            tasks.append(task)
+        return tasks
+
+    def prepare_resume(self, run_id: str, retry_failed: bool = True, reset_running: bool = True) -> int:
+        """
+        중단된 작업(실행 중으로 남은 작업, 취소된 작업)과 실패한 작업을 다시 대기 상태로 돌립니다.
+        성공한 작업은 그대로 두므로 이어서 실행하면 남은 작업만 실행됩니다.
+
+        Args:
+            run_id: 실행 ID
+            retry_failed: 실패한 작업도 다시 실행할지 여부
+            reset_running: 실행 중으로 남은 작업도 다시 실행할지 여부 (이전 작업이 아직 실행 중이면 False)
+
+        Returns:
+            int: 대기 상태로 돌린 작업 수
+        """
+        statuses = ([TASK_RUNNING] if reset_running else []) + [TASK_CANCELLED] + ([TASK_FAILED] if retry_failed else [])
+        with self._connect() as conn:
+            return conn.execute(
+                f"UPDATE fleet_tasks SET status = ? WHERE run_id = ? AND status IN ({', '.join('?' for _ in statuses)})",
+                (TASK_PENDING, run_id, *statuses)
+            ).rowcount
+
+    def claim_run(self, run_id: str, expected_job_id: Optional[str], job_id: str,
+                  previous_finished: bool = False) -> bool:
+        """
+        실행을 새 작업에 할당합니다. 실행의 작업 ID가 조회 시점 그대로이고 대기/실행 중이 아닐 때만
+        조건부 UPDATE 한 번으로 바꾸므로, 같은 실행을 동시에 이어서 실행해도 한 요청만 할당됩니다.
+
+        Args:
+            run_id: 실행 ID
+            expected_job_id: 조회 시점의 실행 작업 ID (없으면 None)
+            job_id: 새 작업 ID
+            previous_finished: expected_job_id 작업이 이미 끝났는지 여부
+                               (True면 비정상 종료로 실행 상태가 대기/실행 중으로 남아 있어도 할당)
+
+        Returns:
+            bool: 할당 여부
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                'UPDATE fleet_runs SET status = ?, job_id = ?, updated_at = ?, finished_at = NULL '
+                'WHERE id = ? AND job_id IS ? AND (status NOT IN (?, ?) OR ?)',
+                (RUN_QUEUED, job_id, time.time(), run_id, expected_job_id, RUN_QUEUED, TASK_RUNNING,
+                 1 if previous_finished else 0)
+            ).rowcount == 1
+
+    def set_run_status(self, run_id: str, status: str, job_id: str = None, finished: bool = False) -> None:
+        """실행 상태(와 실행 중인 작업 ID)를 기록합니다."""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE fleet_runs SET status = ?, job_id = COALESCE(?, job_id), updated_at = ?, finished_at = ? '
+                'WHERE id = ?',
+                (status, job_id, now, now if finished else None, run_id)
+            )
+
+    def start_task(self, task: Dict[str, Any]) -> None:
+        """작업을 실행 중 상태로 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE fleet_tasks SET status = ?, attempts = attempts + 1, started_at = ?, error = NULL '
+                'WHERE run_id = ? AND account_id = ? AND task_type = ? AND service_name = ?',
+                (TASK_RUNNING, time.time(), *_task_key(task))
+            )
+
+    def finish_task(self, task: Dict[str, Any], status: str, result: Any = None, error: str = None) -> None:
+        """작업 종료 상태와 결과 요약을 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE fleet_tasks SET status = ?, result = ?, error = ?, finished_at = ? '
+                'WHERE run_id = ? AND account_id = ? AND task_type = ? AND service_name = ?',
+                (status, json.dumps(result, default=str) if result is not None else None, error, time.time(),
+                 *_task_key(task))
+            )
+
+    def mark_collection_saved(self, run_id: str, account_id: str) -> None:
+        """계정 수집의 메타데이터/카탈로그 기록 완료를 표시합니다."""
+        with self._connect() as conn:
+            conn.execute('UPDATE fleet_accounts SET collection_saved = 1 WHERE run_id = ? AND account_id = ?',
+                         (run_id, account_id))
+
+    def _connect(self) -> ClosingConnection:
+        """연결을 생성합니다. 작업마다 새 연결을 사용하므로 스레드 간에 공유하지 않습니다."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return ClosingConnection(conn)
+
+
+def _task_key(task: Dict[str, Any]) -> tuple:
+    """작업 기본 키 (run_id, account_id, task_type, service_name)"""
+    return task['run_id'], task['account_id'], task['task_type'], task['service_name']
+
+
+def _interleave_by_account(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """계정마다 한 작업씩 번갈아 나열합니다. (한 계정의 작업이 스레드 풀을 차지하고 제한을 기다리지 않도록)"""
+    by_account: Dict[str, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        by_account.setdefault(task['account_id'], []).append(task)
+    ordered = []
+    queues = list(by_account.values())
+    while queues:
+        ordered.extend(queue.pop(0) for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+def _sum_counts(total: Dict[str, Any], counts: Dict[str, Any]) -> None:
+    """숫자 항목을 항목별로 더합니다."""
+    for name, value in (counts or {}).items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[name] = total.get(name, 0) + value
+
+
+class FleetManager:
+    """
+    계정 목록의 수집/검사 작업을 공유 스레드 풀에서 계정별 동시 실행 수를 제한하며 실행하는 플릿 관리자
+    """
+
+    def __init__(self, store: FleetStore = None, max_workers: int = None, per_account: int = None):
+        """
+        플릿 관리자 초기화
+
+        Args:
+            store: 플릿 실행 저장소 (기본값: Config 경로의 FleetStore)
+            max_workers: 프로세스 전체 최대 동시 작업 수 (기본값: Config에서 가져옴)
+            per_account: 한 계정에 대한 최대 동시 작업 수 (기본값: Config에서 가져옴)
+        """
+        self.store = store or FleetStore()
+        self.max_workers = max_workers or Config.FLEET_MAX_WORKERS
+        self.per_account = per_account or Config.FLEET_PER_ACCOUNT_CONCURRENCY
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='fleet')
+        # 플릿 검사는 전용 스캔 실행기에서 실행 (프로세스 전역 스캔 실행기의 슬롯을 차지하면 대화형 스캔이 멈춤)
+        self._scan_executor = ScanExecutor(max_workers=Config.FLEET_SCAN_MAX_CONCURRENT_CHECKS)
+        self._account_limits: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def create_run(self, user_id: str, accounts: List[Dict[str, str]], services: List[str] = None,
+                   scan_services: List[str] = None, region: str = None, regions: List[str] = None) -> str:
+        """
+        플릿 실행을 생성합니다. 같은 계정이 여러 번 있으면 한 번만 실행합니다.
+
+        Args:
+            user_id: 사용자 ID
+            accounts: [{'role_arn', 'name'(선택)}] (계정 ID는 역할 ARN에서 추출)
+            services: 계정마다 수집할 리소스 서비스 목록
+            scan_services: 계정마다 검사할 서비스 어드바이저 서비스 목록
+            region: 기본 리전 (선택 사항)
+            regions: 리소스 수집 리전 목록 (선택 사항)
+
+        Returns:
+            str: 실행 ID
+
+        Raises:
+            ValueError: 계정이나 서비스가 없거나, 역할 ARN이 올바르지 않거나, 계정 수가 상한을 넘는 경우
+        """
+        if not services and not scan_services:
+            raise ValueError("수집하거나 검사할 서비스를 하나 이상 선택해야 합니다.")
+
+        unique_accounts = {}
+        for account in accounts or []:
+            account_id = get_account_id(account.get('role_arn'))
+            unique_accounts.setdefault(account_id, {
+                'account_id': account_id,
+                'name': account.get('name'),
+                'role_arn': account['role_arn']
+            })
+        if not unique_accounts:
+            raise ValueError("계정 목록이 비어 있습니다.")
+        if len(unique_accounts) > Config.FLEET_MAX_ACCOUNTS:
+            raise ValueError(f"계정 수({len(unique_accounts)})가 상한({Config.FLEET_MAX_ACCOUNTS})을 넘습니다.")
+
+        run_id = self.store.create_run(user_id, list(unique_accounts.values()), {
+            'services': list(services or []),
+            'scan_services': list(scan_services or []),
+            'region': region,
+            'regions': regions
+        })
+        logger.info(f"플릿 실행 생성: {run_id} (사용자: {user_id}, 계정 {len(unique_accounts)}개)")
+        return run_id
+
+    def run(self, run_id: str, cancel_event: Optional[threading.Event] = None,
+            on_progress: Optional[Callable[..., None]] = None, reset_running: bool = True) -> Dict[str, Any]:
+        """
+        실행의 남은 작업을 실행하고 계정별 수집을 마무리합니다. 중단된 실행에 다시 호출하면 이어서 실행합니다.
+
+        Args:
+            run_id: 실행 ID
+            cancel_event: 설정되면 시작하지 않은 작업을 대기 상태로 남기고 멈추는 이벤트 (선택 사항)
+            on_progress: 작업이 끝날 때마다 진행 상태를 받는 함수 on_progress(**progress) (선택 사항)
+            reset_running: 실행 중으로 남은 작업도 다시 실행할지 여부 (이전 작업이 아직 실행 중이면 False)
+
+        Returns:
+            Dict[str, Any]: 실행 상태와 롤업 합계
+        """
+        run = self.store.get_run(run_id)
+        if not run:
+            raise ValueError(f"플릿 실행을 찾을 수 없습니다: {run_id}")
+
+        resumed = self.store.prepare_resume(run_id, reset_running=reset_running)
+        if resumed:
+            logger.info(f"플릿 실행 {run_id} 이어서 실행: 작업 {resumed}개 재시도")
+        self.store.set_run_status(run_id, TASK_RUNNING)
+
+        accounts = {account['account_id']: account for account in self.store.get_accounts(run_id)}
+        pending = _interleave_by_account(self.store.get_tasks(run_id, statuses=[TASK_PENDING]))
+        total = len(self.store.get_tasks(run_id))
+        counts = {TASK_SUCCEEDED: total - len(pending), TASK_FAILED: 0}
+        logger.info(f"플릿 실행 {run_id} 시작: 계정 {len(accounts)}개, 남은 작업 {len(pending)}/{total}개")
+
+        started_at = time.time()
+        futures = [self._executor.submit(self._run_task, run, accounts[task['account_id']], task, cancel_event)
+                   for task in pending]
+        for future in as_completed(futures):
+            status = future.result()
+            if status in counts:
+                counts[status] += 1
+            if on_progress:
+                on_progress(total_tasks=total, completed_tasks=counts[TASK_SUCCEEDED], failed_tasks=counts[TASK_FAILED])
+
+        cancelled = cancel_event is not None and cancel_event.is_set()
+        touched_accounts = {task['account_id'] for task in pending if task['task_type'] == TASK_COLLECT}
+        tasks = self.store.get_tasks(run_id)
+        for account in accounts.values():
+            if account['account_id'] in touched_accounts or not account['collection_saved']:
+                self._finalize_collection(run, account, tasks)
+
+        rollup = self.get_rollup(run_id)
+        status = TASK_CANCELLED if cancelled else rollup['status']
+        self.store.set_run_status(run_id, status, finished=not cancelled)
+        logger.info(f"플릿 실행 {run_id} 종료: {status} ({time.time() - started_at:.1f}초)")
+        return {'run_id': run_id, 'status': status, 'totals': rollup['totals']}
+
+    def get_rollup(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        계정별 작업 결과와 전체 합계를 반환합니다.
+
+        Args:
+            run_id: 실행 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 롤업 (실행이 없으면 None)
+        """
+        run = self.store.get_run(run_id)
+        if not run:
+            return None
+
+        accounts = {}
+        for account in self.store.get_accounts(run_id):
+            accounts[account['account_id']] = {
+                'account_id': account['account_id'],
+                'name': account['name'],
+                'role_arn': account['role_arn'],
+                'owner_id': get_account_owner_id(run['user_id'], account['account_id']),
+                'collection_id': account['collection_id'] if account['collection_saved'] else None,
+                'services': {},
+                'scans': {}
+            }
+
+        totals = {
+            'accounts': len(accounts),
+            'accounts_by_status': {},
+            'tasks': {},
+            'resources': {},
+            'check_status': {},
+            'problem_count': 0
+        }
+        for task in self.store.get_tasks(run_id):
+            entry = {'status': task['status'], 'attempts': task['attempts']}
+            if task['error']:
+                entry['error'] = task['error']
+            if task['started_at'] and task['finished_at']:
+                entry['elapsed'] = round(task['finished_at'] - task['started_at'], 2)
+            result = task['result'] or {}
+            totals['tasks'][task['status']] = totals['tasks'].get(task['status'], 0) + 1
+
+            account = accounts[task['account_id']]
+            if task['task_type'] == TASK_COLLECT:
+                entry['counts'] = result.get('counts', {})
+                account['services'][task['service_name']] = entry
+                if task['status'] == TASK_SUCCEEDED:
+                    _sum_counts(totals['resources'].setdefault(task['service_name'], {}), entry['counts'])
+            else:
+                entry['status_counts'] = result.get('status_counts', {})
+                entry['problem_count'] = result.get('problem_count', 0)
+                account['scans'][task['service_name']] = entry
+                if task['status'] == TASK_SUCCEEDED:
+                    _sum_counts(totals['check_status'], entry['status_counts'])
+                    totals['problem_count'] += entry['problem_count']
+
+        for account in accounts.values():
+            statuses = [entry['status'] for entry in list(account['services'].values()) + list(account['scans'].values())]
+            account['status'] = self._combine_status(statuses)
+            totals['accounts_by_status'][account['status']] = totals['accounts_by_status'].get(account['status'], 0) + 1
+
+        return {
+            'run_id': run_id,
+            'user_id': run['user_id'],
+            'status': run['status'] if run['status'] == TASK_CANCELLED else
+                      self._combine_status([account['status'] for account in accounts.values()]),
+            'params': run['params'],
+            'job_id': run['job_id'],
+            'created_at': run['created_at'],
+            'finished_at': run['finished_at'],
+            'totals': totals,
+            'accounts': list(accounts.values())
+        }
+
+    @staticmethod
+    def _combine_status(statuses: List[str]) -> str:
+        """작업(또는 계정) 상태 목록을 하나의 상태로 합칩니다."""
+        if not statuses:
+            return TASK_PENDING
+        if all(status == TASK_SUCCEEDED for status in statuses):
+            return TASK_SUCCEEDED
+        if any(status in (TASK_PENDING, TASK_RUNNING) for status in statuses):
+            return TASK_RUNNING if any(status != TASK_PENDING for status in statuses) else TASK_PENDING
+        if all(status == TASK_FAILED for status in statuses):
+            return TASK_FAILED
+        return RUN_PARTIAL
+
+    def _run_task(self, run: Dict[str, Any], account: Dict[str, Any], task: Dict[str, Any],
+                  cancel_event: Optional[threading.Event]) -> str:
+        """계정 동시 실행 제한을 지키며 작업 하나를 실행하고 종료 상태를 반환합니다."""
+        with self._get_account_limit(account['account_id']):
+            # 취소되면 시작하지 않은 작업은 대기 상태로 남겨 이어서 실행할 수 있게 함
+            if cancel_event is not None and cancel_event.is_set():
+                return TASK_PENDING
+
+            self.store.start_task(task)
+            started_at = time.time()
+            try:
+                if task['task_type'] == TASK_COLLECT:
+                    result = self._collect_service(run, account, task['service_name'])
+                else:
+                    result = self._scan_service(run, account, task['service_name'], cancel_event)
+                status, error = TASK_SUCCEEDED, None
+                if result.get('cancelled_checks'):
+                    status = TASK_CANCELLED
+            except Exception as e:
+                result, status, error = None, TASK_FAILED, str(e)
+                logger.warning(f"플릿 작업 실패: {account['account_id']} {task['task_type']}:{task['service_name']} - {error}")
+
+            self.store.finish_task(task, status, result=result, error=error)
+            logger.info(f"플릿 작업 종료: {account['account_id']} {task['task_type']}:{task['service_name']} "
+                        f"({status}, {time.time() - started_at:.1f}초)")
+            return status
+
+    def _collect_service(self, run: Dict[str, Any], account: Dict[str, Any], service_name: str) -> Dict[str, Any]:
+        """계정의 서비스 하나를 수집하고 계정 소유자 ID로 저장합니다. 카탈로그 요약을 반환합니다."""
+        owner_id = get_account_owner_id(run['user_id'], account['account_id'])
+        response = collect_service_data(
+            username=owner_id,
+            service_name=service_name,
+            region=run['params'].get('region'),
+            auth_type='role_arn',
+            role_arn=account['role_arn'],
+            collection_id=account['collection_id'],
+            regions=run['params'].get('regions')
+        )
+        if not response or not response.get('success'):
+            raise RuntimeError((response or {}).get('error', '알 수 없는 오류'))
+
+        summary = S3Storage().save_service_data(owner_id, account['collection_id'], service_name,
+                                                response.get('result', {}))
+        if summary is None:
+            raise RuntimeError('수집 데이터 저장 실패')
+        return summary
+
+    def _scan_service(self, run: Dict[str, Any], account: Dict[str, Any], service_name: str,
+                      cancel_event: Optional[threading.Event]) -> Dict[str, Any]:
+        """계정의 서비스 하나를 전체 검사하고 계정 소유자 ID로 검사 기록을 저장합니다. 검사 상태 요약을 반환합니다."""
+        advisor = ServiceAdvisorFactory().get_advisor(service_name)
+        if not advisor:
+            raise ValueError(f'서비스 {service_name}에 대한 어드바이저를 찾을 수 없습니다.')
+
+        owner_id = get_account_owner_id(run['user_id'], account['account_id'])
+        role_arn = account['role_arn']
+        check_ids = [check.get('id') for check in advisor.get_available_checks()]
+        history_storage = AdvisorHistoryStorage()
+
+        def persist(check_id, result):
+            history_storage.save_check_result(
+                username=owner_id,
+                service_name=service_name,
+                check_id=check_id,
+                result=result
+            )
+
+        with scan_scope(role_arn):
+            results = self._scan_executor.run_scan(
+                advisor,
+                check_ids,
+                role_arn=role_arn,
+                persist=persist,
+                cancel_event=cancel_event
+            )
+
+        status_counts = {}
+        for result in results.values():
+            status = result.get('status', 'unknown')
+            status_counts[status] = status_counts.get(status, 0) + 1
+        return {
+            'checks': {check_id: result.get('status') for check_id, result in results.items()},
+            'status_counts': status_counts,
+            'problem_count': sum(result.get('problem_count', 0) or 0 for result in results.values()),
+            'cancelled_checks': [check_id for check_id, result in results.items() if result.get('cancelled')]
+        }
+
+    def _finalize_collection(self, run: Dict[str, Any], account: Dict[str, Any], tasks: List[Dict[str, Any]]) -> None:
+        """계정의 수집 작업이 모두 끝났으면 저장된 서비스로 수집 메타데이터와 카탈로그를 기록합니다."""
+        collect_tasks = [task for task in tasks
+                         if task['account_id'] == account['account_id'] and task['task_type'] == TASK_COLLECT]
+        if not collect_tasks or any(task['status'] in (TASK_PENDING, TASK_RUNNING, TASK_CANCELLED)
+                                    for task in collect_tasks):
+            return
+
+        summaries = {task['service_name']: task['result'] for task in collect_tasks
+                     if task['status'] == TASK_SUCCEEDED and task['result'] is not None}
+        if not summaries:
+            return
+
+        owner_id = get_account_owner_id(run['user_id'], account['account_id'])
+        if S3Storage().finalize_collection(owner_id, account['collection_id'], summaries, run['params'].get('services')):
+            self.store.mark_collection_saved(run['id'], account['account_id'])
+        else:
+            logger.error(f"플릿 실행 {run['id']}의 계정 {account['account_id']} 수집 메타데이터 저장 실패")
+
+    def _get_account_limit(self, account_id: str) -> threading.Semaphore:
+        """계정별 동시 실행 제한 세마포어를 반환합니다. (프로세스의 모든 플릿 실행이 공유)"""
+        with self._lock:
+            if account_id not in self._account_limits:
+                self._account_limits[account_id] = threading.BoundedSemaphore(self.per_account)
+            return self._account_limits[account_id]
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_fleet_manager() -> FleetManager:
+    """
+    프로세스 전역 플릿 관리자를 반환합니다.
+
+    Returns:
+        FleetManager: 플릿 관리자 객체
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = FleetManager()
+    return _manager
@@ -0,0 +1,536 @@
+"""
+비동기 작업 관리자
+
+서비스 스캔은 요청 스레드에서 동기로 실행되고, 데이터 수집은 데몬 스레드에서 실행되며
+진행 상태가 라우트 모듈의 딕셔너리에만 있어 재시작하면 사라지고 다른 워커 프로세스에서는 보이지 않습니다.
+이 모듈은 작업을 로컬 SQLite 저장소에 기록하고, 프로세스마다 설정된 수의 작업 스레드가
+대기 중인 작업을 가져가 실행합니다. 제출/상태/취소/결과 조회는 어느 워커 프로세스에서나 가능합니다.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+from app.services.sqlite_util import ClosingConnection
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_SUCCEEDED = 'succeeded'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+# 대기 작업 확인, 하트비트 기록, 취소 요청 확인 간격(초)
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10
+
+# 하트비트가 이 시간(초) 이상 끊긴 실행 중 작업은 워커가 종료된 것으로 보고 실패 처리
+STALE_SECONDS = 120
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    user_id TEXT,
+    status TEXT NOT NULL,
+    params TEXT,
+    progress TEXT,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_user ON jobs (user_id, kind, status);
+"""
+
+
+class JobContext:
+    """
+    작업 처리 함수에 전달되는 실행 정보 (진행 상태 기록과 취소 확인)
+    """
+
+    def __init__(self, manager: 'JobManager', job: Dict[str, Any]):
+        """
+        작업 실행 정보 초기화
+
+        Args:
+            manager: 작업 관리자
+            job: 작업 정보
+        """
+        self.job_id = job['id']
+        self.kind = job['kind']
+        self.user_id = job['user_id']
+        self.params = job['params'] or {}
+        self.cancel_event = threading.Event()
+        self._manager = manager
+
+    def update_progress(self, **progress) -> None:
+        """
+        진행 상태를 기록합니다. 기존 진행 상태에 덮어씁니다.
+
+        Args:
+            **progress: 진행 상태 항목
+        """
+        self._manager.store.update_progress(self.job_id, progress)
+
+    def is_cancelled(self) -> bool:
+        """
+        취소 요청 여부를 반환합니다.
+
+        Returns:
+            bool: 취소 요청 여부
+        """
+        return self.cancel_event.is_set()
+
+
+class JobStore:
+    """
+    SQLite 기반 작업 저장소 (여러 프로세스에서 같은 파일을 공유)
+    """
+
+    def __init__(self, path: str = None):
+        """
+        작업 저장소 초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본값: Config에서 가져옴)
+        """
+        self.path = path or Config.JOB_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def create(self, kind: str, user_id: str, params: Dict[str, Any], job_id: str = None) -> str:
+        """
+        대기 상태의 작업을 생성합니다.
+
+        Args:
+            kind: 작업 종류
+            user_id: 사용자 ID
+            params: 작업 파라미터 (JSON 직렬화 가능해야 함)
+            job_id: 미리 정한 작업 ID (기본값: 새로 생성)
+
+        Returns:
+            str: 작업 ID
+        """
+        job_id = job_id or new_job_id()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, kind, user_id, status, params, progress, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, kind, user_id, STATUS_QUEUED, json.dumps(params, default=str), '{}', time.time())
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 정보를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 정보 (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def find_active(self, kind: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자의 대기 중이거나 실행 중인 작업을 반환합니다.
+
+        Args:
+            kind: 작업 종류
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 가장 최근 작업 정보 (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT * FROM jobs WHERE kind = ? AND user_id = ? AND status IN (?, ?) '
+                'ORDER BY created_at DESC LIMIT 1',
+                (kind, user_id) + ACTIVE_STATUSES
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def claim_next(self, kinds: List[str], worker: str) -> Optional[Dict[str, Any]]:
+        """
+        가장 오래된 대기 작업을 실행 중 상태로 바꾸고 반환합니다. 여러 프로세스가 같은 작업을 가져가지 않습니다.
+
+        Args:
+            kinds: 이 프로세스가 처리할 수 있는 작업 종류 목록
+            worker: 워커 식별자
+
+        Returns:
+            Optional[Dict[str, Any]]: 가져온 작업 정보 (대기 작업이 없으면 None)
+        """
+        if not kinds:
+            return None
+        placeholders = ', '.join('?' for _ in kinds)
+        with self._connect() as conn:
+            while True:
+                row = conn.execute(
+                    f'SELECT id FROM jobs WHERE status = ? AND kind IN ({placeholders}) ORDER BY created_at LIMIT 1',
+                    (STATUS_QUEUED, *kinds)
+                ).fetchone()
+                if not row:
+                    return None
+                now = time.time()
+                claimed = conn.execute(
+                    'UPDATE jobs SET status = ?, worker = ?, started_at = ?, heartbeat_at = ? '
+                    'WHERE id = ? AND status = ?',
+                    (STATUS_RUNNING, worker, now, now, row['id'], STATUS_QUEUED)
+                ).rowcount
+                conn.commit()
+                # 다른 프로세스가 먼저 가져갔으면 다음 작업 확인
+                if claimed:
+                    return _row_to_job(conn.execute('SELECT * FROM jobs WHERE id = ?', (row['id'],)).fetchone())
+
+    def update_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """진행 상태 항목을 기존 진행 상태에 덮어씁니다."""
+        with self._connect() as conn:
+            row = conn.execute('SELECT progress FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            merged = json.loads(row['progress'] or '{}') if row else {}
+            merged.update(progress)
+            conn.execute('UPDATE jobs SET progress = ?, heartbeat_at = ? WHERE id = ?',
+                         (json.dumps(merged, default=str), time.time(), job_id))
+
+    def finish(self, job_id: str, status: str, result: Any = None, error: str = None) -> None:
+        """작업을 종료 상태로 기록합니다."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?',
+                (status, json.dumps(result, default=str) if result is not None else None, error, time.time(), job_id)
+            )
+
+    def request_cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업 취소를 요청합니다. 대기 중인 작업은 바로 취소되고 실행 중인 작업은 취소 요청만 기록됩니다.
+
+        Returns:
+            Optional[str]: 요청 후 작업 상태 (작업이 없으면 None)
+        """
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, cancel_requested = 1, finished_at = ? WHERE id = ? AND status = ?',
+                (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED)
+            )
+            conn.execute('UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?', (job_id, STATUS_RUNNING))
+            row = conn.execute('SELECT status FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return row['status'] if row else None
+
+    def heartbeat(self, job_ids: List[str]) -> List[str]:
+        """
+        실행 중인 작업의 하트비트를 기록하고 취소가 요청된 작업 ID 목록을 반환합니다.
+        """
+        if not job_ids:
+            return []
+        placeholders = ', '.join('?' for _ in job_ids)
+        with self._connect() as conn:
+            conn.execute(f'UPDATE jobs SET heartbeat_at = ? WHERE id IN ({placeholders})', (time.time(), *job_ids))
+            rows = conn.execute(
+                f'SELECT id FROM jobs WHERE cancel_requested = 1 AND id IN ({placeholders})', tuple(job_ids)
+            ).fetchall()
+        return [row['id'] for row in rows]
+
+    def fail_stale(self, stale_seconds: int = STALE_SECONDS) -> int:
+        """하트비트가 끊긴 실행 중 작업을 실패 처리하고 처리한 작업 수를 반환합니다."""
+        now = time.time()
+        with self._connect() as conn:
+            return conn.execute(
+                'UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE status = ? AND heartbeat_at < ?',
+                (STATUS_FAILED, '작업을 실행하던 워커가 종료되어 작업이 중단되었습니다.', now,
+                 STATUS_RUNNING, now - stale_seconds)
+            ).rowcount
+
+    def purge(self, retention_days: int) -> int:
+        """보관 기간이 지난 종료된 작업을 삭제하고 삭제한 작업 수를 반환합니다."""
+        with self._connect() as conn:
+            return conn.execute(
+                'DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?',
+                (time.time() - retention_days * 86400,)
+            ).rowcount
+
+    def _connect(self) -> ClosingConnection:
+        """연결을 생성합니다. 작업마다 새 연결을 사용하므로 스레드 간에 공유하지 않습니다."""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return ClosingConnection(conn)
+
+
+def new_job_id() -> str:
+    """
+    새 작업 ID를 생성합니다.
+
+    Returns:
+        str: 작업 ID
+    """
+    return uuid.uuid4().hex
+
+
+def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+    """작업 행을 딕셔너리로 변환합니다."""
+    job = dict(row)
+    for field in ('params', 'progress', 'result'):
+        job[field] = json.loads(job[field]) if job[field] else None
+    job['cancel_requested'] = bool(job['cancel_requested'])
+    return job
+
+
+class JobManager:
+    """
+    작업 제출/상태/취소/결과 조회와 작업 스레드 풀을 관리하는 작업 관리자
+    """
+
+    def __init__(self, store: JobStore = None, max_workers: int = None, retention_days: int = None):
+        """
+        작업 관리자 초기화
+
+        Args:
+            store: 작업 저장소 (기본값: Config 경로의 JobStore)
+            max_workers: 프로세스당 작업 스레드 수 (기본값: Config에서 가져옴)
+            retention_days: 종료된 작업 보관 기간(일) (기본값: Config에서 가져옴)
+        """
+        self.store = store or JobStore()
+        self.max_workers = max_workers or Config.JOB_WORKERS
+        self.retention_days = retention_days or Config.JOB_RETENTION_DAYS
+
+        self._handlers: Dict[str, Callable[[JobContext], Any]] = {}
+        self._running: Dict[str, JobContext] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid = None
+        self._worker_id = None
+        self._executor = None
+        self._slots = None
+
+    def register(self, kind: str, handler: Callable[[JobContext], Any]) -> None:
+        """
+        작업 종류별 처리 함수를 등록합니다. 처리 함수의 반환값이 작업 결과로 저장됩니다.
+
+        Args:
+            kind: 작업 종류
+            handler: 처리 함수 handler(context)
+        """
+        with self._lock:
+            self._handlers[kind] = handler
+
+    def submit(self, kind: str, user_id: str, params: Dict[str, Any], job_id: str = None) -> str:
+        """
+        작업을 제출합니다.
+
+        Args:
+            kind: 작업 종류
+            user_id: 사용자 ID
+            params: 작업 파라미터 (JSON 직렬화 가능해야 함)
+            job_id: 미리 정한 작업 ID (제출 전에 다른 저장소에 작업 ID를 기록해야 할 때 new_job_id()로 생성)
+
+        Returns:
+            str: 작업 ID
+        """
+        job_id = self.store.create(kind, user_id, params, job_id=job_id)
+        logger.info(f"작업 제출: {kind} {job_id} (사용자: {user_id})")
+        self._wakeup.set()
+        return job_id
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태를 반환합니다. (결과는 제외)
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 상태 (없으면 None)
+        """
+        job = self.store.get(job_id)
+        if not job:
+            return None
+        return {
+            'job_id': job['id'],
+            'kind': job['kind'],
+            'user_id': job['user_id'],
+            'status': job['status'],
+            'progress': job['progress'] or {},
+            'error': job['error'],
+            'cancel_requested': job['cancel_requested'],
+            'created_at': job['created_at'],
+            'started_at': job['started_at'],
+            'finished_at': job['finished_at']
+        }
+
+    def get_result(self, job_id: str) -> Any:
+        """
+        작업 결과를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Any: 처리 함수가 반환한 결과 (종료되지 않았거나 결과가 없으면 None)
+        """
+        job = self.store.get(job_id)
+        return job['result'] if job else None
+
+    def find_active(self, kind: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자의 대기 중이거나 실행 중인 작업 상태를 반환합니다.
+
+        Args:
+            kind: 작업 종류
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 상태 (없으면 None)
+        """
+        job = self.store.find_active(kind, user_id)
+        return self.get_status(job['id']) if job else None
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업을 취소합니다. 실행 중인 작업은 처리 함수가 취소 요청을 확인하는 시점에 멈춥니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[str]: 취소 요청 후 작업 상태 (작업이 없으면 None)
+        """
+        status = self.store.request_cancel(job_id)
+        with self._lock:
+            context = self._running.get(job_id)
+        if context:
+            context.cancel_event.set()
+        logger.info(f"작업 취소 요청: {job_id} (상태: {status})")
+        return status
+
+    def start(self) -> None:
+        """
+        작업 스레드를 시작합니다. 작업 처리 함수를 모두 등록한 뒤 서버 시작 시 한 번 호출합니다.
+        이미 시작한 프로세스에서는 아무 일도 하지 않고, fork된 자식 프로세스에서 호출하면 스레드를 새로 시작합니다.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._worker_id = f"{socket.gethostname()}:{self._pid}"
+            self._running = {}
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job-worker')
+            self._slots = threading.BoundedSemaphore(self.max_workers)
+
+        try:
+            self.store.fail_stale()
+            self.store.purge(self.retention_days)
+        except Exception as e:
+            logger.warning(f"작업 저장소 정리 중 오류 발생: {str(e)}")
+
+        threading.Thread(target=self._dispatch_loop, name='job-dispatcher', daemon=True).start()
+        threading.Thread(target=self._monitor_loop, name='job-monitor', daemon=True).start()
+        logger.info(f"작업 관리자 시작: 워커 {self._worker_id}, 작업 스레드 {self.max_workers}개")
+
+    def _dispatch_loop(self) -> None:
+        """빈 작업 스레드가 있으면 대기 작업을 가져와 실행합니다."""
+        while True:
+            self._slots.acquire()
+            job = None
+            try:
+                with self._lock:
+                    kinds = list(self._handlers)
+                job = self.store.claim_next(kinds, self._worker_id)
+            except Exception as e:
+                logger.error(f"대기 작업 조회 중 오류 발생: {str(e)}")
+
+            if job is None:
+                self._slots.release()
+                self._wakeup.wait(POLL_INTERVAL)
+                self._wakeup.clear()
+                continue
+
+            context = JobContext(self, job)
+            with self._lock:
+                self._running[job['id']] = context
+            self._executor.submit(self._run, context)
+
+    def _run(self, context: JobContext) -> None:
+        """작업 처리 함수를 실행하고 종료 상태를 기록합니다."""
+        started = time.time()
+        try:
+            with self._lock:
+                handler = self._handlers[context.kind]
+            result = handler(context)
+            status = STATUS_CANCELLED if context.is_cancelled() else STATUS_SUCCEEDED
+            self.store.finish(context.job_id, status, result=result)
+            logger.info(f"작업 종료: {context.kind} {context.job_id} ({status}, {time.time() - started:.1f}초)")
+        except Exception as e:
+            logger.error(f"작업 {context.kind} {context.job_id} 실행 중 오류 발생: {str(e)}")
+            try:
+                self.store.finish(context.job_id, STATUS_FAILED, error=str(e))
+            except Exception as store_err:
+                logger.error(f"작업 {context.job_id} 상태 기록 실패: {str(store_err)}")
+        finally:
+            with self._lock:
+                self._running.pop(context.job_id, None)
+            self._slots.release()
+            self._wakeup.set()
+
+    def _monitor_loop(self) -> None:
+        """실행 중인 작업의 하트비트를 기록하고 다른 프로세스에서 들어온 취소 요청을 전달합니다."""
+        last_stale_check = time.time()
+        while True:
+            time.sleep(HEARTBEAT_INTERVAL)
+            try:
+                with self._lock:
+                    running = dict(self._running)
+                for job_id in self.store.heartbeat(list(running)):
+                    running[job_id].cancel_event.set()
+
+                if time.time() - last_stale_check > STALE_SECONDS:
+                    last_stale_check = time.time()
+                    failed = self.store.fail_stale()
+                    if failed:
+                        logger.warning(f"하트비트가 끊긴 작업 {failed}개를 실패 처리했습니다.")
+            except Exception as e:
+                logger.error(f"작업 상태 확인 중 오류 발생: {str(e)}")
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    프로세스 전역 작업 관리자를 반환합니다.
+
+    Returns:
+        JobManager: 작업 관리자 객체
+    """
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = JobManager()
+    return _manager
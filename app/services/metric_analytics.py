@@ -0,0 +1,110 @@
+"""
+NumPy 기반 메트릭 통계 분석
+
+크기 검사는 리소스마다 파이썬 루프로 평균/최대값을 계산하고 최대값 한 번의 스파이크로 판정합니다.
+이 모듈은 여러 리소스의 시계열을 하나의 행렬로 만들어 한 번의 벡터 연산으로
+평균, 최대, 최소, p50/p95/p99, 임계값 초과 시간을 계산하고, 여러 시계열을 공통 시간축에 정렬합니다.
+"""
+import warnings
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# 백분위수 계산 대상
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(values_by_resource: Dict[str, Sequence[float]],
+              threshold: float = None) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    리소스별 시계열 통계를 한 번의 벡터 연산으로 계산합니다.
+
+    Args:
+        values_by_resource: {리소스 ID: 값 목록}
+        threshold: 초과 시간을 계산할 임계값 (선택 사항)
+
+    Returns:
+        Dict: {리소스 ID: {count, avg, max, min, p50, p95, p99, above_threshold, above_threshold_pct}}
+              데이터가 없는 리소스는 count가 0이고 나머지 값은 None
+    """
+    resource_ids = list(values_by_resource)
+    if not resource_ids:
+        return {}
+
+    # 길이가 다른 시계열을 NaN으로 채운 행렬로 변환 (리소스 x 데이터포인트)
+    lengths = np.array([len(values_by_resource[resource_id]) for resource_id in resource_ids])
+    width = max(int(lengths.max()), 1)
+    matrix = np.full((len(resource_ids), width), np.nan)
+    if lengths.sum():
+        mask = np.arange(width) < lengths[:, None]
+        matrix[mask] = np.concatenate([
+            np.asarray(values_by_resource[resource_id], dtype=np.float64) for resource_id in resource_ids
+        ])
+
+    # 데이터가 없는 행은 NaN이 되므로 빈 구간 경고는 무시
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        averages = np.nanmean(matrix, axis=1)
+        maximums = np.nanmax(matrix, axis=1)
+        minimums = np.nanmin(matrix, axis=1)
+        percentiles = np.nanpercentile(matrix, PERCENTILES, axis=1)
+    above = np.sum(matrix > threshold, axis=1) if threshold is not None else np.zeros(len(resource_ids), dtype=int)
+
+    stats = {}
+    for row, resource_id in enumerate(resource_ids):
+        count = int(lengths[row])
+        if not count:
+            stats[resource_id] = {
+                'count': 0, 'avg': None, 'max': None, 'min': None,
+                'p50': None, 'p95': None, 'p99': None,
+                'above_threshold': 0, 'above_threshold_pct': None
+            }
+            continue
+        stats[resource_id] = {
+            'count': count,
+            'avg': float(averages[row]),
+            'max': float(maximums[row]),
+            'min': float(minimums[row]),
+            'p50': float(percentiles[0][row]),
+            'p95': float(percentiles[1][row]),
+            'p99': float(percentiles[2][row]),
+            'above_threshold': int(above[row]),
+            'above_threshold_pct': float(above[row]) / count * 100 if threshold is not None else None
+        }
+    return stats
+
+
+def align_series(resource_series: Dict[str, Dict[str, list]], labels: List[str],
+                 limit: int = None) -> Dict[str, list]:
+    """
+    한 리소스의 여러 시계열을 공통 타임스탬프 축에 맞춥니다. 값이 없는 시점은 None으로 채웁니다.
+
+    Args:
+        resource_series: {레이블: {'timestamps': [...], 'values': [...]}}
+        labels: 정렬할 레이블 목록
+        limit: 최근 몇 개 시점만 반환할지 (선택 사항)
+
+    Returns:
+        Dict[str, list]: {'timestamps': [...], 레이블: [...]} (시간 오름차순)
+    """
+    epochs = {}
+    for label in labels:
+        timestamps = resource_series.get(label, {}).get('timestamps', [])
+        epochs[label] = np.array([timestamp.timestamp() for timestamp in timestamps], dtype=np.float64)
+
+    axis = np.unique(np.concatenate(list(epochs.values()))) if epochs else np.empty(0)
+    if limit:
+        axis = axis[-limit:]
+
+    aligned = {'timestamps': [datetime.fromtimestamp(epoch, tz=timezone.utc) for epoch in axis]}
+    for label in labels:
+        column = np.full(len(axis), np.nan)
+        values = np.asarray(resource_series.get(label, {}).get('values', []), dtype=np.float64)
+        positions = np.searchsorted(axis, epochs[label])
+        # limit으로 잘린 구간 밖의 데이터포인트는 제외
+        inside = (positions < len(axis)) & (axis[np.minimum(positions, len(axis) - 1)] == epochs[label]) \
+            if len(axis) else np.zeros(len(values), dtype=bool)
+        column[positions[inside]] = values[inside]
+        aligned[label] = [None if np.isnan(value) else float(value) for value in column]
+    return aligned
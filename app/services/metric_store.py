@@ -0,0 +1,207 @@
+"""
+로컬 메트릭 시계열 저장소
+
+크기 검사는 실행할 때마다 14일치 1시간 간격 데이터(메트릭당 336개 포인트)를 CloudWatch에서 다시 가져옵니다.
+이 모듈은 메트릭 쿼리별 시계열을 numpy 배열(타임스탬프 int64, 값 float64)로 디스크에 추가 전용으로 저장하고,
+마지막으로 저장된 타임스탬프 이후의 데이터만 조회하도록 하여 반복 검사의 메트릭 조회를 최소화합니다.
+집계가 끝나지 않은 최근 구간의 데이터포인트는 값이 바뀔 수 있으므로 저장하지 않습니다.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# 집계 구간이 끝난 뒤 늦게 도착하는 데이터를 기다리는 시간(초)
+SETTLE_SECONDS = 600
+
+
+class MetricStore:
+    """
+    메트릭 쿼리 단위로 시계열을 디스크에 저장하는 스레드 안전한 추가 전용 저장소
+    """
+
+    def __init__(self, base_dir: str = None, retention_days: int = None):
+        """
+        메트릭 저장소 초기화
+
+        Args:
+            base_dir: 저장 디렉토리 (기본값: Config에서 가져옴)
+            retention_days: 보관 기간(일), 이보다 오래된 데이터포인트는 추가 시 정리 (기본값: Config에서 가져옴)
+        """
+        self.base_dir = base_dir or Config.METRIC_STORE_DIR
+        self.retention_days = retention_days or Config.METRIC_STORE_RETENTION_DAYS
+
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {'reads': 0, 'appends': 0, 'appended_points': 0}
+
+        os.makedirs(self.base_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(scope: str, region: str, query: Dict[str, Any]) -> str:
+        """
+        메트릭 쿼리의 저장 키를 계산합니다.
+
+        Args:
+            scope: 계정 구분자 (예: 역할 ARN)
+            region: AWS 리전
+            query: GetMetricData 쿼리의 MetricStat
+
+        Returns:
+            str: 저장 키 (sha1 16진수)
+        """
+        metric = query['Metric']
+        identity = {
+            'scope': scope,
+            'region': region,
+            'namespace': metric['Namespace'],
+            'metric': metric['MetricName'],
+            'dimensions': sorted((d['Name'], d['Value']) for d in metric.get('Dimensions', [])),
+            'stat': query['Stat'],
+            'period': query['Period']
+        }
+        return hashlib.sha1(json.dumps(identity, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def last_timestamp(self, key: str) -> Optional[int]:
+        """
+        저장된 마지막 타임스탬프를 반환합니다.
+
+        Args:
+            key: 저장 키
+
+        Returns:
+            Optional[int]: epoch 초 (저장된 데이터가 없으면 None)
+        """
+        timestamps, _ = self._load(key)
+        return int(timestamps[-1]) if len(timestamps) else None
+
+    def read(self, key: str, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        조회 구간의 시계열을 반환합니다.
+
+        Args:
+            key: 저장 키
+            start: 구간 시작 (epoch 초, 포함)
+            end: 구간 끝 (epoch 초, 제외)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (타임스탬프, 값) 배열
+        """
+        timestamps, values = self._load(key)
+        with self._lock:
+            self._stats['reads'] += 1
+        lo, hi = np.searchsorted(timestamps, [start, end])
+        return timestamps[lo:hi], values[lo:hi]
+
+    def append(self, key: str, timestamps: List[int], values: List[float]) -> int:
+        """
+        마지막 저장 시점 이후의 데이터포인트만 추가합니다.
+
+        Args:
+            key: 저장 키
+            timestamps: epoch 초 목록 (오름차순)
+            values: 값 목록
+
+        Returns:
+            int: 실제로 추가된 데이터포인트 수
+        """
+        if not timestamps:
+            return 0
+
+        with self._get_key_lock(key):
+            stored_timestamps, stored_values = self._load(key)
+            new_timestamps = np.asarray(timestamps, dtype=np.int64)
+            new_values = np.asarray(values, dtype=np.float64)
+
+            if len(stored_timestamps):
+                newer = new_timestamps > stored_timestamps[-1]
+                new_timestamps, new_values = new_timestamps[newer], new_values[newer]
+            if not len(new_timestamps):
+                return 0
+
+            merged_timestamps = np.concatenate([stored_timestamps, new_timestamps])
+            merged_values = np.concatenate([stored_values, new_values])
+
+            # 보관 기간이 지난 데이터포인트 정리
+            cutoff = int(time.time()) - self.retention_days * 86400
+            keep_from = int(np.searchsorted(merged_timestamps, cutoff))
+            self._save(key, merged_timestamps[keep_from:], merged_values[keep_from:])
+
+        with self._lock:
+            self._stats['appends'] += 1
+            self._stats['appended_points'] += len(new_timestamps)
+        return len(new_timestamps)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        저장소 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 읽기/추가 횟수와 추가된 데이터포인트 수
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _path(self, key: str) -> str:
+        """저장 키의 파일 경로를 반환합니다. 한 디렉토리에 파일이 몰리지 않도록 키 앞 2자리로 나눕니다."""
+        return os.path.join(self.base_dir, key[:2], f"{key}.npz")
+
+    def _load(self, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """저장된 시계열을 읽습니다. 파일이 없거나 손상되었으면 빈 배열을 반환합니다."""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                return data['timestamps'], data['values']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"메트릭 저장 파일 읽기 실패, 새로 저장합니다 ({path}): {str(e)}")
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    def _save(self, key: str, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """임시 파일에 쓴 뒤 교체하여 다른 프로세스가 쓰다 만 파일을 읽지 않도록 합니다."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, timestamps=timestamps, values=values)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        """저장 키별 쓰기 잠금을 반환합니다."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_metric_store() -> MetricStore:
+    """
+    프로세스 전역 메트릭 저장소를 반환합니다.
+
+    Returns:
+        MetricStore: 메트릭 저장소 객체
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = MetricStore()
+    return _store
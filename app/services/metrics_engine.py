@@ -0,0 +1,226 @@
+"""
+CloudWatch GetMetricData 배치 조회 엔진
+
+검사와 수집기가 리소스마다, 메트릭마다 get_metric_statistics를 호출하면
+인스턴스/함수가 수천 개인 계정에서 API 호출이 수만 건으로 늘어나고 스로틀링이 발생합니다.
+이 모듈은 여러 리소스의 메트릭 조회를 모아 GetMetricData 한 번에 최대 500개 쿼리씩 묶어 보내고,
+NextToken 페이지를 이어 붙여 리소스별로 시간순 정렬된 시계열을 반환합니다.
+저장 범위(store_scope)를 지정하면 로컬 메트릭 저장소에 없는 최근 데이터포인트만 조회합니다.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.services.metric_store import SETTLE_SECONDS, get_metric_store
+
+logger = logging.getLogger(__name__)
+
+# GetMetricData 요청 하나에 담을 수 있는 최대 쿼리 수 (API 제한)
+MAX_QUERIES_PER_REQUEST = 500
+
+
+class MetricsEngine:
+    """
+    메트릭 쿼리를 모아 GetMetricData로 일괄 조회하는 엔진 (한 리전의 CloudWatch 클라이언트 단위)
+    """
+
+    def __init__(self, cloudwatch_client, batch_size: int = MAX_QUERIES_PER_REQUEST, store_scope: str = None):
+        """
+        메트릭 엔진 초기화
+
+        Args:
+            cloudwatch_client: CloudWatch 클라이언트
+            batch_size: 요청당 최대 쿼리 수 (기본값: 500)
+            store_scope: 로컬 메트릭 저장소에서 계정을 구분할 값 (예: 역할 ARN, 없으면 저장소 미사용)
+        """
+        self.cloudwatch = cloudwatch_client
+        self.batch_size = min(batch_size, MAX_QUERIES_PER_REQUEST)
+        self.store_scope = store_scope
+
+        self._queries: List[Dict[str, Any]] = []
+        self._keys: Dict[str, tuple] = {}
+        self._stats = {'requests': 0}
+
+    def add(self, resource_id: str, label: str, namespace: str, metric_name: str,
+            dimensions: List[Dict[str, str]], stat: str, period: int) -> None:
+        """
+        조회할 메트릭을 추가합니다.
+
+        Args:
+            resource_id: 결과를 묶을 리소스 ID
+            label: 리소스 안에서 시계열을 구분할 이름 (예: cpu_avg)
+            namespace: CloudWatch 네임스페이스
+            metric_name: 메트릭 이름
+            dimensions: 메트릭 차원 목록
+            stat: 통계 (Average, Maximum, Minimum, Sum 등)
+            period: 집계 간격(초)
+        """
+        # 쿼리 ID는 소문자로 시작하는 영숫자만 허용되므로 순번으로 만들고 리소스/레이블과 매핑
+        query_id = f"m{len(self._queries)}"
+        self._keys[query_id] = (resource_id, label)
+        self._queries.append({
+            'Id': query_id,
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': namespace,
+                    'MetricName': metric_name,
+                    'Dimensions': dimensions
+                },
+                'Period': period,
+                'Stat': stat
+            },
+            'ReturnData': True
+        })
+
+    def add_statistics(self, resource_id: str, namespace: str, metric_name: str,
+                       dimensions: List[Dict[str, str]], statistics: List[str], period: int) -> None:
+        """
+        get_metric_statistics처럼 한 메트릭의 여러 통계를 추가합니다. 레이블은 '메트릭이름.통계'입니다.
+
+        Args:
+            resource_id: 결과를 묶을 리소스 ID
+            namespace: CloudWatch 네임스페이스
+            metric_name: 메트릭 이름
+            dimensions: 메트릭 차원 목록
+            statistics: 통계 목록 (예: ['Average', 'Maximum'])
+            period: 집계 간격(초)
+        """
+        for stat in statistics:
+            self.add(resource_id, f"{metric_name}.{stat}", namespace, metric_name, dimensions, stat, period)
+
+    def fetch(self, start_time: datetime, end_time: datetime) -> Dict[str, Dict[str, Dict[str, list]]]:
+        """
+        추가된 모든 메트릭을 조회합니다. 데이터가 없는 메트릭도 빈 시계열로 포함됩니다.
+
+        Args:
+            start_time: 조회 시작 시간
+            end_time: 조회 종료 시간
+
+        Returns:
+            Dict: {리소스 ID: {레이블: {'timestamps': [...], 'values': [...]}}} (시간 오름차순)
+        """
+        series: Dict[str, Dict[str, Dict[str, list]]] = {}
+        points = None
+        if self.store_scope:
+            try:
+                points = self._fetch_incremental(start_time, end_time)
+            except Exception as e:
+                logger.warning(f"메트릭 저장소 사용 실패, 전체 구간을 조회합니다: {str(e)}")
+        if points is None:
+            points = self._fetch_points(self._queries, start_time, end_time)
+
+        for query_id, (resource_id, label) in self._keys.items():
+            ordered = sorted(points[query_id], key=lambda point: point[0])
+            series.setdefault(resource_id, {})[label] = {
+                'timestamps': [timestamp for timestamp, _ in ordered],
+                'values': [value for _, value in ordered]
+            }
+
+        logger.debug(f"GetMetricData 조회 완료: 쿼리 {len(self._queries)}개, 요청 {self._stats['requests']}회")
+        return series
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        엔진 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 추가된 쿼리 수와 GetMetricData 요청 횟수
+        """
+        return dict(self._stats, queries=len(self._queries))
+
+    def _fetch_points(self, queries: List[Dict[str, Any]], start_time: datetime,
+                      end_time: datetime) -> Dict[str, List[tuple]]:
+        """쿼리를 요청당 최대 쿼리 수로 나누어 조회하고 쿼리 ID별 (타임스탬프, 값) 목록을 반환합니다."""
+        points: Dict[str, List[tuple]] = {query['Id']: [] for query in queries}
+        for offset in range(0, len(queries), self.batch_size):
+            batch = queries[offset:offset + self.batch_size]
+            self._fetch_batch(batch, start_time, end_time, points)
+        return points
+
+    def _fetch_incremental(self, start_time: datetime, end_time: datetime) -> Dict[str, List[tuple]]:
+        """
+        로컬 저장소의 마지막 타임스탬프 이후 데이터만 조회하여 저장하고, 조회 구간은 저장소에서 읽어 반환합니다.
+        마지막 타임스탬프가 같은 쿼리끼리 묶어 조회하므로 요청 수는 저장 상태의 종류 수만큼만 늘어납니다.
+        """
+        store = get_metric_store()
+        region = self.cloudwatch.meta.region_name
+        start_epoch, end_epoch = _to_epoch(start_time), _to_epoch(end_time)
+
+        store_keys: Dict[str, str] = {}
+        groups: Dict[int, List[Dict[str, Any]]] = {}
+        for query in self._queries:
+            period = query['MetricStat']['Period']
+            key = store.make_key(self.store_scope, region, query['MetricStat'])
+            store_keys[query['Id']] = key
+
+            last = store.last_timestamp(key)
+            fetch_from = start_epoch if last is None or last < start_epoch else last + period
+            groups.setdefault(fetch_from - fetch_from % period, []).append(query)
+
+        fetched: Dict[str, List[tuple]] = {}
+        for fetch_from, queries in groups.items():
+            if fetch_from < end_epoch:
+                fetched.update(self._fetch_points(queries, _from_epoch(fetch_from), end_time))
+
+        points: Dict[str, List[tuple]] = {}
+        for query in self._queries:
+            query_id, key = query['Id'], store_keys[query['Id']]
+            period = query['MetricStat']['Period']
+            new_points = sorted((_to_epoch(timestamp), value) for timestamp, value in fetched.get(query_id, []))
+
+            # 집계가 끝난 구간만 저장 (진행 중인 구간은 다음 조회에서 값이 바뀔 수 있음)
+            complete = [(epoch, value) for epoch, value in new_points if epoch + period + SETTLE_SECONDS <= end_epoch]
+            try:
+                store.append(key, [epoch for epoch, _ in complete], [value for _, value in complete])
+            except Exception as e:
+                logger.warning(f"메트릭 저장소 추가 실패 ({key}): {str(e)}")
+
+            timestamps, values = store.read(key, start_epoch, end_epoch)
+            last_stored = int(timestamps[-1]) if len(timestamps) else start_epoch - 1
+            points[query_id] = [(_from_epoch(int(epoch)), float(value)) for epoch, value in zip(timestamps, values)]
+            points[query_id].extend(
+                (_from_epoch(epoch), value) for epoch, value in new_points
+                if last_stored < epoch < end_epoch and epoch >= start_epoch
+            )
+
+        logger.debug(f"메트릭 증분 조회: 쿼리 {len(self._queries)}개, 조회 그룹 {len(groups)}개")
+        return points
+
+    def _fetch_batch(self, batch: List[Dict[str, Any]], start_time: datetime, end_time: datetime,
+                     points: Dict[str, List[tuple]]) -> None:
+        """쿼리 묶음 하나를 NextToken이 없을 때까지 조회하여 데이터포인트를 모읍니다."""
+        next_token: Optional[str] = None
+        while True:
+            params = {
+                'MetricDataQueries': batch,
+                'StartTime': start_time,
+                'EndTime': end_time,
+                'ScanBy': 'TimestampAscending'
+            }
+            if next_token:
+                params['NextToken'] = next_token
+
+            response = self.cloudwatch.get_metric_data(**params)
+            self._stats['requests'] += 1
+
+            for result in response.get('MetricDataResults', []):
+                if result.get('StatusCode') == 'InternalError':
+                    logger.warning(f"메트릭 조회 일부 실패: {self._keys.get(result['Id'])}")
+                points[result['Id']].extend(zip(result.get('Timestamps', []), result.get('Values', [])))
+
+            next_token = response.get('NextToken')
+            if not next_token:
+                break
+
+
+def _to_epoch(value: datetime) -> int:
+    """datetime을 epoch 초로 변환합니다. 시간대가 없으면 UTC로 간주합니다."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _from_epoch(epoch: int) -> datetime:
+    """epoch 초를 UTC datetime으로 변환합니다."""
+    return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
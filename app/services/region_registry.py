@@ -0,0 +1,174 @@
+"""
+계정별 활성 리전 레지스트리
+
+검사마다 ec2.describe_regions()를 호출하면 검사 수만큼 API 호출이 늘어나고,
+botocore의 정적 리전 목록은 활성화되지 않은 옵트인 리전을 포함해 항상 실패하는 호출을 만듭니다.
+이 모듈은 계정마다 한 번만 describe_regions를 호출하여 활성화된 리전만 TTL 동안 캐시합니다.
+"""
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import boto3
+
+from config import Config
+from app.services.aws_client_pool import get_client_pool
+from app.services.credential_broker import get_credential_broker
+
+logger = logging.getLogger(__name__)
+
+# 활성 리전 필터 (옵트인이 필요 없는 리전 + 옵트인한 리전)
+ENABLED_REGION_FILTER = [{'Name': 'opt-in-status', 'Values': ['opt-in-not-required', 'opted-in']}]
+
+
+class RegionRegistry:
+    """
+    계정 단위로 활성 리전 목록을 캐시하는 스레드 안전한 레지스트리
+    """
+
+    def __init__(self, ttl: int = None):
+        """
+        리전 레지스트리 초기화
+
+        Args:
+            ttl: 리전 목록 캐시 유지 시간(초) (기본값: Config에서 가져옴)
+        """
+        self.ttl = ttl or Config.REGION_CACHE_TTL
+
+        self._regions: Dict[str, Dict] = {}
+        self._account_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'errors': 0}
+
+    def get_regions(self, role_arn: str = None, service_name: str = None,
+                    session: Optional[boto3.Session] = None) -> List[str]:
+        """
+        계정에서 활성화된 리전 목록을 반환합니다.
+
+        Args:
+            role_arn: AWS 역할 ARN (있으면 역할 자격 증명 사용)
+            service_name: 서비스 이름 (지정하면 해당 서비스를 제공하는 리전만 반환)
+            session: 역할 ARN이 없을 때 사용할 세션 (없으면 기본 자격 증명 사용)
+
+        Returns:
+            List[str]: 활성 리전 이름 목록
+
+        Raises:
+            Exception: describe_regions 조회에 실패한 경우
+        """
+        if role_arn:
+            session = get_credential_broker().get_session(role_arn)
+        session = session or get_client_pool().get_default_session()
+        account_key = self._get_account_key(role_arn, session)
+
+        regions = self._get_cached(account_key)
+        if regions is None:
+            with self._get_account_lock(account_key):
+                # 잠금을 기다리는 동안 다른 스레드가 이미 조회했을 수 있음
+                regions = self._get_cached(account_key)
+                if regions is None:
+                    regions = self._describe_regions(account_key, session)
+
+        if service_name:
+            available = set(session.get_available_regions(service_name))
+            regions = [region for region in regions if region in available]
+        return regions
+
+    def invalidate(self, role_arn: str = None) -> None:
+        """
+        캐시된 리전 목록을 제거합니다.
+
+        Args:
+            role_arn: 역할 ARN (없으면 전체 캐시 제거)
+        """
+        with self._lock:
+            if role_arn:
+                self._regions.pop(self._get_account_key(role_arn, None), None)
+            else:
+                self._regions.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        레지스트리 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 히트/미스/오류 횟수와 캐시된 계정 수
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._regions))
+
+    def _describe_regions(self, account_key: str, session: boto3.Session) -> List[str]:
+        """describe_regions로 활성 리전을 조회하고 캐시합니다. (계정 잠금 안에서 호출)"""
+        try:
+            ec2_client = get_client_pool().get_client('ec2', region_name=Config.AWS_REGION, session=session)
+            response = ec2_client.describe_regions(Filters=ENABLED_REGION_FILTER)
+            regions = sorted(region['RegionName'] for region in response['Regions'])
+        except Exception as e:
+            # 실패 결과는 캐시하지 않고 호출자에게 오류를 전달 (일부 리전만 검사한 결과가 정상처럼 보이지 않도록)
+            logger.error(f"활성 리전 조회 실패 ({account_key}): {str(e)}")
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+
+        with self._lock:
+            self._regions[account_key] = {'regions': regions, 'expires_at': time.time() + self.ttl}
+            self._stats['misses'] += 1
+        logger.debug(f"활성 리전 {len(regions)}개 캐시 ({account_key})")
+        return regions
+
+    def _get_cached(self, account_key: str) -> Optional[List[str]]:
+        """유효한 캐시 항목이 있으면 리전 목록을, 없으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._regions.get(account_key)
+            if entry and entry['expires_at'] > time.time():
+                self._stats['hits'] += 1
+                return list(entry['regions'])
+        return None
+
+    def _get_account_key(self, role_arn: Optional[str], session: Optional[boto3.Session]) -> str:
+        """캐시 키를 계산합니다. 역할 ARN이 있으면 ARN의 계정 ID를 사용합니다."""
+        if role_arn:
+            parts = role_arn.split(':')
+            return parts[4] if len(parts) > 4 and parts[4] else role_arn
+        return get_client_pool().get_identity(session)
+
+    def _get_account_lock(self, account_key: str) -> threading.Lock:
+        """계정별 조회 잠금을 반환합니다."""
+        with self._lock:
+            return self._account_locks.setdefault(account_key, threading.Lock())
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_region_registry() -> RegionRegistry:
+    """
+    프로세스 전역 리전 레지스트리를 반환합니다.
+
+    Returns:
+        RegionRegistry: 리전 레지스트리 객체
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RegionRegistry()
+    return _registry
+
+
+def get_enabled_regions(role_arn: str = None, service_name: str = None,
+                        session: Optional[boto3.Session] = None) -> List[str]:
+    """
+    계정에서 활성화된 리전 목록을 반환합니다.
+
+    Args:
+        role_arn: AWS 역할 ARN (선택 사항)
+        service_name: 서비스 이름 (선택 사항)
+        session: AWS 세션 객체 (선택 사항)
+
+    Returns:
+        List[str]: 활성 리전 이름 목록
+    """
+    return get_region_registry().get_regions(role_arn=role_arn, service_name=service_name, session=session)
@@ -0,0 +1,252 @@
+"""
+프로세스 전역 리전 팬아웃 실행기
+
+검사마다 ThreadPoolExecutor를 만들면 여러 검사가 동시에 실행될 때 스레드 수에 상한이 없고,
+리전을 순차적으로 도는 검사는 리전 수만큼 느려집니다.
+이 모듈은 하나의 공유 스레드 풀로 리전별 작업을 실행하며, 프로세스 전체 동시 실행 수와
+리전별/서비스별 동시 실행 수를 제한하고 리전별 지연 시간을 기록합니다.
+리전별/서비스별 제한은 작업을 제출하기 전에 호출 스레드에서 얻으므로, 제한을 기다리는 작업이
+공유 풀의 스레드를 차지하여 다른 서비스의 작업을 막지 않습니다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import boto3
+
+from config import Config
+from app.services.region_registry import get_enabled_regions
+
+logger = logging.getLogger(__name__)
+
+# 리전/서비스 제한을 얻지 못했을 때 다시 시도하기 전 최대 대기 시간(초) (제한이 반환되면 바로 다시 시도)
+LIMIT_RETRY_INTERVAL = 0.5
+
+# map_regions를 호출한 스레드별 실패 리전 기록 (track_failed_regions 블록 안에서만 사용)
+_tracking = threading.local()
+
+
+class RegionResults(list):
+    """
+    성공한 리전의 결과 목록 (리전 순서). failed_regions에 실패한 리전과 오류 메시지를 담습니다.
+    """
+
+    def __init__(self, results: List[Any] = (), failed_regions: Dict[str, str] = None):
+        super().__init__(results)
+        self.failed_regions: Dict[str, str] = failed_regions or {}
+
+
+@contextmanager
+def track_failed_regions() -> Iterator[Dict[str, str]]:
+    """
+    블록 안에서 현재 스레드가 호출한 map_regions의 실패 리전을 모읍니다.
+    검사가 일부 리전의 데이터만으로 정상 결과를 내지 않도록 검사 실행부에서 사용합니다.
+
+    Returns:
+        Iterator[Dict[str, str]]: {리전: 오류 메시지} (블록이 끝난 뒤에도 유효)
+    """
+    previous = getattr(_tracking, 'failed', None)
+    failed: Dict[str, str] = {}
+    _tracking.failed = failed
+    try:
+        yield failed
+    finally:
+        _tracking.failed = previous
+        if previous is not None:
+            previous.update(failed)
+
+
+class RegionalExecutor:
+    """
+    동시 실행 수가 제한된 스레드 안전한 리전 팬아웃 실행기
+    """
+
+    def __init__(self, max_workers: int = None, per_region: int = None, per_service: int = None):
+        """
+        리전 팬아웃 실행기 초기화
+
+        Args:
+            max_workers: 프로세스 전체 최대 동시 작업 수 (기본값: Config에서 가져옴)
+            per_region: 한 리전에 대한 최대 동시 작업 수 (기본값: Config에서 가져옴)
+            per_service: 한 서비스에 대한 최대 동시 작업 수 (기본값: Config에서 가져옴)
+        """
+        self.max_workers = max_workers or Config.REGION_FANOUT_MAX_WORKERS
+        self.per_region = per_region or Config.REGION_FANOUT_PER_REGION
+        self.per_service = per_service or Config.REGION_FANOUT_PER_SERVICE
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='region-fanout')
+        self._region_limits: Dict[str, threading.Semaphore] = {}
+        self._service_limits: Dict[str, threading.Semaphore] = {}
+        self._latencies: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._released = threading.Condition()
+        self._release_count = 0
+
+    def map_regions(self, fn: Callable[[str], Any], regions: List[str],
+                    service_name: str = 'default') -> RegionResults:
+        """
+        리전마다 fn(region)을 공유 스레드 풀에서 실행하고 결과를 리전 순서대로 반환합니다.
+        예외가 발생한 리전은 결과에서 빠지고 반환값의 failed_regions에 오류 메시지와 함께 기록됩니다.
+
+        Args:
+            fn: 리전 이름을 인자로 받는 함수
+            regions: 리전 이름 목록
+            service_name: 서비스별 동시 실행 제한과 지연 시간 집계에 사용할 서비스 이름
+
+        Returns:
+            RegionResults: 성공한 리전의 결과 목록 (failed_regions: {리전: 오류 메시지})
+        """
+        # 팬아웃 작업 안에서 다시 호출되면 풀 고갈을 막기 위해 현재 스레드에서 순차 실행
+        if getattr(self._local, 'in_worker', False):
+            outcomes = [self._run(fn, region, service_name) for region in regions]
+        else:
+            outcomes = self._dispatch(fn, regions, service_name)
+
+        failed_regions = {region: error for region, (ok, _, _, error) in zip(regions, outcomes) if not ok}
+        tracked = getattr(_tracking, 'failed', None)
+        if tracked is not None:
+            tracked.update(failed_regions)
+
+        if outcomes:
+            slowest_region, slowest_ms = max(zip(regions, (outcome[2] for outcome in outcomes)), key=lambda x: x[1])
+            logger.info(f"리전 팬아웃 완료 ({service_name}): {len(regions)}개 리전, "
+                        f"실패 {len(failed_regions)}개, 최장 {slowest_region} {slowest_ms:.0f}ms")
+        return RegionResults([result for ok, result, _, _ in outcomes if ok], failed_regions)
+
+    def get_latency_report(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        서비스/리전별 지연 시간 통계를 반환합니다.
+
+        Returns:
+            Dict: {서비스: {리전: {count, errors, avg_ms, max_ms, last_ms}}}
+        """
+        with self._lock:
+            return {
+                service: {region: dict(stats) for region, stats in regions.items()}
+                for service, regions in self._latencies.items()
+            }
+
+    def _dispatch(self, fn: Callable[[str], Any], regions: List[str], service_name: str) -> List[tuple]:
+        """
+        리전/서비스 제한을 호출 스레드에서 얻은 리전부터 공유 풀에 제출하고 결과를 리전 순서대로 반환합니다.
+        제한을 얻지 못한 리전은 다른 작업이 제한을 반환할 때까지 호출 스레드에서 기다렸다가 다시 시도합니다.
+        """
+        service_limit = self._get_limit(self._service_limits, service_name, self.per_service)
+        futures = [None] * len(regions)
+        waiting = list(range(len(regions)))
+
+        while waiting:
+            with self._released:
+                release_count = self._release_count
+
+            for index in list(waiting):
+                if not service_limit.acquire(blocking=False):
+                    break
+                region_limit = self._get_limit(self._region_limits, regions[index], self.per_region)
+                if not region_limit.acquire(blocking=False):
+                    service_limit.release()
+                    continue
+                futures[index] = self._executor.submit(
+                    self._run_in_worker, fn, regions[index], service_name, (service_limit, region_limit)
+                )
+                waiting.remove(index)
+
+            if waiting:
+                with self._released:
+                    if self._release_count == release_count:
+                        self._released.wait(LIMIT_RETRY_INTERVAL)
+
+        return [future.result() for future in futures]
+
+    def _run_in_worker(self, fn: Callable[[str], Any], region: str, service_name: str,
+                       limits: tuple) -> tuple:
+        """공유 풀의 작업 스레드에서 작업을 실행하고, 끝나면 제출 전에 얻은 리전/서비스 제한을 반환합니다."""
+        self._local.in_worker = True
+        try:
+            return self._run(fn, region, service_name)
+        finally:
+            self._local.in_worker = False
+            for limit in limits:
+                limit.release()
+            with self._released:
+                self._release_count += 1
+                self._released.notify_all()
+
+    def _run(self, fn: Callable[[str], Any], region: str, service_name: str) -> tuple:
+        """작업을 실행하고 지연 시간을 기록합니다. (성공 여부, 결과, 소요 시간 ms, 오류 메시지)를 반환합니다."""
+        start = time.time()
+        error = None
+        try:
+            result = fn(region)
+            ok = True
+        except Exception as e:
+            logger.warning(f"리전 {region} 작업 실패 ({service_name}): {str(e)}")
+            result, ok, error = None, False, str(e)
+        elapsed_ms = (time.time() - start) * 1000
+        self._record_latency(service_name, region, elapsed_ms, ok)
+        return ok, result, elapsed_ms, error
+
+    def _record_latency(self, service_name: str, region: str, elapsed_ms: float, ok: bool) -> None:
+        """리전별 지연 시간 통계를 갱신합니다."""
+        with self._lock:
+            stats = self._latencies.setdefault(service_name, {}).setdefault(
+                region, {'count': 0, 'errors': 0, 'avg_ms': 0.0, 'max_ms': 0.0, 'last_ms': 0.0}
+            )
+            stats['count'] += 1
+            if not ok:
+                stats['errors'] += 1
+            stats['avg_ms'] += (elapsed_ms - stats['avg_ms']) / stats['count']
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['last_ms'] = elapsed_ms
+        logger.debug(f"리전 {region} 작업 완료 ({service_name}): {elapsed_ms:.0f}ms")
+
+    def _get_limit(self, limits: Dict[str, threading.Semaphore], key: str, size: int) -> threading.Semaphore:
+        """키별 동시 실행 제한 세마포어를 반환합니다."""
+        with self._lock:
+            if key not in limits:
+                limits[key] = threading.BoundedSemaphore(size)
+            return limits[key]
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_regional_executor() -> RegionalExecutor:
+    """
+    프로세스 전역 리전 팬아웃 실행기를 반환합니다.
+
+    Returns:
+        RegionalExecutor: 리전 팬아웃 실행기 객체
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = RegionalExecutor()
+    return _executor
+
+
+def map_regions(fn: Callable[[str], Any], regions: List[str] = None, role_arn: str = None,
+                service_name: str = None, session: Optional[boto3.Session] = None) -> RegionResults:
+    """
+    리전마다 fn(region)을 병렬로 실행하고 성공한 리전의 결과를 리전 순서대로 반환합니다.
+    실패한 리전은 반환값의 failed_regions와 track_failed_regions 블록에 기록됩니다.
+
+    Args:
+        fn: 리전 이름을 인자로 받는 함수
+        regions: 리전 이름 목록 (없으면 리전 레지스트리의 활성 리전 사용)
+        role_arn: AWS 역할 ARN (활성 리전 조회용, 선택 사항)
+        service_name: 서비스 이름 (활성 리전 필터와 서비스별 동시 실행 제한에 사용)
+        session: AWS 세션 객체 (활성 리전 조회용, 선택 사항)
+
+    Returns:
+        RegionResults: 성공한 리전의 결과 목록 (failed_regions: {리전: 오류 메시지})
+    """
+    if regions is None:
+        regions = get_enabled_regions(role_arn=role_arn, service_name=service_name, session=session)
+    return get_regional_executor().map_regions(fn, regions, service_name=service_name or 'default')
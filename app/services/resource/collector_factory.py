@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import boto3
 from app.services.resource.common.base_collector import BaseCollector
 from app.services.resource.ec2_collector import EC2Collector
@@ -25,7 +25,8 @@ class CollectorFactory:
     
     @classmethod
     def get_collector(cls, service_name: str, region: str = None, 
-                     session: Optional[boto3.Session] = None) -> BaseCollector:
+                     session: Optional[boto3.Session] = None,
+                     regions: Optional[List[str]] = None) -> BaseCollector:
         """
         서비스 이름에 해당하는 수집기 인스턴스를 반환합니다.
         
@@ -33,6 +34,7 @@ class CollectorFactory:
             service_name: AWS 서비스 이름
             region: AWS 리전 (선택 사항)
             session: AWS 세션 객체 (선택 사항)
+            regions: 수집할 리전 목록 (선택 사항, ['all']이면 활성 리전 전체)
             
         Returns:
             BaseCollector: 수집기 인스턴스
@@ -52,7 +54,7 @@ class CollectorFactory:
                 region_name=region or Config.AWS_REGION
             )
         
-        return collector_class(region=region, session=session)
+        return collector_class(region=region, session=session, regions=regions)
     
     @classmethod
     def get_available_services(cls) -> Dict[str, str]:
@@ -3,6 +3,7 @@ from botocore.exceptions import ClientError
 import logging
 from typing import Optional, Dict, Any
 from config import Config
+from app.services.aws_client_pool import get_client_pool
 
 class AWSClient:
     """
@@ -45,7 +46,7 @@ class AWSClient:
         """
         if service_name not in self.clients:
             try:
-                self.clients[service_name] = self.session.client(service_name)
+                self.clients[service_name] = get_client_pool().get_client(service_name, session=self.session)
                 self.logger.debug(f"{service_name} 클라이언트 생성 완료")
             except ClientError as e:
                 self.logger.error(f"{service_name} 클라이언트 생성 중 오류 발생: {str(e)}")
@@ -1,23 +1,41 @@
 import boto3
 import logging
+import time
 from typing import Dict, List, Any, Optional
 from config import Config
+from app.services.aws_client_pool import get_client_pool
+from app.services.credential_broker import get_credential_broker
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 
 class BaseCollector:
     """
     모든 리소스 수집기의 기본 클래스입니다.
     각 서비스별 수집기는 이 클래스를 상속받아 구현합니다.
+    
+    collect()는 수집기 리전 하나를 수집하고, collect_regions()는 리전 목록의 리전마다
+    같은 세션의 수집기를 만들어 리전 팬아웃 실행기에서 병렬로 수집한 뒤 결과를 합칩니다.
     """
     
-    def __init__(self, region: str = None, session: Optional[boto3.Session] = None):
+    # 리전 팬아웃에 사용할 AWS 서비스 이름 (활성 리전 필터와 서비스별 동시 실행 제한)
+    SERVICE_NAME = None
+    # 리전별 결과에서 리소스 목록이 담긴 키 (예: 'instances')
+    ITEMS_KEY = None
+    # 리전과 무관하게 한 번만 수집하는 글로벌 서비스 여부 (IAM, S3 등)
+    GLOBAL_SERVICE = False
+    
+    def __init__(self, region: str = None, session: Optional[boto3.Session] = None,
+                 regions: Optional[List[str]] = None):
         """
         수집기 초기화
         
         Args:
             region: AWS 리전 (기본값: Config에서 가져옴)
             session: AWS 세션 객체 (선택 사항)
+            regions: 수집할 리전 목록 (선택 사항, ['all']이면 계정의 활성 리전 전체)
         """
         self.region = region or Config.AWS_REGION
+        self.regions = list(regions) if regions else None
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # 세션 설정 (간소화)
@@ -50,42 +68,172 @@ class BaseCollector:
         """
         raise NotImplementedError("이 메서드는 하위 클래스에서 구현해야 합니다.")
     
-    def get_client(self, service_name: str) -> boto3.client:
+    def collect_regions(self, collection_id: str = None) -> Dict[str, Any]:
+        """
+        수집기 리전 목록의 리전마다 병렬로 수집하고 하나의 결과로 합칩니다.
+        리전 목록이 없거나 글로벌 서비스이면 collect()와 같습니다.
+        
+        합친 결과의 리소스마다 'region' 필드가 있고, summary는 리전별 요약의 합이며,
+        'regions'에 리전별 요약과 수집 시간(ms), 오류가 기록됩니다.
+        
+        Args:
+            collection_id: 수집 ID (선택 사항)
+            
+        Returns:
+            Dict[str, Any]: 리전별 결과를 합친 리소스 데이터
+        """
+        if not self.regions or self.GLOBAL_SERVICE or not self.ITEMS_KEY:
+            return self.collect(collection_id=collection_id)
+        
+        log_prefix = f"[{collection_id}] " if collection_id else ""
+        regions = self.resolve_regions()
+        self.logger.info(f"{log_prefix}리전 {len(regions)}개 병렬 수집 시작: {regions}")
+        
+        def collect_region(region):
+            # 같은 세션의 리전별 수집기 (클라이언트는 프로세스 전역 클라이언트 풀에서 재사용)
+            started_at = time.time()
+            collector = self.__class__(region=region, session=self.session)
+            result = collector.collect(collection_id=collection_id)
+            return region, result, (time.time() - started_at) * 1000
+        
+        outcomes = map_regions(collect_region, regions=regions, service_name=self.SERVICE_NAME)
+        result = self._merge_region_results(regions, outcomes, outcomes.failed_regions)
+        
+        timings = {region: info['elapsed_ms'] for region, info in result['regions'].items() if 'elapsed_ms' in info}
+        if timings:
+            slowest_region = max(timings, key=timings.get)
+            self.logger.info(f"{log_prefix}리전별 수집 완료: 리소스 {len(result[self.ITEMS_KEY])}개, "
+                             f"최장 {slowest_region} {timings[slowest_region]}ms")
+        return result
+    
+    def resolve_regions(self) -> List[str]:
+        """
+        수집할 리전 목록을 반환합니다. ['all']이면 서비스를 제공하는 계정의 활성 리전 전체입니다.
+        
+        Returns:
+            List[str]: 리전 이름 목록
+        """
+        if not self.regions:
+            return [self.region]
+        if [region.lower() for region in self.regions] == ['all']:
+            return get_enabled_regions(service_name=self.SERVICE_NAME, session=self.session) or [self.region]
+        # 순서를 유지하며 중복 제거
+        return list(dict.fromkeys(self.regions))
+    
+    def _merge_region_results(self, regions: List[str], outcomes: List[tuple],
+                              failed_regions: Dict[str, str] = None) -> Dict[str, Any]:
+        """
+        리전별 수집 결과를 하나로 합칩니다.
+        
+        Args:
+            regions: 수집을 요청한 리전 목록
+            outcomes: (리전, 수집 결과, 소요 시간 ms) 목록 (실패한 리전은 빠져 있음)
+            failed_regions: 예외로 실패한 리전의 오류 메시지 {리전: 오류 메시지} (선택 사항)
+            
+        Returns:
+            Dict[str, Any]: 합친 리소스 데이터
+        """
+        items = []
+        summary = {}
+        region_results = {}
+        
+        for region, result, elapsed_ms in outcomes:
+            result = result or {}
+            region_items = result.get(self.ITEMS_KEY) or []
+            for item in region_items:
+                if isinstance(item, dict):
+                    item.setdefault('region', region)
+            items.extend(region_items)
+            
+            region_summary = result.get('summary') or {}
+            summary = _merge_summary(summary, region_summary)
+            
+            region_results[region] = {
+                'summary': region_summary,
+                'elapsed_ms': round(elapsed_ms)
+            }
+            for key in ('error', 'partial_error', 'message'):
+                if result.get(key):
+                    region_results[region][key] = result[key]
+            if result.get('permission_error'):
+                region_results[region]['permission_error'] = True
+        
+        # 예외로 결과가 없는 리전
+        for region in regions:
+            if region not in region_results:
+                error = (failed_regions or {}).get(region)
+                region_results[region] = {'summary': {}, 'error': f'리전 수집 실패: {error}' if error else '리전 수집 실패'}
+        
+        merged = {
+            self.ITEMS_KEY: items,
+            'summary': summary,
+            'regions': {region: region_results[region] for region in regions}
+        }
+        
+        failed = [region for region in regions if region_results[region].get('error')]
+        if failed and len(failed) == len(regions):
+            merged['error'] = region_results[failed[0]]['error']
+            if all(region_results[region].get('permission_error') for region in failed):
+                merged['permission_error'] = True
+                merged['message'] = region_results[failed[0]].get('message', merged['error'])
+        elif failed:
+            merged['partial_error'] = f"리전 {len(failed)}개 수집 실패: {', '.join(failed)}"
+        return merged
+    
+    def get_client(self, service_name: str, region_name: str = None) -> boto3.client:
         """
-        AWS 서비스 클라이언트를 생성합니다.
+        AWS 서비스 클라이언트를 프로세스 전역 클라이언트 풀에서 가져옵니다.
         
         Args:
             service_name: AWS 서비스 이름
+            region_name: AWS 리전 (기본값: 수집기 리전)
             
         Returns:
             boto3.client: AWS 서비스 클라이언트
         """
-        return self.session.client(service_name)
+        return get_client_pool().get_client(service_name, region_name=region_name or self.region, session=self.session)
+    
+    def get_regions(self) -> List[str]:
+        """
+        수집기 세션의 계정에서 활성화된 리전 목록을 리전 레지스트리에서 가져옵니다.
+        
+        Returns:
+            List[str]: 활성 리전 이름 목록
+        """
+        return get_enabled_regions(session=self.session)
     
     def assume_role_session(self, role_arn: str, session_name: str = "CollectorSession") -> boto3.Session:
         """
-        지정된 IAM 역할을 수임하여 새 세션을 생성합니다.
+        지정된 IAM 역할의 세션을 자격 증명 브로커에서 가져옵니다.
         
         Args:
             role_arn: 수임할 역할의 ARN
-            session_name: 세션 이름
+            session_name: 세션 이름 (브로커가 공통 세션 이름을 사용하므로 무시됨)
             
         Returns:
             boto3.Session: 새 세션 객체
         """
-        sts_client = self.session.client('sts')
-        
-        # 역할 수임
-        response = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName=session_name
-        )
+        return get_credential_broker().get_session(role_arn, region_name=self.region)
+
+
+def _merge_summary(total: Dict[str, Any], summary: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    리전별 요약을 합칩니다. 숫자는 더하고, 딕셔너리는 키별로 합치며, 그 외 값은 먼저 나온 값을 유지합니다.
+    
+    Args:
+        total: 지금까지 합친 요약
+        summary: 더할 리전 요약
         
-        # 임시 자격 증명으로 새 세션 생성
-        credentials = response['Credentials']
-        return boto3.Session(
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken'],
-            region_name=self.region
-        )
\ No newline at end of file
+    Returns:
+        Dict[str, Any]: 합친 요약
+    """
+    merged = dict(total)
+    for key, value in summary.items():
+        current = merged.get(key)
+        if isinstance(value, bool) or key not in merged:
+            merged.setdefault(key, value if not isinstance(value, dict) else _merge_summary({}, value))
+        elif isinstance(value, (int, float)) and isinstance(current, (int, float)):
+            merged[key] = current + value
+        elif isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _merge_summary(current, value)
+    return merged
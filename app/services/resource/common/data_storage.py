@@ -1,18 +1,30 @@
 import os
 import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import boto3
 from botocore.exceptions import ClientError
 import hashlib
-import time
+
+from config import Config
+from app.services import blob_codec
+from app.services.collection_catalog import CollectionCatalog, summarize_service
+from app.services.s3_conditional_read import forget_objects, read_cached, remember_object
+from app.services.storage_backend import create_storage_client
+from app.services.storage_cache import get_storage_cache
 
 class ResourceDataStorage:
     """
     리소스 데이터 저장소 클래스
     """
     
+    # 공용 저장소 캐시 네임스페이스 (인스턴스를 새로 만들어도 캐시 유지)
+    CACHE_NAMESPACES = {
+        'collections': 'resource.collections',  # 컬렉션 목록 캐시
+        'data': 'resource.data'                 # 데이터 캐시
+    }
+    
     def __init__(self, region: str = None):
         """
         초기화
@@ -22,34 +34,10 @@ class ResourceDataStorage:
         """
         self.logger = logging.getLogger(__name__)
         self.region = region or 'ap-northeast-2'
-        self.bucket_name = 'saltware-console-data'
-        self.s3_client = boto3.client('s3', region_name=self.region)
-        
-        # 메모리 캐시
-        self.cache = {
-            'collections': {},  # 컬렉션 목록 캐시
-            'metadata': {},     # 메타데이터 캐시
-            'data': {}          # 데이터 캐시
-        }
-        
-        # 캐시 만료 시간 (초)
-        self.cache_ttl = 300  # 5분
-        
-        # 캐시 타임스탬프
-        self.cache_timestamp = {
-            'collections': {},
-            'metadata': {},
-            'data': {}
-        }
+        self.bucket_name = Config.DATA_BUCKET_NAME
+        self.s3_client = create_storage_client(self.region)
         
         self.logger.info(f"ResourceDataStorage 초기화: 버킷={self.bucket_name}, 리전={self.region}")
-        
-        # S3 버킷 접근 확인
-        try:
-            self.s3_client.head_bucket(Bucket=self.bucket_name)
-            self.logger.info(f"S3 버킷 {self.bucket_name} 접근 확인 완료")
-        except ClientError as e:
-            self.logger.error(f"S3 버킷 접근 오류: {str(e)}")
     
     def save_resource_data(self, username: str, service_name: str, collection_id: str, data: Dict[str, Any]) -> bool:
         """
@@ -65,53 +53,53 @@ class ResourceDataStorage:
             bool: 저장 성공 여부
         """
         try:
+            # 데이터 저장 경로
+            data_key = f"users/{username}/collections/{collection_id}/{service_name}.json"
+            metadata_key = f"users/{username}/collections/{collection_id}/metadata.json"
+            
+            # 한 번만 직렬화/압축 (datetime은 인코더에서 문자열로 변환)
+            try:
+                body, encoding_params, data_size = blob_codec.encode_json(data)
+            except (TypeError, ValueError) as e:
+                self.logger.error(f"리소스 데이터 직렬화 중 오류 발생: {str(e)}")
+                return False
+            
             # 메타데이터 생성
             metadata = {
                 'username': username,
                 'service_name': service_name,
                 'collection_id': collection_id,
                 'timestamp': datetime.now().isoformat(),
-                'data_size': len(str(data))
+                'data_size': data_size
             }
             
-            # JSON 직렬화 가능한지 확인
-            try:
-                json.dumps(data)
-            except TypeError as e:
-                self.logger.error(f"리소스 데이터 저장 중 오류 발생: {str(e)}")
-                
-                # datetime 객체를 문자열로 변환
-                self._convert_datetime_to_str(data)
-                
-                # 다시 시도
-                try:
-                    json.dumps(data)
-                except TypeError as e:
-                    self.logger.error(f"리소스 데이터 변환 후에도 오류 발생: {str(e)}")
-                    return False
-            
-            # 데이터 저장 경로
-            data_key = f"users/{username}/collections/{collection_id}/{service_name}.json"
-            metadata_key = f"users/{username}/collections/{collection_id}/metadata.json"
-            
             # 데이터 저장
-            self.s3_client.put_object(
+            put_response = self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=data_key,
-                Body=json.dumps(data),
-                ContentType='application/json'
+                Body=body,
+                ContentType='application/json',
+                **encoding_params
             )
+            remember_object(self.bucket_name, data_key, body, put_response.get('ETag'), encoding_params.get('ContentEncoding'))
             
             # 메타데이터 저장
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=metadata_key,
-                Body=json.dumps(metadata),
-                ContentType='application/json'
-            )
+            blob_codec.put_json(self.s3_client, self.bucket_name, metadata_key, metadata, content_type='application/json')
+            
+            # 수집 카탈로그 갱신 (수집 목록은 카탈로그만 읽음)
+            try:
+                self._get_catalog(username).update(
+                    collection_id,
+                    fields={'timestamp': metadata['timestamp']},
+                    services={service_name: summarize_service(data, data_size)}
+                )
+            except Exception as e:
+                self.logger.error(f"수집 카탈로그 갱신 중 오류 발생: {str(e)}")
             
             # 캐시 무효화
             self._invalidate_cache('collections', username)
+            self._invalidate_cache('data', username, (collection_id, f"{service_name}.json"))
+            self._invalidate_cache('data', username, (collection_id, 'metadata.json'))
             
             return True
         except Exception as e:
@@ -131,20 +119,15 @@ class ResourceDataStorage:
             Optional[Dict[str, Any]]: 조회된 데이터 또는 None
         """
         try:
-            # 캐시 확인
-            cache_key = f"{username}:{collection_id}:{service_name}"
-            if self._check_cache('data', username, cache_key):
-                self.logger.info(f"✅ 데이터 캐시 히트: {cache_key}")
-                return self.cache['data'][username][cache_key]
-            
             # 데이터 조회 경로
             data_key = f"users/{username}/collections/{collection_id}/{service_name}.json"
             metadata_key = f"users/{username}/collections/{collection_id}/metadata.json"
             
-            # 데이터 조회
+            # 데이터 조회 (서비스 데이터는 변경되지 않으므로 만료 없이 캐시)
             try:
-                data_response = self.s3_client.get_object(Bucket=self.bucket_name, Key=data_key)
-                data = json.loads(data_response['Body'].read().decode('utf-8'))
+                data, source = self._read_cached(data_key, username, (collection_id, f"{service_name}.json"),
+                                                 immutable=True, disk=True)
+                self.logger.info(f"📥 데이터 로드 ({source}): {username}:{collection_id}:{service_name}")
             except ClientError as e:
                 if e.response['Error']['Code'] == 'NoSuchKey':
                     self.logger.warning(f"데이터 파일을 찾을 수 없음: {data_key}")
@@ -152,10 +135,9 @@ class ResourceDataStorage:
                 else:
                     raise
             
-            # 메타데이터 조회
+            # 메타데이터 조회 (서비스를 저장할 때마다 바뀌므로 만료 후 ETag로 재검증)
             try:
-                metadata_response = self.s3_client.get_object(Bucket=self.bucket_name, Key=metadata_key)
-                metadata = json.loads(metadata_response['Body'].read().decode('utf-8'))
+                metadata, _ = self._read_cached(metadata_key, username, (collection_id, 'metadata.json'))
             except ClientError as e:
                 if e.response['Error']['Code'] == 'NoSuchKey':
                     self.logger.warning(f"메타데이터 파일을 찾을 수 없음: {metadata_key}")
@@ -169,9 +151,6 @@ class ResourceDataStorage:
                 'metadata': metadata
             }
             
-            # 캐시 저장
-            self._set_in_cache('data', username, result, cache_key)
-            
             return result
         except Exception as e:
             self.logger.error(f"리소스 데이터 조회 중 오류 발생: {str(e)}")
@@ -191,10 +170,9 @@ class ResourceDataStorage:
         """
         try:
             # 캐시 확인
-            cache_key = f"{username}"
-            if self._check_cache('collections', username, cache_key):
+            collections, cache_hit = self._get_from_cache('collections', username)
+            if cache_hit:
                 self.logger.info(f"✅ 컬렉션 목록 캐시 히트: {username}")
-                collections = self.cache['collections'][username][cache_key]
                 
                 # 서비스 이름으로 필터링
                 if service_name:
@@ -206,67 +184,15 @@ class ResourceDataStorage:
             self.logger.info(f"❌ 컬렉션 목록 캐시 히트 실패: {username}")
             self.logger.info(f"📥 S3에서 컬렉션 목록 조회 시작")
             
-            # 메타데이터 조회 경로
-            prefix = f"users/{username}/collections/"
-            
-            # 메타데이터 조회
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                Delimiter='/'
-            )
-            
-            collections = []
-            
-            # 컬렉션 ID 추출
-            if 'CommonPrefixes' in response:
-                for common_prefix in response['CommonPrefixes']:
-                    collection_prefix = common_prefix['Prefix']
-                    collection_id = collection_prefix.split('/')[-2]
-                    
-                    # 메타데이터 조회
-                    metadata_key = f"{collection_prefix}metadata.json"
-                    try:
-                        metadata_response = self.s3_client.get_object(Bucket=self.bucket_name, Key=metadata_key)
-                        metadata = json.loads(metadata_response['Body'].read().decode('utf-8'))
-                        
-                        # 서비스 파일 목록 조회
-                        service_files = self.s3_client.list_objects_v2(
-                            Bucket=self.bucket_name,
-                            Prefix=collection_prefix,
-                            Delimiter='/'
-                        )
-                        
-                        # 서비스 이름 추출
-                        selected_services = []
-                        if 'Contents' in service_files:
-                            for content in service_files['Contents']:
-                                key = content['Key']
-                                if key.endswith('.json') and not key.endswith('metadata.json'):
-                                    service_name = key.split('/')[-1].replace('.json', '')
-                                    selected_services.append(service_name)
-                        
-                        # 컬렉션 정보 구성
-                        collection_info = {
-                            'collection_id': collection_id,
-                            'timestamp': metadata.get('timestamp', ''),
-                            'selected_services': selected_services
-                        }
-                        
-                        collections.append(collection_info)
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == 'NoSuchKey':
-                            self.logger.warning(f"메타데이터 파일을 찾을 수 없음: {metadata_key}")
-                        else:
-                            raise
-            
-            # 시간순 정렬 (최신순)
-            collections.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+            # 카탈로그 한 번 읽기로 목록 조회 (카탈로그 도입 전 사용자는 한 번 재구성)
+            collections = self._get_catalog(username).list()
+            if collections is None:
+                collections = self.rebuild_catalog(username)
             
             # 캐시 저장
-            self._set_in_cache('collections', username, collections, cache_key)
+            self._set_in_cache('collections', username, collections)
             
-            self.logger.info(f"📊 데이터 소스: S3 (컬렉션 목록)")
+            self.logger.info(f"📊 데이터 소스: S3 (컬렉션 카탈로그)")
             
             # 서비스 이름으로 필터링
             if service_name:
@@ -278,6 +204,70 @@ class ResourceDataStorage:
             self.logger.error(f"수집 목록 조회 중 오류 발생: {str(e)}")
             return []
     
+    def rebuild_catalog(self, username: str, include_counts: bool = False) -> List[Dict[str, Any]]:
+        """
+        수집별 메타데이터와 서비스 파일 목록을 모두 읽어 사용자의 수집 카탈로그를 다시 만듭니다.
+        
+        Args:
+            username: 사용자 ID
+            include_counts: 서비스 파일까지 읽어 요약 개수를 기록할지 여부 (크기는 목록 조회 결과 사용)
+            
+        Returns:
+            List[Dict[str, Any]]: 수집 목록 (최신순)
+        """
+        prefix = f"users/{username}/collections/"
+        collections = []
+        
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter='/'):
+            for common_prefix in page.get('CommonPrefixes', []):
+                collection_prefix = common_prefix['Prefix']
+                collection_id = collection_prefix.split('/')[-2]
+                
+                # 메타데이터 조회
+                metadata_key = f"{collection_prefix}metadata.json"
+                try:
+                    metadata_response = self.s3_client.get_object(Bucket=self.bucket_name, Key=metadata_key)
+                    metadata = blob_codec.load_json(metadata_response)
+                except ClientError as e:
+                    if e.response['Error']['Code'] == 'NoSuchKey':
+                        self.logger.warning(f"메타데이터 파일을 찾을 수 없음: {metadata_key}")
+                        continue
+                    raise
+                
+                # 서비스 파일 목록 조회 (파일 크기 포함)
+                services = {}
+                service_files = self.s3_client.list_objects_v2(
+                    Bucket=self.bucket_name,
+                    Prefix=collection_prefix,
+                    Delimiter='/'
+                )
+                for content in service_files.get('Contents', []):
+                    key = content['Key']
+                    if key.endswith('.json') and not key.endswith('metadata.json'):
+                        service_data, size = None, content['Size']
+                        if include_counts:
+                            # 압축된 객체는 압축 해제한 크기를 기록
+                            service_response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                            service_body = blob_codec.read_body(service_response)
+                            service_data, size = json.loads(service_body.decode('utf-8')), len(service_body)
+                        services[key.split('/')[-1].replace('.json', '')] = summarize_service(service_data, size)
+                
+                collections.append({
+                    'collection_id': collection_id,
+                    'timestamp': metadata.get('timestamp', ''),
+                    'selected_services': sorted(services),
+                    'services': services
+                })
+        
+        # 시간순 정렬 (최신순)
+        collections.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        
+        self._get_catalog(username).replace(collections)
+        self._invalidate_cache('collections', username)
+        self.logger.info(f"수집 카탈로그 재구성 완료: 사용자={username}, 수집 {len(collections)}개")
+        return collections
+    
     def delete_collection(self, username: str, collection_id: str) -> bool:
         """
         수집 데이터 삭제
@@ -311,134 +301,107 @@ class ResourceDataStorage:
                 Delete=delete_objects
             )
             
+            forget_objects(self.bucket_name, prefix=prefix)
+            
+            # 수집 카탈로그에서 제거
+            try:
+                self._get_catalog(username).remove(collection_id)
+            except Exception as e:
+                self.logger.error(f"수집 카탈로그 갱신 중 오류 발생: {str(e)}")
+            
             # 캐시 무효화
             self._invalidate_cache('collections', username)
-            self._invalidate_cache('data', username, f"{username}:{collection_id}")
+            self._invalidate_cache('data', username, (collection_id,))
             
             return True
         except Exception as e:
             self.logger.error(f"수집 데이터 삭제 중 오류 발생: {str(e)}")
             return False
     
-    def _check_cache(self, cache_type: str, username: str, cache_key: str = None) -> bool:
+    def _get_catalog(self, username: str) -> CollectionCatalog:
         """
-        캐시 확인
+        사용자별 수집 카탈로그
         
         Args:
-            cache_type: 캐시 유형 ('collections', 'metadata', 'data')
             username: 사용자 ID
-            cache_key: 캐시 키 (선택 사항)
             
         Returns:
-            bool: 캐시 존재 여부
+            CollectionCatalog: 수집 카탈로그
         """
-        # 사용자 캐시 초기화
-        if username not in self.cache[cache_type]:
-            self.cache[cache_type][username] = {}
-            self.cache_timestamp[cache_type][username] = {}
-            return False
-        
-        # 캐시 키가 없는 경우
-        if cache_key is None:
-            cache_key = username
-        
-        # 캐시 존재 여부 확인
-        if cache_key not in self.cache[cache_type][username]:
-            return False
-        
-        # 캐시 만료 확인
-        if cache_key not in self.cache_timestamp[cache_type][username]:
-            return False
-        
-        # 캐시 만료 시간 확인
-        if time.time() - self.cache_timestamp[cache_type][username][cache_key] > self.cache_ttl:
-            # 캐시 삭제
-            del self.cache[cache_type][username][cache_key]
-            del self.cache_timestamp[cache_type][username][cache_key]
-            return False
+        return CollectionCatalog(self.s3_client, self.bucket_name, f"users/{username}/collections_catalog.json")
+    
+    def _read_cached(self, key: str, username: str, cache_key: Tuple[str, ...], immutable: bool = False,
+                     disk: bool = False) -> Tuple[Any, str]:
+        """
+        캐시를 먼저 확인하고 만료된 항목은 ETag로 재검증하여 S3 객체를 읽습니다.
         
-        return True
+        Args:
+            key: S3 객체 키
+            username: 사용자 ID
+            cache_key: 캐시 키
+            immutable: 변경되지 않는 객체 여부
+            disk: 로컬 디스크 캐시 사용 여부
+            
+        Returns:
+            Tuple[Any, str]: (데이터, 출처)
+        """
+        return read_cached(self.s3_client, self.bucket_name, key, self.CACHE_NAMESPACES['data'], username,
+                           cache_key, immutable=immutable, disk=disk)
     
-    def _set_in_cache(self, cache_type: str, username: str, data: Any, cache_key: str = None, sub_key: str = None) -> None:
+    def _get_from_cache(self, cache_type: str, username: str, cache_key: Tuple[str, ...] = ()) -> Tuple[Any, bool]:
         """
-        캐시 저장
+        캐시 조회
         
         Args:
-            cache_type: 캐시 유형 ('collections', 'metadata', 'data')
+            cache_type: 캐시 유형 ('collections', 'data')
             username: 사용자 ID
-            data: 저장할 데이터
             cache_key: 캐시 키 (선택 사항)
-            sub_key: 하위 키 (선택 사항)
+            
+        Returns:
+            Tuple[Any, bool]: (캐시된 데이터, 적중 여부)
         """
-        # 사용자 캐시 초기화
-        if username not in self.cache[cache_type]:
-            self.cache[cache_type][username] = {}
-            self.cache_timestamp[cache_type][username] = {}
-        
-        # 캐시 키가 없는 경우
-        if cache_key is None:
-            cache_key = username
-        
-        # 하위 키가 있는 경우
-        if sub_key:
-            if cache_key not in self.cache[cache_type][username]:
-                self.cache[cache_type][username][cache_key] = {}
-            
-            self.cache[cache_type][username][cache_key][sub_key] = data
-        else:
-            self.cache[cache_type][username][cache_key] = data
-        
-        # 캐시 타임스탬프 갱신
-        self.cache_timestamp[cache_type][username][cache_key] = time.time()
-        
-        self.logger.info(f"💾 {cache_type} 캐시 저장 완료: {username}")
+        return get_storage_cache().get(self.CACHE_NAMESPACES[cache_type], username, cache_key)
     
-    def _invalidate_cache(self, cache_type: str, username: str, cache_key_prefix: str = None) -> None:
+    def _set_in_cache(self, cache_type: str, username: str, data: Any, cache_key: Tuple[str, ...] = (), size: int = None) -> None:
         """
-        캐시 무효화
+        캐시 저장
         
         Args:
-            cache_type: 캐시 유형 ('collections', 'metadata', 'data')
+            cache_type: 캐시 유형 ('collections', 'data')
             username: 사용자 ID
-            cache_key_prefix: 캐시 키 접두사 (선택 사항)
+            data: 저장할 데이터
+            cache_key: 캐시 키 (선택 사항)
+            size: 데이터 크기(바이트) (없으면 추정)
         """
-        # 사용자 캐시가 없는 경우
-        if username not in self.cache[cache_type]:
-            return
-        
-        # 캐시 키 접두사가 있는 경우
-        if cache_key_prefix:
-            # 접두사로 시작하는 모든 캐시 키 삭제
-            keys_to_delete = []
-            for key in self.cache[cache_type][username]:
-                if key.startswith(cache_key_prefix):
-                    keys_to_delete.append(key)
-            
-            for key in keys_to_delete:
-                del self.cache[cache_type][username][key]
-                if key in self.cache_timestamp[cache_type][username]:
-                    del self.cache_timestamp[cache_type][username][key]
-        else:
-            # 모든 캐시 삭제
-            self.cache[cache_type][username] = {}
-            self.cache_timestamp[cache_type][username] = {}
+        get_storage_cache().set(self.CACHE_NAMESPACES[cache_type], username, cache_key, data, size=size)
+        self.logger.info(f"💾 {cache_type} 캐시 저장 완료: {username}")
     
-    def _convert_datetime_to_str(self, data: Any) -> None:
+    def _invalidate_cache(self, cache_type: str, username: str, cache_key_prefix: Tuple[str, ...] = ()) -> None:
         """
-        데이터 내의 datetime 객체를 문자열로 변환
+        캐시 무효화
         
         Args:
-            data: 변환할 데이터
+            cache_type: 캐시 유형 ('collections', 'data')
+            username: 사용자 ID
+            cache_key_prefix: 캐시 키 접두사 (선택 사항, 없으면 해당 유형의 사용자 캐시 전체)
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, datetime):
-                    data[key] = value.isoformat()
-                elif isinstance(value, (dict, list)):
-                    self._convert_datetime_to_str(value)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, datetime):
-                    data[i] = item.isoformat()
-                elif isinstance(item, (dict, list)):
-                    self._convert_datetime_to_str(item)
\ No newline at end of file
+        get_storage_cache().invalidate(username, self.CACHE_NAMESPACES[cache_type], prefix=cache_key_prefix)
+
+
+_resource_data_storage = None
+_resource_data_storage_lock = threading.Lock()
+
+
+def get_resource_data_storage() -> ResourceDataStorage:
+    """
+    프로세스 전역 리소스 데이터 저장소를 반환합니다. (버킷 확인은 처음 한 번만 수행)
+
+    Returns:
+        ResourceDataStorage: 리소스 데이터 저장소 객체
+    """
+    global _resource_data_storage
+    if _resource_data_storage is None:
+        with _resource_data_storage_lock:
+            if _resource_data_storage is None:
+                _resource_data_storage = ResourceDataStorage()
+    return _resource_data_storage
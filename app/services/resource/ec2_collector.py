@@ -4,12 +4,20 @@ import pytz
 import logging
 from app.services.resource.common.base_collector import BaseCollector
 from app.services.resource.common.resource_model import EC2Instance
+from app.services.metrics_engine import MetricsEngine
+from app.services.metric_analytics import align_series
+
+# 일괄 조회 필터에 넣는 ID 개수 (EC2 API 필터 값 최대 200개)
+FILTER_CHUNK_SIZE = 200
 
 class EC2Collector(BaseCollector):
     """
     EC2 인스턴스 데이터 수집기
     """
     
+    SERVICE_NAME = 'ec2'
+    ITEMS_KEY = 'instances'
+    
     def _init_clients(self) -> None:
         """
         필요한 AWS 클라이언트 초기화
@@ -18,10 +26,7 @@ class EC2Collector(BaseCollector):
         self.cloudwatch = self.get_client('cloudwatch')
         
         # pricing 클라이언트는 us-east-1 리전에서만 사용 가능
-        # 별도의 세션을 생성하여 pricing 클라이언트 초기화
-        import boto3
-        pricing_session = boto3.Session(region_name='us-east-1')
-        self.pricing_client = pricing_session.client('pricing')
+        self.pricing_client = self.get_client('pricing', region_name='us-east-1')
     
     def collect(self, collection_id: str = None) -> Dict[str, Any]:
         """
@@ -47,10 +52,21 @@ class EC2Collector(BaseCollector):
             # 리전 내 가용 영역 정보 수집
             az_info = self._get_availability_zones()
             
+            # 모든 인스턴스의 CloudWatch 메트릭을 GetMetricData로 일괄 조회
+            instance_metrics = self._fetch_instance_metrics(response['Reservations'], current_time, log_prefix)
+            
+            # 인스턴스가 사용하는 보안 그룹과 연결된 볼륨을 일괄 조회 (인스턴스별 조회 없이 ID로 결합)
+            security_group_index = self._prefetch_security_groups(response['Reservations'], log_prefix)
+            volume_index = self._prefetch_volumes(response['Reservations'], log_prefix)
+            
             for reservation in response['Reservations']:
                 for instance_data in reservation['Instances']:
                     # EC2Instance 객체 생성
-                    instance = self._process_instance(instance_data, current_time, log_prefix)
+                    instance = self._process_instance(
+                        instance_data, current_time, log_prefix,
+                        instance_metrics.get(instance_data['InstanceId'], {}),
+                        security_group_index, volume_index
+                    )
                     
                     # datetime 객체를 문자열로 변환
                     instance_dict = instance.to_dict()
@@ -142,7 +158,62 @@ class EC2Collector(BaseCollector):
             self.logger.error(f"가용 영역 정보 수집 중 오류 발생: {str(e)}")
             return {}
     
-    def _process_instance(self, instance_data: Dict[str, Any], current_time: datetime, log_prefix: str) -> EC2Instance:
+    def _fetch_instance_metrics(self, reservations: List[Dict[str, Any]], current_time: datetime,
+                                log_prefix: str) -> Dict[str, Dict[str, Dict[str, list]]]:
+        """
+        인스턴스 메트릭 일괄 조회
+        
+        실행 중인 인스턴스는 CPU(24시간)와 네트워크/메모리/디스크(1시간), 중지된 인스턴스는 상태 검사(1일)를
+        조회 기간별로 묶어 GetMetricData 요청 몇 번으로 가져옵니다.
+        
+        Args:
+            reservations: describe_instances 예약 목록
+            current_time: 현재 시간
+            log_prefix: 로그 접두사
+            
+        Returns:
+            Dict: {인스턴스 ID: {'메트릭이름.통계': {'timestamps': [...], 'values': [...]}}}
+        """
+        daily = MetricsEngine(self.cloudwatch)
+        recent = MetricsEngine(self.cloudwatch)
+        
+        for reservation in reservations:
+            for instance_data in reservation['Instances']:
+                instance_id = instance_data['InstanceId']
+                state = instance_data['State']['Name']
+                dimensions = [{'Name': 'InstanceId', 'Value': instance_id}]
+                
+                if state == 'stopped':
+                    daily.add_statistics(instance_id, 'AWS/EC2', 'StatusCheckFailed', dimensions, ['Maximum'], 3600)
+                elif state == 'running':
+                    # CPU는 1시간 간격, 나머지는 5분 간격
+                    daily.add_statistics(instance_id, 'AWS/EC2', 'CPUUtilization', dimensions,
+                                         ['Average', 'Maximum', 'Minimum'], 3600)
+                    recent.add_statistics(instance_id, 'AWS/EC2', 'NetworkIn', dimensions, ['Average', 'Sum'], 300)
+                    recent.add_statistics(instance_id, 'AWS/EC2', 'NetworkOut', dimensions, ['Average', 'Sum'], 300)
+                    # 메모리/디스크는 CloudWatch 에이전트가 설치된 경우에만 데이터가 있음
+                    recent.add_statistics(instance_id, 'CWAgent', 'mem_used_percent', dimensions, ['Average'], 300)
+                    recent.add_statistics(instance_id, 'CWAgent', 'disk_used_percent',
+                                          dimensions + [{'Name': 'path', 'Value': '/'}], ['Average'], 300)
+        
+        instance_metrics = {}
+        for engine, start_time in ((daily, current_time - timedelta(hours=24)),
+                                   (recent, current_time - timedelta(hours=1))):
+            if not engine.get_stats()['queries']:
+                continue
+            try:
+                for instance_id, series in engine.fetch(start_time, current_time).items():
+                    instance_metrics.setdefault(instance_id, {}).update(series)
+            except Exception as e:
+                self.logger.error(f"{log_prefix}인스턴스 메트릭 일괄 조회 중 오류 발생: {str(e)}")
+        
+        self.logger.debug(f"{log_prefix}인스턴스 메트릭 일괄 조회 완료: {len(instance_metrics)}개 인스턴스")
+        return instance_metrics
+    
+    def _process_instance(self, instance_data: Dict[str, Any], current_time: datetime, log_prefix: str,
+                          metrics: Dict[str, Dict[str, list]] = None,
+                          security_group_index: Dict[str, Dict[str, Any]] = None,
+                          volume_index: Dict[str, List[Dict[str, Any]]] = None) -> EC2Instance:
         """
         EC2 인스턴스 데이터 처리
         
@@ -150,6 +221,9 @@ class EC2Collector(BaseCollector):
             instance_data: EC2 인스턴스 원시 데이터
             current_time: 현재 시간
             log_prefix: 로그 접두사
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
+            security_group_index: 일괄 조회한 보안 그룹 정보 {보안 그룹 ID: 보안 그룹 정보}
+            volume_index: 일괄 조회한 볼륨 정보 {인스턴스 ID: [볼륨 정보]}
             
         Returns:
             EC2Instance: 처리된 EC2 인스턴스 객체
@@ -189,341 +263,333 @@ class EC2Collector(BaseCollector):
             instance.network_interfaces.append(ni_info)
         
         # 보안 그룹 정보 수집
-        self._collect_security_groups(instance, instance_data, log_prefix)
+        self._collect_security_groups(instance, instance_data, log_prefix, security_group_index or {})
+        
+        metrics = metrics or {}
         
         # 상태 변경 시간 수집 (중지된 인스턴스만)
         if instance.state == 'stopped':
-            self._collect_state_transition_time(instance, current_time, log_prefix)
+            self._collect_state_transition_time(instance, metrics, current_time, log_prefix)
         
         # CPU 사용률 데이터 수집 (실행 중인 인스턴스만)
         if instance.state == 'running':
-            self._collect_cpu_metrics(instance, current_time, log_prefix)
-            self._collect_network_metrics(instance, current_time, log_prefix)
-            self._collect_memory_metrics(instance, current_time, log_prefix)
-            self._collect_disk_metrics(instance, current_time, log_prefix)
+            self._collect_cpu_metrics(instance, metrics, log_prefix)
+            self._collect_network_metrics(instance, metrics, log_prefix)
+            self._collect_memory_metrics(instance, metrics, log_prefix)
+            self._collect_disk_metrics(instance, metrics, log_prefix)
         
         # EBS 볼륨 정보 수집
-        self._collect_volumes(instance, log_prefix)
+        self._collect_volumes(instance, log_prefix, volume_index or {})
         
         return instance
     
-    def _collect_security_groups(self, instance: EC2Instance, instance_data: Dict[str, Any], log_prefix: str) -> None:
+    def _prefetch_security_groups(self, reservations: List[Dict[str, Any]], log_prefix: str) -> Dict[str, Dict[str, Any]]:
+        """
+        인스턴스가 사용하는 보안 그룹 일괄 조회
+        
+        보안 그룹 ID를 중복 없이 모아 group-id 필터로 페이지 단위 조회하므로,
+        인스턴스 수에 관계없이 보안 그룹 200개당 요청 한 번이면 됩니다.
+        
+        Args:
+            reservations: describe_instances 예약 목록
+            log_prefix: 로그 접두사
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: {보안 그룹 ID: 보안 그룹 정보}
+        """
+        group_ids = sorted({
+            sg['GroupId']
+            for reservation in reservations
+            for instance_data in reservation['Instances']
+            for sg in instance_data.get('SecurityGroups', [])
+        })
+        
+        security_group_index = {}
+        try:
+            paginator = self.ec2_client.get_paginator('describe_security_groups')
+            for i in range(0, len(group_ids), FILTER_CHUNK_SIZE):
+                chunk = group_ids[i:i + FILTER_CHUNK_SIZE]
+                for page in paginator.paginate(Filters=[{'Name': 'group-id', 'Values': chunk}]):
+                    for sg in page.get('SecurityGroups', []):
+                        security_group_index[sg['GroupId']] = self._format_security_group(sg)
+        except Exception as e:
+            self.logger.error(f"{log_prefix}보안 그룹 일괄 조회 중 오류 발생: {str(e)}")
+        
+        self.logger.debug(f"{log_prefix}보안 그룹 일괄 조회 완료: {len(security_group_index)}/{len(group_ids)}개")
+        return security_group_index
+    
+    def _format_security_group(self, sg: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        보안 그룹 원시 데이터를 인스턴스에 붙일 보안 그룹 정보로 변환
+        
+        Args:
+            sg: describe_security_groups 보안 그룹 데이터
+            
+        Returns:
+            Dict[str, Any]: 보안 그룹 정보
+        """
+        sg_info = {
+            'group_id': sg['GroupId'],
+            'group_name': sg.get('GroupName', ''),
+            'description': sg.get('Description', ''),
+            'inbound_rules': [],
+            'outbound_rules': []
+        }
+        
+        # 인바운드 규칙
+        for rule in sg.get('IpPermissions', []):
+            rule_info = {
+                'protocol': rule.get('IpProtocol', 'all'),
+                'from_port': rule.get('FromPort', 0),
+                'to_port': rule.get('ToPort', 0),
+                'ip_ranges': [ip.get('CidrIp') for ip in rule.get('IpRanges', [])],
+                'ipv6_ranges': [ip.get('CidrIpv6') for ip in rule.get('Ipv6Ranges', [])]
+            }
+            sg_info['inbound_rules'].append(rule_info)
+        
+        # 아웃바운드 규칙
+        for rule in sg.get('IpPermissionsEgress', []):
+            rule_info = {
+                'protocol': rule.get('IpProtocol', 'all'),
+                'from_port': rule.get('FromPort', 0),
+                'to_port': rule.get('ToPort', 0),
+                'ip_ranges': [ip.get('CidrIp') for ip in rule.get('IpRanges', [])],
+                'ipv6_ranges': [ip.get('CidrIpv6') for ip in rule.get('Ipv6Ranges', [])]
+            }
+            sg_info['outbound_rules'].append(rule_info)
+        
+        return sg_info
+    
+    def _collect_security_groups(self, instance: EC2Instance, instance_data: Dict[str, Any], log_prefix: str,
+                                 security_group_index: Dict[str, Dict[str, Any]]) -> None:
         """
-        보안 그룹 정보 수집
+        보안 그룹 정보 수집 (일괄 조회한 보안 그룹과 결합)
         
         Args:
             instance: EC2 인스턴스 객체
             instance_data: EC2 인스턴스 원시 데이터
             log_prefix: 로그 접두사
+            security_group_index: {보안 그룹 ID: 보안 그룹 정보}
         """
         self.logger.debug(f"{log_prefix}보안 그룹 정보 수집 중: {instance.id}")
-        try:
-            for sg in instance_data.get('SecurityGroups', []):
-                sg_details = self.ec2_client.describe_security_groups(GroupIds=[sg['GroupId']])
-                if sg_details['SecurityGroups']:
-                    sg_info = {
-                        'group_id': sg['GroupId'],
-                        'group_name': sg['GroupName'],
-                        'description': sg_details['SecurityGroups'][0].get('Description', ''),
-                        'inbound_rules': [],
-                        'outbound_rules': []
-                    }
-                    
-                    # 인바운드 규칙
-                    for rule in sg_details['SecurityGroups'][0].get('IpPermissions', []):
-                        rule_info = {
-                            'protocol': rule.get('IpProtocol', 'all'),
-                            'from_port': rule.get('FromPort', 0),
-                            'to_port': rule.get('ToPort', 0),
-                            'ip_ranges': [ip.get('CidrIp') for ip in rule.get('IpRanges', [])],
-                            'ipv6_ranges': [ip.get('CidrIpv6') for ip in rule.get('Ipv6Ranges', [])]
-                        }
-                        sg_info['inbound_rules'].append(rule_info)
-                    
-                    # 아웃바운드 규칙
-                    for rule in sg_details['SecurityGroups'][0].get('IpPermissionsEgress', []):
-                        rule_info = {
-                            'protocol': rule.get('IpProtocol', 'all'),
-                            'from_port': rule.get('FromPort', 0),
-                            'to_port': rule.get('ToPort', 0),
-                            'ip_ranges': [ip.get('CidrIp') for ip in rule.get('IpRanges', [])],
-                            'ipv6_ranges': [ip.get('CidrIpv6') for ip in rule.get('Ipv6Ranges', [])]
-                        }
-                        sg_info['outbound_rules'].append(rule_info)
-                    
-                    instance.security_groups.append(sg_info)
-        except Exception as e:
-            self.logger.error(f"{log_prefix}보안 그룹 정보 수집 중 오류 발생: {str(e)}")
+        for sg in instance_data.get('SecurityGroups', []):
+            sg_info = security_group_index.get(sg['GroupId'])
+            if sg_info:
+                instance.security_groups.append(sg_info)
     
-    def _collect_state_transition_time(self, instance: EC2Instance, current_time: datetime, log_prefix: str) -> None:
+    def _collect_state_transition_time(self, instance: EC2Instance, metrics: Dict[str, Dict[str, list]],
+                                       current_time: datetime, log_prefix: str) -> None:
         """
         인스턴스 상태 변경 시간 수집
         
         Args:
             instance: EC2 인스턴스 객체
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
             current_time: 현재 시간
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}상태 변경 시간 수집 중: {instance.id}")
         try:
-            # 시간 파라미터 설정
-            end_time = current_time
-            start_time = end_time - timedelta(days=1)  # 1일로 축소
-            
-            status_checks = self.cloudwatch.get_metric_data(
-                MetricDataQueries=[{
-                    'Id': 'status',
-                    'MetricStat': {
-                        'Metric': {
-                            'Namespace': 'AWS/EC2',
-                            'MetricName': 'StatusCheckFailed',
-                            'Dimensions': [{'Name': 'InstanceId', 'Value': instance.id}]
-                        },
-                        'Period': 3600,
-                        'Stat': 'Maximum'
-                    },
-                    'ReturnData': True
-                }],
-                StartTime=start_time,
-                EndTime=end_time
-            )
-            
-            if status_checks['MetricDataResults'][0]['Values']:
-                instance.state_transition_time = current_time - timedelta(
-                    hours=len(status_checks['MetricDataResults'][0]['Values'])
-                )
+            values = metrics.get('StatusCheckFailed.Maximum', {}).get('values', [])
+            if values:
+                instance.state_transition_time = current_time - timedelta(hours=len(values))
         except Exception as e:
             self.logger.error(f"{log_prefix}상태 변경 시간 수집 중 오류 발생: {str(e)}")
     
-    def _collect_cpu_metrics(self, instance: EC2Instance, current_time: datetime, log_prefix: str) -> None:
+    def _collect_cpu_metrics(self, instance: EC2Instance, metrics: Dict[str, Dict[str, list]], log_prefix: str) -> None:
         """
         CPU 사용률 데이터 수집
         
         Args:
             instance: EC2 인스턴스 객체
-            current_time: 현재 시간
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}CPU 메트릭 수집 중: {instance.id}")
         try:
-            # 시간 파라미터 설정 - 24시간으로 축소
-            end_time = current_time
-            start_time = end_time - timedelta(hours=24)
-                
-            cpu_metrics = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='CPUUtilization',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=3600,  # 1시간 간격
-                Statistics=['Average', 'Maximum', 'Minimum']
-            )
+            # 추세 데이터 (최대 24개 포인트)
+            cpu = align_series(metrics, ['CPUUtilization.Average', 'CPUUtilization.Maximum', 'CPUUtilization.Minimum'],
+                               limit=24)
             
             # CPU 메트릭 수집
-            if cpu_metrics['Datapoints']:
+            if cpu['timestamps']:
                 # 최신 데이터포인트를 현재 CPU 사용률로 설정
-                latest_point = max(cpu_metrics['Datapoints'], key=lambda x: x['Timestamp'])
-                instance.cpu_utilization = latest_point['Average']
-                instance.cpu_max = latest_point['Maximum']
-                instance.cpu_min = latest_point['Minimum']
+                instance.cpu_utilization = cpu['CPUUtilization.Average'][-1]
+                instance.cpu_max = cpu['CPUUtilization.Maximum'][-1]
+                instance.cpu_min = cpu['CPUUtilization.Minimum'][-1]
                 
-                # 추세 데이터 (최대 24개 포인트)
-                sorted_points = sorted(cpu_metrics['Datapoints'], key=lambda x: x['Timestamp'])
                 instance.cpu_trend = [
                     {
-                        'timestamp': point['Timestamp'].isoformat(),
-                        'average': point['Average'],
-                        'maximum': point['Maximum'],
-                        'minimum': point['Minimum']
+                        'timestamp': timestamp.isoformat(),
+                        'average': average,
+                        'maximum': maximum,
+                        'minimum': minimum
                     }
-                    for point in sorted_points[-24:]
+                    for timestamp, average, maximum, minimum in zip(
+                        cpu['timestamps'], cpu['CPUUtilization.Average'],
+                        cpu['CPUUtilization.Maximum'], cpu['CPUUtilization.Minimum']
+                    )
                 ]
         except Exception as e:
             self.logger.error(f"{log_prefix}CPU 메트릭 수집 중 오류 발생: {str(e)}")
     
-    def _collect_memory_metrics(self, instance: EC2Instance, current_time: datetime, log_prefix: str) -> None:
+    def _collect_memory_metrics(self, instance: EC2Instance, metrics: Dict[str, Dict[str, list]], log_prefix: str) -> None:
         """
         메모리 사용률 데이터 수집 (CloudWatch 에이전트 필요)
         
         Args:
             instance: EC2 인스턴스 객체
-            current_time: 현재 시간
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}메모리 메트릭 수집 중: {instance.id}")
-        try:
-            # 시간 파라미터 설정
-            end_time = current_time
-            start_time = end_time - timedelta(hours=1)
-            
-            # 메모리 사용률 메트릭 (CloudWatch 에이전트 필요)
-            memory_metrics = self.cloudwatch.get_metric_statistics(
-                Namespace='CWAgent',
-                MetricName='mem_used_percent',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5분 간격
-                Statistics=['Average']
-            )
-            
-            if memory_metrics['Datapoints']:
-                latest_point = max(memory_metrics['Datapoints'], key=lambda x: x['Timestamp'])
-                instance.memory_utilization = latest_point['Average']
-        except Exception as e:
-            # CloudWatch 에이전트가 설치되지 않은 경우 무시
-            self.logger.debug(f"{log_prefix}메모리 메트릭 수집 중 오류 발생 (무시): {str(e)}")
+        values = metrics.get('mem_used_percent.Average', {}).get('values', [])
+        if values:
+            instance.memory_utilization = values[-1]
     
-    def _collect_disk_metrics(self, instance: EC2Instance, current_time: datetime, log_prefix: str) -> None:
+    def _collect_disk_metrics(self, instance: EC2Instance, metrics: Dict[str, Dict[str, list]], log_prefix: str) -> None:
         """
         디스크 사용률 데이터 수집 (CloudWatch 에이전트 필요)
         
         Args:
             instance: EC2 인스턴스 객체
-            current_time: 현재 시간
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}디스크 메트릭 수집 중: {instance.id}")
-        try:
-            # 시간 파라미터 설정
-            end_time = current_time
-            start_time = end_time - timedelta(hours=1)
-            
-            # 디스크 사용률 메트릭 (CloudWatch 에이전트 필요)
-            disk_metrics = self.cloudwatch.get_metric_statistics(
-                Namespace='CWAgent',
-                MetricName='disk_used_percent',
-                Dimensions=[
-                    {'Name': 'InstanceId', 'Value': instance.id},
-                    {'Name': 'path', 'Value': '/'}
-                ],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5분 간격
-                Statistics=['Average']
-            )
-            
-            if disk_metrics['Datapoints']:
-                latest_point = max(disk_metrics['Datapoints'], key=lambda x: x['Timestamp'])
-                instance.disk_utilization = latest_point['Average']
-        except Exception as e:
-            # CloudWatch 에이전트가 설치되지 않은 경우 무시
-            self.logger.debug(f"{log_prefix}디스크 메트릭 수집 중 오류 발생 (무시): {str(e)}")
+        values = metrics.get('disk_used_percent.Average', {}).get('values', [])
+        if values:
+            instance.disk_utilization = values[-1]
     
-    def _collect_network_metrics(self, instance: EC2Instance, current_time: datetime, log_prefix: str) -> None:
+    def _collect_network_metrics(self, instance: EC2Instance, metrics: Dict[str, Dict[str, list]], log_prefix: str) -> None:
         """
         네트워크 메트릭 수집
         
         Args:
             instance: EC2 인스턴스 객체
-            current_time: 현재 시간
+            metrics: 일괄 조회한 인스턴스 메트릭 시계열
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}네트워크 메트릭 수집 중: {instance.id}")
         try:
-            # 시간 파라미터 설정
-            end_time = current_time
-            start_time = end_time - timedelta(hours=1)
-            
-            # NetworkIn 메트릭
-            network_in = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='NetworkIn',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5분 간격
-                Statistics=['Average', 'Sum']
-            )
-            
-            # NetworkOut 메트릭
-            network_out = self.cloudwatch.get_metric_statistics(
-                Namespace='AWS/EC2',
-                MetricName='NetworkOut',
-                Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5분 간격
-                Statistics=['Average', 'Sum']
-            )
+            network_in = metrics.get('NetworkIn.Average', {}).get('values', [])
+            network_in_sum = metrics.get('NetworkIn.Sum', {}).get('values', [])
+            network_out = metrics.get('NetworkOut.Average', {}).get('values', [])
+            network_out_sum = metrics.get('NetworkOut.Sum', {}).get('values', [])
             
             # 최신 데이터 저장 (MB 단위로 변환)
-            if network_in['Datapoints']:
-                latest_in = max(network_in['Datapoints'], key=lambda x: x['Timestamp'])
-                instance.network_in = latest_in['Average'] / (1024 * 1024)  # Bytes to MB
-                instance.network_in_sum = latest_in['Sum'] / (1024 * 1024)  # Bytes to MB
+            if network_in:
+                instance.network_in = network_in[-1] / (1024 * 1024)  # Bytes to MB
+                instance.network_in_sum = network_in_sum[-1] / (1024 * 1024) if network_in_sum else 0
                 
-            if network_out['Datapoints']:
-                latest_out = max(network_out['Datapoints'], key=lambda x: x['Timestamp'])
-                instance.network_out = latest_out['Average'] / (1024 * 1024)  # Bytes to MB
-                instance.network_out_sum = latest_out['Sum'] / (1024 * 1024)  # Bytes to MB
+            if network_out:
+                instance.network_out = network_out[-1] / (1024 * 1024)  # Bytes to MB
+                instance.network_out_sum = network_out_sum[-1] / (1024 * 1024) if network_out_sum else 0
                 
-            # 네트워크 추세 데이터
-            if network_in['Datapoints'] and network_out['Datapoints']:
-                in_points = sorted(network_in['Datapoints'], key=lambda x: x['Timestamp'])
-                out_points = sorted(network_out['Datapoints'], key=lambda x: x['Timestamp'])
+            # 네트워크 추세 데이터 (공통 타임스탬프 축으로 정렬)
+            if network_in and network_out:
+                # 최근 1시간 (5분 간격 = 12개 포인트)
+                trend = align_series(metrics, ['NetworkIn.Average', 'NetworkOut.Average'], limit=12)
                 
-                # 타임스탬프 매칭
-                timestamps = sorted(set([p['Timestamp'] for p in in_points + out_points]))
-                
-                instance.network_trend = []
-                for ts in timestamps[-12:]:  # 최근 1시간 (5분 간격 = 12개 포인트)
-                    in_point = next((p for p in in_points if p['Timestamp'] == ts), None)
-                    out_point = next((p for p in out_points if p['Timestamp'] == ts), None)
-                    
-                    trend_point = {
-                        'timestamp': ts.isoformat(),
-                        'in': in_point['Average'] / (1024 * 1024) if in_point else 0,
-                        'out': out_point['Average'] / (1024 * 1024) if out_point else 0
+                instance.network_trend = [
+                    {
+                        'timestamp': timestamp.isoformat(),
+                        'in': in_value / (1024 * 1024) if in_value is not None else 0,
+                        'out': out_value / (1024 * 1024) if out_value is not None else 0
                     }
-                    instance.network_trend.append(trend_point)
+                    for timestamp, in_value, out_value in zip(
+                        trend['timestamps'], trend['NetworkIn.Average'], trend['NetworkOut.Average']
+                    )
+                ]
                 
         except Exception as e:
             self.logger.error(f"{log_prefix}네트워크 메트릭 수집 중 오류 발생: {str(e)}")
     
-    def _collect_volumes(self, instance: EC2Instance, log_prefix: str) -> None:
+    def _prefetch_volumes(self, reservations: List[Dict[str, Any]], log_prefix: str) -> Dict[str, List[Dict[str, Any]]]:
         """
-        EBS 볼륨 정보 수집
+        인스턴스에 연결된 EBS 볼륨 일괄 조회
+        
+        인스턴스 ID를 attachment.instance-id 필터로 묶어 페이지 단위 조회하고 인스턴스 ID별 색인을 만듭니다.
         
         Args:
-            instance: EC2 인스턴스 객체
+            reservations: describe_instances 예약 목록
             log_prefix: 로그 접두사
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: {인스턴스 ID: [볼륨 정보]}
         """
-        self.logger.debug(f"{log_prefix}볼륨 정보 수집 중: {instance.id}")
+        instance_ids = [
+            instance_data['InstanceId']
+            for reservation in reservations
+            for instance_data in reservation['Instances']
+        ]
+        
+        volume_index = {}
+        volume_count = 0
         try:
-            volumes = self.ec2_client.describe_volumes(
-                Filters=[{'Name': 'attachment.instance-id', 'Values': [instance.id]}]
-            )
-            
-            # 필요한 볼륨 정보만 저장
-            for volume in volumes.get('Volumes', []):
-                volume_info = {
-                    'volume_id': volume['VolumeId'],
-                    'size': volume['Size'],
-                    'volume_type': volume['VolumeType'],
-                    'iops': volume.get('Iops'),
-                    'throughput': volume.get('Throughput'),
-                    'encrypted': volume['Encrypted'],
-                    'state': volume['State'],
-                    'create_time': volume['CreateTime'].isoformat(),
-                    'attachments': []
-                }
-                
-                # 볼륨 연결 정보
-                for attachment in volume.get('Attachments', []):
-                    attachment_info = {
-                        'device': attachment.get('Device'),
-                        'state': attachment.get('State'),
-                        'attach_time': attachment.get('AttachTime').isoformat() if attachment.get('AttachTime') else None,
-                        'delete_on_termination': attachment.get('DeleteOnTermination', False)
-                    }
-                    volume_info['attachments'].append(attachment_info)
-                
-                # 볼륨 태그
-                volume_info['tags'] = volume.get('Tags', [])
-                
-                instance.volumes.append(volume_info)
-                
+            paginator = self.ec2_client.get_paginator('describe_volumes')
+            for i in range(0, len(instance_ids), FILTER_CHUNK_SIZE):
+                chunk = instance_ids[i:i + FILTER_CHUNK_SIZE]
+                for page in paginator.paginate(Filters=[{'Name': 'attachment.instance-id', 'Values': chunk}]):
+                    for volume in page.get('Volumes', []):
+                        volume_info = self._format_volume(volume)
+                        volume_count += 1
+                        # 다중 연결 볼륨은 연결된 인스턴스마다 추가
+                        for attached_id in {attachment.get('InstanceId') for attachment in volume.get('Attachments', [])}:
+                            if attached_id:
+                                volume_index.setdefault(attached_id, []).append(volume_info)
         except Exception as e:
-            self.logger.error(f"{log_prefix}볼륨 정보 수집 중 오류 발생: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"{log_prefix}볼륨 일괄 조회 중 오류 발생: {str(e)}")
+        
+        self.logger.debug(f"{log_prefix}볼륨 일괄 조회 완료: 볼륨 {volume_count}개, 인스턴스 {len(volume_index)}개")
+        return volume_index
+    
+    def _format_volume(self, volume: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        볼륨 원시 데이터를 인스턴스에 붙일 볼륨 정보로 변환 (필요한 정보만 저장)
+        
+        Args:
+            volume: describe_volumes 볼륨 데이터
+            
+        Returns:
+            Dict[str, Any]: 볼륨 정보
+        """
+        volume_info = {
+            'volume_id': volume['VolumeId'],
+            'size': volume['Size'],
+            'volume_type': volume['VolumeType'],
+            'iops': volume.get('Iops'),
+            'throughput': volume.get('Throughput'),
+            'encrypted': volume['Encrypted'],
+            'state': volume['State'],
+            'create_time': volume['CreateTime'].isoformat(),
+            'attachments': []
+        }
+        
+        # 볼륨 연결 정보
+        for attachment in volume.get('Attachments', []):
+            attachment_info = {
+                'device': attachment.get('Device'),
+                'state': attachment.get('State'),
+                'attach_time': attachment.get('AttachTime').isoformat() if attachment.get('AttachTime') else None,
+                'delete_on_termination': attachment.get('DeleteOnTermination', False)
+            }
+            volume_info['attachments'].append(attachment_info)
+        
+        # 볼륨 태그
+        volume_info['tags'] = volume.get('Tags', [])
+        
+        return volume_info
+    
+    def _collect_volumes(self, instance: EC2Instance, log_prefix: str,
+                         volume_index: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        EBS 볼륨 정보 수집 (일괄 조회한 볼륨과 결합)
+        
+        Args:
+            instance: EC2 인스턴스 객체
+            log_prefix: 로그 접두사
+            volume_index: {인스턴스 ID: [볼륨 정보]}
+        """
+        self.logger.debug(f"{log_prefix}볼륨 정보 수집 중: {instance.id}")
+        instance.volumes.extend(volume_index.get(instance.id, []))
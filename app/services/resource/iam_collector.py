@@ -10,6 +10,9 @@ class IAMCollector(BaseCollector):
     IAM 데이터 수집기
     """
     
+    # IAM은 리전이 없는 글로벌 서비스
+    GLOBAL_SERVICE = True
+    
     def _init_clients(self) -> None:
         """
         필요한 AWS 클라이언트 초기화
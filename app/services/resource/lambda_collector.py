@@ -4,12 +4,16 @@ import pytz
 import logging
 from app.services.resource.common.base_collector import BaseCollector
 from app.services.resource.common.resource_model import LambdaFunction
+from app.services.metrics_engine import MetricsEngine
 
 class LambdaCollector(BaseCollector):
     """
     Lambda 함수 데이터 수집기
     """
     
+    SERVICE_NAME = 'lambda'
+    ITEMS_KEY = 'functions'
+    
     def _init_clients(self) -> None:
         """
         필요한 AWS 클라이언트 초기화
@@ -50,6 +54,9 @@ class LambdaCollector(BaseCollector):
             
             self.logger.info(f"{log_prefix}Lambda 함수 {len(response.get('Functions', []))}개 발견")
             
+            # 모든 함수의 CloudWatch 메트릭을 GetMetricData로 일괄 조회
+            function_metrics = self._fetch_function_metrics(response.get('Functions', []), current_time, log_prefix)
+            
             for function_data in response.get('Functions', []):
                 function_name = function_data.get('FunctionName', 'Unknown')
                 try:
@@ -57,7 +64,7 @@ class LambdaCollector(BaseCollector):
                     # AWS API 응답 데이터 로그 추가
                     code_size_from_api = function_data.get('CodeSize', 0)
                     self.logger.info(f"{log_prefix}AWS API에서 받은 코드 크기: {function_name} = {code_size_from_api} bytes")
-                    function = self._process_function(function_data, current_time, log_prefix)
+                    function = self._process_function(function_data, function_metrics.get(function_name), log_prefix)
                     
                     # datetime 객체를 문자열로 변환
                     function_dict = function.to_dict()
@@ -189,13 +196,14 @@ class LambdaCollector(BaseCollector):
                     'error': str(e)
                 }
     
-    def _process_function(self, function_data: Dict[str, Any], current_time: datetime, log_prefix: str) -> LambdaFunction:
+    def _process_function(self, function_data: Dict[str, Any], metrics: Dict[str, Dict[str, list]],
+                          log_prefix: str) -> LambdaFunction:
         """
         Lambda 함수 데이터 처리
         
         Args:
             function_data: Lambda 함수 원시 데이터
-            current_time: 현재 시간
+            metrics: 일괄 조회한 함수 메트릭 시계열 (조회 실패 시 None)
             log_prefix: 로그 접두사
             
         Returns:
@@ -242,7 +250,7 @@ class LambdaCollector(BaseCollector):
         
         # 추가 함수 정보 수집
         self._collect_function_configuration(function, log_prefix)
-        self._collect_function_metrics(function, current_time, log_prefix)
+        self._collect_function_metrics(function, metrics, log_prefix)
         self._collect_function_tags(function, log_prefix)
         
         return function
@@ -284,13 +292,41 @@ class LambdaCollector(BaseCollector):
         except Exception as e:
             self.logger.warning(f"{log_prefix}함수 구성 정보 수집 중 오류 발생: {str(e)}")
     
-    def _collect_function_metrics(self, function: LambdaFunction, current_time: datetime, log_prefix: str) -> None:
+    def _fetch_function_metrics(self, functions: List[Dict[str, Any]], current_time: datetime,
+                                log_prefix: str) -> Dict[str, Dict[str, Dict[str, list]]]:
+        """
+        함수 메트릭 일괄 조회 (최근 24시간 호출/오류/실행 시간)
+        
+        Args:
+            functions: list_functions 함수 목록
+            current_time: 현재 시간
+            log_prefix: 로그 접두사
+            
+        Returns:
+            Dict: {함수 이름: {'메트릭이름.통계': {'timestamps': [...], 'values': [...]}}}
+        """
+        engine = MetricsEngine(self.cloudwatch)
+        for function_data in functions:
+            function_name = function_data['FunctionName']
+            dimensions = [{'Name': 'FunctionName', 'Value': function_name}]
+            engine.add_statistics(function_name, 'AWS/Lambda', 'Invocations', dimensions, ['Sum'], 3600)
+            engine.add_statistics(function_name, 'AWS/Lambda', 'Errors', dimensions, ['Sum'], 3600)
+            engine.add_statistics(function_name, 'AWS/Lambda', 'Duration', dimensions, ['Average', 'Maximum'], 3600)
+        
+        try:
+            return engine.fetch(current_time - timedelta(hours=24), current_time)
+        except Exception as e:
+            self.logger.warning(f"{log_prefix}함수 메트릭 일괄 조회 중 오류 발생: {str(e)}")
+            return {}
+    
+    def _collect_function_metrics(self, function: LambdaFunction, metrics: Dict[str, Dict[str, list]],
+                                  log_prefix: str) -> None:
         """
         함수 메트릭 수집
         
         Args:
             function: Lambda 함수 객체
-            current_time: 현재 시간
+            metrics: 일괄 조회한 함수 메트릭 시계열 (조회 실패 시 None)
             log_prefix: 로그 접두사
         """
         self.logger.debug(f"{log_prefix}함수 메트릭 수집 중: {function.name}")
@@ -301,59 +337,24 @@ class LambdaCollector(BaseCollector):
         function.avg_duration = None
         function.max_duration = None
         
+        if not metrics:
+            return
+        
         try:
-            end_time = current_time
-            start_time = end_time - timedelta(hours=24)
-            
-            # 호출 횟수 수집
-            try:
-                invocations = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/Lambda',
-                    MetricName='Invocations',
-                    Dimensions=[{'Name': 'FunctionName', 'Value': function.name}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=3600,
-                    Statistics=['Sum']
-                )
-                if invocations.get('Datapoints'):
-                    function.invocations = int(sum(point['Sum'] for point in invocations['Datapoints']))
-            except Exception as e:
-                self.logger.debug(f"{log_prefix}호출 횟수 메트릭 수집 실패: {str(e)}")
+            invocations = metrics.get('Invocations.Sum', {}).get('values', [])
+            if invocations:
+                function.invocations = int(sum(invocations))
             
-            # 오류 횟수 수집
-            try:
-                errors = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/Lambda',
-                    MetricName='Errors',
-                    Dimensions=[{'Name': 'FunctionName', 'Value': function.name}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=3600,
-                    Statistics=['Sum']
-                )
-                if errors.get('Datapoints'):
-                    function.errors = int(sum(point['Sum'] for point in errors['Datapoints']))
-            except Exception as e:
-                self.logger.debug(f"{log_prefix}오류 횟수 메트릭 수집 실패: {str(e)}")
+            errors = metrics.get('Errors.Sum', {}).get('values', [])
+            if errors:
+                function.errors = int(sum(errors))
             
-            # 실행 시간 수집
-            try:
-                duration = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/Lambda',
-                    MetricName='Duration',
-                    Dimensions=[{'Name': 'FunctionName', 'Value': function.name}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=3600,
-                    Statistics=['Average', 'Maximum']
-                )
-                if duration.get('Datapoints'):
-                    latest_duration = max(duration['Datapoints'], key=lambda x: x['Timestamp'])
-                    function.avg_duration = latest_duration.get('Average')
-                    function.max_duration = latest_duration.get('Maximum')
-            except Exception as e:
-                self.logger.debug(f"{log_prefix}실행 시간 메트릭 수집 실패: {str(e)}")
+            # 최신 데이터포인트의 실행 시간
+            durations = metrics.get('Duration.Average', {}).get('values', [])
+            max_durations = metrics.get('Duration.Maximum', {}).get('values', [])
+            if durations:
+                function.avg_duration = durations[-1]
+                function.max_duration = max_durations[-1] if max_durations else None
             
         except Exception as e:
             self.logger.warning(f"{log_prefix}함수 메트릭 수집 중 전체 오류 발생: {str(e)}")
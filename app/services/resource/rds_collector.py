@@ -9,6 +9,9 @@ class RDSCollector(BaseCollector):
     RDS 인스턴스 데이터 수집기
     """
     
+    SERVICE_NAME = 'rds'
+    ITEMS_KEY = 'instances'
+    
     def _init_clients(self) -> None:
         """
         필요한 AWS 클라이언트 초기화
@@ -1,26 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import json
 import logging
+import time
 from app.services.resource.common.base_collector import BaseCollector
 from app.services.resource.common.resource_model import S3Bucket
 
+# 동시에 처리하는 버킷 수
+BUCKET_WORKERS = 16
+
+# 수집 요약에 표시하는 가장 오래 걸린 버킷 수
+SLOWEST_BUCKETS = 5
+
 class S3Collector(BaseCollector):
     """
     S3 버킷 데이터 수집기
     """
     
+    SERVICE_NAME = 's3'
+    ITEMS_KEY = 'buckets'
+    # 버킷 목록은 전역이므로 한 번만 조회하고, 리전 목록이 있으면 해당 리전의 버킷만 수집
+    GLOBAL_SERVICE = True
+    
     def _init_clients(self) -> None:
         """
         필요한 AWS 클라이언트 초기화
         """
         self.s3_client = self.get_client('s3')
-        self.s3_control = self.get_client('s3control')
+        self.bucket_regions = None
     
     def collect(self, collection_id: str = None) -> Dict[str, Any]:
         """
         S3 버킷 데이터 수집
         
+        버킷마다 필요한 10여 개의 조회를 버킷 단위 작업으로 묶어 최대 BUCKET_WORKERS개 버킷을 동시에 처리하고,
+        각 버킷은 버킷 리전의 클라이언트로 조회합니다.
+        
         Args:
             collection_id: 수집 ID (선택 사항)
             
@@ -31,11 +47,28 @@ class S3Collector(BaseCollector):
         self.logger.info(f"{log_prefix}S3 데이터 수집 시작")
         
         try:
+            # 수집할 버킷 리전 (리전 목록이 없으면 모든 리전)
+            self.bucket_regions = set(self.resolve_regions()) if self.regions else None
+            
             response = self.s3_client.list_buckets()
             buckets = []
             
             self.logger.info(f"{log_prefix}S3 버킷 {len(response['Buckets'])}개 발견")
             
+            # 액세스 포인트 조회용 계정 ID (버킷마다 STS를 호출하지 않도록 한 번만 조회)
+            account_id = self._get_account_id()
+            
+            # 버킷별 처리 (버킷 순서 유지)
+            started_at = time.time()
+            processed = []
+            if response['Buckets']:
+                with ThreadPoolExecutor(max_workers=min(BUCKET_WORKERS, len(response['Buckets'])),
+                                        thread_name_prefix='s3-bucket') as executor:
+                    processed = list(executor.map(
+                        lambda bucket_data: self._process_bucket(bucket_data, log_prefix, account_id),
+                        response['Buckets']
+                    ))
+            
             # 스토리지 클래스별 요약 정보
             storage_class_summary = {
                 'STANDARD': {'count': 0, 'size_bytes': 0},
@@ -49,10 +82,13 @@ class S3Collector(BaseCollector):
             # 리전별 버킷 분포
             region_distribution = {}
             
-            for bucket_data in response['Buckets']:
-                # S3Bucket 객체 생성
-                bucket = self._process_bucket(bucket_data, log_prefix)
+            # 버킷별 처리 시간(ms)
+            bucket_timings = {}
+            
+            for bucket, elapsed_ms in processed:
                 if bucket:
+                    bucket_timings[bucket.name] = elapsed_ms
+                    
                     # datetime 객체를 문자열로 변환
                     bucket_dict = bucket.to_dict()
                     if 'creation_date' in bucket_dict and isinstance(bucket_dict['creation_date'], datetime):
@@ -81,6 +117,12 @@ class S3Collector(BaseCollector):
                     
                     buckets.append(bucket_dict)
             
+            # 가장 오래 걸린 버킷
+            slowest_buckets = [
+                {'name': b['name'], 'region': b['region'], 'elapsed_ms': bucket_timings[b['name']]}
+                for b in sorted(buckets, key=lambda b: bucket_timings[b['name']], reverse=True)[:SLOWEST_BUCKETS]
+            ]
+            
             result = {
                 'buckets': buckets,
                 'summary': {
@@ -89,35 +131,54 @@ class S3Collector(BaseCollector):
                     'encrypted_buckets': sum(1 for b in buckets if b.get('encryption_enabled', False)),
                     'versioning_enabled': sum(1 for b in buckets if b.get('versioning_enabled', False)),
                     'storage_class_summary': storage_class_summary,
-                    'region_distribution': region_distribution
+                    'region_distribution': region_distribution,
+                    'bucket_timings': bucket_timings,
+                    'slowest_buckets': slowest_buckets
                 }
             }
             
-            self.logger.info(f"{log_prefix}S3 버킷 {len(buckets)}개 데이터 수집 완료")
+            if slowest_buckets:
+                slowest = slowest_buckets[0]
+                self.logger.info(f"{log_prefix}가장 오래 걸린 버킷: {slowest['name']} ({slowest['region']}) {slowest['elapsed_ms']}ms")
+            self.logger.info(f"{log_prefix}S3 버킷 {len(buckets)}개 데이터 수집 완료 ({(time.time() - started_at) * 1000:.0f}ms)")
             return result
             
         except Exception as e:
             self.logger.error(f"{log_prefix}S3 데이터 수집 중 오류 발생: {str(e)}")
             return {'error': str(e)}
     
-    def _process_bucket(self, bucket_data: Dict[str, Any], log_prefix: str) -> Optional[S3Bucket]:
+    def _process_bucket(self, bucket_data: Dict[str, Any], log_prefix: str,
+                        account_id: str = '') -> Tuple[Optional[S3Bucket], int]:
         """
-        S3 버킷 데이터 처리
+        S3 버킷 데이터 처리 (버킷 리전의 클라이언트 사용)
         
         Args:
             bucket_data: S3 버킷 원시 데이터
             log_prefix: 로그 접두사
+            account_id: AWS 계정 ID (액세스 포인트 조회용)
             
         Returns:
-            Optional[S3Bucket]: 처리된 S3 버킷 객체 또는 None
+            Tuple[Optional[S3Bucket], int]: (처리된 S3 버킷 객체 또는 None, 처리 시간 ms)
         """
         bucket_name = bucket_data['Name']
         self.logger.debug(f"{log_prefix}버킷 처리 중: {bucket_name}")
+        started_at = time.time()
         
         try:
-            # 버킷 리전 확인
-            location = self.s3_client.get_bucket_location(Bucket=bucket_name)
-            region = location['LocationConstraint'] or 'us-east-1'  # None인 경우 us-east-1
+            # 버킷 리전 확인 (목록에 리전이 있으면 조회하지 않음)
+            region = bucket_data.get('BucketRegion')
+            if not region:
+                location = self.s3_client.get_bucket_location(Bucket=bucket_name)
+                region = location['LocationConstraint'] or 'us-east-1'  # None인 경우 us-east-1
+            
+            # 수집할 리전 목록에 없는 버킷은 제외
+            if self.bucket_regions is not None and region not in self.bucket_regions:
+                self.logger.debug(f"{log_prefix}수집 대상 리전이 아닌 버킷 제외: {bucket_name} ({region})")
+                return None, 0
+            
+            # 버킷 리전의 클라이언트 (다른 리전 엔드포인트로의 리디렉션 방지, 클라이언트 풀에서 재사용)
+            s3_client = self.get_client('s3', region_name=region)
+            s3_control = self.get_client('s3control', region_name=region)
             
             # 기본 버킷 정보로 객체 생성
             bucket = S3Bucket(
@@ -128,57 +189,57 @@ class S3Collector(BaseCollector):
             )
             
             # 태그 수집
-            self._collect_tags(bucket, log_prefix)
+            self._collect_tags(bucket, s3_client, log_prefix)
             
             # 버전 관리 상태 확인
-            self._check_versioning(bucket, log_prefix)
+            self._check_versioning(bucket, s3_client, log_prefix)
             
-            # 공개 액세스 설정 확인
-            self._check_public_access(bucket, log_prefix)
+            # 버킷 정책 확인
+            has_policy = self._check_bucket_policy(bucket, s3_client, log_prefix)
+            
+            # 공개 액세스 설정 확인 (위에서 조회한 정책 존재 여부 사용)
+            self._check_public_access(bucket, s3_client, has_policy, log_prefix)
             
             # 암호화 설정 확인
-            self._check_encryption(bucket, log_prefix)
+            self._check_encryption(bucket, s3_client, log_prefix)
             
             # 수명 주기 규칙 확인
-            self._check_lifecycle_rules(bucket, log_prefix)
-            
-            # 버킷 정책 확인
-            self._check_bucket_policy(bucket, log_prefix)
+            self._check_lifecycle_rules(bucket, s3_client, log_prefix)
             
             # CORS 설정 확인
-            self._check_cors_rules(bucket, log_prefix)
+            self._check_cors_rules(bucket, s3_client, log_prefix)
             
             # 웹사이트 설정 확인
-            self._check_website_config(bucket, log_prefix)
+            self._check_website_config(bucket, s3_client, log_prefix)
             
             # 로깅 설정 확인
-            self._check_logging_config(bucket, log_prefix)
+            self._check_logging_config(bucket, s3_client, log_prefix)
             
-            # 스토리지 클래스별 객체 분포 확인
-            self._collect_storage_class_distribution(bucket, log_prefix)
+            # 스토리지 클래스별 객체 분포와 버킷 크기 확인 (객체 목록 한 번 조회)
+            objects = self._list_first_objects(bucket, s3_client, log_prefix)
+            self._collect_storage_class_distribution(bucket, objects, log_prefix)
+            self._collect_size_metrics(bucket, objects, log_prefix)
             
             # 액세스 포인트 확인
-            self._collect_access_points(bucket, log_prefix)
-            
-            # 버킷 크기 및 객체 수 확인
-            self._collect_size_metrics(bucket, log_prefix)
+            self._collect_access_points(bucket, s3_control, account_id, log_prefix)
             
-            return bucket
+            return bucket, round((time.time() - started_at) * 1000)
             
         except Exception as e:
             self.logger.error(f"{log_prefix}버킷 처리 중 오류 발생: {bucket_name} - {str(e)}")
-            return None
+            return None, round((time.time() - started_at) * 1000)
     
-    def _collect_tags(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _collect_tags(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 태그 수집
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_tagging(Bucket=bucket.name)
+            response = s3_client.get_bucket_tagging(Bucket=bucket.name)
             if 'TagSet' in response:
                 bucket.tags = [{'Key': tag['Key'], 'Value': tag['Value']} for tag in response['TagSet']]
         except Exception as e:
@@ -186,42 +247,39 @@ class S3Collector(BaseCollector):
             if 'NoSuchTagSet' not in str(e):
                 self.logger.error(f"{log_prefix}태그 수집 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_versioning(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_versioning(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 버전 관리 상태 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_versioning(Bucket=bucket.name)
+            response = s3_client.get_bucket_versioning(Bucket=bucket.name)
             bucket.versioning_enabled = response.get('Status') == 'Enabled'
         except Exception as e:
             self.logger.error(f"{log_prefix}버전 관리 상태 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_public_access(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_public_access(self, bucket: S3Bucket, s3_client, has_policy: Optional[bool], log_prefix: str) -> None:
         """
         버킷 공개 액세스 설정 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
+            has_policy: 버킷 정책 존재 여부 (확인하지 못했으면 None)
             log_prefix: 로그 접두사
         """
         try:
-            # 버킷 정책 확인
-            try:
-                self.s3_client.get_bucket_policy(Bucket=bucket.name)
-                # 정책이 있으면 추가 확인 필요
-                bucket.public_access = True
-            except Exception as e:
-                if 'NoSuchBucketPolicy' in str(e):
-                    # 정책이 없으면 공개 액세스 아님
-                    bucket.public_access = False
+            # 정책이 있으면 추가 확인 필요, 정책이 없으면 공개 액세스 아님
+            if has_policy is not None:
+                bucket.public_access = has_policy
             
             # 퍼블릭 액세스 차단 설정 확인
             try:
-                response = self.s3_client.get_public_access_block(Bucket=bucket.name)
+                response = s3_client.get_public_access_block(Bucket=bucket.name)
                 block_config = response.get('PublicAccessBlockConfiguration', {})
                 
                 # 모든 퍼블릭 액세스 차단 설정이 True이면 비공개
@@ -237,16 +295,17 @@ class S3Collector(BaseCollector):
         except Exception as e:
             self.logger.error(f"{log_prefix}공개 액세스 설정 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_encryption(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_encryption(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 암호화 설정 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_encryption(Bucket=bucket.name)
+            response = s3_client.get_bucket_encryption(Bucket=bucket.name)
             if 'ServerSideEncryptionConfiguration' in response:
                 bucket.encryption_enabled = True
         except Exception as e:
@@ -255,16 +314,17 @@ class S3Collector(BaseCollector):
             else:
                 self.logger.error(f"{log_prefix}암호화 설정 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_lifecycle_rules(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_lifecycle_rules(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 수명 주기 규칙 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_lifecycle_configuration(Bucket=bucket.name)
+            response = s3_client.get_bucket_lifecycle_configuration(Bucket=bucket.name)
             if 'Rules' in response:
                 # 필요한 정보만 추출
                 for rule in response['Rules']:
@@ -283,65 +343,75 @@ class S3Collector(BaseCollector):
             if 'NoSuchLifecycleConfiguration' not in str(e):
                 self.logger.error(f"{log_prefix}수명 주기 규칙 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_bucket_policy(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_bucket_policy(self, bucket: S3Bucket, s3_client, log_prefix: str) -> Optional[bool]:
         """
         버킷 정책 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
+            
+        Returns:
+            Optional[bool]: 버킷 정책 존재 여부 (확인하지 못했으면 None)
         """
         try:
-            response = self.s3_client.get_bucket_policy(Bucket=bucket.name)
+            response = s3_client.get_bucket_policy(Bucket=bucket.name)
             if 'Policy' in response:
                 policy_str = response['Policy']
                 bucket.policy = json.loads(policy_str)
+            return True
         except Exception as e:
-            if 'NoSuchBucketPolicy' not in str(e):
-                self.logger.error(f"{log_prefix}버킷 정책 확인 중 오류 발생: {bucket.name} - {str(e)}")
+            if 'NoSuchBucketPolicy' in str(e):
+                return False
+            self.logger.error(f"{log_prefix}버킷 정책 확인 중 오류 발생: {bucket.name} - {str(e)}")
+            return None
     
-    def _check_cors_rules(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_cors_rules(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 CORS 설정 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_cors(Bucket=bucket.name)
+            response = s3_client.get_bucket_cors(Bucket=bucket.name)
             if 'CORSRules' in response:
                 bucket.cors_rules = response['CORSRules']
         except Exception as e:
             if 'NoSuchCORSConfiguration' not in str(e):
                 self.logger.error(f"{log_prefix}CORS 설정 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_website_config(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_website_config(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 웹사이트 설정 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_website(Bucket=bucket.name)
+            response = s3_client.get_bucket_website(Bucket=bucket.name)
             bucket.website_enabled = True
             bucket.website_config = response
         except Exception as e:
             if 'NoSuchWebsiteConfiguration' not in str(e):
                 self.logger.error(f"{log_prefix}웹사이트 설정 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _check_logging_config(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _check_logging_config(self, bucket: S3Bucket, s3_client, log_prefix: str) -> None:
         """
         버킷 로깅 설정 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
         """
         try:
-            response = self.s3_client.get_bucket_logging(Bucket=bucket.name)
+            response = s3_client.get_bucket_logging(Bucket=bucket.name)
             if 'LoggingEnabled' in response:
                 bucket.logging_enabled = True
                 bucket.logging_target_bucket = response['LoggingEnabled'].get('TargetBucket', '')
@@ -349,66 +419,76 @@ class S3Collector(BaseCollector):
         except Exception as e:
             self.logger.error(f"{log_prefix}로깅 설정 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _collect_storage_class_distribution(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _list_first_objects(self, bucket: S3Bucket, s3_client, log_prefix: str) -> Optional[List[Dict[str, Any]]]:
         """
-        스토리지 클래스별 객체 분포 확인
+        버킷 객체 목록의 첫 페이지 조회 (최대 1000개, 성능 최적화)
         
         Args:
             bucket: S3 버킷 객체
+            s3_client: 버킷 리전의 S3 클라이언트
             log_prefix: 로그 접두사
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: 객체 목록 (조회하지 못했으면 None)
         """
         try:
-            # 스토리지 클래스 초기화
-            storage_classes = [
-                'STANDARD', 'INTELLIGENT_TIERING', 'STANDARD_IA', 
-                'ONEZONE_IA', 'GLACIER', 'DEEP_ARCHIVE'
-            ]
+            response = s3_client.list_objects_v2(Bucket=bucket.name, MaxKeys=1000)
+            return response.get('Contents', [])
+        except Exception as e:
+            self.logger.error(f"{log_prefix}객체 목록 조회 중 오류 발생: {bucket.name} - {str(e)}")
+            return None
+    
+    def _collect_storage_class_distribution(self, bucket: S3Bucket, objects: Optional[List[Dict[str, Any]]],
+                                            log_prefix: str) -> None:
+        """
+        스토리지 클래스별 객체 분포 확인
+        
+        Args:
+            bucket: S3 버킷 객체
+            objects: 객체 목록 첫 페이지 (조회하지 못했으면 None)
+            log_prefix: 로그 접두사
+        """
+        # 스토리지 클래스 초기화
+        storage_classes = [
+            'STANDARD', 'INTELLIGENT_TIERING', 'STANDARD_IA', 
+            'ONEZONE_IA', 'GLACIER', 'DEEP_ARCHIVE'
+        ]
+        
+        for storage_class in storage_classes:
+            bucket.storage_class_distribution[storage_class] = {
+                'count': 0,
+                'size_bytes': 0
+            }
+        
+        for obj in objects or []:
+            storage_class = obj.get('StorageClass', 'STANDARD')
+            size = obj.get('Size', 0)
             
-            for storage_class in storage_classes:
+            if storage_class in bucket.storage_class_distribution:
+                bucket.storage_class_distribution[storage_class]['count'] += 1
+                bucket.storage_class_distribution[storage_class]['size_bytes'] += size
+            else:
                 bucket.storage_class_distribution[storage_class] = {
-                    'count': 0,
-                    'size_bytes': 0
+                    'count': 1,
+                    'size_bytes': size
                 }
-            
-            # 객체 목록 조회 (최대 1000개)
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(
-                Bucket=bucket.name,
-                MaxKeys=1000
-            )
-            
-            for page in page_iterator:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        storage_class = obj.get('StorageClass', 'STANDARD')
-                        size = obj.get('Size', 0)
-                        
-                        if storage_class in bucket.storage_class_distribution:
-                            bucket.storage_class_distribution[storage_class]['count'] += 1
-                            bucket.storage_class_distribution[storage_class]['size_bytes'] += size
-                        else:
-                            bucket.storage_class_distribution[storage_class] = {
-                                'count': 1,
-                                'size_bytes': size
-                            }
-                
-                # 최대 1페이지만 처리 (성능 최적화)
-                break
-                
-        except Exception as e:
-            self.logger.error(f"{log_prefix}스토리지 클래스 분포 확인 중 오류 발생: {bucket.name} - {str(e)}")
     
-    def _collect_access_points(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _collect_access_points(self, bucket: S3Bucket, s3_control, account_id: str, log_prefix: str) -> None:
         """
         버킷 액세스 포인트 확인
         
         Args:
             bucket: S3 버킷 객체
+            s3_control: 버킷 리전의 S3 Control 클라이언트
+            account_id: AWS 계정 ID
             log_prefix: 로그 접두사
         """
+        if not account_id:
+            return
+        
         try:
-            response = self.s3_control.list_access_points(
-                AccountId=self._get_account_id(),
+            response = s3_control.list_access_points(
+                AccountId=account_id,
                 Bucket=bucket.name
             )
             
@@ -439,30 +519,19 @@ class S3Collector(BaseCollector):
             self.logger.error(f"계정 ID 조회 중 오류 발생: {str(e)}")
             return ''
     
-    def _collect_size_metrics(self, bucket: S3Bucket, log_prefix: str) -> None:
+    def _collect_size_metrics(self, bucket: S3Bucket, objects: Optional[List[Dict[str, Any]]], log_prefix: str) -> None:
         """
         버킷 크기 및 객체 수 수집
         
         Args:
             bucket: S3 버킷 객체
+            objects: 객체 목록 첫 페이지 (조회하지 못했으면 None)
             log_prefix: 로그 접두사
         """
-        try:
-            # 버킷 크기 추정 (첫 100개 객체만)
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            total_size = 0
-            object_count = 0
-            
-            # 최대 1페이지만 조회 (성능 최적화)
-            for page in paginator.paginate(Bucket=bucket.name, MaxKeys=100):
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        total_size += obj.get('Size', 0)
-                        object_count += 1
-                break  # 첫 페이지만 처리
-            
-            bucket.size_bytes = total_size
-            bucket.object_count = object_count
-            
-        except Exception as e:
-            self.logger.error(f"{log_prefix}버킷 크기 수집 중 오류 발생: {bucket.name} - {str(e)}")
\ No newline at end of file
+        if objects is None:
+            return
+        
+        # 버킷 크기 추정 (첫 100개 객체만)
+        sample = objects[:100]
+        bucket.size_bytes = sum(obj.get('Size', 0) for obj in sample)
+        bucket.object_count = len(sample)
@@ -0,0 +1,177 @@
+"""
+S3 객체 캐시 조회와 ETag 재검증
+
+메모리 캐시의 TTL이 지나면 저장소 클래스는 변경되지 않은 객체도 전체를 다시 내려받습니다.
+수집 데이터처럼 한 번 쓰면 바뀌지 않는 객체가 수 MB에 이르면 대시보드를 열 때마다 같은 데이터를 다시 받게 됩니다.
+이 모듈은 캐시 항목에 ETag를 함께 기억해 두고, 만료되면 If-None-Match 조건부 GET으로 재검증하여
+변경이 없으면(304) 캐시를 그대로 연장합니다. 변경되지 않는 객체(수집 데이터, 검사 기록 아카이브)는 만료 없이 캐시합니다.
+큰 객체는 메모리 캐시와 S3 사이의 로컬 디스크 캐시(disk_cache)를 거쳐, 워커 재시작이나 다른 워커 프로세스에서도
+S3에서 다시 내려받지 않습니다.
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError
+
+from app.services import blob_codec
+from app.services.disk_cache import get_disk_cache
+from app.services.storage_cache import get_storage_cache
+
+logger = logging.getLogger(__name__)
+
+# 조회 결과 출처
+SOURCE_CACHE = 'cache'
+SOURCE_REVALIDATED = 'revalidated'
+SOURCE_DISK = 'disk'
+SOURCE_S3 = 'S3'
+
+# 조건부 GET에서 객체가 변경되지 않았을 때의 오류 코드
+_NOT_MODIFIED_CODES = ('304', 'NotModified')
+
+
+def _parse_json(body: bytes) -> Any:
+    """압축 해제된 본문을 JSON으로 읽습니다."""
+    return json.loads(body.decode('utf-8'))
+
+
+def read_cached(s3_client, bucket_name: str, key: str, namespace: str, user_id: str,
+                cache_key: Union[str, Iterable[str]] = None, immutable: bool = False,
+                parse: Callable[[bytes], Any] = None, disk: bool = False,
+                revalidate: bool = False) -> Tuple[Any, str]:
+    """
+    캐시를 먼저 확인하고, 만료된 항목은 ETag로 재검증하여 S3 객체를 읽습니다.
+    객체가 없으면 get_object와 같이 NoSuchKey ClientError가 발생합니다.
+
+    Args:
+        s3_client: S3 클라이언트
+        bucket_name: 버킷 이름
+        key: S3 객체 키
+        namespace: 캐시 네임스페이스
+        user_id: 사용자 ID (사용자 단위 무효화용)
+        cache_key: 네임스페이스 안의 캐시 키 (기본값: S3 객체 키)
+        immutable: 변경되지 않는 객체 여부 (True면 만료 없이 캐시)
+        parse: 압축 해제된 본문을 값으로 변환하는 함수 (기본값: JSON)
+        disk: 메모리 캐시와 S3 사이에 로컬 디스크 캐시를 사용할지 여부
+        revalidate: TTL과 관계없이 매번 ETag로 재검증할지 여부 (다른 워커 프로세스가 고쳐 쓰는 작은 객체용)
+
+    Returns:
+        Tuple[Any, str]: (값, 출처 - 'cache', 'revalidated', 'disk', 'S3')
+    """
+    cache = get_storage_cache()
+    cache_key = cache_key if cache_key is not None else (key,)
+    parse = parse or _parse_json
+
+    entry = cache.get_entry(namespace, user_id, cache_key)
+    if entry and entry['fresh'] and not revalidate:
+        return entry['value'], SOURCE_CACHE
+
+    # 메모리에 없으면 디스크 캐시 확인 (변경되지 않는 객체는 S3 요청 없이 사용, 그 외에는 ETag 재검증에 사용)
+    disk_cache = get_disk_cache() if disk and entry is None else None
+    disk_entry = _lookup_disk(disk_cache, bucket_name, key)
+    if disk_entry and immutable:
+        value = _read_disk(disk_cache, bucket_name, key, disk_entry, parse)
+        if value is not None:
+            cache.set(namespace, user_id, cache_key, value[0], size=value[1], etag=disk_entry['etag'], immutable=True)
+            return value[0], SOURCE_DISK
+
+    etag = entry['etag'] if entry else (disk_entry['etag'] if disk_entry else None)
+    params = {'Bucket': bucket_name, 'Key': key}
+    if etag:
+        params['IfNoneMatch'] = etag
+    try:
+        response = s3_client.get_object(**params)
+    except ClientError as e:
+        if etag and e.response['Error']['Code'] in _NOT_MODIFIED_CODES:
+            if entry:
+                cache.refresh(namespace, user_id, cache_key)
+                logger.debug(f"변경 없음, 캐시 재사용: {key}")
+                return entry['value'], SOURCE_REVALIDATED
+            value = _read_disk(disk_cache, bucket_name, key, disk_entry, parse)
+            if value is not None:
+                cache.set(namespace, user_id, cache_key, value[0], size=value[1], etag=etag, immutable=immutable)
+                return value[0], SOURCE_DISK
+            # 디스크 본문이 그 사이 제거된 경우 조건 없이 다시 조회
+            params.pop('IfNoneMatch')
+            response = s3_client.get_object(**params)
+        else:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                cache.invalidate(user_id, namespace, prefix=cache_key)
+                if disk_cache:
+                    disk_cache.discard(bucket_name, key)
+            raise
+
+    raw_body = response['Body'].read()
+    if disk:
+        remember_object(bucket_name, key, raw_body, response.get('ETag'), response.get('ContentEncoding'))
+    body = blob_codec.decode_body(raw_body, response.get('ContentEncoding'))
+    value = parse(body)
+    cache.set(namespace, user_id, cache_key, value, size=len(body), etag=response.get('ETag'), immutable=immutable)
+    return value, SOURCE_S3
+
+
+def remember_object(bucket_name: str, key: str, raw_body: bytes, etag: Optional[str],
+                    content_encoding: Optional[str]) -> None:
+    """
+    S3에 쓰거나 S3에서 받은 객체 본문을 디스크 캐시에 저장합니다. 캐시 오류는 무시합니다.
+
+    Args:
+        bucket_name: 버킷 이름
+        key: S3 객체 키
+        raw_body: S3에 저장된 그대로의 본문
+        etag: 객체 ETag
+        content_encoding: 객체 Content-Encoding
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return
+    try:
+        disk_cache.put(bucket_name, key, raw_body, etag, content_encoding)
+    except Exception as e:
+        logger.warning(f"디스크 캐시 저장 중 오류 (무시): {key} - {str(e)}")
+
+
+def forget_objects(bucket_name: str, key: str = None, prefix: str = None) -> None:
+    """
+    삭제한 S3 객체를 디스크 캐시에서 제거합니다. 캐시 오류는 무시합니다.
+
+    Args:
+        bucket_name: 버킷 이름
+        key: S3 객체 키
+        prefix: S3 키 접두사 (지정하면 접두사로 시작하는 모든 객체 제거)
+    """
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return
+    try:
+        if prefix is not None:
+            disk_cache.discard_prefix(bucket_name, prefix)
+        elif key is not None:
+            disk_cache.discard(bucket_name, key)
+    except Exception as e:
+        logger.warning(f"디스크 캐시 정리 중 오류 (무시): {prefix or key} - {str(e)}")
+
+
+def _lookup_disk(disk_cache, bucket_name: str, key: str) -> Optional[Dict[str, Any]]:
+    """디스크 캐시 항목을 조회합니다. 캐시 오류는 없는 것으로 처리합니다."""
+    if disk_cache is None:
+        return None
+    try:
+        return disk_cache.lookup(bucket_name, key)
+    except Exception as e:
+        logger.warning(f"디스크 캐시 조회 중 오류 (무시): {key} - {str(e)}")
+        return None
+
+
+def _read_disk(disk_cache, bucket_name: str, key: str, disk_entry: Dict[str, Any],
+               parse: Callable[[bytes], Any]) -> Optional[Tuple[Any, int]]:
+    """디스크 캐시 본문을 mmap으로 읽어 압축 해제/변환합니다. 본문이 없으면 None을 반환합니다."""
+    try:
+        with disk_cache.open_body(bucket_name, key, disk_entry) as buffer:
+            if buffer is None:
+                return None
+            body = blob_codec.decode_body(buffer, disk_entry['content_encoding'])
+    except Exception as e:
+        logger.warning(f"디스크 캐시 읽기 중 오류 (무시): {key} - {str(e)}")
+        return None
+    return parse(body), len(body)
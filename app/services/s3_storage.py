@@ -1,10 +1,13 @@
-import boto3
-import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 from config import Config
+from app.services import blob_codec
+from app.services.collection_catalog import CollectionCatalog, summarize_service
+from app.services.s3_conditional_read import forget_objects, read_cached, remember_object
+from app.services.storage_backend import create_storage_client
+from app.services.storage_cache import get_storage_cache
 
 # 로깅 설정 - 중복 로그 방지
 logger = logging.getLogger(__name__)
@@ -20,20 +23,20 @@ logger.addHandler(handler)
 # 상위 로거로 전파 방지
 logger.propagate = False
 
+# 수집의 서비스별 데이터 파일을 동시에 가져오는 최대 스레드 수
+SERVICE_FETCH_WORKERS = 8
+
 class S3Storage:
     """
     S3를 데이터베이스처럼 사용하여 통합 대시보드 결과를 관리하는 클래스
     """
-    # 메모리 캐시 (클래스 변수)
-    _cache = {
-        'collections': {},  # 사용자별 컬렉션 목록 캐시
-        'metadata': {},     # 메타데이터 캐시
-        'data': {}          # 서비스 데이터 캐시
+    # 공용 저장소 캐시 네임스페이스
+    CACHE_NAMESPACES = {
+        'collections': 'dashboard.collections',  # 사용자별 컬렉션 목록 캐시
+        'metadata': 'dashboard.metadata',        # 메타데이터 캐시
+        'data': 'dashboard.data'                 # 서비스 데이터 캐시
     }
     
-    # 캐시 만료 시간 (초)
-    CACHE_TTL = 300  # 5분
-    
     # 클래스 인스턴스 캐시
     _instances = {}
     
@@ -64,14 +67,9 @@ class S3Storage:
         # 버킷 이름 로깅
         logger.info(f"S3Storage 초기화: 버킷={self.bucket_name}, 리전={self.region}")
         
-        # S3 클라이언트 생성
+        # 저장소 클라이언트 생성 (Config.STORAGE_BACKEND에 따라 S3 또는 로컬 저장소)
         try:
-            self.s3_client = boto3.client(
-                's3',
-                region_name=self.region,
-                aws_access_key_id=Config.AWS_ACCESS_KEY,
-                aws_secret_access_key=Config.AWS_SECRET_KEY
-            )
+            self.s3_client = create_storage_client(self.region)
             # 버킷이 존재하는지 확인
             self.s3_client.head_bucket(Bucket=self.bucket_name)
             logger.info(f"S3 버킷 {self.bucket_name} 접근 확인 완료")
@@ -85,187 +83,218 @@ class S3Storage:
         """사용자별 S3 경로 접두사 생성"""
         return f"users/{user_id}/dashboard_data/"
     
-    def _get_cache_key(self, key_type, user_id, collection_id=None, service_key=None):
-        """캐시 키 생성"""
+    def _get_catalog(self, user_id):
+        """사용자별 수집 카탈로그"""
+        return CollectionCatalog(self.s3_client, self.bucket_name, f"{self._get_user_prefix(user_id)}catalog.json")
+    
+    def _get_collection_prefix(self, user_id, collection_id):
+        """수집별 S3 경로 접두사"""
+        return f"{self._get_user_prefix(user_id)}collections/{collection_id}/"
+    
+    def _get_service_key(self, user_id, collection_id, service_key):
+        """수집의 서비스별 데이터 파일 키"""
+        return f"{self._get_collection_prefix(user_id, collection_id)}services/{service_key}.json"
+    
+    def _get_cache_key(self, key_type, collection_id=None, service_key=None):
+        """캐시 키 생성 (네임스페이스 안의 키)"""
         if key_type == 'collections':
-            return f"collections:{user_id}"
+            return ()
         elif key_type == 'metadata':
-            return f"metadata:{user_id}:{collection_id}"
+            return (collection_id,)
         elif key_type == 'data':
-            return f"data:{user_id}:{collection_id}:{service_key}"
+            return (collection_id, service_key)
         return None
     
     def _get_from_cache(self, key_type, user_id, collection_id=None, service_key=None):
         """캐시에서 데이터 가져오기"""
-        cache_key = self._get_cache_key(key_type, user_id, collection_id, service_key)
-        if not cache_key:
-            return None, False
-        
-        cache_entry = S3Storage._cache.get(key_type, {}).get(cache_key)
-        if not cache_entry:
-            return None, False
-        
-        # 캐시 만료 확인
-        if time.time() - cache_entry['timestamp'] > S3Storage.CACHE_TTL:
-            # 캐시 만료
+        cache_key = self._get_cache_key(key_type, collection_id, service_key)
+        if cache_key is None:
             return None, False
-        
-        return cache_entry['data'], True
+        return get_storage_cache().get(S3Storage.CACHE_NAMESPACES[key_type], user_id, cache_key)
     
-    def _set_in_cache(self, key_type, user_id, data, collection_id=None, service_key=None):
-        """캐시에 데이터 저장"""
-        cache_key = self._get_cache_key(key_type, user_id, collection_id, service_key)
-        if not cache_key:
+    def _set_in_cache(self, key_type, user_id, data, collection_id=None, service_key=None, size=None, etag=None):
+        """캐시에 데이터 저장 (수집별 메타데이터와 서비스 데이터는 변경되지 않으므로 만료 없이 저장)"""
+        cache_key = self._get_cache_key(key_type, collection_id, service_key)
+        if cache_key is None:
             return
-        
-        if key_type not in S3Storage._cache:
-            S3Storage._cache[key_type] = {}
-        
-        S3Storage._cache[key_type][cache_key] = {
-            'data': data,
-            'timestamp': time.time()
-        }
+        get_storage_cache().set(S3Storage.CACHE_NAMESPACES[key_type], user_id, cache_key, data, size=size,
+                                etag=etag, immutable=key_type != 'collections')
     
     def _invalidate_cache(self, key_type, user_id, collection_id=None):
         """캐시 무효화"""
+        cache = get_storage_cache()
         if key_type == 'collections':
-            cache_key = self._get_cache_key('collections', user_id)
-            if cache_key in S3Storage._cache.get('collections', {}):
-                del S3Storage._cache['collections'][cache_key]
+            cache.invalidate(user_id, S3Storage.CACHE_NAMESPACES['collections'])
         elif key_type == 'all':
             # 사용자의 모든 캐시 무효화
-            for cache_type in S3Storage._cache:
-                keys_to_delete = []
-                for key in S3Storage._cache[cache_type]:
-                    if f":{user_id}:" in key or key.endswith(f":{user_id}"):
-                        keys_to_delete.append(key)
-                
-                for key in keys_to_delete:
-                    if key in S3Storage._cache[cache_type]:
-                        del S3Storage._cache[cache_type][key]
+            cache.invalidate(user_id, S3Storage.CACHE_NAMESPACES.values())
         elif collection_id:
             # 특정 컬렉션 관련 캐시 무효화
-            for cache_type in ['metadata', 'data']:
-                keys_to_delete = []
-                for key in S3Storage._cache.get(cache_type, {}):
-                    if f":{user_id}:{collection_id}" in key:
-                        keys_to_delete.append(key)
-                
-                for key in keys_to_delete:
-                    if key in S3Storage._cache.get(cache_type, {}):
-                        del S3Storage._cache[cache_type][key]
+            cache.invalidate(user_id, [S3Storage.CACHE_NAMESPACES['metadata'], S3Storage.CACHE_NAMESPACES['data']],
+                             prefix=(collection_id,))
     
-    def save_collection_data(self, user_id, collection_id, data, selected_services=None):
+    def save_service_data(self, user_id, collection_id, service_key, service_data):
         """
-        수집된 데이터를 S3에 저장
+        수집이 끝난 서비스 데이터를 한 번 저장합니다. (서비스마다 수집 직후 호출)
         
         Args:
             user_id: 사용자 ID
             collection_id: 수집 ID
-            data: 저장할 데이터 (dict)
+            service_key: 서비스 이름
+            service_data: 서비스 수집 데이터
+            
+        Returns:
+            dict: 카탈로그용 서비스 요약 (저장 실패 시 None)
+        """
+        # 데이터가 None이 아닌지 확인
+        if service_data is None:
+            logger.warning(f"서비스 {service_key}의 데이터가 None입니다. 빈 객체로 저장합니다.")
+            service_data = {"status": "collected", "data": {}}
+        
+        # 한 번만 직렬화 (직렬화 불가능한 데이터는 오류 객체로 대체)
+        try:
+            fragment = blob_codec.dumps(service_data)
+        except (TypeError, ValueError) as e:
+            logger.error(f"서비스 {service_key} 데이터 직렬화 중 오류: {str(e)}")
+            service_data = {
+                "status": "error",
+                "message": "직렬화 불가능한 데이터",
+                "error": str(e)
+            }
+            fragment = blob_codec.dumps(service_data)
+        
+        try:
+            service_data_key = self._get_service_key(user_id, collection_id, service_key)
+            body, encoding_params, raw_size = blob_codec.encode_chunks([fragment])
+            put_response = self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=service_data_key,
+                Body=body,
+                ContentType='application/json',
+                **encoding_params
+            )
+            logger.info(f"서비스 데이터 저장 완료: {service_data_key} ({raw_size} -> {len(body)} bytes)")
+            remember_object(self.bucket_name, service_data_key, body, put_response.get('ETag'),
+                            encoding_params.get('ContentEncoding'))
+        except Exception as e:
+            logger.error(f"서비스 {service_key} 데이터 저장 중 오류 발생: {str(e)}")
+            return None
+        
+        # 서비스 데이터는 변경되지 않으므로 만료 없이 캐시 (통합 조회도 이 항목을 사용)
+        self._set_in_cache('data', user_id, service_data, collection_id, service_key, size=raw_size,
+                           etag=put_response.get('ETag'))
+        return summarize_service(service_data, raw_size)
+    
+    def finalize_collection(self, user_id, collection_id, service_summaries, selected_services=None):
+        """
+        서비스별 저장이 끝난 수집의 메타데이터와 카탈로그를 기록합니다.
+        통합 데이터는 따로 저장하지 않고 조회할 때 서비스별 파일로 구성합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            collection_id: 수집 ID
+            service_summaries: {서비스 이름: save_service_data 결과} (저장된 서비스)
             selected_services: 선택된 서비스 목록 (list)
             
         Returns:
             bool: 저장 성공 여부
         """
         try:
-            # 타임스탬프 추가
-            timestamp = datetime.now().isoformat()
+            services = dict(service_summaries)
+            # 선택된 서비스 중 저장되지 않은 서비스는 빈 데이터로 표시
+            for service_key in selected_services or []:
+                if service_key not in services:
+                    services[service_key] = summarize_service(self._empty_service_data(), 0)
             
-            # 메타데이터 생성
             metadata = {
                 'user_id': user_id,
                 'collection_id': collection_id,
-                'timestamp': timestamp,
-                'selected_services': selected_services or []
+                'timestamp': datetime.now().isoformat(),
+                'selected_services': selected_services or list(service_summaries),
+                'stored_services': list(service_summaries),
+                'services': services
             }
             
             # 메타데이터 저장
-            metadata_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/metadata.json"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=metadata_key,
-                Body=json.dumps(metadata),
-                ContentType='application/json'
-            )
+            metadata_key = f"{self._get_collection_prefix(user_id, collection_id)}metadata.json"
+            blob_codec.put_json(self.s3_client, self.bucket_name, metadata_key, metadata, content_type='application/json')
             logger.info(f"메타데이터 저장 완료: {metadata_key}")
             
-            # 서비스 데이터 통합 파일 생성 (모든 서비스 데이터를 하나의 파일로 저장)
-            all_services_data = {}
-            
-            # 각 서비스 데이터 처리
-            for service_key, service_data in data.items():
-                # 데이터가 None이 아닌지 확인
-                if service_data is None:
-                    logger.warning(f"서비스 {service_key}의 데이터가 None입니다. 빈 객체로 저장합니다.")
-                    service_data = {"status": "collected", "data": {}}
-                
-                # 데이터 직렬화 가능한지 확인
-                try:
-                    # datetime 객체를 문자열로 변환하는 JSON 인코더
-                    class DateTimeEncoder(json.JSONEncoder):
-                        def default(self, obj):
-                            if isinstance(obj, datetime):
-                                return obj.isoformat()
-                            return super().default(obj)
-                    
-                    # 테스트 직렬화 (오류 확인용)
-                    json.dumps(service_data, cls=DateTimeEncoder)
-                    
-                    # 통합 데이터에 추가
-                    all_services_data[service_key] = service_data
-                    
-                except TypeError as e:
-                    logger.error(f"서비스 {service_key} 데이터 직렬화 중 오류: {str(e)}")
-                    # 직렬화 불가능한 객체가 있는 경우 기본 객체로 대체
-                    all_services_data[service_key] = {
-                        "status": "error", 
-                        "message": "직렬화 불가능한 데이터", 
-                        "error": str(e)
-                    }
-            
-            # 선택된 서비스 중 데이터가 없는 경우에도 빈 객체 추가
-            if selected_services:
-                for service_key in selected_services:
-                    if service_key not in all_services_data:
-                        all_services_data[service_key] = {"status": "collected", "data": {}}
-            
-            # 통합 데이터 파일 저장
-            all_services_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/all_services.json"
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=all_services_key,
-                Body=json.dumps(all_services_data, cls=DateTimeEncoder),
-                ContentType='application/json'
-            )
-            logger.info(f"통합 서비스 데이터 저장 완료: {all_services_key}")
+            # 수집 카탈로그 갱신 (수집 목록은 카탈로그만 읽음)
+            try:
+                self._get_catalog(user_id).update(collection_id, fields=metadata, services=services)
+            except Exception as e:
+                logger.error(f"수집 카탈로그 갱신 중 오류 발생: {str(e)}")
             
-            # 캐시 무효화 - 기존 캐시 삭제
+            # 캐시 갱신
             self._invalidate_cache('collections', user_id)
-            self._invalidate_cache('all', user_id, collection_id)
-            
-            # 메타데이터를 캐시에 저장
             self._set_in_cache('metadata', user_id, metadata, collection_id)
-            logger.info(f"💾 메타데이터 캐시 저장 완료: {collection_id}")
-            
-            # 서비스 데이터를 캐시에 저장
-            self._set_in_cache('data', user_id, all_services_data, collection_id, 'all')
-            logger.info(f"💾 서비스 데이터 캐시 저장 완료: {collection_id}")
             
             logger.info(f"사용자 {user_id}의 수집 데이터 {collection_id}를 S3에 저장했습니다.")
             return True
             
         except Exception as e:
-            logger.error(f"S3에 데이터 저장 중 오류 발생: {str(e)}")
+            logger.error(f"S3에 수집 메타데이터 저장 중 오류 발생: {str(e)}")
             return False
     
-    def get_collection_data(self, user_id, collection_id):
+    def save_collection_data(self, user_id, collection_id, data, selected_services=None):
+        """
+        수집된 데이터를 S3에 저장 (서비스별 저장 후 수집 마무리)
+        
+        Args:
+            user_id: 사용자 ID
+            collection_id: 수집 ID
+            data: 저장할 데이터 (dict)
+            selected_services: 선택된 서비스 목록 (list)
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        service_summaries = {}
+        for service_key, service_data in data.items():
+            summary = self.save_service_data(user_id, collection_id, service_key, service_data)
+            if summary is None:
+                return False
+            service_summaries[service_key] = summary
+        return self.finalize_collection(user_id, collection_id, service_summaries, selected_services)
+    
+    @staticmethod
+    def _empty_service_data():
+        """데이터가 없는 서비스의 기본 데이터"""
+        return {"status": "collected", "data": {}}
+    
+    def get_collection_metadata(self, user_id, collection_id):
+        """
+        수집 메타데이터 조회 (캐시 → S3, 수집 메타데이터는 변경되지 않으므로 만료 없이 캐시)
+        
+        Args:
+            user_id: 사용자 ID
+            collection_id: 수집 ID
+            
+        Returns:
+            tuple: (메타데이터, 데이터 소스) (없으면 (None, None))
+        """
+        metadata_key = f"{self._get_collection_prefix(user_id, collection_id)}metadata.json"
+        try:
+            return read_cached(
+                self.s3_client, self.bucket_name, metadata_key, S3Storage.CACHE_NAMESPACES['metadata'], user_id,
+                self._get_cache_key('metadata', collection_id), immutable=True
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                logger.warning(f"❌ S3에서 메타데이터를 찾을 수 없습니다: {metadata_key}")
+                return None, None
+            logger.error(f"❌ S3에서 메타데이터 로드 중 오류: {str(e)}")
+            raise
+    
+    def get_collection_data(self, user_id, collection_id, services=None):
         """
         S3에서 특정 수집 ID의 데이터 조회
         
         Args:
             user_id: 사용자 ID
             collection_id: 수집 ID
+            services: 조회할 서비스 목록 (없으면 전체, 지정하면 나머지 서비스는 조회하지 않음)
             
         Returns:
             dict: 수집된 데이터와 메타데이터
@@ -274,62 +303,29 @@ class S3Storage:
             result = {'metadata': None, 'services_data': {}}
             data_source = {'metadata': None, 'services_data': None}  # 데이터 소스 추적
             
-            # 메타데이터 캐시 확인
-            metadata, cache_hit = self._get_from_cache('metadata', user_id, collection_id)
-            if cache_hit:
-                logger.info(f"✅ 메타데이터 캐시 히트 성공: {collection_id}")
-                result['metadata'] = metadata
-                data_source['metadata'] = 'cache'
-            else:
-                logger.info(f"❌ 메타데이터 캐시 히트 실패: {collection_id}")
-                # 메타데이터 조회
-                metadata_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/metadata.json"
-                logger.info(f"📥 S3에서 메타데이터 조회 시도: {metadata_key}")
-                
-                try:
-                    metadata_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=metadata_key)
-                    result['metadata'] = json.loads(metadata_obj['Body'].read().decode('utf-8'))
-                    logger.info(f"📥 S3에서 메타데이터 로드 성공")
-                    data_source['metadata'] = 'S3'
-                    
-                    # 메타데이터 캐시에 저장
-                    self._set_in_cache('metadata', user_id, result['metadata'], collection_id)
-                    logger.info(f"💾 메타데이터 캐시 저장 완료")
-                except ClientError as e:
-                    if e.response['Error']['Code'] == 'NoSuchKey':
-                        logger.warning(f"❌ S3에서 메타데이터를 찾을 수 없습니다: {metadata_key}")
-                        return None
-                    else:
-                        logger.error(f"❌ S3에서 메타데이터 로드 중 오류: {str(e)}")
-                        raise
-            
-            # 서비스 데이터 캐시 확인
-            services_data, cache_hit = self._get_from_cache('data', user_id, collection_id, 'all')
-            if cache_hit:
-                logger.info(f"✅ 서비스 데이터 캐시 히트 성공: {collection_id}")
-                result['services_data'] = services_data
-                data_source['services_data'] = 'cache'
+            # 메타데이터 조회
+            result['metadata'], data_source['metadata'] = self.get_collection_metadata(user_id, collection_id)
+            if result['metadata'] is None:
+                return None
+            logger.info(f"📥 메타데이터 로드 성공 ({data_source['metadata']}): {collection_id}")
+            
+            # 서비스별로 저장된 수집은 서비스 파일로 통합 데이터 구성
+            if 'stored_services' in result['metadata']:
+                result['services_data'], data_source['services_data'] = self._load_stored_services(
+                    user_id, collection_id, result['metadata'], services
+                )
                 logger.info(f"📊 데이터 소스 요약 - 메타데이터: {data_source['metadata']}, 서비스 데이터: {data_source['services_data']}")
                 return result
-            else:
-                logger.info(f"❌ 서비스 데이터 캐시 히트 실패: {collection_id}")
             
-            # 통합 서비스 데이터 파일 조회
+            # 통합 서비스 데이터 파일 조회 (서비스별 저장 도입 전 수집)
             all_services_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/all_services.json"
-            logger.info(f"📥 S3에서 통합 서비스 데이터 조회 시도: {all_services_key}")
-            
             try:
-                all_services_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=all_services_key)
-                result['services_data'] = json.loads(all_services_obj['Body'].read().decode('utf-8'))
-                logger.info(f"📥 S3에서 통합 서비스 데이터 로드 성공")
-                data_source['services_data'] = 'S3'
-                
-                # 서비스 데이터 캐시에 저장
-                self._set_in_cache('data', user_id, result['services_data'], collection_id, 'all')
-                logger.info(f"💾 서비스 데이터 캐시 저장 완료")
-                
+                result['services_data'], data_source['services_data'] = read_cached(
+                    self.s3_client, self.bucket_name, all_services_key, S3Storage.CACHE_NAMESPACES['data'], user_id,
+                    self._get_cache_key('data', collection_id, 'all'), immutable=True, disk=True
+                )
                 logger.info(f"📊 데이터 소스 요약 - 메타데이터: {data_source['metadata']}, 서비스 데이터: {data_source['services_data']}")
-                return result
+                return self._filter_services(result, services)
             except ClientError as e:
                 if e.response['Error']['Code'] == 'NoSuchKey':
                     logger.warning(f"❌ S3에서 통합 서비스 데이터를 찾을 수 없습니다. 개별 서비스 파일 조회로 전환합니다.")
@@ -338,7 +334,7 @@ class S3Storage:
                     if legacy_result:
                         data_source['services_data'] = 'S3 (legacy)'
                         logger.info(f"📊 데이터 소스 요약 - 메타데이터: {data_source['metadata']}, 서비스 데이터: {data_source['services_data']}")
-                    return legacy_result
+                    return self._filter_services(legacy_result, services)
                 else:
                     logger.error(f"❌ S3에서 통합 서비스 데이터 로드 중 오류: {str(e)}")
                     raise
@@ -347,6 +343,52 @@ class S3Storage:
             logger.error(f"❌ 데이터 조회 중 오류 발생: {str(e)}")
             return None
     
+    def _load_stored_services(self, user_id, collection_id, metadata, services=None):
+        """
+        서비스별 파일을 동시에 읽어 통합 서비스 데이터를 구성합니다. (캐시 → 디스크 → S3)
+        
+        Returns:
+            tuple: (서비스별 데이터, 데이터 소스 요약)
+        """
+        targets = [service_key for service_key in metadata['stored_services'] if services is None or service_key in services]
+        
+        def fetch(service_key):
+            try:
+                return read_cached(
+                    self.s3_client, self.bucket_name, self._get_service_key(user_id, collection_id, service_key),
+                    S3Storage.CACHE_NAMESPACES['data'], user_id,
+                    self._get_cache_key('data', collection_id, service_key), immutable=True, disk=True
+                )
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'NoSuchKey':
+                    raise
+                logger.warning(f"⚠️ S3에서 서비스 {service_key} 데이터를 찾을 수 없습니다")
+                return self._empty_service_data(), 'missing'
+        
+        services_data = {}
+        sources = {}
+        if targets:
+            with ThreadPoolExecutor(max_workers=min(SERVICE_FETCH_WORKERS, len(targets))) as executor:
+                for service_key, (service_data, source) in zip(targets, executor.map(fetch, targets)):
+                    services_data[service_key] = service_data
+                    sources[source] = sources.get(source, 0) + 1
+        
+        for service_key in metadata.get('selected_services', []):
+            if services is None or service_key in services:
+                services_data.setdefault(service_key, self._empty_service_data())
+        
+        return services_data, ', '.join(f"{source} {count}개" for source, count in sources.items()) or 'none'
+    
+    @staticmethod
+    def _filter_services(result, services):
+        """조회 결과에서 요청한 서비스만 남깁니다."""
+        if result and services is not None:
+            result['services_data'] = {
+                service_key: service_data for service_key, service_data in result['services_data'].items()
+                if service_key in services
+            }
+        return result
+    
     def _get_collection_data_legacy(self, user_id, collection_id, result):
         """
         이전 방식으로 개별 서비스 파일 조회 (하위 호환성 유지)
@@ -383,12 +425,7 @@ class S3Storage:
                     # 통합 데이터 파일 저장
                     all_services_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/all_services.json"
                     logger.info(f"📤 S3에 빈 통합 서비스 데이터 생성 시작")
-                    self.s3_client.put_object(
-                        Bucket=self.bucket_name,
-                        Key=all_services_key,
-                        Body=json.dumps(all_services_data),
-                        ContentType='application/json'
-                    )
+                    blob_codec.put_json(self.s3_client, self.bucket_name, all_services_key, all_services_data, content_type='application/json')
                     logger.info(f"📤 S3에 통합 서비스 데이터 생성 완료: {all_services_key}")
                     
                     # 결과에 추가
@@ -402,24 +439,30 @@ class S3Storage:
             except Exception as e:
                 logger.error(f"❌ S3 서비스 디렉토리 조회 중 오류: {str(e)}")
             
-            # 각 서비스 데이터 조회
-            all_services_data = {}
-            for service_key in selected_services:
+            # 각 서비스 데이터 동시 조회
+            def fetch(service_key):
                 try:
-                    service_data_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/services/{service_key}.json"
+                    service_data_key = self._get_service_key(user_id, collection_id, service_key)
                     logger.info(f"📥 S3에서 서비스 데이터 조회 시도: {service_key}")
                     
                     service_data_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=service_data_key)
-                    service_data = json.loads(service_data_obj['Body'].read().decode('utf-8'))
-                    all_services_data[service_key] = service_data
+                    service_data = blob_codec.load_json(service_data_obj)
                     logger.info(f"📥 S3에서 서비스 {service_key} 데이터 로드 성공")
+                    return service_data
                 except ClientError as e:
                     if e.response['Error']['Code'] == 'NoSuchKey':
                         logger.warning(f"⚠️ S3에서 서비스 {service_key} 데이터를 찾을 수 없습니다")
                         # 데이터가 없으면 빈 데이터 생성
-                        all_services_data[service_key] = {"status": "collected", "data": {}}
-                    else:
-                        logger.error(f"❌ S3에서 서비스 {service_key} 데이터 로드 중 오류: {str(e)}")
+                        return self._empty_service_data()
+                    logger.error(f"❌ S3에서 서비스 {service_key} 데이터 로드 중 오류: {str(e)}")
+                    return None
+            
+            all_services_data = {}
+            if selected_services:
+                with ThreadPoolExecutor(max_workers=min(SERVICE_FETCH_WORKERS, len(selected_services))) as executor:
+                    for service_key, service_data in zip(selected_services, executor.map(fetch, selected_services)):
+                        if service_data is not None:
+                            all_services_data[service_key] = service_data
             
             # 데이터가 비어있는지 확인
             if not all_services_data:
@@ -432,12 +475,7 @@ class S3Storage:
             try:
                 all_services_key = f"{self._get_user_prefix(user_id)}collections/{collection_id}/all_services.json"
                 logger.info(f"📤 S3에 통합 서비스 데이터 저장 시작")
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=all_services_key,
-                    Body=json.dumps(all_services_data),
-                    ContentType='application/json'
-                )
+                blob_codec.put_json(self.s3_client, self.bucket_name, all_services_key, all_services_data, content_type='application/json')
                 logger.info(f"📤 S3에 통합 서비스 데이터 저장 완료: {all_services_key}")
             except Exception as e:
                 logger.error(f"❌ S3에 통합 서비스 데이터 저장 중 오류: {str(e)}")
@@ -475,45 +513,15 @@ class S3Storage:
             logger.info(f"📥 S3에서 컬렉션 목록 조회 시작")
         
         try:
-            collections = []
-            prefix = f"{self._get_user_prefix(user_id)}collections/"
-            
-            # S3에서 메타데이터 파일 목록 조회
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter='/'):
-                if 'CommonPrefixes' in page:
-                    for common_prefix in page['CommonPrefixes']:
-                        collection_prefix = common_prefix['Prefix']
-                        collection_id = collection_prefix.split('/')[-2]  # collections/{collection_id}/
-                        
-                        # 메타데이터 조회
-                        try:
-                            # 캐시 확인
-                            metadata, cache_hit = self._get_from_cache('metadata', user_id, collection_id)
-                            if cache_hit:
-                                collections.append(metadata)
-                                continue
-                            
-                            metadata_key = f"{collection_prefix}metadata.json"
-                            metadata_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=metadata_key)
-                            metadata = json.loads(metadata_obj['Body'].read().decode('utf-8'))
-                            collections.append(metadata)
-                            
-                            # 메타데이터 캐시에 저장
-                            self._set_in_cache('metadata', user_id, metadata, collection_id)
-                        except ClientError as e:
-                            if e.response['Error']['Code'] == 'NoSuchKey':
-                                logger.warning(f"수집 ID {collection_id}의 메타데이터를 찾을 수 없습니다.")
-                            else:
-                                raise
-            
-            # 최신순으로 정렬
-            collections.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+            # 카탈로그 한 번 읽기로 목록 조회 (카탈로그 도입 전 사용자는 한 번 재구성)
+            collections = self._get_catalog(user_id).list()
+            if collections is None:
+                collections = self.rebuild_catalog(user_id, include_services=False)
             
             # 캐시에 저장
             self._set_in_cache('collections', user_id, collections)
             logger.info(f"💾 컬렉션 목록 캐시 저장 완료: {user_id}")
-            logger.info(f"📊 데이터 소스: S3 (컬렉션 목록)")
+            logger.info(f"📊 데이터 소스: S3 (컬렉션 카탈로그)")
             
             return collections
             
@@ -521,6 +529,61 @@ class S3Storage:
             logger.error(f"사용자 수집 목록 조회 중 오류 발생: {str(e)}")
             return []
     
+    def rebuild_catalog(self, user_id, include_services=True):
+        """
+        수집별 메타데이터를 모두 읽어 사용자의 수집 카탈로그를 다시 만듭니다.
+        
+        Args:
+            user_id: 사용자 ID
+            include_services: 통합 서비스 데이터까지 읽어 서비스별 크기와 요약 개수를 기록할지 여부
+            
+        Returns:
+            list: 수집 데이터 메타데이터 목록 (최신순)
+        """
+        collections = []
+        prefix = f"{self._get_user_prefix(user_id)}collections/"
+        
+        # S3에서 메타데이터 파일 목록 조회
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix, Delimiter='/'):
+            for common_prefix in page.get('CommonPrefixes', []):
+                collection_prefix = common_prefix['Prefix']
+                collection_id = collection_prefix.split('/')[-2]  # collections/{collection_id}/
+                
+                try:
+                    metadata_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=f"{collection_prefix}metadata.json")
+                    entry = blob_codec.load_json(metadata_obj)
+                except ClientError as e:
+                    if e.response['Error']['Code'] == 'NoSuchKey':
+                        logger.warning(f"수집 ID {collection_id}의 메타데이터를 찾을 수 없습니다.")
+                        continue
+                    raise
+                
+                # 서비스별로 저장된 수집은 메타데이터에 서비스 요약이 있음
+                if 'stored_services' in entry:
+                    collections.append(entry)
+                    continue
+                
+                entry['services'] = {}
+                if include_services:
+                    try:
+                        all_services_obj = self.s3_client.get_object(Bucket=self.bucket_name, Key=f"{collection_prefix}all_services.json")
+                        for service_key, service_data in blob_codec.load_json(all_services_obj).items():
+                            size = len(blob_codec.dumps(service_data).encode('utf-8'))
+                            entry['services'][service_key] = summarize_service(service_data, size)
+                    except ClientError as e:
+                        if e.response['Error']['Code'] != 'NoSuchKey':
+                            raise
+                collections.append(entry)
+        
+        # 최신순으로 정렬
+        collections.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        
+        self._get_catalog(user_id).replace(collections)
+        self._invalidate_cache('collections', user_id)
+        logger.info(f"수집 카탈로그 재구성 완료: 사용자={user_id}, 수집 {len(collections)}개")
+        return collections
+    
     def get_service_data(self, user_id, collection_id, service_type):
         """
         특정 수집 ID의 특정 서비스 데이터만 조회
@@ -540,6 +603,22 @@ class S3Storage:
                 logger.info(f"✅ 서비스 데이터 캐시 히트 성공: {collection_id}/{service_type}")
                 return service_data
             
+            # 서비스별로 저장된 수집은 해당 서비스 파일만 조회
+            metadata, _ = self.get_collection_metadata(user_id, collection_id)
+            if metadata is None:
+                logger.warning(f"❌ 수집 ID {collection_id}의 데이터를 찾을 수 없습니다.")
+                return None
+            if 'stored_services' in metadata:
+                if service_type not in metadata['stored_services']:
+                    return self._empty_service_data() if service_type in metadata.get('selected_services', []) else None
+                service_data, source = read_cached(
+                    self.s3_client, self.bucket_name, self._get_service_key(user_id, collection_id, service_type),
+                    S3Storage.CACHE_NAMESPACES['data'], user_id,
+                    self._get_cache_key('data', collection_id, service_type), immutable=True, disk=True
+                )
+                logger.info(f"📥 서비스 데이터 로드 성공 ({source}): {collection_id}/{service_type}")
+                return service_data
+            
             # 전체 데이터 조회
             collection_data = self.get_collection_data(user_id, collection_id)
             if not collection_data or 'services_data' not in collection_data:
@@ -588,6 +667,14 @@ class S3Storage:
                             Delete={'Objects': objects_to_delete}
                         )
             
+            forget_objects(self.bucket_name, prefix=prefix)
+            
+            # 수집 카탈로그에서 제거
+            try:
+                self._get_catalog(user_id).remove(collection_id)
+            except Exception as e:
+                logger.error(f"수집 카탈로그 갱신 중 오류 발생: {str(e)}")
+            
             # 캐시 무효화
             self._invalidate_cache('collections', user_id)
             self._invalidate_cache('all', user_id, collection_id)
@@ -1,4 +1,3 @@
-import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 # 상수 정의
@@ -6,6 +5,8 @@ RESOURCE_STATUS_PASS = 'pass'
 RESOURCE_STATUS_WARNING = 'warning'
 RESOURCE_STATUS_FAIL = 'fail'
 from app.services.service_advisor.acm.checks.base_acm_check import BaseACMCheck
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 
 class CertificateExpiryCheck(BaseACMCheck):
     """ACM 인증서 만료 검사"""
@@ -19,41 +20,15 @@ class CertificateExpiryCheck(BaseACMCheck):
         try:
             certificates = []
             
-            # 모든 리전 목록 가져오기
-            if role_arn:
-                sts_client = self.session.client('sts')
-                assumed_role = sts_client.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName='ACMCertificateExpiryCheck'
-                )
-                credentials = assumed_role['Credentials']
-                ec2_client = boto3.client(
-                    'ec2',
-                    aws_access_key_id=credentials['AccessKeyId'],
-                    aws_secret_access_key=credentials['SecretAccessKey'],
-                    aws_session_token=credentials['SessionToken']
-                )
-            else:
-                ec2_client = self.session.client('ec2')
+            # 활성 리전 목록 가져오기 (계정별 캐시)
+            regions = get_enabled_regions(role_arn=role_arn, service_name='acm', session=self.session)
             
-            # 모든 리전 목록 가져오기
-            regions_response = ec2_client.describe_regions()
-            regions = [region['RegionName'] for region in regions_response['Regions']]
-            
-            # 각 리전에서 인증서 조회
-            for region in regions:
+            def collect_region(region: str) -> List[Dict[str, Any]]:
+                region_results = []
+                
                 try:
                     # 리전별 ACM 클라이언트 생성
-                    if role_arn:
-                        acm_client = boto3.client(
-                            'acm',
-                            region_name=region,
-                            aws_access_key_id=credentials['AccessKeyId'],
-                            aws_secret_access_key=credentials['SecretAccessKey'],
-                            aws_session_token=credentials['SessionToken']
-                        )
-                    else:
-                        acm_client = self.session.client('acm', region_name=region)
+                    acm_client = self.get_client('acm', region_name=region, role_arn=role_arn)
                     
                     # 인증서 목록 조회
                     paginator = acm_client.get_paginator('list_certificates')
@@ -66,7 +41,7 @@ class CertificateExpiryCheck(BaseACMCheck):
                                 cert_detail = acm_client.describe_certificate(CertificateArn=cert_arn)
                                 cert_info = cert_detail['Certificate']
                                 
-                                certificates.append({
+                                region_results.append({
                                     'CertificateArn': cert_arn,
                                     'DomainName': cert_info.get('DomainName', 'N/A'),
                                     'Status': cert_info.get('Status', 'UNKNOWN'),
@@ -81,7 +56,13 @@ class CertificateExpiryCheck(BaseACMCheck):
                                 
                 except Exception as e:
                     print(f"리전 {region} ACM 조회 실패: {str(e)}")
-                    continue
+                    return region_results
+                
+                return region_results
+            
+            # 리전별 조회 병렬 실행 (공유 팬아웃 실행기)
+            for region_results in map_regions(collect_region, regions, service_name='acm'):
+                certificates.extend(region_results)
             
             return {'certificates': certificates}
             
@@ -3,6 +3,7 @@ import logging
 import boto3
 from botocore.exceptions import ClientError
 from config import Config
+from app.services.credential_broker import get_credential_broker
 
 # 서비스별 어드바이저 임포트
 from app.services.service_advisor.ec2.ec2_advisor import EC2Advisor
@@ -87,31 +88,8 @@ class ServiceAdvisorFactory:
         """
         try:
             if role_arn:
-                # STS 클라이언트 생성
-                sts_client = boto3.client(
-                    'sts',
-                    region_name=Config.AWS_REGION,
-                    aws_access_key_id=Config.AWS_ACCESS_KEY,
-                    aws_secret_access_key=Config.AWS_SECRET_KEY
-                )
-                
-                # 역할 수임
-                response = sts_client.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName='ServiceAdvisorSession',
-                    DurationSeconds=3600  # 1시간
-                )
-                
-                # 임시 자격증명 가져오기
-                credentials = response['Credentials']
-                
-                # 세션 생성
-                session = boto3.Session(
-                    aws_access_key_id=credentials['AccessKeyId'],
-                    aws_secret_access_key=credentials['SecretAccessKey'],
-                    aws_session_token=credentials['SessionToken'],
-                    region_name=Config.AWS_REGION
-                )
+                # 캐시된 역할 자격 증명 세션 사용 (만료 전 자동 갱신)
+                session = get_credential_broker().get_session(role_arn)
                 
                 self.logger.info(f"Role ARN {role_arn}을 사용하여 AWS 세션 생성 완료")
                 return session
@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.common.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING, RESOURCE_STATUS_FAIL
 )
@@ -42,19 +43,14 @@ class SecurityGroupCheck(BaseALBCheck):
             return {'load_balancers': [], 'security_groups': {}}
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_load_balancers = []
         all_security_groups = {}
         
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
-                all_load_balancers.extend(result['load_balancers'])
-                all_security_groups.update(result['security_groups'])
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='elbv2'):
+            all_load_balancers.extend(result['load_balancers'])
+            all_security_groups.update(result['security_groups'])
         
         return {
             'load_balancers': all_load_balancers,
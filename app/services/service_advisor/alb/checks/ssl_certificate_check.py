@@ -1,7 +1,6 @@
 import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.common.aws_client import create_boto3_client
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING, RESOURCE_STATUS_FAIL
@@ -2,6 +2,8 @@ import boto3
 from botocore.exceptions import ClientError
 import logging
 from typing import Optional, Dict, Any
+from app.services.aws_client_pool import get_client_pool
+from app.services.credential_broker import get_credential_broker
 
 class AWSClient:
     """
@@ -32,7 +34,7 @@ class AWSClient:
         """
         if service_name not in self.clients:
             try:
-                self.clients[service_name] = self.session.client(service_name)
+                self.clients[service_name] = get_client_pool().get_client(service_name, session=self.session)
                 self.logger.debug(f"{service_name} 클라이언트 생성 완료")
             except ClientError as e:
                 self.logger.error(f"{service_name} 클라이언트 생성 중 오류 발생: {str(e)}")
@@ -98,42 +100,11 @@ def create_boto3_client(service_name, region_name=None, role_arn=None):
         if not Config.AWS_ACCESS_KEY or not Config.AWS_SECRET_KEY:
             raise Exception(".env 파일에 AWS_ACCESS_KEY와 AWS_SECRET_KEY가 설정되지 않았습니다.")
         
-        session = boto3.Session(
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY,
-            region_name=region_name or Config.AWS_REGION
-        )
+        # 캐시된 역할 자격 증명 세션 사용 (만료 전 자동 갱신)
+        session = get_credential_broker().get_session(role_arn, region_name=region_name or Config.AWS_REGION)
         
-        # STS 클라이언트로 역할 전환
-        sts_client = session.client('sts')
-        logging.info(f"Role ARN으로 인증 시도: {role_arn}")
-        
-        # 현재 자격증명 확인
-        try:
-            current_identity = sts_client.get_caller_identity()
-            logging.info(f"현재 자격증명: {current_identity['Arn']}")
-        except Exception as e:
-            logging.error(f"현재 자격증명 확인 실패: {str(e)}")
-        
-        response = sts_client.assume_role(
-            RoleArn=role_arn,
-            RoleSessionName='ServiceAdvisorSession',
-            DurationSeconds=3600  # 1시간
-        )
-        
-        credentials = response['Credentials']
-        logging.info(f"Role 전환 성공: {response['AssumedRoleUser']['Arn']}")
-        
-        # 임시 자격 증명으로 새 세션 생성
-        session = boto3.Session(
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken'],
-            region_name=region_name or Config.AWS_REGION
-        )
-        
-        # 클라이언트 생성
-        client = session.client(service_name)
+        # 클라이언트 생성 (풀에서 역할 ARN 단위로 재사용)
+        client = get_client_pool().get_client(service_name, session=session, identity=role_arn)
         
         # 연결 테스트
         if service_name == 'sts':
@@ -2,6 +2,8 @@ import boto3
 from botocore.exceptions import ClientError
 import logging
 from typing import Optional, Dict, Any
+from app.services.aws_client_pool import get_client_pool
+from app.services.region_registry import get_enabled_regions
 
 class AWSClient:
     """
@@ -36,10 +38,9 @@ class AWSClient:
         
         if client_key not in self.clients:
             try:
-                if region_name:
-                    self.clients[client_key] = self.session.client(service_name, region_name=region_name)
-                else:
-                    self.clients[client_key] = self.session.client(service_name)
+                self.clients[client_key] = get_client_pool().get_client(
+                    service_name, region_name=region_name, session=self.session
+                )
                 self.logger.debug(f"{service_name} 클라이언트 생성 완료 (region: {region_name or 'default'})")
             except ClientError as e:
                 self.logger.error(f"{service_name} 클라이언트 생성 중 오류 발생: {str(e)}")
@@ -96,30 +97,29 @@ def create_boto3_client(service_name, region_name=None, role_arn=None):
     """
     # 일단 role_arn을 무시하고 기본 자격증명 사용
     # Role assume 권한 문제로 인한 임시 수정
-    session = boto3.Session()
-    if region_name:
-        return session.client(service_name, region_name=region_name)
-    else:
-        return session.client(service_name)
+    return get_client_pool().get_client(service_name, region_name=region_name, session=_get_default_session())
 
-def get_all_regions(service_name='lambda'):
+_default_session = None
+
+def _get_default_session():
+    """
+    기본 자격 증명 공급자 체인을 사용하는 세션을 반환합니다. (프로세스당 한 번 생성)
     """
-    Lambda 서비스가 지원하는 모든 리전을 반환합니다.
+    global _default_session
+    if _default_session is None:
+        _default_session = boto3.Session()
+    return _default_session
+
+def get_all_regions(service_name='lambda', role_arn=None):
+    """
+    서비스를 제공하는 리전 중 계정에서 활성화된 리전을 반환합니다. (리전 레지스트리 사용)
     
     Args:
         service_name: AWS 서비스 이름
+        role_arn: AWS 역할 ARN (선택 사항)
         
     Returns:
         List[str]: 리전 목록
     """
-    try:
-        session = boto3.Session()
-        return session.get_available_regions(service_name)
-    except Exception:
-        # 기본 리전 목록 반환
-        return [
-            'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
-            'ap-northeast-1', 'ap-northeast-2', 'ap-southeast-1', 'ap-southeast-2',
-            'ap-south-1', 'eu-west-1', 'eu-west-2', 'eu-central-1',
-            'ca-central-1', 'sa-east-1'
-        ]
\ No newline at end of file
+    return get_enabled_regions(role_arn=role_arn, service_name=service_name,
+                               session=None if role_arn else _get_default_session())
@@ -5,6 +5,9 @@ import boto3
 from typing import Dict, List, Any, Optional
 import logging
 from config import Config
+from app.services.aws_client_pool import get_client_pool
+from app.services.regional_executor import track_failed_regions
+from app.services.service_advisor.common.unified_result import STATUS_OK, STATUS_WARNING
 
 class BaseAdvisor:
     """
@@ -23,6 +26,23 @@ class BaseAdvisor:
         self.checks = {}
         self._register_checks()
     
+    def get_client(self, service_name: str, region_name: str = None, role_arn: str = None) -> Any:
+        """
+        검사에 사용할 AWS 클라이언트를 프로세스 전역 클라이언트 풀에서 가져옵니다.
+        
+        Args:
+            service_name: AWS 서비스 이름
+            region_name: AWS 리전 이름 (선택 사항)
+            role_arn: AWS 역할 ARN (있으면 해당 역할의 자격증명 사용)
+            
+        Returns:
+            boto3 클라이언트 객체
+        """
+        if role_arn:
+            from app.services.service_advisor.aws_client import create_boto3_client
+            return create_boto3_client(service_name, region_name=region_name, role_arn=role_arn)
+        return get_client_pool().get_client(service_name, region_name=region_name, session=self.session)
+    
     def _register_checks(self) -> None:
         """
         서비스별 검사 항목을 등록합니다.
@@ -98,8 +118,16 @@ class BaseAdvisor:
         check_function = check_info.get('function')
         
         try:
-            result = check_function(role_arn=role_arn)
+            with track_failed_regions() as failed_regions:
+                result = check_function(role_arn=role_arn)
             result['id'] = check_id
+            if failed_regions:
+                # 일부 리전 조회가 실패하면 나머지 리전 데이터만으로 정상 결과를 내지 않도록 표시
+                result['failed_regions'] = failed_regions
+                if result.get('status') == STATUS_OK:
+                    result['status'] = STATUS_WARNING
+                result['message'] = (f"{result.get('message', '')} "
+                                     f"(리전 {len(failed_regions)}개 조회 실패: {', '.join(sorted(failed_regions))})").strip()
             return result
         except Exception as e:
             self.logger.error(f"검사 실행 중 오류 발생: {str(e)}")
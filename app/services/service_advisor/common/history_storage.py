@@ -1,13 +1,32 @@
-import boto3
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from botocore.exceptions import ClientError
 from config import Config
+from app.services import blob_codec
+from app.services.s3_conditional_write import conditional_rewrite, supports_conditional_writes
+from app.services.s3_conditional_read import forget_objects, read_cached, remember_object
+from app.services.storage_backend import create_storage_client
+from app.services.storage_cache import get_storage_cache
 
 logger = logging.getLogger(__name__)
 
+# 검사 기록 매니페스트 경로 접두사 (사용자별, 월별 샤드: {접두사}/{사용자}/{YYYY-MM}.jsonl)
+MANIFEST_PREFIX = 'advisor_history_manifest'
+
+# 사용자별 최신 검사 결과 색인 파일 이름 ({매니페스트 접두사}/{사용자}/latest.json)
+LATEST_INDEX_NAME = 'latest.json'
+
+# 최신 검사 결과 본문을 동시에 가져오는 최대 스레드 수
+LATEST_FETCH_WORKERS = 8
+
+# 공용 저장소 캐시 네임스페이스 (검사 결과 본문 / 매니페스트 샤드 / 최신 결과 색인)
+RESULT_CACHE_NAMESPACE = 'history.result'
+MANIFEST_CACHE_NAMESPACE = 'history.manifest'
+LATEST_INDEX_CACHE_NAMESPACE = 'history.latest_index'
+
 class AdvisorHistoryStorage:
     """
     서비스 어드바이저 검사 기록을 S3에 저장하고 관리하는 클래스
@@ -23,13 +42,11 @@ class AdvisorHistoryStorage:
         self.region = region or Config.AWS_REGION
         self.bucket_name = Config.DATA_BUCKET_NAME
         
-        # S3 클라이언트 생성
-        self.s3_client = boto3.client(
-            's3',
-            region_name=self.region,
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY
-        )
+        # 저장소 클라이언트 생성 (Config.STORAGE_BACKEND에 따라 S3 또는 로컬 저장소)
+        self.s3_client = create_storage_client(self.region)
+        
+        # 설치된 botocore가 S3 조건부 쓰기(IfMatch)를 지원하는지 확인
+        self._conditional_writes = supports_conditional_writes(self.s3_client)
     
     def _get_history_prefix(self, username: str, service_name: str = None) -> str:
         """
@@ -62,7 +79,7 @@ class AdvisorHistoryStorage:
         # 검사 항목별로 고정된 키 사용 (최신 결과만 유지)
         return f"{self._get_history_prefix(username, service_name)}{check_id}/latest.json"
     
-    def _get_history_archive_key(self, username: str, service_name: str, check_id: str) -> str:
+    def _get_history_archive_key(self, username: str, service_name: str, check_id: str, now: datetime = None) -> str:
         """
         기록 아카이브 파일 키 생성 - 모든 검사 결과 보관
         
@@ -70,13 +87,45 @@ class AdvisorHistoryStorage:
             username: 사용자 ID
             service_name: 서비스 이름
             check_id: 검사 ID
+            now: 저장 시각 (기본값: 현재 시각)
             
         Returns:
             str: S3 파일 키
         """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        timestamp = (now or datetime.now()).strftime("%Y%m%d%H%M%S")
         return f"{self._get_history_prefix(username, service_name)}{check_id}/archive/{timestamp}.json"
     
+    @staticmethod
+    def _get_key_username(key: str) -> str:
+        """검사 결과 키(advisor_history/{사용자}/...)에서 사용자 ID를 추출합니다."""
+        parts = key.split('/')
+        return parts[1] if len(parts) > 1 else ''
+    
+    def _get_manifest_key(self, username: str, month: str) -> str:
+        """
+        매니페스트 샤드 키 생성
+        
+        Args:
+            username: 사용자 ID
+            month: 샤드 월 (YYYY-MM)
+            
+        Returns:
+            str: S3 파일 키
+        """
+        return f"{MANIFEST_PREFIX}/{username}/{month}.jsonl"
+    
+    def _get_latest_index_key(self, username: str) -> str:
+        """
+        최신 검사 결과 색인 키 생성
+        
+        Args:
+            username: 사용자 ID
+            
+        Returns:
+            str: S3 파일 키
+        """
+        return f"{MANIFEST_PREFIX}/{username}/{LATEST_INDEX_NAME}"
+    
     def save_check_result(self, username: str, service_name: str, check_id: str, result: Dict[str, Any]) -> bool:
         """
         검사 결과를 S3에 저장
@@ -91,8 +140,9 @@ class AdvisorHistoryStorage:
             bool: 저장 성공 여부
         """
         try:
-            # 메타데이터 추가
-            timestamp = datetime.now().isoformat()
+            # 메타데이터 추가 (아카이브 키와 같은 시각 사용)
+            now = datetime.now()
+            timestamp = now.isoformat()
             result_with_meta = {
                 "metadata": {
                     "username": username,
@@ -103,27 +153,51 @@ class AdvisorHistoryStorage:
                 "result": result
             }
             
-            # 한글 인코딩 문제 해결을 위해 ensure_ascii=False 설정
-            json_data = json.dumps(result_with_meta, ensure_ascii=False)
+            # 한 번만 직렬화/압축하여 최신 결과와 아카이브에 같은 본문 저장 (한글은 UTF-8 그대로 인코딩)
+            body, encoding_params, _ = blob_codec.encode_json(result_with_meta)
             
             # 최신 결과 저장 (검사 항목별로 최신 결과만 유지)
             latest_key = self._get_history_key(username, service_name, check_id)
-            self.s3_client.put_object(
+            latest_response = self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=latest_key,
-                Body=json_data.encode('utf-8'),  # UTF-8로 명시적 인코딩
-                ContentType='application/json; charset=utf-8'  # 문자셋 명시
+                Body=body,
+                ContentType='application/json; charset=utf-8',  # 문자셋 명시
+                **encoding_params
             )
             
             # 아카이브에도 저장 (모든 검사 결과 보관)
-            archive_key = self._get_history_archive_key(username, service_name, check_id)
-            self.s3_client.put_object(
+            archive_key = self._get_history_archive_key(username, service_name, check_id, now)
+            archive_response = self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=archive_key,
-                Body=json_data.encode('utf-8'),  # UTF-8로 명시적 인코딩
-                ContentType='application/json; charset=utf-8'  # 문자셋 명시
+                Body=body,
+                ContentType='application/json; charset=utf-8',  # 문자셋 명시
+                **encoding_params
             )
             
+            # 디스크 캐시에 저장 (같은 본문이므로 파일 하나를 함께 참조)
+            for key, response in ((latest_key, latest_response), (archive_key, archive_response)):
+                remember_object(self.bucket_name, key, body, response.get('ETag'), encoding_params.get('ContentEncoding'))
+            
+            # 매니페스트에 기록 요약 추가 (기록 목록은 매니페스트만 읽음)
+            try:
+                self._append_manifest(username, now.strftime('%Y-%m'),
+                                      [self._summarize(archive_key, result_with_meta)])
+            except Exception as e:
+                logger.error(f"검사 기록 매니페스트 갱신 중 오류 발생: {archive_key} - {str(e)}")
+            
+            # 최신 검사 결과 색인 갱신 (여러 검사 항목의 결과 유무를 한 번에 조회)
+            try:
+                self._update_latest_index(username, {
+                    f"{service_name}/{check_id}": self._summarize(latest_key, result_with_meta)
+                })
+            except Exception as e:
+                logger.error(f"최신 검사 결과 색인 갱신 중 오류 발생: {latest_key} - {str(e)}")
+            
+            # 이전 최신 결과 캐시 제거
+            get_storage_cache().invalidate(username, RESULT_CACHE_NAMESPACE, prefix=(latest_key,))
+            
             logger.info(f"검사 결과 저장 완료: {latest_key} (아카이브: {archive_key})")
             return True
             
@@ -143,61 +217,280 @@ class AdvisorHistoryStorage:
         Returns:
             List[Dict[str, Any]]: 검사 기록 목록
         """
+        return self.get_check_history_page(username, service_name=service_name, limit=limit)['items']
+    
+    def get_check_history_page(self, username: str, service_name: Optional[str] = None, limit: int = 50,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        사용자의 검사 기록을 최신 순으로 한 페이지 조회합니다. 매니페스트 샤드만 읽고 아카이브는 읽지 않습니다.
+        
+        Args:
+            username: 사용자 ID
+            service_name: 서비스 이름 (선택 사항)
+            limit: 페이지 크기
+            cursor: 이전 페이지에서 받은 다음 페이지 커서 (선택 사항)
+            
+        Returns:
+            Dict[str, Any]: {'items': 검사 기록 목록, 'next_cursor': 다음 페이지 커서 (마지막 페이지면 None)}
+        """
         try:
-            prefix = self._get_history_prefix(username, service_name)
-            logger.info(f"검사 기록 조회: 사용자={username}, 서비스={service_name}, 접두사={prefix}")
+            logger.info(f"검사 기록 조회: 사용자={username}, 서비스={service_name}, 커서={cursor}")
             
-            # 모든 아카이브 결과 조회
-            history_list = []
+            months = self._list_manifest_months(username)
+            if not months:
+                # 매니페스트 도입 전 기록만 있는 사용자는 한 번 재구성
+                self.rebuild_manifest(username)
+                months = self._list_manifest_months(username)
             
-            # S3 객체 목록 조회 (최대 1000개까지 가져옴)
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=1000
-            )
+            start_month, offset = None, 0
+            if cursor:
+                start_month, _, offset_text = cursor.partition(':')
+                offset = int(offset_text or 0)
+                months = [month for month in months if month <= start_month]
+            
+            items = []
+            for month in months:
+                entries = self._read_manifest_shard(username, month)
+                entries = [entry for entry in entries if not service_name or entry.get('service_name') == service_name]
+                entries.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+                
+                skip = offset if month == start_month else 0
+                remaining = limit - len(items)
+                items.extend(entries[skip:skip + remaining])
+                if len(items) >= limit:
+                    # 이 샤드에 남은 기록이 있으면 같은 샤드에서, 없으면 다음 샤드에서 이어서 조회
+                    if skip + remaining < len(entries):
+                        return {'items': items, 'next_cursor': f"{month}:{skip + remaining}"}
+                    older = [m for m in months if m < month]
+                    return {'items': items, 'next_cursor': f"{older[0]}:0" if older else None}
             
-            if 'Contents' in response:
-                # 모든 객체 처리
-                for obj in response['Contents']:
-                    key = obj['Key']
-                    
-                    # 아카이브 파일만 처리 (latest.json 제외)
-                    if 'archive' in key and key.endswith('.json'):
-                        try:
-                            # 객체 내용 가져오기
-                            obj_response = self.s3_client.get_object(
-                                Bucket=self.bucket_name,
-                                Key=key
-                            )
-                            
-                            data = json.loads(obj_response['Body'].read().decode('utf-8'))
-                            
-                            # 기록 정보 추출
-                            metadata = data.get('metadata', {})
-                            result_summary = {
-                                'key': key,
-                                'service_name': metadata.get('service_name', ''),
-                                'check_id': metadata.get('check_id', ''),
-                                'timestamp': metadata.get('timestamp', ''),
-                                'status': data.get('result', {}).get('status', ''),
-                                'message': data.get('result', {}).get('message', '')
-                            }
-                            
-                            history_list.append(result_summary)
-                            
-                        except Exception as e:
-                            logger.error(f"기록 항목 처리 중 오류 발생: {key} - {str(e)}")
-            
-            # 최신 순으로 정렬
-            history_list.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            # 제한된 개수만 반환
-            return history_list[:limit]
+            return {'items': items, 'next_cursor': None}
             
         except Exception as e:
             logger.error(f"검사 기록 조회 중 오류 발생: {str(e)}")
-            return []
+            return {'items': [], 'next_cursor': None}
+    
+    def rebuild_manifest(self, username: str) -> int:
+        """
+        아카이브 파일을 모두 읽어 사용자의 매니페스트를 다시 만듭니다.
+        매니페스트 도입 전에 저장된 기록을 색인할 때 사용합니다.
+        
+        Args:
+            username: 사용자 ID
+            
+        Returns:
+            int: 색인된 기록 수
+        """
+        shards: Dict[str, List[Dict[str, Any]]] = {}
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self._get_history_prefix(username)):
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                
+                # 아카이브 파일만 처리 (latest.json 제외)
+                if '/archive/' not in key or not key.endswith('.json'):
+                    continue
+                try:
+                    response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+                    data = blob_codec.load_json(response)
+                    shards.setdefault(self._get_archive_month(key), []).append(self._summarize(key, data))
+                except Exception as e:
+                    logger.error(f"기록 항목 처리 중 오류 발생: {key} - {str(e)}")
+        
+        for month, entries in shards.items():
+            self._put_manifest_shard(username, month, entries)
+        
+        count = sum(len(entries) for entries in shards.values())
+        logger.info(f"검사 기록 매니페스트 재구성 완료: 사용자={username}, 샤드 {len(shards)}개, 기록 {count}개")
+        return count
+    
+    def _summarize(self, key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """저장된 검사 결과에서 매니페스트 항목을 만듭니다."""
+        metadata = data.get('metadata', {})
+        result = data.get('result', {})
+        return {
+            'key': key,
+            'service_name': metadata.get('service_name', ''),
+            'check_id': metadata.get('check_id', ''),
+            'timestamp': metadata.get('timestamp', ''),
+            'status': result.get('status', ''),
+            'message': result.get('message', ''),
+            'problem_count': result.get('problem_count', 0)
+        }
+    
+    @staticmethod
+    def _get_archive_month(key: str) -> str:
+        """아카이브 키의 파일명(YYYYmmddHHMMSS.json)에서 샤드 월(YYYY-MM)을 구합니다."""
+        stamp = key.rsplit('/', 1)[-1]
+        return f"{stamp[:4]}-{stamp[4:6]}"
+    
+    def _list_manifest_months(self, username: str) -> List[str]:
+        """사용자의 매니페스트 샤드 월 목록을 최신 순으로 반환합니다."""
+        prefix = f"{MANIFEST_PREFIX}/{username}/"
+        months = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                name = obj['Key'][len(prefix):]
+                if name.endswith('.jsonl'):
+                    months.append(name[:-len('.jsonl')])
+        return sorted(months, reverse=True)
+    
+    def _read_manifest_shard(self, username: str, month: str) -> List[Dict[str, Any]]:
+        """
+        매니페스트 샤드를 읽습니다. 삭제 표시가 있는 기록은 제외합니다.
+        
+        Returns:
+            List[Dict[str, Any]]: 기록 목록 (샤드가 없으면 빈 목록)
+        """
+        def parse(body: bytes) -> List[Dict[str, Any]]:
+            lines = [json.loads(line) for line in body.decode('utf-8').splitlines() if line.strip()]
+            deleted = {line['key'] for line in lines if line.get('deleted')}
+            return list({line['key']: line for line in lines if not line.get('deleted') and line['key'] not in deleted}.values())
+        
+        try:
+            entries, _ = read_cached(self.s3_client, self.bucket_name, self._get_manifest_key(username, month),
+                                     MANIFEST_CACHE_NAMESPACE, username, (month,), parse=parse)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return []
+            raise
+        return list(entries)
+    
+    def _put_manifest_shard(self, username: str, month: str, lines: List[Dict[str, Any]]) -> None:
+        """매니페스트 샤드 전체를 씁니다."""
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=self._get_manifest_key(username, month),
+            Body=''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines).encode('utf-8'),
+            ContentType='application/x-ndjson; charset=utf-8'
+        )
+        get_storage_cache().invalidate(username, MANIFEST_CACHE_NAMESPACE, prefix=(month,))
+    
+    def _append_manifest(self, username: str, month: str, lines: List[Dict[str, Any]]) -> None:
+        """매니페스트 샤드 끝에 줄을 추가합니다."""
+        def append(body: Optional[bytes]) -> bytes:
+            existing = body.decode('utf-8') if body else ''
+            return (existing + ''.join(json.dumps(line, ensure_ascii=False) + '\n' for line in lines)).encode('utf-8')
+        
+        self._conditional_rewrite(self._get_manifest_key(username, month), append,
+                                  'application/x-ndjson; charset=utf-8')
+        get_storage_cache().invalidate(username, MANIFEST_CACHE_NAMESPACE, prefix=(month,))
+    
+    def _update_latest_index(self, username: str, entries: Dict[str, Optional[Dict[str, Any]]],
+                             overwrite: bool = True) -> None:
+        """최신 검사 결과 색인의 항목을 갱신합니다. 값이 None인 항목은 삭제하고, overwrite가 아니면 없는 항목만 추가합니다."""
+        def update(body: Optional[bytes]) -> bytes:
+            index = json.loads(body.decode('utf-8')) if body else {}
+            for item_key, entry in entries.items():
+                if entry is None:
+                    index.pop(item_key, None)
+                elif overwrite or item_key not in index:
+                    index[item_key] = entry
+            return json.dumps(index, ensure_ascii=False).encode('utf-8')
+        
+        self._conditional_rewrite(self._get_latest_index_key(username), update,
+                                  'application/json; charset=utf-8')
+        get_storage_cache().invalidate(username, LATEST_INDEX_CACHE_NAMESPACE)
+    
+    def _conditional_rewrite(self, key: str, build: Callable[[Optional[bytes]], bytes], content_type: str) -> None:
+        """객체를 읽고 새 본문으로 다시 씁니다. (동시 갱신 시 변경이 유실되지 않도록 조건부 쓰기 사용)"""
+        conditional_rewrite(self.s3_client, self.bucket_name, key, build, content_type,
+                            conditional=self._conditional_writes)
+    
+    def get_latest_status_batch(self, username: str, items: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """
+        여러 검사 항목의 최신 결과 요약을 색인 한 번 읽기로 조회합니다.
+        
+        Args:
+            username: 사용자 ID
+            items: (서비스 이름, 검사 ID) 목록
+            
+        Returns:
+            Dict[Tuple[str, str], Optional[Dict[str, Any]]]: {(서비스 이름, 검사 ID): 최신 결과 요약 (없으면 None)}
+        """
+        index = self._read_latest_index(username)
+        if index is None:
+            # 색인 도입 전 결과만 있는 사용자는 한 번 재구성
+            index = self.rebuild_latest_index(username)
+        return {(service_name, check_id): index.get(f"{service_name}/{check_id}") for service_name, check_id in items}
+    
+    def get_latest_check_results(self, username: str, items: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """
+        여러 검사 항목의 최신 결과 본문을 조회합니다. 색인에 있는 항목만 동시에 가져옵니다.
+        
+        Args:
+            username: 사용자 ID
+            items: (서비스 이름, 검사 ID) 목록
+            
+        Returns:
+            Dict[Tuple[str, str], Optional[Dict[str, Any]]]: {(서비스 이름, 검사 ID): 검사 결과 (없으면 None)}
+        """
+        statuses = self.get_latest_status_batch(username, items)
+        results: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {item: None for item in items}
+        targets = [item for item, status in statuses.items() if status]
+        if not targets:
+            return results
+        
+        def fetch(item: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_latest_check_result(username, item[0], item[1])
+            except Exception as e:
+                logger.error(f"최신 검사 결과 조회 중 오류 발생: {item[0]}/{item[1]} - {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(LATEST_FETCH_WORKERS, len(targets))) as executor:
+            for item, result in zip(targets, executor.map(fetch, targets)):
+                results[item] = result
+        return results
+    
+    def rebuild_latest_index(self, username: str) -> Dict[str, Dict[str, Any]]:
+        """
+        검사 항목별 latest.json을 모두 읽어 최신 검사 결과 색인을 다시 만듭니다.
+        
+        Args:
+            username: 사용자 ID
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: {'서비스 이름/검사 ID': 최신 결과 요약}
+        """
+        keys = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self._get_history_prefix(username)):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []) if obj['Key'].endswith('/latest.json'))
+        
+        def summarize(key: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self._summarize(key, self.get_check_result(key) or {})
+            except Exception as e:
+                logger.error(f"기록 항목 처리 중 오류 발생: {key} - {str(e)}")
+                return None
+        
+        index = {}
+        if keys:
+            with ThreadPoolExecutor(max_workers=min(LATEST_FETCH_WORKERS, len(keys))) as executor:
+                for entry in executor.map(summarize, keys):
+                    if entry and entry['service_name'] and entry['check_id']:
+                        index[f"{entry['service_name']}/{entry['check_id']}"] = entry
+        
+        # 재구성 중에 저장된 결과는 덮어쓰지 않음
+        self._update_latest_index(username, index, overwrite=False)
+        logger.info(f"최신 검사 결과 색인 재구성 완료: 사용자={username}, 항목 {len(index)}개")
+        return self._read_latest_index(username) or index
+    
+    def _read_latest_index(self, username: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        최신 검사 결과 색인을 읽습니다. 색인이 없으면 None을 반환합니다.
+        다른 워커 프로세스의 검사 직후에도 최신 색인을 보도록 캐시가 있어도 매번 ETag로 재검증합니다.
+        """
+        try:
+            index, _ = read_cached(self.s3_client, self.bucket_name, self._get_latest_index_key(username),
+                                   LATEST_INDEX_CACHE_NAMESPACE, username, (), revalidate=True)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                return None
+            raise
+        return index
     
     def _list_service_folders(self, prefix: str) -> List[str]:
         """
@@ -268,7 +561,7 @@ class AdvisorHistoryStorage:
                     Key=key
                 )
                 
-                data = json.loads(response['Body'].read().decode('utf-8'))
+                data = blob_codec.load_json(response)
                 metadata = data.get('metadata', {})
                 
                 return {
@@ -300,15 +593,9 @@ class AdvisorHistoryStorage:
             Optional[Dict[str, Any]]: 검사 결과 또는 None
         """
         try:
-            # S3에서 객체 가져오기
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=key
-            )
-            
-            # UTF-8로 명시적 디코딩하여 한글 처리
-            content = response['Body'].read().decode('utf-8')
-            data = json.loads(content)
+            # 캐시 또는 S3에서 가져오기 (아카이브는 변경되지 않으므로 만료 없이 캐시, 최신 결과는 ETag로 재검증)
+            data, _ = read_cached(self.s3_client, self.bucket_name, key, RESULT_CACHE_NAMESPACE,
+                                  self._get_key_username(key), (key,), immutable='/archive/' in key, disk=True)
             
             return data
             
@@ -355,6 +642,22 @@ class AdvisorHistoryStorage:
                 Key=key
             )
             
+            get_storage_cache().invalidate(self._get_key_username(key), RESULT_CACHE_NAMESPACE, prefix=(key,))
+            forget_objects(self.bucket_name, key=key)
+            
+            # 아카이브 삭제는 매니페스트에 삭제 표시 추가, 최신 결과 삭제는 색인에서 제거
+            parts = key.split('/')
+            if len(parts) > 2 and parts[0] == 'advisor_history' and '/archive/' in key:
+                try:
+                    self._append_manifest(parts[1], self._get_archive_month(key), [{'key': key, 'deleted': True}])
+                except Exception as e:
+                    logger.error(f"검사 기록 매니페스트 갱신 중 오류 발생: {key} - {str(e)}")
+            elif len(parts) == 5 and parts[0] == 'advisor_history' and parts[4] == 'latest.json':
+                try:
+                    self._update_latest_index(parts[1], {f"{parts[2]}/{parts[3]}": None})
+                except Exception as e:
+                    logger.error(f"최신 검사 결과 색인 갱신 중 오류 발생: {key} - {str(e)}")
+            
             logger.info(f"검사 결과 삭제 완료: {key}")
             return True
             
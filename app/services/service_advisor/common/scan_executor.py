@@ -0,0 +1,247 @@
+"""
+서비스 스캔 실행기
+
+서비스 전체 스캔은 검사를 하나씩 순서대로 실행하고 검사마다 S3 쓰기를 기다리므로
+스캔 시간이 모든 검사 시간의 합이 됩니다.
+이 모듈은 프로세스 전체 동시 실행 수 안에서 한 서비스의 검사를 동시에 실행하고,
+검사별 제한 시간과 취소를 지원하며, 결과 저장은 다른 검사가 실행되는 동안 백그라운드에서 진행합니다.
+스캔 시간은 대략 가장 느린 검사의 시간이 됩니다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# 진행 중인 검사의 제한 시간과 취소 요청을 확인하는 간격(초)
+POLL_INTERVAL = 0.5
+
+
+class _CheckSlot:
+    """검사 하나가 차지한 동시 실행 슬롯 (검사가 끝나거나 제한 시간을 넘기면 한 번만 반환)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.released = False
+        self.stuck = False
+
+
+class ScanExecutor:
+    """
+    검사 동시 실행 수가 제한된 스레드 안전한 스캔 실행기
+
+    실행 중인 스레드는 강제로 멈출 수 없으므로 제한 시간을 넘긴 검사는 결과를 버리고 슬롯을 먼저 반환합니다.
+    그 스레드가 끝날 때까지는 예비 스레드(최대 max_stuck개)가 대신 다음 검사를 실행하므로,
+    멈춘 검사가 쌓여도 이후 스캔이 기다리지 않습니다.
+    """
+
+    def __init__(self, max_workers: int = None, check_timeout: int = None, persist_workers: int = None,
+                 max_stuck: int = None):
+        """
+        스캔 실행기 초기화
+
+        Args:
+            max_workers: 프로세스 전체 최대 동시 검사 수 (기본값: Config에서 가져옴)
+            check_timeout: 검사별 제한 시간(초) (기본값: Config에서 가져옴)
+            persist_workers: 결과 저장 작업 스레드 수 (기본값: Config에서 가져옴)
+            max_stuck: 제한 시간을 넘기고도 실행 중인 검사를 대신할 예비 스레드 수 (기본값: Config에서 가져옴)
+        """
+        self.max_workers = max_workers or Config.SCAN_MAX_CONCURRENT_CHECKS
+        self.check_timeout = check_timeout or Config.SCAN_CHECK_TIMEOUT
+        self.persist_workers = persist_workers or Config.SCAN_PERSIST_WORKERS
+        self.max_stuck = max_stuck if max_stuck is not None else Config.SCAN_MAX_STUCK_CHECKS
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers + self.max_stuck,
+                                            thread_name_prefix='scan-check')
+        self._persist_executor = ThreadPoolExecutor(max_workers=self.persist_workers, thread_name_prefix='scan-persist')
+        self._slots = threading.Semaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._stats = {'running': 0, 'stuck': 0, 'timed_out': 0}
+
+    def run_scan(self, advisor, check_ids: List[str], role_arn: str = None,
+                 persist: Optional[Callable[[str, Dict[str, Any]], Any]] = None,
+                 timeout: int = None, cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        검사를 동시에 실행하고 검사 ID별 결과를 반환합니다.
+        제한 시간을 넘긴 검사와 취소된 검사는 오류 결과로 대체하고 나머지 검사 결과는 그대로 반환합니다.
+
+        Args:
+            advisor: run_check(check_id, role_arn)을 제공하는 어드바이저 객체
+            check_ids: 실행할 검사 ID 목록
+            role_arn: AWS 역할 ARN
+            persist: 완료된 검사 결과를 저장하는 함수 persist(check_id, result) (백그라운드에서 실행)
+            timeout: 검사별 제한 시간(초), 검사가 실행을 시작한 시점부터 계산 (기본값: check_timeout)
+            cancel_event: 설정되면 남은 검사를 취소하는 이벤트 (선택 사항)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: {검사 ID: 검사 결과} (check_ids 순서)
+        """
+        timeout = timeout or self.check_timeout
+        scan_start = time.time()
+        started: Dict[str, float] = {}
+        elapsed: Dict[str, float] = {}
+        slots: Dict[str, _CheckSlot] = {}
+
+        def run_check(check_id: str) -> Dict[str, Any]:
+            started[check_id] = time.time()
+            try:
+                return advisor.run_check(check_id, role_arn=role_arn)
+            finally:
+                elapsed[check_id] = time.time() - started[check_id]
+                self._release(slots[check_id], finished=True)
+
+        futures = {}
+        persist_futures = []
+        results: Dict[str, Dict[str, Any]] = {}
+        queued = list(check_ids)
+        pending = set()
+
+        while queued or pending:
+            if cancel_event is not None and cancel_event.is_set():
+                for check_id in queued:
+                    results[check_id] = _cancelled_result(check_id)
+                queued = []
+
+            # 빈 슬롯만큼 제출 (슬롯은 제출 전에 얻으므로 슬롯을 기다리는 검사가 작업 스레드를 차지하지 않음)
+            while queued and self._slots.acquire(blocking=not pending, timeout=POLL_INTERVAL if not pending else None):
+                check_id = queued.pop(0)
+                slots[check_id] = _CheckSlot()
+                with self._lock:
+                    self._stats['running'] += 1
+                future = self._executor.submit(run_check, check_id)
+                futures[future] = check_id
+                pending.add(future)
+            if not pending:
+                continue
+
+            done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                check_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"검사 {check_id} 실행 중 오류 발생: {str(e)}")
+                    result = _error_result(check_id, f'검사 실행 중 오류가 발생했습니다: {str(e)}')
+                results[check_id] = result
+
+                # 다른 검사가 실행되는 동안 결과 저장 (취소된 검사는 저장하지 않음)
+                if persist and not result.get('cancelled'):
+                    persist_futures.append(self._persist_executor.submit(self._persist, persist, check_id, result))
+
+            now = time.time()
+            for future in list(pending):
+                check_id = futures[future]
+                if cancel_event is not None and cancel_event.is_set():
+                    # 시작하지 않은 검사는 취소하고, 실행 중인 검사는 결과를 버리고 슬롯을 반환
+                    self._release(slots[check_id], finished=future.cancel())
+                    results[check_id] = _cancelled_result(check_id)
+                    pending.discard(future)
+                elif check_id in started and now - started[check_id] > timeout:
+                    # 실행 중인 스레드는 강제로 멈출 수 없으므로 결과를 버리고 슬롯을 반환 (예비 스레드가 대신 실행)
+                    self._release(slots[check_id], finished=False)
+                    with self._lock:
+                        self._stats['timed_out'] += 1
+                    logger.warning(f"검사 {check_id} 제한 시간 초과 ({timeout}초)")
+                    results[check_id] = _error_result(check_id, f'검사 제한 시간({timeout}초)을 초과했습니다.', timed_out=True)
+                    pending.discard(future)
+
+        # 마지막으로 끝난 검사의 저장만 기다리면 됨
+        wait(persist_futures)
+
+        wall_time = time.time() - scan_start
+        logger.info(f"스캔 완료: 검사 {len(check_ids)}개, 소요 {wall_time:.1f}초 "
+                    f"(검사 시간 합계 {sum(elapsed.values()):.1f}초, "
+                    f"제한 시간 초과 {sum(1 for r in results.values() if r.get('timed_out'))}개)")
+        return {check_id: results[check_id] for check_id in check_ids}
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        스캔 실행기 상태를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 실행 중인 검사 수, 제한 시간을 넘기고도 실행 중인 검사 수, 누적 제한 시간 초과 수
+        """
+        with self._lock:
+            return dict(self._stats, max_workers=self.max_workers, max_stuck=self.max_stuck)
+
+    def _release(self, slot: _CheckSlot, finished: bool) -> None:
+        """
+        검사 슬롯을 반환합니다.
+
+        Args:
+            slot: 검사 슬롯
+            finished: 검사 스레드가 끝났는지 여부 (False면 제한 시간 초과나 취소로 결과를 버린 경우)
+        """
+        with slot.lock:
+            with self._lock:
+                if finished:
+                    self._stats['running'] -= 1
+                    if slot.stuck:
+                        self._stats['stuck'] -= 1
+                else:
+                    if slot.released:
+                        # 그 사이 검사 스레드가 이미 끝남
+                        return
+                    # 예비 스레드가 남아 있을 때만 슬롯을 먼저 반환 (스레드 수 상한 유지)
+                    if self._stats['stuck'] >= self.max_stuck:
+                        logger.warning(f"제한 시간을 넘긴 검사 {self._stats['stuck']}개가 아직 실행 중이어서 "
+                                       f"검사가 끝날 때까지 슬롯을 반환하지 않습니다.")
+                        return
+                    self._stats['stuck'] += 1
+                    slot.stuck = True
+            if not slot.released:
+                slot.released = True
+                self._slots.release()
+
+    @staticmethod
+    def _persist(persist: Callable[[str, Dict[str, Any]], Any], check_id: str, result: Dict[str, Any]) -> None:
+        """결과 저장 함수를 실행합니다. 저장 실패는 스캔 결과에 영향을 주지 않습니다."""
+        try:
+            persist(check_id, result)
+        except Exception as e:
+            logger.error(f"검사 {check_id} 결과 저장 중 오류 발생: {str(e)}")
+
+
+def _error_result(check_id: str, message: str, timed_out: bool = False) -> Dict[str, Any]:
+    """검사 오류 결과를 생성합니다."""
+    result = {
+        'id': check_id,
+        'status': 'error',
+        'message': message,
+        'resources': [],
+        'recommendations': []
+    }
+    if timed_out:
+        result['timed_out'] = True
+    return result
+
+
+def _cancelled_result(check_id: str) -> Dict[str, Any]:
+    """취소된 검사 결과를 생성합니다."""
+    result = _error_result(check_id, '스캔이 취소되어 검사를 실행하지 않았습니다.')
+    result['cancelled'] = True
+    return result
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_scan_executor() -> ScanExecutor:
+    """
+    프로세스 전역 스캔 실행기를 반환합니다.
+
+    Returns:
+        ScanExecutor: 스캔 실행기 객체
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ScanExecutor()
+    return _executor
@@ -0,0 +1,177 @@
+"""
+스캔 범위 계정 스냅샷
+
+서비스 전체 스캔에서는 여러 검사가 같은 리전에 같은 describe_* 호출을 반복합니다.
+(예: EC2 검사 9개가 모두 describe_instances를 호출)
+이 모듈은 스캔이 진행되는 동안 (서비스, 리전, 작업, 파라미터) 단위로 페이지네이션된 전체 결과를
+한 번만 조회하여 공유합니다. 스캔 범위 밖에서는 캐시 없이 바로 조회합니다.
+"""
+import copy
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from app.services.service_advisor.aws_client import create_boto3_client
+
+logger = logging.getLogger(__name__)
+
+
+class ScanSnapshot:
+    """
+    한 역할(계정)의 스캔 동안 API 조회 결과를 메모이즈하는 스레드 안전한 스냅샷
+    """
+
+    def __init__(self, role_arn: str):
+        """
+        스캔 스냅샷 초기화
+
+        Args:
+            role_arn: AWS 역할 ARN
+        """
+        self.role_arn = role_arn
+        self._results: Dict[tuple, Any] = {}
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0}
+
+    def fetch(self, service_name: str, region: str, operation: str, **params) -> Dict[str, Any]:
+        """
+        API 조회 결과를 반환합니다. 같은 스캔에서 같은 조회는 한 번만 호출합니다.
+
+        Args:
+            service_name: AWS 서비스 이름
+            region: AWS 리전
+            operation: 클라이언트 메서드 이름 (예: describe_instances)
+            **params: 조회 파라미터
+
+        Returns:
+            Dict[str, Any]: 페이지네이션된 전체 결과의 사본 (검사에서 수정해도 다른 검사에 영향 없음)
+        """
+        key = (service_name, region, operation, json.dumps(params, sort_keys=True, default=str))
+
+        with self._get_key_lock(key):
+            with self._lock:
+                cached = key in self._results
+                if cached:
+                    self._stats['hits'] += 1
+            if not cached:
+                result = _call_operation(self.role_arn, service_name, region, operation, params)
+                with self._lock:
+                    self._results[key] = result
+                    self._stats['misses'] += 1
+
+        with self._lock:
+            return copy.deepcopy(self._results[key])
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        스냅샷 사용 통계를 반환합니다.
+
+        Returns:
+            Dict[str, int]: 히트/미스 횟수
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _get_key_lock(self, key: tuple) -> threading.Lock:
+        """조회 키별 잠금을 반환합니다. 동시에 같은 조회를 요청하면 한 번만 호출됩니다."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+
+_active_scans: Dict[str, Dict[str, Any]] = {}
+_active_scans_lock = threading.Lock()
+
+
+@contextmanager
+def scan_scope(role_arn: str):
+    """
+    스캔 범위를 시작합니다. 범위 안에서 fetch_scan_data로 조회한 결과는 공유됩니다.
+    같은 역할의 스캔이 겹치면 하나의 스냅샷을 함께 사용합니다.
+
+    Args:
+        role_arn: AWS 역할 ARN
+
+    Yields:
+        ScanSnapshot: 스캔 스냅샷 객체
+    """
+    with _active_scans_lock:
+        entry = _active_scans.setdefault(role_arn, {'snapshot': ScanSnapshot(role_arn), 'refs': 0})
+        entry['refs'] += 1
+    try:
+        yield entry['snapshot']
+    finally:
+        with _active_scans_lock:
+            entry['refs'] -= 1
+            if entry['refs'] == 0:
+                _active_scans.pop(role_arn, None)
+                logger.info(f"스캔 스냅샷 종료: {entry['snapshot'].get_stats()}")
+
+
+def get_scan_snapshot(role_arn: str) -> Optional[ScanSnapshot]:
+    """
+    진행 중인 스캔의 스냅샷을 반환합니다.
+
+    Args:
+        role_arn: AWS 역할 ARN
+
+    Returns:
+        Optional[ScanSnapshot]: 스캔 중이 아니면 None
+    """
+    with _active_scans_lock:
+        entry = _active_scans.get(role_arn)
+        return entry['snapshot'] if entry else None
+
+
+def fetch_scan_data(role_arn: str, service_name: str, region: str, operation: str, **params) -> Dict[str, Any]:
+    """
+    스캔 스냅샷을 통해 API 조회 결과를 반환합니다. 스캔 중이 아니면 바로 조회합니다.
+
+    Args:
+        role_arn: AWS 역할 ARN
+        service_name: AWS 서비스 이름
+        region: AWS 리전
+        operation: 클라이언트 메서드 이름
+        **params: 조회 파라미터
+
+    Returns:
+        Dict[str, Any]: 페이지네이션된 전체 결과
+    """
+    snapshot = get_scan_snapshot(role_arn)
+    if snapshot:
+        return snapshot.fetch(service_name, region, operation, **params)
+    return _call_operation(role_arn, service_name, region, operation, params)
+
+
+def filter_instances(response: Dict[str, Any], states: List[str] = None, platform: str = None) -> Dict[str, Any]:
+    """
+    describe_instances 결과를 로컬에서 필터링합니다. (필터 없는 스냅샷 하나를 여러 검사가 공유하기 위함)
+
+    Args:
+        response: describe_instances 결과
+        states: 포함할 인스턴스 상태 목록 (예: ['running'])
+        platform: 포함할 플랫폼 (예: 'windows')
+
+    Returns:
+        Dict[str, Any]: 조건에 맞는 인스턴스만 남긴 결과
+    """
+    reservations = []
+    for reservation in response.get('Reservations', []):
+        instances = [
+            instance for instance in reservation.get('Instances', [])
+            if (not states or instance.get('State', {}).get('Name') in states)
+            and (not platform or instance.get('Platform') == platform)
+        ]
+        if instances:
+            reservations.append(dict(reservation, Instances=instances))
+    return {'Reservations': reservations}
+
+
+def _call_operation(role_arn: str, service_name: str, region: str, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """API를 호출합니다. 페이지네이션을 지원하는 작업은 모든 페이지를 합쳐서 반환합니다."""
+    client = create_boto3_client(service_name, region_name=region, role_arn=role_arn)
+    if client.can_paginate(operation):
+        return client.get_paginator(operation).paginate(**params).build_full_result()
+    return getattr(client, operation)(**params)
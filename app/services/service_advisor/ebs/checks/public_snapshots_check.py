@@ -1,7 +1,9 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     create_unified_check_result, create_resource_result, create_error_result,
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -17,21 +19,13 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 스냅샷 검사
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_snapshots = []
         
-        # 병렬로 모든 리전 검사
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {
-                executor.submit(_check_region_snapshots, region, role_arn): region 
-                for region in regions
-            }
-            
-            for future in as_completed(future_to_region):
-                region_snapshots = future.result()
-                all_snapshots.extend(region_snapshots)
+        # 모든 리전 병렬 검사 (공유 팬아웃 실행기)
+        for region_snapshots in map_regions(lambda region: _check_region_snapshots(region, role_arn), regions, service_name='ec2'):
+            all_snapshots.extend(region_snapshots)
         
         # 결과 분류
         public_snapshots = [s for s in all_snapshots if s['status'] == RESOURCE_STATUS_FAIL]
@@ -73,7 +67,7 @@ def _check_region_snapshots(region: str, role_arn: str) -> List[Dict[str, Any]]:
         ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
         
         # 자신이 소유한 스냅샷만 조회
-        response = ec2_client.describe_snapshots(OwnerIds=['self'])
+        response = fetch_scan_data(role_arn, 'ec2', region, 'describe_snapshots', OwnerIds=['self'])
         snapshots = response['Snapshots']
         
         snapshot_results = []
@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 
 RESOURCE_STATUS_PASS = 'pass'
 RESOURCE_STATUS_WARNING = 'warning'
@@ -18,8 +19,7 @@ class UnusedVolumesCheck(BaseEBSCheck):
     
     def _collect_region_data(self, region: str, role_arn: str) -> Dict[str, Any]:
         try:
-            ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            volumes_response = ec2_client.describe_volumes()
+            volumes_response = fetch_scan_data(role_arn, 'ec2', region, 'describe_volumes')
             volumes = volumes_response['Volumes']
             
             for volume in volumes:
@@ -32,17 +32,12 @@ class UnusedVolumesCheck(BaseEBSCheck):
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
         """EBS 볼륨 데이터 수집"""
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_volumes = []
         
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
-                all_volumes.extend(result['volumes'])
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_volumes.extend(result['volumes'])
         
         return {'volumes': all_volumes}
     
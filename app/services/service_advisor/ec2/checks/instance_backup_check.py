@@ -1,8 +1,9 @@
 import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING
 )
@@ -18,10 +19,8 @@ class InstanceBackupCheck(BaseEC2Check):
     def _collect_region_data(self, region: str, role_arn: str) -> Dict[str, Any]:
         """특정 리전의 인스턴스와 스냅샷 데이터를 수집합니다."""
         try:
-            ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            
-            instances = ec2_client.describe_instances()
-            snapshots = ec2_client.describe_snapshots(OwnerIds=['self'])
+            instances = fetch_scan_data(role_arn, 'ec2', region, 'describe_instances')
+            snapshots = fetch_scan_data(role_arn, 'ec2', region, 'describe_snapshots', OwnerIds=['self'])
             
             return {
                 'reservations': instances['Reservations'],
@@ -34,26 +33,21 @@ class InstanceBackupCheck(BaseEC2Check):
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
         # 모든 리전 목록 가져오기
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_reservations = []
         all_snapshots = []
         
-        # 병렬 처리로 리전별 데이터 수집
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
+        # 리전별 데이터 병렬 수집 (공유 팬아웃 실행기)
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
                 
-                # 각 인스턴스에 리전 정보 추가
-                for reservation in result['reservations']:
-                    for instance in reservation['Instances']:
-                        instance['Region'] = result['region']
+            # 각 인스턴스에 리전 정보 추가
+            for reservation in result['reservations']:
+                for instance in reservation['Instances']:
+                    instance['Region'] = result['region']
                 
-                all_reservations.extend(result['reservations'])
-                all_snapshots.extend(result['snapshots'])
+            all_reservations.extend(result['reservations'])
+            all_snapshots.extend(result['snapshots'])
         
         return {
             'reservations': all_reservations,
@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING
 )
@@ -16,8 +17,7 @@ class InstanceGenerationCheck(BaseEC2Check):
     
     def _collect_region_data(self, region: str, role_arn: str) -> Dict[str, Any]:
         try:
-            ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            instances = ec2_client.describe_instances()
+            instances = fetch_scan_data(role_arn, 'ec2', region, 'describe_instances')
             
             for reservation in instances['Reservations']:
                 for instance in reservation['Instances']:
@@ -29,17 +29,12 @@ class InstanceGenerationCheck(BaseEC2Check):
             return {'reservations': []}
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_reservations = []
         
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
-                all_reservations.extend(result['reservations'])
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_reservations.extend(result['reservations'])
         
         return {'reservations': all_reservations}
     
@@ -4,8 +4,12 @@ EC2 인스턴스 타입 최적화 검사
 import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.metrics_engine import MetricsEngine
+from app.services.metric_analytics import summarize
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data, filter_instances
 from app.services.service_advisor.common.unified_result import (
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
     RESOURCE_STATUS_PASS, RESOURCE_STATUS_FAIL, RESOURCE_STATUS_UNKNOWN,
@@ -27,9 +31,9 @@ class InstanceTypeCheck(BaseEC2Check):
             ec2 = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
             cloudwatch = create_boto3_client('cloudwatch', region_name=region, role_arn=role_arn)
             
-            # 실행 중인 인스턴스 정보 수집
-            instances = ec2.describe_instances(
-                Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
+            # 실행 중인 인스턴스 정보 수집 (스캔 스냅샷 공유)
+            instances = filter_instances(
+                fetch_scan_data(role_arn, 'ec2', region, 'describe_instances'), states=['running']
             )
             
             region_instances = []
@@ -39,12 +43,13 @@ class InstanceTypeCheck(BaseEC2Check):
                     region_instances.append(instance)
             
             return {
+                'region': region,
                 'instances': region_instances,
                 'clients': {'ec2': ec2, 'cloudwatch': cloudwatch}
             }
         except Exception as e:
             print(f"리전 {region}에서 데이터 수집 중 오류: {str(e)}")
-            return {'instances': [], 'clients': None}
+            return {'region': region, 'instances': [], 'clients': None}
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
         """
@@ -57,29 +62,23 @@ class InstanceTypeCheck(BaseEC2Check):
             Dict[str, Any]: 수집된 데이터
         """
         # 모든 리전 목록 가져오기
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_instances = []
         region_clients = {}
         
-        # 병렬 처리로 리전별 데이터 수집 (8개 리전 동시 처리)
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                region = future_to_region[future]
-                result = future.result()
-                
-                all_instances.extend(result['instances'])
-                if result['clients']:
-                    region_clients[region] = result['clients']
+        # 리전별 데이터 병렬 수집 (공유 팬아웃 실행기)
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_instances.extend(result['instances'])
+            if result['clients']:
+                region_clients[result['region']] = result['clients']
         
         # 현재 시간 설정
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(days=14)  # 2주 데이터 분석
         
         return {
+            'role_arn': role_arn,
             'instances': all_instances,
             'region_clients': region_clients,
             'start_time': start_time,
@@ -100,10 +99,38 @@ class InstanceTypeCheck(BaseEC2Check):
         region_clients = collected_data['region_clients']
         start_time = collected_data['start_time']
         end_time = collected_data['end_time']
+        role_arn = collected_data.get('role_arn')
         
         # 인스턴스 분석 결과
         instance_analysis = []
         
+        # 리전별 CPU 사용률을 GetMetricData로 일괄 조회 (조회에 실패한 리전은 결과에서 빠짐)
+        instances_by_region = {}
+        for instance in instances:
+            instances_by_region.setdefault(instance['Region'], []).append(instance)
+        
+        def fetch_region_metrics(region: str):
+            engine = MetricsEngine(region_clients[region]['cloudwatch'], store_scope=role_arn)
+            for instance in instances_by_region[region]:
+                engine.add_statistics(
+                    instance['InstanceId'], 'AWS/EC2', 'CPUUtilization',
+                    [{'Name': 'InstanceId', 'Value': instance['InstanceId']}],
+                    ['Average', 'Maximum'], 3600  # 1시간 간격
+                )
+            return region, engine.fetch(start_time, end_time)
+        
+        cpu_metrics = dict(map_regions(fetch_region_metrics, list(instances_by_region), service_name='cloudwatch'))
+        
+        # 전체 인스턴스의 CPU 통계를 한 번에 계산 (평균은 시간별 평균값, 최대/p95는 시간별 최대값 기준)
+        average_stats = summarize({
+            instance_id: series['CPUUtilization.Average']['values']
+            for region_metrics in cpu_metrics.values() for instance_id, series in region_metrics.items()
+        })
+        maximum_stats = summarize({
+            instance_id: series['CPUUtilization.Maximum']['values']
+            for region_metrics in cpu_metrics.values() for instance_id, series in region_metrics.items()
+        }, threshold=90)
+        
         for instance in instances:
             instance_id = instance['InstanceId']
             instance_type = instance['InstanceType']
@@ -116,43 +143,34 @@ class InstanceTypeCheck(BaseEC2Check):
                     instance_name = tag['Value']
                     break
             
-            # 해당 리전의 CloudWatch 클라이언트 가져오기
-            cloudwatch = region_clients[region]['cloudwatch']
-            
             # CPU 사용률 데이터 가져오기
             try:
-                cpu_response = cloudwatch.get_metric_statistics(
-                    Namespace='AWS/EC2',
-                    MetricName='CPUUtilization',
-                    Dimensions=[{'Name': 'InstanceId', 'Value': instance_id}],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=3600,  # 1시간 간격
-                    Statistics=['Average', 'Maximum']
-                )
-                
-                datapoints = cpu_response.get('Datapoints', [])
+                if region not in cpu_metrics:
+                    raise Exception(f"리전 {region}의 CloudWatch 메트릭 조회 실패")
                 
-                if datapoints:
-                    avg_cpu = sum(point['Average'] for point in datapoints) / len(datapoints)
-                    max_cpu = max(point['Maximum'] for point in datapoints) if datapoints else 0
+                if average_stats[instance_id]['count']:
+                    avg_cpu = average_stats[instance_id]['avg']
+                    max_cpu = maximum_stats[instance_id]['max'] or 0
+                    # 일시적인 스파이크 한 번이 아니라 p95로 판정
+                    p95_cpu = maximum_stats[instance_id]['p95'] or 0
                     
                     # 인스턴스 타입 최적화 분석
                     status = RESOURCE_STATUS_PASS  # 기본값은 통과
                     advice = None
                     status_text = None
+                    usage = f'평균: {round(avg_cpu, 2)}%, p95: {round(p95_cpu, 2)}%, 최대: {round(max_cpu, 2)}%'
                     
-                    if avg_cpu < 10 and max_cpu < 40:
+                    if avg_cpu < 10 and p95_cpu < 40:
                         status = RESOURCE_STATUS_FAIL
                         status_text = '최적화 필요'
-                        advice = f'CPU 사용률이 낮습니다(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%). 이 인스턴스는 과다 프로비저닝되어 있습니다.'
-                    elif avg_cpu > 80 or max_cpu > 90:
+                        advice = f'CPU 사용률이 낮습니다({usage}). 이 인스턴스는 과다 프로비저닝되어 있습니다.'
+                    elif avg_cpu > 80 or p95_cpu > 90:
                         status = RESOURCE_STATUS_FAIL
                         status_text = '최적화 필요'
-                        advice = f'CPU 사용률이 높습니다(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%). 이 인스턴스는 리소스 제약을 받고 있습니다.'
+                        advice = f'CPU 사용률이 높습니다({usage}, 90% 초과: {maximum_stats[instance_id]["above_threshold"]}시간). 이 인스턴스는 리소스 제약을 받고 있습니다.'
                     else:
                         status_text = '최적화됨'
-                        advice = f'CPU 사용률(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%)이 적절한 범위(10-80%) 내에 있습니다.'
+                        advice = f'CPU 사용률({usage})이 적절한 범위(10-80%) 내에 있습니다.'
                     
                     # 인스턴스 결과 생성 (리전 정보 추가)
                     instance_result = create_resource_result(
@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     create_unified_check_result, create_resource_result, create_error_result,
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -19,8 +20,7 @@ class PublicInstanceCheck(BaseEC2Check):
     def _collect_region_data(self, region: str, role_arn: str) -> Dict[str, Any]:
         """특정 리전의 인스턴스 데이터를 수집합니다."""
         try:
-            ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            instances = ec2_client.describe_instances()
+            instances = fetch_scan_data(role_arn, 'ec2', region, 'describe_instances')
             
             # 각 인스턴스에 리전 정보 추가
             for reservation in instances['Reservations']:
@@ -35,18 +35,13 @@ class PublicInstanceCheck(BaseEC2Check):
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
         """EC2 인스턴스 데이터 수집"""
         # 모든 리전 목록 가져오기
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_reservations = []
         
-        # 병렬 처리로 리전별 데이터 수집
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
-                all_reservations.extend(result['reservations'])
+        # 리전별 데이터 병렬 수집 (공유 팬아웃 실행기)
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_reservations.extend(result['reservations'])
         
         return {'reservations': all_reservations}
     
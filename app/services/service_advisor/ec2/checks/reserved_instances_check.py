@@ -2,6 +2,7 @@ import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data, filter_instances
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING, RESOURCE_STATUS_FAIL
 )
@@ -22,9 +23,9 @@ class ReservedInstancesCheck(BaseEC2Check):
             Filters=[{'Name': 'state', 'Values': ['active']}]
         )
         
-        # 실행 중인 인스턴스 조회
-        running_instances = ec2_client.describe_instances(
-            Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
+        # 실행 중인 인스턴스 조회 (스캔 스냅샷 공유)
+        running_instances = filter_instances(
+            fetch_scan_data(role_arn, 'ec2', ec2_client.meta.region_name, 'describe_instances'), states=['running']
         )
         
         return {
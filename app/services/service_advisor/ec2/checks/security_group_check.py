@@ -3,8 +3,9 @@ EC2 보안 그룹 설정 검사
 """
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
     RESOURCE_STATUS_PASS, RESOURCE_STATUS_FAIL,
@@ -23,8 +24,7 @@ class SecurityGroupCheck(BaseEC2Check):
         특정 리전의 보안 그룹 데이터를 수집합니다.
         """
         try:
-            ec2 = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            security_groups = ec2.describe_security_groups()
+            security_groups = fetch_scan_data(role_arn, 'ec2', region, 'describe_security_groups')
             
             # 리전 정보 추가
             region_sgs = []
@@ -48,18 +48,13 @@ class SecurityGroupCheck(BaseEC2Check):
             Dict[str, Any]: 수집된 데이터
         """
         # 모든 리전 목록 가져오기
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_security_groups = []
         
-        # 병렬 처리로 리전별 데이터 수집 (10개 리전 동시 처리)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                region_sgs = future.result()
-                all_security_groups.extend(region_sgs)
+        # 리전별 데이터 병렬 수집 (공유 팬아웃 실행기)
+        for region_sgs in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_security_groups.extend(region_sgs)
         
         return {
             'security_groups': all_security_groups
@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data
 from app.services.service_advisor.common.unified_result import (
     create_resource_result, RESOURCE_STATUS_PASS, RESOURCE_STATUS_WARNING
 )
@@ -19,21 +20,19 @@ class UnusedResourcesCheck(BaseEC2Check):
         특정 리전의 리소스 데이터를 수집합니다.
         """
         try:
-            ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
-            
             # Elastic IP 조회
-            eips = ec2_client.describe_addresses()
+            eips = fetch_scan_data(role_arn, 'ec2', region, 'describe_addresses')
             region_eips = []
             for eip in eips['Addresses']:
                 eip['Region'] = region
                 region_eips.append(eip)
             
-            # 사용되지 않는 볼륨 조회
-            volumes = ec2_client.describe_volumes(
-                Filters=[{'Name': 'status', 'Values': ['available']}]
-            )
+            # 사용되지 않는 볼륨 조회 (스캔 스냅샷을 EBS 검사와 공유하기 위해 로컬에서 필터링)
+            volumes = fetch_scan_data(role_arn, 'ec2', region, 'describe_volumes')
             region_volumes = []
             for volume in volumes['Volumes']:
+                if volume.get('State') != 'available':
+                    continue
                 volume['Region'] = region
                 region_volumes.append(volume)
             
@@ -47,20 +46,15 @@ class UnusedResourcesCheck(BaseEC2Check):
     
     def collect_data(self, role_arn=None) -> Dict[str, Any]:
         # 모든 리전 목록 가져오기
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_eips = []
         all_volumes = []
         
-        # 병렬 처리로 리전별 데이터 수집 (10개 리전 동시 처리)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_region = {executor.submit(self._collect_region_data, region, role_arn): region for region in regions}
-            
-            for future in as_completed(future_to_region):
-                result = future.result()
-                all_eips.extend(result['eips'])
-                all_volumes.extend(result['volumes'])
+        # 리전별 데이터 병렬 수집 (공유 팬아웃 실행기)
+        for result in map_regions(lambda region: self._collect_region_data(region, role_arn), regions, service_name='ec2'):
+            all_eips.extend(result['eips'])
+            all_volumes.extend(result['volumes'])
         
         return {
             'elastic_ips': all_eips,
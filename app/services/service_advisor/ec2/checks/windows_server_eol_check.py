@@ -1,8 +1,10 @@
 import boto3
 from typing import Dict, List, Any
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.service_advisor.common.scan_snapshot import fetch_scan_data, filter_instances
 from app.services.service_advisor.common.unified_result import (
     create_unified_check_result, create_resource_result, create_error_result,
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -18,21 +20,13 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 EC2 인스턴스 검사
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn)
         
         all_instances = []
         
-        # 병렬로 모든 리전 검사
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {
-                executor.submit(_check_region_instances, region, role_arn): region 
-                for region in regions
-            }
-            
-            for future in as_completed(future_to_region):
-                region_instances = future.result()
-                all_instances.extend(region_instances)
+        # 모든 리전 병렬 검사 (공유 팬아웃 실행기)
+        for region_instances in map_regions(lambda region: _check_region_instances(region, role_arn), regions, service_name='ec2'):
+            all_instances.extend(region_instances)
         
         # 결과 분류
         eol_instances = [i for i in all_instances if i['status'] == RESOURCE_STATUS_FAIL]
@@ -83,12 +77,11 @@ def _check_region_instances(region: str, role_arn: str) -> List[Dict[str, Any]]:
     try:
         ec2_client = create_boto3_client('ec2', region_name=region, role_arn=role_arn)
         
-        # Windows 인스턴스만 필터링
-        response = ec2_client.describe_instances(
-            Filters=[
-                {'Name': 'platform', 'Values': ['windows']},
-                {'Name': 'instance-state-name', 'Values': ['running', 'stopped']}
-            ]
+        # Windows 인스턴스만 필터링 (스캔 스냅샷 공유)
+        response = filter_instances(
+            fetch_scan_data(role_arn, 'ec2', region, 'describe_instances'),
+            states=['running', 'stopped'],
+            platform='windows'
         )
         
         instance_results = []
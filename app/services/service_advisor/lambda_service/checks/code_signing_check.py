@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
 from app.services.service_advisor.aws_client import create_boto3_client
-from app.services.service_advisor.common.aws_client import get_all_regions
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 from app.services.service_advisor.common.unified_result import (
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
     RESOURCE_STATUS_PASS, RESOURCE_STATUS_FAIL,
@@ -20,10 +21,12 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 Lambda 함수 정보 수집
-        regions = get_all_regions('lambda')
+        regions = get_enabled_regions(role_arn=role_arn, service_name='lambda')
         function_analysis = []
         
-        for region in regions:
+        def analyze_region(region: str) -> List[Dict[str, Any]]:
+            region_results = []
+            
             try:
                 lambda_client = create_boto3_client('lambda', region_name=region, role_arn=role_arn)
                 
@@ -31,11 +34,11 @@ def run(role_arn=None) -> Dict[str, Any]:
                 functions = lambda_client.list_functions()
                 
                 if not functions.get('Functions'):
-                    continue  # 해당 리전에 함수가 없으면 다음 리전으로
+                    return region_results  # 해당 리전에 함수가 없으면 다음 리전으로
                 
             except Exception as e:
                 # 리전 접근 실패 시 다음 리전으로 계속
-                continue
+                return region_results
             
             for function in functions.get('Functions', []):
                 function_name = function['FunctionName']
@@ -91,7 +94,13 @@ def run(role_arn=None) -> Dict[str, Any]:
                     has_code_signing=has_code_signing
                 )
                 
-                function_analysis.append(function_result)
+                region_results.append(function_result)
+            
+            return region_results
+        
+        # 리전별 분석 병렬 실행 (공유 팬아웃 실행기)
+        for region_results in map_regions(analyze_region, regions, service_name='lambda'):
+            function_analysis.extend(region_results)
         
         # 결과 분류
         passed_functions = [f for f in function_analysis if f['status'] == RESOURCE_STATUS_PASS]
@@ -2,7 +2,10 @@ import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from app.services.service_advisor.aws_client import create_boto3_client
-from app.services.service_advisor.common.aws_client import get_all_regions
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.metrics_engine import MetricsEngine
+from app.services.metric_analytics import summarize
 from app.services.service_advisor.common.unified_result import (
     create_unified_check_result, create_resource_result, create_error_result,
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -18,14 +21,16 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 Lambda 함수 정보 수집
-        regions = get_all_regions('lambda')
+        regions = get_enabled_regions(role_arn=role_arn, service_name='lambda')
         function_analysis = []
         
         # 현재 시간 설정
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(days=14)  # 2주 데이터 분석
         
-        for region in regions:
+        def analyze_region(region: str) -> List[Dict[str, Any]]:
+            region_results = []
+            
             try:
                 lambda_client = create_boto3_client('lambda', region_name=region, role_arn=role_arn)
                 cloudwatch = create_boto3_client('cloudwatch', region_name=region, role_arn=role_arn)
@@ -34,11 +39,29 @@ def run(role_arn=None) -> Dict[str, Any]:
                 functions = lambda_client.list_functions()
                 
                 if not functions.get('Functions'):
-                    continue  # 해당 리전에 함수가 없으면 다음 리전으로
+                    return region_results  # 해당 리전에 함수가 없으면 다음 리전으로
                 
             except Exception as e:
                 # 리전 접근 실패 시 다음 리전으로 계속
-                continue
+                return region_results
+            
+            # 리전의 모든 함수 메트릭을 GetMetricData로 일괄 조회
+            try:
+                metrics_engine = MetricsEngine(cloudwatch, store_scope=role_arn)
+                for function in functions.get('Functions', []):
+                    dimensions = [{'Name': 'FunctionName', 'Value': function['FunctionName']}]
+                    metrics_engine.add_statistics(function['FunctionName'], 'AWS/Lambda', 'MemoryUtilization',
+                                                  dimensions, ['Average', 'Maximum'], 3600)  # 1시간 간격
+                metrics = metrics_engine.fetch(start_time, end_time)
+            except Exception:
+                # 조회 실패 시 함수별 오류 결과로 처리
+                metrics = {}
+            
+            # 리전의 모든 함수 통계를 메트릭별로 한 번에 계산
+            stats = {
+                label: summarize({resource_id: series[label]['values'] for resource_id, series in metrics.items()})
+                for label in ('MemoryUtilization.Average', 'MemoryUtilization.Maximum')
+            }
         
             for function in functions.get('Functions', []):
                 function_name = function['FunctionName']
@@ -53,38 +76,33 @@ def run(role_arn=None) -> Dict[str, Any]:
                 
                 # 메모리 사용률 데이터 가져오기
                 try:
-                    memory_response = cloudwatch.get_metric_statistics(
-                        Namespace='AWS/Lambda',
-                        MetricName='MemoryUtilization',
-                        Dimensions=[{'Name': 'FunctionName', 'Value': function_name}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 간격
-                        Statistics=['Average', 'Maximum']
-                    )
-                    
-                    datapoints = memory_response.get('Datapoints', [])
+                    if function_name not in metrics:
+                        raise Exception(f"함수 {function_name}의 CloudWatch 메트릭 조회 실패")
                     
-                    if datapoints:
-                        avg_memory = sum(point['Average'] for point in datapoints) / len(datapoints)
-                        max_memory = max(point['Maximum'] for point in datapoints) if datapoints else 0
+                    if stats['MemoryUtilization.Average'][function_name]['count']:
+                        # 일시적인 스파이크 한 번이 아니라 p95로 판정
+                        avg_memory = stats['MemoryUtilization.Average'][function_name]['avg']
+                        max_memory = stats['MemoryUtilization.Maximum'][function_name]['max'] or 0
+                        p95_memory = stats['MemoryUtilization.Maximum'][function_name]['p95'] or 0
                         
                         # 메모리 크기 최적화 분석
                         status = RESOURCE_STATUS_PASS  # 기본값은 통과
                         advice = None
                         status_text = None
                         
-                        if avg_memory < 20 and max_memory < 50:
+                        usage = f'평균: {round(avg_memory, 2)}%, p95: {round(p95_memory, 2)}%, 최대: {round(max_memory, 2)}%'
+                        
+                        if avg_memory < 20 and p95_memory < 50:
                             status = RESOURCE_STATUS_FAIL
                             status_text = '최적화 필요'
-                            advice = f'메모리 사용률이 낮습니다(평균: {round(avg_memory, 2)}%, 최대: {round(max_memory, 2)}%). 메모리 크기를 줄여 비용을 절감하세요.'
-                        elif max_memory > 90:
+                            advice = f'메모리 사용률이 낮습니다({usage}). 메모리 크기를 줄여 비용을 절감하세요.'
+                        elif p95_memory > 90:
                             status = RESOURCE_STATUS_FAIL
                             status_text = '최적화 필요'
-                            advice = f'메모리 사용률이 높습니다(평균: {round(avg_memory, 2)}%, 최대: {round(max_memory, 2)}%). 메모리 크기를 늘려 성능을 개선하세요.'
+                            advice = f'메모리 사용률이 높습니다({usage}). 메모리 크기를 늘려 성능을 개선하세요.'
                         else:
                             status_text = '최적화됨'
-                            advice = f'현재 메모리 크기는 워크로드에 적합합니다. 메모리 사용률(평균: {round(avg_memory, 2)}%, 최대: {round(max_memory, 2)}%)이 적절한 범위 내에 있습니다.'
+                            advice = f'현재 메모리 크기는 워크로드에 적합합니다. 메모리 사용률({usage})이 적절한 범위 내에 있습니다.'
                         
                         # 표준화된 리소스 결과 생성 (리전 정보 포함)
                         function_result = create_resource_result(
@@ -96,10 +114,11 @@ def run(role_arn=None) -> Dict[str, Any]:
                             region=region,
                             memory_size=memory_size,
                             avg_memory=round(avg_memory, 2),
-                            max_memory=round(max_memory, 2)
+                            max_memory=round(max_memory, 2),
+                            p95_memory=round(p95_memory, 2)
                         )
                         
-                        function_analysis.append(function_result)
+                        region_results.append(function_result)
                     else:
                         # 표준화된 리소스 결과 생성 (데이터 없음)
                         status_text = '데이터 부족'
@@ -114,10 +133,11 @@ def run(role_arn=None) -> Dict[str, Any]:
                             region=region,
                             memory_size=memory_size,
                             avg_memory='N/A',
-                            max_memory='N/A'
+                            max_memory='N/A',
+                            p95_memory='N/A'
                         )
                         
-                        function_analysis.append(function_result)
+                        region_results.append(function_result)
                         
                 except Exception as e:
                     # 표준화된 리소스 결과 생성 (오류)
@@ -133,10 +153,17 @@ def run(role_arn=None) -> Dict[str, Any]:
                         region=region,
                         memory_size=memory_size,
                         avg_memory='Error',
-                        max_memory='Error'
+                        max_memory='Error',
+                        p95_memory='Error'
                     )
                     
-                    function_analysis.append(function_result)
+                    region_results.append(function_result)
+            
+            return region_results
+        
+        # 리전별 분석 병렬 실행 (공유 팬아웃 실행기)
+        for region_results in map_regions(analyze_region, regions, service_name='lambda'):
+            function_analysis.extend(region_results)
         
         # 결과 분류
         passed_functions = [f for f in function_analysis if f['status'] == RESOURCE_STATUS_PASS]
@@ -2,7 +2,10 @@ import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from app.services.service_advisor.aws_client import create_boto3_client
-from app.services.service_advisor.common.aws_client import get_all_regions
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.metrics_engine import MetricsEngine
+from app.services.metric_analytics import summarize
 from app.services.service_advisor.common.unified_result import (
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
     RESOURCE_STATUS_PASS, RESOURCE_STATUS_FAIL, RESOURCE_STATUS_UNKNOWN,
@@ -21,14 +24,16 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 Lambda 함수 정보 수집
-        regions = get_all_regions('lambda')
+        regions = get_enabled_regions(role_arn=role_arn, service_name='lambda')
         function_analysis = []
         
         # 현재 시간 설정
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(days=14)  # 2주 데이터 분석
         
-        for region in regions:
+        def analyze_region(region: str) -> List[Dict[str, Any]]:
+            region_results = []
+            
             try:
                 lambda_client = create_boto3_client('lambda', region_name=region, role_arn=role_arn)
                 cloudwatch = create_boto3_client('cloudwatch', region_name=region, role_arn=role_arn)
@@ -37,11 +42,29 @@ def run(role_arn=None) -> Dict[str, Any]:
                 functions = lambda_client.list_functions()
                 
                 if not functions.get('Functions'):
-                    continue  # 해당 리전에 함수가 없으면 다음 리전으로
+                    return region_results  # 해당 리전에 함수가 없으면 다음 리전으로
                 
             except Exception as e:
                 # 리전 접근 실패 시 다음 리전으로 계속
-                continue
+                return region_results
+            
+            # 리전의 모든 함수 메트릭을 GetMetricData로 일괄 조회
+            try:
+                metrics_engine = MetricsEngine(cloudwatch, store_scope=role_arn)
+                for function in functions.get('Functions', []):
+                    dimensions = [{'Name': 'FunctionName', 'Value': function['FunctionName']}]
+                    metrics_engine.add_statistics(function['FunctionName'], 'AWS/Lambda', 'Invocations',
+                                                  dimensions, ['Sum'], 3600)  # 1시간 간격
+                metrics = metrics_engine.fetch(start_time, end_time)
+            except Exception:
+                # 조회 실패 시 함수별 오류 결과로 처리
+                metrics = {}
+            
+            # 리전의 모든 함수 통계를 메트릭별로 한 번에 계산
+            stats = {
+                label: summarize({resource_id: series[label]['values'] for resource_id, series in metrics.items()})
+                for label in ('Invocations.Sum',)
+            }
         
             for function in functions.get('Functions', []):
                 function_name = function['FunctionName']
@@ -57,34 +80,12 @@ def run(role_arn=None) -> Dict[str, Any]:
                 
                 # 호출 지표 가져오기
                 try:
-                    invocations_response = cloudwatch.get_metric_statistics(
-                        Namespace='AWS/Lambda',
-                        MetricName='Invocations',
-                        Dimensions=[{'Name': 'FunctionName', 'Value': function_name}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 간격
-                        Statistics=['Sum']
-                    )
+                    if function_name not in metrics:
+                        raise Exception(f"함수 {function_name}의 CloudWatch 메트릭 조회 실패")
                     
-                    # 콜드 스타트 지표 가져오기
-                    cold_start_response = cloudwatch.get_metric_statistics(
-                        Namespace='AWS/Lambda',
-                        MetricName='Duration',
-                        Dimensions=[{'Name': 'FunctionName', 'Value': function_name}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 간격
-                        Statistics=['Average', 'Maximum']
-                    )
-                    
-                    invocations_datapoints = invocations_response.get('Datapoints', [])
-                    cold_start_datapoints = cold_start_response.get('Datapoints', [])
-                    
-                    if invocations_datapoints:
+                    if stats['Invocations.Sum'][function_name]['count']:
                         # 시간당 평균 호출 수 계산
-                        total_invocations = sum(point['Sum'] for point in invocations_datapoints)
-                        avg_hourly_invocations = total_invocations / len(invocations_datapoints)
+                        avg_hourly_invocations = stats['Invocations.Sum'][function_name]['avg']
                         
                         # 프로비저닝된 동시성 분석
                         status = RESOURCE_STATUS_PASS  # 기본값은 통과
@@ -118,7 +119,7 @@ def run(role_arn=None) -> Dict[str, Any]:
                             avg_hourly_invocations=round(avg_hourly_invocations, 2)
                         )
                         
-                        function_analysis.append(function_result)
+                        region_results.append(function_result)
                     else:
                         # 표준화된 리소스 결과 생성 (데이터 없음)
                         status_text = '데이터 부족'
@@ -134,7 +135,7 @@ def run(role_arn=None) -> Dict[str, Any]:
                             has_provisioned_concurrency=has_provisioned_concurrency
                         )
                         
-                        function_analysis.append(function_result)
+                        region_results.append(function_result)
                         
                 except Exception as e:
                     # 표준화된 리소스 결과 생성 (오류)
@@ -150,7 +151,13 @@ def run(role_arn=None) -> Dict[str, Any]:
                         region=region
                     )
                     
-                    function_analysis.append(function_result)
+                    region_results.append(function_result)
+            
+            return region_results
+        
+        # 리전별 분석 병렬 실행 (공유 팬아웃 실행기)
+        for region_results in map_regions(analyze_region, regions, service_name='lambda'):
+            function_analysis.extend(region_results)
         
         # 결과 분류
         passed_functions = [f for f in function_analysis if f['status'] == RESOURCE_STATUS_PASS]
@@ -2,6 +2,10 @@ import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
+from app.services.metrics_engine import MetricsEngine
+from app.services.metric_analytics import summarize
 from app.services.service_advisor.check_result import (
     create_check_result, create_resource_result,
     create_error_result, STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -17,8 +21,7 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 RDS 인스턴스 수집
-        ec2_client = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_client.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn, service_name='rds')
         
         # 인스턴스 분석 결과
         instance_analysis = []
@@ -27,80 +30,62 @@ def run(role_arn=None) -> Dict[str, Any]:
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(days=14)  # 2주 데이터 분석
         
-        for region in regions:
+        def analyze_region(region: str) -> List[Dict[str, Any]]:
+            region_results = []
+            
             try:
                 rds_client = create_boto3_client('rds', region_name=region, role_arn=role_arn)
                 cloudwatch = create_boto3_client('cloudwatch', region_name=region, role_arn=role_arn)
                 instances = rds_client.describe_db_instances()
             except Exception:
-                continue
+                return region_results
+            
+            # 리전의 모든 인스턴스 메트릭을 GetMetricData로 일괄 조회
+            try:
+                metrics_engine = MetricsEngine(cloudwatch, store_scope=role_arn)
+                for instance in instances.get('DBInstances', []):
+                    dimensions = [{'Name': 'DBInstanceIdentifier', 'Value': instance['DBInstanceIdentifier']}]
+                    metrics_engine.add_statistics(instance['DBInstanceIdentifier'], 'AWS/RDS', 'CPUUtilization',
+                                                  dimensions, ['Average', 'Maximum'], 3600)  # 1시간 간격
+                    metrics_engine.add_statistics(instance['DBInstanceIdentifier'], 'AWS/RDS', 'FreeableMemory',
+                                                  dimensions, ['Average', 'Minimum'], 3600)
+                    metrics_engine.add_statistics(instance['DBInstanceIdentifier'], 'AWS/RDS', 'FreeStorageSpace',
+                                                  dimensions, ['Average', 'Minimum'], 3600)
+                metrics = metrics_engine.fetch(start_time, end_time)
+            except Exception:
+                # 조회 실패 시 인스턴스별 오류 결과로 처리
+                metrics = {}
+            
+            # 리전의 모든 인스턴스 통계를 메트릭별로 한 번에 계산
+            stats = {
+                label: summarize({resource_id: series[label]['values'] for resource_id, series in metrics.items()})
+                for label in ('CPUUtilization.Average', 'CPUUtilization.Maximum', 'FreeableMemory.Average',
+                              'FreeableMemory.Minimum', 'FreeStorageSpace.Average', 'FreeStorageSpace.Minimum')
+            }
                 
             for instance in instances.get('DBInstances', []):
                 instance_id = instance['DBInstanceIdentifier']
                 engine = instance['Engine']
                 instance_class = instance['DBInstanceClass']
                 
-                # CPU 사용률 데이터 가져오기
+                # CPU/메모리/디스크 사용률 데이터 가져오기
                 try:
-                    cpu_response = cloudwatch.get_metric_statistics(
-                        Namespace='AWS/RDS',
-                        MetricName='CPUUtilization',
-                        Dimensions=[{'Name': 'DBInstanceIdentifier', 'Value': instance_id}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 간격
-                        Statistics=['Average', 'Maximum']
-                    )
+                    if instance_id not in metrics:
+                        raise Exception(f"인스턴스 {instance_id}의 CloudWatch 메트릭 조회 실패")
                     
-                    # 메모리 사용률 데이터 가져오기 (일부 엔진에서만 사용 가능)
-                    memory_response = None
-                    try:
-                        memory_response = cloudwatch.get_metric_statistics(
-                            Namespace='AWS/RDS',
-                            MetricName='FreeableMemory',
-                            Dimensions=[{'Name': 'DBInstanceIdentifier', 'Value': instance_id}],
-                            StartTime=start_time,
-                            EndTime=end_time,
-                            Period=3600,  # 1시간 간격
-                            Statistics=['Average', 'Minimum']
-                        )
-                    except Exception:
-                        pass
-                    
-                    # 디스크 사용률 데이터 가져오기
-                    disk_response = cloudwatch.get_metric_statistics(
-                        Namespace='AWS/RDS',
-                        MetricName='FreeStorageSpace',
-                        Dimensions=[{'Name': 'DBInstanceIdentifier', 'Value': instance_id}],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1시간 간격
-                        Statistics=['Average', 'Minimum']
-                        )
-                    
-                    # 데이터 분석
-                    cpu_datapoints = cpu_response.get('Datapoints', [])
-                    memory_datapoints = memory_response.get('Datapoints', []) if memory_response else []
-                    disk_datapoints = disk_response.get('Datapoints', [])
-                    
-                    if cpu_datapoints:
-                        # CPU 사용률 계산
-                        avg_cpu = sum(point['Average'] for point in cpu_datapoints) / len(cpu_datapoints)
-                        max_cpu = max(point['Maximum'] for point in cpu_datapoints) if cpu_datapoints else 0
+                    if stats['CPUUtilization.Average'][instance_id]['count']:
+                        # CPU 사용률 계산 (일시적인 스파이크 한 번이 아니라 p95로 판정)
+                        avg_cpu = stats['CPUUtilization.Average'][instance_id]['avg']
+                        max_cpu = stats['CPUUtilization.Maximum'][instance_id]['max'] or 0
+                        p95_cpu = stats['CPUUtilization.Maximum'][instance_id]['p95'] or 0
                         
-                        # 메모리 사용률 계산 (가능한 경우)
-                        avg_memory_free = None
-                        min_memory_free = None
-                        if memory_datapoints:
-                            avg_memory_free = sum(point['Average'] for point in memory_datapoints) / len(memory_datapoints)
-                            min_memory_free = min(point['Minimum'] for point in memory_datapoints)
+                        # 메모리 사용률 계산 (일부 엔진에서만 사용 가능)
+                        avg_memory_free = stats['FreeableMemory.Average'][instance_id]['avg']
+                        min_memory_free = stats['FreeableMemory.Minimum'][instance_id]['min']
                         
                         # 디스크 사용률 계산
-                        avg_disk_free = None
-                        min_disk_free = None
-                        if disk_datapoints:
-                            avg_disk_free = sum(point['Average'] for point in disk_datapoints) / len(disk_datapoints)
-                            min_disk_free = min(point['Minimum'] for point in disk_datapoints)
+                        avg_disk_free = stats['FreeStorageSpace.Average'][instance_id]['avg']
+                        min_disk_free = stats['FreeStorageSpace.Minimum'][instance_id]['min']
                         
                         # 인스턴스 크기 최적화 분석
                         status = RESOURCE_STATUS_PASS
@@ -108,17 +93,18 @@ def run(role_arn=None) -> Dict[str, Any]:
                         status_text = None
                         
                         # CPU 기반 분석
-                        if avg_cpu < 5 and max_cpu < 20:
+                        usage = f'평균: {round(avg_cpu, 2)}%, p95: {round(p95_cpu, 2)}%, 최대: {round(max_cpu, 2)}%'
+                        if avg_cpu < 5 and p95_cpu < 20:
                             status = RESOURCE_STATUS_FAIL
                             status_text = '다운사이징 권장'
-                            advice = f'CPU 사용률이 매우 낮습니다(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%). 더 작은 인스턴스 유형으로 다운사이징하여 비용을 절감하세요.'
-                        elif avg_cpu > 70 or max_cpu > 90:
+                            advice = f'CPU 사용률이 매우 낮습니다({usage}). 더 작은 인스턴스 유형으로 다운사이징하여 비용을 절감하세요.'
+                        elif avg_cpu > 70 or p95_cpu > 90:
                             status = RESOURCE_STATUS_FAIL
                             status_text = '업그레이드 권장'
-                            advice = f'CPU 사용률이 높습니다(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%). 더 큰 인스턴스 유형으로 업그레이드하여 성능을 개선하세요.'
+                            advice = f'CPU 사용률이 높습니다({usage}). 더 큰 인스턴스 유형으로 업그레이드하여 성능을 개선하세요.'
                         else:
                             status_text = '최적화됨'
-                            advice = f'현재 인스턴스 크기는 워크로드에 적합합니다. CPU 사용률(평균: {round(avg_cpu, 2)}%, 최대: {round(max_cpu, 2)}%)이 적절한 범위 내에 있습니다.'
+                            advice = f'현재 인스턴스 크기는 워크로드에 적합합니다. CPU 사용률({usage})이 적절한 범위 내에 있습니다.'
                         
                         # 표준화된 리소스 결과 생성
                         instance_result = create_resource_result(
@@ -132,13 +118,14 @@ def run(role_arn=None) -> Dict[str, Any]:
                             instance_class=instance_class,
                             avg_cpu=round(avg_cpu, 2),
                             max_cpu=round(max_cpu, 2),
+                            p95_cpu=round(p95_cpu, 2),
                             avg_memory_free=round(avg_memory_free / (1024 * 1024 * 1024), 2) if avg_memory_free else 'N/A',  # GB로 변환
                             min_memory_free=round(min_memory_free / (1024 * 1024 * 1024), 2) if min_memory_free else 'N/A',  # GB로 변환
                             avg_disk_free=round(avg_disk_free / (1024 * 1024 * 1024), 2) if avg_disk_free else 'N/A',  # GB로 변환
                             min_disk_free=round(min_disk_free / (1024 * 1024 * 1024), 2) if min_disk_free else 'N/A'  # GB로 변환
                         )
                         
-                        instance_analysis.append(instance_result)
+                        region_results.append(instance_result)
                     else:
                         # 표준화된 리소스 결과 생성 (데이터 없음)
                         status_text = '데이터 부족'
@@ -155,13 +142,14 @@ def run(role_arn=None) -> Dict[str, Any]:
                             instance_class=instance_class,
                             avg_cpu='N/A',
                             max_cpu='N/A',
+                            p95_cpu='N/A',
                             avg_memory_free='N/A',
                             min_memory_free='N/A',
                             avg_disk_free='N/A',
                             min_disk_free='N/A'
                         )
                         
-                        instance_analysis.append(instance_result)
+                        region_results.append(instance_result)
                     
                 except Exception as e:
                     # 표준화된 리소스 결과 생성 (오류)
@@ -179,13 +167,20 @@ def run(role_arn=None) -> Dict[str, Any]:
                         instance_class=instance_class,
                         avg_cpu='Error',
                         max_cpu='Error',
+                        p95_cpu='Error',
                         avg_memory_free='Error',
                         min_memory_free='Error',
                         avg_disk_free='Error',
                         min_disk_free='Error'
                     )
                     
-                    instance_analysis.append(instance_result)
+                    region_results.append(instance_result)
+            
+            return region_results
+        
+        # 리전별 분석 병렬 실행 (공유 팬아웃 실행기)
+        for region_results in map_regions(analyze_region, regions, service_name='rds'):
+            instance_analysis.extend(region_results)
         
         # 결과 분류
         passed_instances = [i for i in instance_analysis if i['status'] == RESOURCE_STATUS_PASS]
@@ -1,6 +1,8 @@
 import boto3
 from typing import Dict, List, Any
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 from app.services.service_advisor.check_result import (
     create_check_result, create_resource_result,
     create_error_result, STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -16,8 +18,7 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 RDS 인스턴스 수집
-        ec2_client = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_client.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn, service_name='rds')
         
         # 인스턴스 분석 결과
         instance_analysis = []
@@ -25,12 +26,14 @@ def run(role_arn=None) -> Dict[str, Any]:
         # 프로덕션 환경으로 간주할 인스턴스 태그 또는 이름 패턴
         production_indicators = ['prod', 'production', 'prd']
         
-        for region in regions:
+        def analyze_region(region: str) -> List[Dict[str, Any]]:
+            region_results = []
+            
             try:
                 rds_client = create_boto3_client('rds', region_name=region, role_arn=role_arn)
                 instances = rds_client.describe_db_instances()
             except Exception:
-                continue
+                return region_results
                 
             for instance in instances.get('DBInstances', []):
                 instance_id = instance['DBInstanceIdentifier']
@@ -93,7 +96,13 @@ def run(role_arn=None) -> Dict[str, Any]:
                     is_production=is_production
                 )
                 
-                instance_analysis.append(instance_result)
+                region_results.append(instance_result)
+            
+            return region_results
+        
+        # 리전별 분석 병렬 실행 (공유 팬아웃 실행기)
+        for region_results in map_regions(analyze_region, regions, service_name='rds'):
+            instance_analysis.extend(region_results)
 
         
         # 결과 분류
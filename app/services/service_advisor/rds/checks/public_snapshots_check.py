@@ -1,7 +1,8 @@
 import boto3
 from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from app.services.service_advisor.aws_client import create_boto3_client
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 from app.services.service_advisor.common.unified_result import (
     create_unified_check_result, create_resource_result, create_error_result,
     STATUS_OK, STATUS_WARNING, STATUS_ERROR,
@@ -17,21 +18,13 @@ def run(role_arn=None) -> Dict[str, Any]:
     """
     try:
         # 모든 리전에서 RDS 스냅샷 검사
-        ec2_default = create_boto3_client('ec2', role_arn=role_arn)
-        regions = [region['RegionName'] for region in ec2_default.describe_regions()['Regions']]
+        regions = get_enabled_regions(role_arn=role_arn, service_name='rds')
         
         all_snapshots = []
         
-        # 병렬로 모든 리전 검사
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_region = {
-                executor.submit(_check_region_snapshots, region, role_arn): region 
-                for region in regions
-            }
-            
-            for future in as_completed(future_to_region):
-                region_snapshots = future.result()
-                all_snapshots.extend(region_snapshots)
+        # 모든 리전 병렬 검사 (공유 팬아웃 실행기)
+        for region_snapshots in map_regions(lambda region: _check_region_snapshots(region, role_arn), regions, service_name='rds'):
+            all_snapshots.extend(region_snapshots)
         
         # 결과 분류
         public_snapshots = [s for s in all_snapshots if s['status'] == RESOURCE_STATUS_FAIL]
@@ -1,4 +1,3 @@
-import boto3
 from typing import Dict, List, Any
 from datetime import datetime, timedelta
 
@@ -7,6 +6,8 @@ RESOURCE_STATUS_WARNING = 'warning'
 RESOURCE_STATUS_FAIL = 'fail'
 
 from app.services.service_advisor.vpn.checks.base_vpn_check import BaseVPNCheck
+from app.services.region_registry import get_enabled_regions
+from app.services.regional_executor import map_regions
 
 class VPNConnectionStatusCheck(BaseVPNCheck):
     """VPN 연결 상태 검사"""
@@ -20,45 +21,20 @@ class VPNConnectionStatusCheck(BaseVPNCheck):
         try:
             vpn_connections = []
             
-            # 모든 리전에서 VPN 연결 조회
-            if role_arn:
-                sts_client = self.session.client('sts')
-                assumed_role = sts_client.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName='VPNConnectionStatusCheck'
-                )
-                credentials = assumed_role['Credentials']
-                ec2_client = boto3.client(
-                    'ec2',
-                    aws_access_key_id=credentials['AccessKeyId'],
-                    aws_secret_access_key=credentials['SecretAccessKey'],
-                    aws_session_token=credentials['SessionToken']
-                )
-            else:
-                ec2_client = self.session.client('ec2')
+            # 활성 리전 목록 가져오기 (계정별 캐시)
+            regions = get_enabled_regions(role_arn=role_arn, session=self.session)
             
-            # 모든 리전 목록 가져오기
-            regions_response = ec2_client.describe_regions()
-            regions = [region['RegionName'] for region in regions_response['Regions']]
-            
-            for region in regions:
+            def collect_region(region: str) -> List[Dict[str, Any]]:
+                region_results = []
+                
                 try:
-                    if role_arn:
-                        regional_ec2 = boto3.client(
-                            'ec2',
-                            region_name=region,
-                            aws_access_key_id=credentials['AccessKeyId'],
-                            aws_secret_access_key=credentials['SecretAccessKey'],
-                            aws_session_token=credentials['SessionToken']
-                        )
-                    else:
-                        regional_ec2 = self.session.client('ec2', region_name=region)
+                    regional_ec2 = self.get_client('ec2', region_name=region, role_arn=role_arn)
                     
                     # VPN 연결 조회
                     response = regional_ec2.describe_vpn_connections()
                     
                     for vpn in response['VpnConnections']:
-                        vpn_connections.append({
+                        region_results.append({
                             'VpnConnectionId': vpn['VpnConnectionId'],
                             'State': vpn['State'],
                             'Type': vpn['Type'],
@@ -72,7 +48,13 @@ class VPNConnectionStatusCheck(BaseVPNCheck):
                         
                 except Exception as e:
                     print(f"리전 {region} VPN 조회 실패: {str(e)}")
-                    continue
+                    return region_results
+                
+                return region_results
+            
+            # 리전별 조회 병렬 실행 (공유 팬아웃 실행기)
+            for region_results in map_regions(collect_region, regions, service_name='ec2'):
+                vpn_connections.extend(region_results)
             
             return {'vpn_connections': vpn_connections}
             
@@ -0,0 +1,27 @@
+"""
+SQLite 저장소 공통 유틸리티
+
+작업/플릿/캐시 저장소는 스레드마다 새 연결을 열고 with 블록이 끝나면 바로 닫습니다.
+"""
+import sqlite3
+
+
+class ClosingConnection:
+    """with 블록이 끝나면 열린 트랜잭션을 커밋(또는 롤백)하고 연결을 닫는 래퍼"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._conn.in_transaction:
+                if exc_type is None:
+                    self._conn.commit()
+                else:
+                    self._conn.rollback()
+        finally:
+            self._conn.close()
+        return False
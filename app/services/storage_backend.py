@@ -0,0 +1,537 @@
+"""
+저장소 백엔드
+
+S3Storage, ResourceDataStorage, AdvisorHistoryStorage, UserStorage는 모두 DATA_BUCKET_NAME 버킷의 boto3 S3 클라이언트에
+고정되어 있어 모든 조회가 S3 지연 시간을 치르고, 오프라인(온프레미스 단일 노드, 로컬 부하 테스트)으로 실행할 수 없습니다.
+이 모듈은 저장소 클래스가 사용하는 S3 객체 API(get/head/put/delete_object, delete_objects, list_objects_v2와 페이지네이터,
+조건부 읽기/쓰기, 오류 코드)를 그대로 구현하는 로컬 백엔드를 제공하고, 설정(STORAGE_BACKEND)에 따라 백엔드를 선택합니다.
+- s3: boto3 S3 클라이언트 (기본값)
+- filesystem: 객체 키를 경로로 하는 로컬 파일 (메타데이터는 별도 디렉토리에 저장)
+- sqlite: 객체 키와 디렉토리(접두사) 색인을 둔 SQLite 파일 (사용자/수집/기록 목록과 조회가 색인 조회 한 번)
+저장소 클래스는 클라이언트만 바꿔 끼우므로 카탈로그, 매니페스트, 조건부 쓰기/읽기 코드가 백엔드와 관계없이 동작합니다.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from config import Config
+from app.services.aws_client_pool import get_client_pool
+from app.services.sqlite_util import ClosingConnection
+
+try:
+    import fcntl
+except ImportError:  # Windows에서는 프로세스 간 파일 잠금 없이 동작
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 지원하는 백엔드
+BACKEND_S3 = 's3'
+BACKEND_FILESYSTEM = 'filesystem'
+BACKEND_SQLITE = 'sqlite'
+
+# 접두사 범위 조회의 상한 문자
+_PREFIX_UPPER_BOUND = '\U0010ffff'
+
+
+def _client_error(code: str, operation: str, message: str) -> ClientError:
+    """S3 클라이언트와 같은 형식의 오류를 생성합니다."""
+    return ClientError({'Error': {'Code': code, 'Message': message}}, operation)
+
+
+def _parent_of(key: str) -> str:
+    """키가 속한 디렉토리 접두사 ('a/b/c.json' → 'a/b/')"""
+    return key[:key.rfind('/') + 1]
+
+
+def _ancestor_prefixes(key: str) -> List[str]:
+    """키의 모든 상위 디렉토리 접두사 ('a/b/c.json' → ['a/', 'a/b/'])"""
+    parts = key.split('/')[:-1]
+    return ['/'.join(parts[:i + 1]) + '/' for i in range(len(parts))]
+
+
+class LocalObjectStore:
+    """
+    S3 클라이언트의 객체 API 일부를 구현하는 로컬 저장소 기본 클래스
+    """
+
+    # 로컬 백엔드 표시 (디스크 캐시 등 S3 전용 최적화를 건너뜀)
+    local = True
+
+    # IfMatch/IfNoneMatch 조건부 쓰기 지원 여부
+    conditional_writes = True
+
+    def head_bucket(self, Bucket: str, **kwargs) -> Dict[str, Any]:
+        """버킷 확인 (로컬 백엔드는 항상 성공)"""
+        return {}
+
+    def get_object(self, Bucket: str, Key: str, IfNoneMatch: str = None, IfMatch: str = None, **kwargs) -> Dict[str, Any]:
+        """객체를 조회합니다."""
+        record = self._read(Bucket, Key, with_body=True)
+        if record is None:
+            raise _client_error('NoSuchKey', 'GetObject', 'The specified key does not exist.')
+        if IfMatch and IfMatch != record['etag']:
+            raise _client_error('PreconditionFailed', 'GetObject', 'At least one of the pre-conditions you specified did not hold')
+        if IfNoneMatch and IfNoneMatch in (record['etag'], '*'):
+            raise _client_error('304', 'GetObject', 'Not Modified')
+        response = self._response(record)
+        response['Body'] = io.BytesIO(record['body'])
+        return response
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        """객체 메타데이터를 조회합니다."""
+        record = self._read(Bucket, Key, with_body=False)
+        if record is None:
+            raise _client_error('404', 'HeadObject', 'Not Found')
+        return self._response(record)
+
+    def put_object(self, Bucket: str, Key: str, Body: Any = b'', ContentType: str = None, ContentEncoding: str = None,
+                   IfMatch: str = None, IfNoneMatch: str = None, **kwargs) -> Dict[str, Any]:
+        """객체를 저장합니다. IfMatch/IfNoneMatch 조건이 맞지 않으면 PreconditionFailed 오류가 발생합니다."""
+        if isinstance(Body, str):
+            body = Body.encode('utf-8')
+        elif hasattr(Body, 'read'):
+            body = Body.read()
+        else:
+            body = bytes(Body)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+
+        with self._write_transaction(Bucket) as txn:
+            if IfMatch or IfNoneMatch:
+                current = self._read(Bucket, Key, with_body=False, txn=txn)
+                if (IfNoneMatch == '*' and current is not None) or (IfMatch and (current is None or current['etag'] != IfMatch)):
+                    raise _client_error('PreconditionFailed', 'PutObject', 'At least one of the pre-conditions you specified did not hold')
+            self._write(Bucket, Key, {
+                'body': body,
+                'size': len(body),
+                'etag': etag,
+                'content_type': ContentType,
+                'content_encoding': ContentEncoding,
+                'last_modified': time.time()
+            }, txn)
+        return {'ETag': etag}
+
+    def delete_object(self, Bucket: str, Key: str, **kwargs) -> Dict[str, Any]:
+        """객체를 삭제합니다. 없는 객체도 성공으로 처리합니다."""
+        with self._write_transaction(Bucket) as txn:
+            self._delete(Bucket, Key, txn)
+        return {}
+
+    def delete_objects(self, Bucket: str, Delete: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """여러 객체를 삭제합니다."""
+        keys = [item['Key'] for item in Delete.get('Objects', [])]
+        with self._write_transaction(Bucket) as txn:
+            for key in keys:
+                self._delete(Bucket, key, txn)
+        return {'Deleted': [{'Key': key} for key in keys]}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = '', Delimiter: str = None, MaxKeys: int = 1000,
+                        ContinuationToken: str = None, StartAfter: str = None, **kwargs) -> Dict[str, Any]:
+        """객체 목록을 키 순서로 조회합니다. Delimiter를 지정하면 하위 접두사를 CommonPrefixes로 묶습니다."""
+        start = ContinuationToken or StartAfter or ''
+        entries = self._list(Bucket, Prefix or '', Delimiter, start, MaxKeys + 1)
+        truncated = len(entries) > MaxKeys
+        entries = entries[:MaxKeys]
+
+        response = {'Name': Bucket, 'Prefix': Prefix or '', 'MaxKeys': MaxKeys, 'KeyCount': len(entries), 'IsTruncated': truncated}
+        contents = [
+            {'Key': name, 'Size': record['size'], 'ETag': record['etag'], 'LastModified': self._to_datetime(record['last_modified'])}
+            for name, record in entries if record is not None
+        ]
+        common_prefixes = [{'Prefix': name} for name, record in entries if record is None]
+        if contents:
+            response['Contents'] = contents
+        if common_prefixes:
+            response['CommonPrefixes'] = common_prefixes
+        if Delimiter:
+            response['Delimiter'] = Delimiter
+        if truncated:
+            response['NextContinuationToken'] = entries[-1][0]
+        return response
+
+    def get_paginator(self, operation_name: str) -> '_ListObjectsPaginator':
+        """목록 조회 페이지네이터 (list_objects_v2만 지원)"""
+        if operation_name != 'list_objects_v2':
+            raise ValueError(f"로컬 저장소 백엔드는 {operation_name} 페이지네이터를 지원하지 않습니다.")
+        return _ListObjectsPaginator(self)
+
+    def _response(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """get/head_object 응답 메타데이터"""
+        response = {
+            'ETag': record['etag'],
+            'ContentLength': record['size'],
+            'ContentType': record['content_type'] or 'binary/octet-stream',
+            'LastModified': self._to_datetime(record['last_modified'])
+        }
+        if record['content_encoding']:
+            response['ContentEncoding'] = record['content_encoding']
+        return response
+
+    @staticmethod
+    def _to_datetime(timestamp: float) -> datetime:
+        """유닉스 시각을 UTC datetime으로 변환"""
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    @staticmethod
+    def _collapse(keys: Iterator[Tuple[str, Dict[str, Any]]], prefix: str, delimiter: Optional[str],
+                  start: str, limit: int) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """키 순서의 (키, 레코드)를 구분자 기준으로 묶어 목록 항목(공통 접두사는 레코드 None)으로 변환합니다."""
+        entries = []
+        for key, record in keys:
+            name = key
+            if delimiter:
+                index = key.find(delimiter, len(prefix))
+                if index >= 0:
+                    name, record = key[:index + len(delimiter)], None
+            if name <= start or (entries and entries[-1][0] == name):
+                continue
+            entries.append((name, record))
+            if len(entries) >= limit:
+                break
+        return entries
+
+    def _read(self, bucket: str, key: str, with_body: bool, txn: Any = None) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _write(self, bucket: str, key: str, record: Dict[str, Any], txn: Any) -> None:
+        raise NotImplementedError
+
+    def _delete(self, bucket: str, key: str, txn: Any) -> None:
+        raise NotImplementedError
+
+    def _list(self, bucket: str, prefix: str, delimiter: Optional[str], start: str,
+              limit: int) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        raise NotImplementedError
+
+    def _write_transaction(self, bucket: str):
+        raise NotImplementedError
+
+
+class _ListObjectsPaginator:
+    """boto3 list_objects_v2 페이지네이터와 같은 방식으로 페이지를 순회"""
+
+    def __init__(self, store: LocalObjectStore):
+        self._store = store
+
+    def paginate(self, **kwargs) -> Iterator[Dict[str, Any]]:
+        kwargs = dict(kwargs)
+        page_size = (kwargs.pop('PaginationConfig', None) or {}).get('PageSize')
+        if page_size:
+            kwargs['MaxKeys'] = page_size
+        while True:
+            page = self._store.list_objects_v2(**kwargs)
+            yield page
+            if not page.get('IsTruncated'):
+                return
+            kwargs['ContinuationToken'] = page['NextContinuationToken']
+
+
+class FilesystemObjectStore(LocalObjectStore):
+    """
+    객체 키를 경로로 하여 로컬 파일로 저장하는 백엔드
+    ({루트}/objects/{버킷}/{키}, 메타데이터는 {루트}/meta/{버킷}/{키}.json)
+    """
+
+    # 쓰기 중인 임시 파일 접두사 (목록에서 제외)
+    _TMP_PREFIX = '.tmp-'
+
+    def __init__(self, root: str = None):
+        """
+        파일 시스템 백엔드 초기화
+
+        Args:
+            root: 저장소 루트 디렉토리 (기본값: Config에서 가져옴)
+        """
+        self.root = root or Config.STORAGE_LOCAL_PATH
+        os.makedirs(self.root, exist_ok=True)
+        self._lock_path = os.path.join(self.root, '.lock')
+
+    def _object_path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, 'objects', bucket, *key.split('/'))
+
+    def _meta_path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, 'meta', bucket, *key.split('/')) + '.json'
+
+    def _read(self, bucket: str, key: str, with_body: bool, txn: Any = None) -> Optional[Dict[str, Any]]:
+        with (_null_context() if txn else self._file_lock(shared=True)):
+            path = self._object_path(bucket, key)
+            try:
+                stat = os.stat(path)
+                with open(self._meta_path(bucket, key), 'r', encoding='utf-8') as f:
+                    record = json.load(f)
+                if with_body:
+                    with open(path, 'rb') as f:
+                        record['body'] = f.read()
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                return None
+        record.update({'size': stat.st_size, 'last_modified': stat.st_mtime})
+        return record
+
+    def _write(self, bucket: str, key: str, record: Dict[str, Any], txn: Any) -> None:
+        meta = {name: record[name] for name in ('etag', 'content_type', 'content_encoding')}
+        self._atomic_write(self._object_path(bucket, key), record['body'])
+        self._atomic_write(self._meta_path(bucket, key), json.dumps(meta).encode('utf-8'))
+
+    def _delete(self, bucket: str, key: str, txn: Any) -> None:
+        for path, base in ((self._object_path(bucket, key), os.path.join(self.root, 'objects', bucket)),
+                           (self._meta_path(bucket, key), os.path.join(self.root, 'meta', bucket))):
+            try:
+                os.remove(path)
+            except (FileNotFoundError, IsADirectoryError):
+                continue
+            # 비어 있는 상위 디렉토리 정리 (S3처럼 빈 접두사는 목록에 나타나지 않음)
+            directory = os.path.dirname(path)
+            while directory != base and directory.startswith(base):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+                directory = os.path.dirname(directory)
+
+    def _list(self, bucket: str, prefix: str, delimiter: Optional[str], start: str,
+              limit: int) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        bucket_root = os.path.join(self.root, 'objects', bucket)
+        with self._file_lock(shared=True):
+            if delimiter == '/' and (prefix == '' or prefix.endswith('/')):
+                # 디렉토리 한 단계만 조회
+                directory = os.path.join(bucket_root, *prefix.split('/')[:-1])
+                try:
+                    children = sorted(os.scandir(directory), key=lambda entry: entry.name)
+                except (FileNotFoundError, NotADirectoryError):
+                    return []
+                entries = []
+                for child in children:
+                    if child.name.startswith(self._TMP_PREFIX):
+                        continue
+                    name = f"{prefix}{child.name}/" if child.is_dir() else f"{prefix}{child.name}"
+                    if name <= start:
+                        continue
+                    entries.append((name, None if child.is_dir() else self._list_record(bucket, name, child.stat())))
+                entries.sort(key=lambda entry: entry[0])
+                return entries[:limit]
+
+            # 접두사가 속한 디렉토리부터 재귀 조회
+            directory = os.path.join(bucket_root, *_parent_of(prefix).split('/')[:-1])
+            keys = []
+            for dirpath, _, filenames in os.walk(directory):
+                relative = os.path.relpath(dirpath, bucket_root).replace(os.sep, '/')
+                relative = '' if relative == '.' else f"{relative}/"
+                for filename in filenames:
+                    key = f"{relative}{filename}"
+                    if not filename.startswith(self._TMP_PREFIX) and key.startswith(prefix) and key > start:
+                        keys.append(key)
+            keys.sort()
+            return self._collapse(
+                ((key, self._list_record(bucket, key, os.stat(os.path.join(bucket_root, *key.split('/'))))) for key in keys),
+                prefix, delimiter, start, limit
+            )
+
+    def _list_record(self, bucket: str, key: str, stat: os.stat_result) -> Dict[str, Any]:
+        """목록 항목 레코드 (ETag는 메타데이터 파일에서 읽음)"""
+        try:
+            with open(self._meta_path(bucket, key), 'r', encoding='utf-8') as f:
+                etag = json.load(f).get('etag')
+        except FileNotFoundError:
+            etag = None
+        return {'size': stat.st_size, 'etag': etag, 'last_modified': stat.st_mtime}
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰는 중인 파일을 보지 않도록 합니다."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=self._TMP_PREFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @contextmanager
+    def _write_transaction(self, bucket: str) -> Iterator[bool]:
+        with self._file_lock(shared=False):
+            yield True
+
+    @contextmanager
+    def _file_lock(self, shared: bool) -> Iterator[None]:
+        """프로세스 간 잠금 (쓰기는 배타, 읽기는 공유)"""
+        if fcntl is None:
+            yield
+            return
+        with open(self._lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT NOT NULL,
+    content_type TEXT,
+    content_encoding TEXT,
+    last_modified REAL NOT NULL,
+    PRIMARY KEY (bucket, key)
+);
+CREATE INDEX IF NOT EXISTS idx_objects_parent ON objects (bucket, parent, key);
+CREATE TABLE IF NOT EXISTS prefixes (
+    bucket TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    PRIMARY KEY (bucket, parent, prefix)
+);
+"""
+
+
+class SQLiteObjectStore(LocalObjectStore):
+    """
+    SQLite 파일 하나에 객체를 저장하는 백엔드
+    객체 키(기본 키)와 디렉토리별 색인(parent, prefixes)으로 접두사/구분자 목록 조회가 색인 범위 조회로 끝납니다.
+    (예: users/ 아래 사용자 목록, 사용자별 수집 목록, 검사 기록 폴더 목록)
+    """
+
+    def __init__(self, path: str = None):
+        """
+        SQLite 백엔드 초기화
+
+        Args:
+            path: SQLite 파일 경로 (기본값: Config에서 가져옴)
+        """
+        self.path = path or Config.STORAGE_SQLITE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SQLITE_SCHEMA)
+
+    def _read(self, bucket: str, key: str, with_body: bool, txn: Any = None) -> Optional[Dict[str, Any]]:
+        columns = 'size, etag, content_type, content_encoding, last_modified' + (', body' if with_body else '')
+        query = f'SELECT {columns} FROM objects WHERE bucket = ? AND key = ?'
+        if txn is not None:
+            row = txn.execute(query, (bucket, key)).fetchone()
+        else:
+            with self._connect() as conn:
+                row = conn.execute(query, (bucket, key)).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        if with_body:
+            record['body'] = bytes(record['body'])
+        return record
+
+    def _write(self, bucket: str, key: str, record: Dict[str, Any], txn: sqlite3.Connection) -> None:
+        txn.execute(
+            'INSERT OR REPLACE INTO objects (bucket, key, parent, body, size, etag, content_type, content_encoding, last_modified) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (bucket, key, _parent_of(key), sqlite3.Binary(record['body']), record['size'], record['etag'],
+             record['content_type'], record['content_encoding'], record['last_modified'])
+        )
+        txn.executemany(
+            'INSERT OR IGNORE INTO prefixes (bucket, parent, prefix) VALUES (?, ?, ?)',
+            [(bucket, _parent_of(prefix[:-1]), prefix) for prefix in _ancestor_prefixes(key)]
+        )
+
+    def _delete(self, bucket: str, key: str, txn: sqlite3.Connection) -> None:
+        if txn.execute('DELETE FROM objects WHERE bucket = ? AND key = ?', (bucket, key)).rowcount == 0:
+            return
+        # 더 이상 객체가 없는 접두사 정리 (깊은 접두사부터)
+        for prefix in reversed(_ancestor_prefixes(key)):
+            remaining = txn.execute(
+                'SELECT 1 FROM objects WHERE bucket = ? AND key >= ? AND key < ? LIMIT 1',
+                (bucket, prefix, prefix + _PREFIX_UPPER_BOUND)
+            ).fetchone()
+            if remaining:
+                break
+            txn.execute('DELETE FROM prefixes WHERE bucket = ? AND parent = ? AND prefix = ?',
+                        (bucket, _parent_of(prefix[:-1]), prefix))
+
+    def _list(self, bucket: str, prefix: str, delimiter: Optional[str], start: str,
+              limit: int) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        columns = 'key, size, etag, last_modified'
+        with self._connect() as conn:
+            if delimiter == '/' and (prefix == '' or prefix.endswith('/')):
+                # 디렉토리 색인으로 한 단계만 조회
+                objects = conn.execute(
+                    f'SELECT {columns} FROM objects WHERE bucket = ? AND parent = ? AND key > ? ORDER BY key LIMIT ?',
+                    (bucket, prefix, start, limit)
+                ).fetchall()
+                prefixes = conn.execute(
+                    'SELECT prefix FROM prefixes WHERE bucket = ? AND parent = ? AND prefix > ? ORDER BY prefix LIMIT ?',
+                    (bucket, prefix, start, limit)
+                ).fetchall()
+                entries = [(row['key'], dict(row)) for row in objects] + [(row['prefix'], None) for row in prefixes]
+                entries.sort(key=lambda entry: entry[0])
+                return entries[:limit]
+
+            rows = conn.execute(
+                f'SELECT {columns} FROM objects WHERE bucket = ? AND key >= ? AND key < ? AND key > ? ORDER BY key',
+                (bucket, prefix, prefix + _PREFIX_UPPER_BOUND, start)
+            )
+            return self._collapse(((row['key'], dict(row)) for row in rows), prefix, delimiter, start, limit)
+
+    @contextmanager
+    def _write_transaction(self, bucket: str) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            yield conn
+
+    def _connect(self) -> ClosingConnection:
+        """연결을 생성합니다. 작업마다 새 연결을 사용하므로 스레드/프로세스 간에 공유하지 않습니다."""
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return ClosingConnection(conn)
+
+
+@contextmanager
+def _null_context() -> Iterator[None]:
+    yield
+
+
+_local_store = None
+_local_store_lock = threading.Lock()
+
+
+def create_storage_client(region: str = None) -> Any:
+    """
+    설정된 저장소 백엔드의 클라이언트를 반환합니다.
+
+    Args:
+        region: AWS 리전 (S3 백엔드에서만 사용, 기본값: Config에서 가져옴)
+
+    Returns:
+        S3 클라이언트 또는 같은 객체 API를 제공하는 로컬 저장소 (로컬 저장소는 프로세스 전역 객체)
+    """
+    global _local_store
+    backend = (Config.STORAGE_BACKEND or BACKEND_S3).lower()
+    if backend == BACKEND_S3:
+        # 기본 자격 증명 세션의 풀링된 클라이언트 재사용
+        return get_client_pool().get_client('s3', region_name=region or Config.AWS_REGION)
+    if backend not in (BACKEND_FILESYSTEM, BACKEND_SQLITE):
+        raise ValueError(f"지원하지 않는 저장소 백엔드: {backend}")
+
+    if _local_store is None:
+        with _local_store_lock:
+            if _local_store is None:
+                _local_store = FilesystemObjectStore() if backend == BACKEND_FILESYSTEM else SQLiteObjectStore()
+                logger.info(f"로컬 저장소 백엔드 사용: {backend}")
+    return _local_store
@@ -0,0 +1,290 @@
+"""
+저장소 공용 메모리 캐시
+
+S3Storage는 크기 제한 없는 클래스 변수 캐시를, ResourceDataStorage는 생성할 때마다 버려지는 인스턴스 캐시를 쓰고,
+AdvisorHistoryStorage는 캐시가 없습니다. 만료된 항목은 지워지지 않고, 무효화는 모든 키를 문자열 비교로 훑습니다.
+이 모듈은 세 저장소가 함께 쓰는 스레드 안전한 캐시를 제공합니다.
+- 항목 크기(바이트) 합계가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+- 네임스페이스별 TTL
+- 사용자별 키 색인으로 전체 스캔 없이 사용자/키 접두사 단위 무효화
+- 적중/실패/제거 통계
+- ETag를 기억하여 만료된 항목을 조건부 GET으로 재검증 (변경되지 않는 객체는 만료 없음)
+"""
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# 네임스페이스별 TTL(초) (등록되지 않은 네임스페이스는 Config.STORAGE_CACHE_TTL 사용)
+NAMESPACE_TTLS = {
+    'dashboard.collections': 300,
+    'dashboard.metadata': 300,
+    'dashboard.data': 300,
+    'resource.collections': 300,
+    'resource.data': 300,
+    'history.result': 300,
+    'history.manifest': 60,
+    'history.latest_index': 60,
+}
+
+# 캐시 키: 네임스페이스, 사용자 ID, 키 튜플
+CacheKey = Tuple[str, str, Tuple[str, ...]]
+
+
+class StorageCache:
+    """
+    바이트 크기 기준 LRU 제거와 네임스페이스별 TTL을 지원하는 스레드 안전한 캐시
+    """
+
+    def __init__(self, max_bytes: int = None, default_ttl: int = None):
+        """
+        저장소 캐시 초기화
+
+        Args:
+            max_bytes: 캐시 항목 크기 합계 상한(바이트) (기본값: Config에서 가져옴)
+            default_ttl: 등록되지 않은 네임스페이스의 TTL(초) (기본값: Config에서 가져옴)
+        """
+        self.max_bytes = max_bytes or Config.STORAGE_CACHE_MAX_BYTES
+        self.default_ttl = default_ttl or Config.STORAGE_CACHE_TTL
+
+        self._entries: 'OrderedDict[CacheKey, Dict[str, Any]]' = OrderedDict()
+        self._user_keys: Dict[str, set] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'revalidations': 0}
+        self._namespace_stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, namespace: str, user_id: str, key: Union[str, Iterable[str]] = ()) -> Tuple[Any, bool]:
+        """
+        캐시 항목을 조회합니다.
+
+        Args:
+            namespace: 네임스페이스 (예: 'dashboard.data')
+            user_id: 사용자 ID
+            key: 네임스페이스 안의 키 (문자열 또는 문자열 튜플)
+
+        Returns:
+            Tuple[Any, bool]: (값, 적중 여부)
+        """
+        entry = self.get_entry(namespace, user_id, key)
+        if entry is None or not entry['fresh']:
+            return None, False
+        return entry['value'], True
+
+    def get_entry(self, namespace: str, user_id: str, key: Union[str, Iterable[str]] = ()) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목을 ETag와 함께 조회합니다. ETag가 있는 항목은 만료되어도 재검증용으로 반환합니다.
+
+        Args:
+            namespace: 네임스페이스
+            user_id: 사용자 ID
+            key: 네임스페이스 안의 키
+
+        Returns:
+            Optional[Dict[str, Any]]: {'value': 값, 'etag': ETag, 'fresh': 만료 전 여부} 또는 None
+        """
+        cache_key = (namespace, user_id, self._normalize_key(key))
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            fresh = bool(entry) and entry['expires_at'] > time.time()
+            if entry and not fresh and not entry['etag']:
+                # 재검증할 수 없는 만료 항목은 제거
+                self._remove(cache_key)
+                self._stats['expirations'] += 1
+                entry = None
+
+            namespace_stats = self._namespace_stats.setdefault(namespace, {'hits': 0, 'misses': 0})
+            if not fresh:
+                self._stats['misses'] += 1
+                namespace_stats['misses'] += 1
+            else:
+                self._stats['hits'] += 1
+                namespace_stats['hits'] += 1
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(cache_key)
+            return {'value': entry['value'], 'etag': entry['etag'], 'fresh': fresh}
+
+    def refresh(self, namespace: str, user_id: str, key: Union[str, Iterable[str]] = (), ttl: int = None) -> bool:
+        """
+        재검증으로 변경되지 않았음을 확인한 항목의 유지 시간을 연장합니다.
+
+        Args:
+            namespace: 네임스페이스
+            user_id: 사용자 ID
+            key: 네임스페이스 안의 키
+            ttl: 유지 시간(초) (기본값: 네임스페이스 TTL)
+
+        Returns:
+            bool: 항목이 있어서 연장했는지 여부
+        """
+        cache_key = (namespace, user_id, self._normalize_key(key))
+        ttl = ttl if ttl is not None else NAMESPACE_TTLS.get(namespace, self.default_ttl)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return False
+            entry['expires_at'] = time.time() + ttl
+            self._stats['revalidations'] += 1
+            return True
+
+    def set(self, namespace: str, user_id: str, key: Union[str, Iterable[str]], value: Any,
+            size: int = None, ttl: int = None, etag: str = None, immutable: bool = False) -> None:
+        """
+        캐시 항목을 저장합니다. 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+
+        Args:
+            namespace: 네임스페이스
+            user_id: 사용자 ID
+            key: 네임스페이스 안의 키
+            value: 저장할 값
+            size: 값의 크기(바이트) (없으면 추정)
+            ttl: 유지 시간(초) (기본값: 네임스페이스 TTL)
+            etag: 원본 S3 객체의 ETag (있으면 만료 후 재검증에 사용)
+            immutable: 변경되지 않는 객체 여부 (True면 만료 없이 LRU 제거나 무효화 전까지 유지)
+        """
+        cache_key = (namespace, user_id, self._normalize_key(key))
+        size = size if size is not None else estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"캐시 상한보다 큰 항목은 저장하지 않습니다: {namespace} ({size} bytes)")
+            with self._lock:
+                self._remove(cache_key)
+            return
+
+        ttl = ttl if ttl is not None else NAMESPACE_TTLS.get(namespace, self.default_ttl)
+        with self._lock:
+            self._remove(cache_key)
+            expires_at = float('inf') if immutable else time.time() + ttl
+            self._entries[cache_key] = {'value': value, 'size': size, 'expires_at': expires_at, 'etag': etag}
+            self._user_keys.setdefault(user_id, set()).add(cache_key)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes and self._entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, user_id: str, namespaces: Union[str, Iterable[str]] = None,
+                   prefix: Union[str, Iterable[str]] = ()) -> int:
+        """
+        사용자의 캐시 항목을 제거합니다. 사용자별 키 색인만 확인합니다.
+
+        Args:
+            user_id: 사용자 ID
+            namespaces: 제거할 네임스페이스 (없으면 모든 네임스페이스)
+            prefix: 키 접두사 (예: ('collection_id',) 는 해당 수집의 모든 키)
+
+        Returns:
+            int: 제거한 항목 수
+        """
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
+        namespaces = set(namespaces) if namespaces else None
+        prefix = self._normalize_key(prefix)
+
+        with self._lock:
+            targets = [
+                cache_key for cache_key in self._user_keys.get(user_id, ())
+                if (namespaces is None or cache_key[0] in namespaces) and cache_key[2][:len(prefix)] == prefix
+            ]
+            for cache_key in targets:
+                self._remove(cache_key)
+        return len(targets)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 제거합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._user_keys.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 적중/실패/제거/만료 횟수, 항목 수, 사용 중인 크기, 네임스페이스별 적중/실패
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'namespaces': {name: dict(value) for name, value in self._namespace_stats.items()}
+            })
+        return stats
+
+    def _remove(self, cache_key: CacheKey) -> None:
+        """항목과 사용자 색인을 제거합니다. (잠금을 잡은 상태에서 호출)"""
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+        self._bytes -= entry['size']
+        user_keys = self._user_keys.get(cache_key[1])
+        if user_keys is not None:
+            user_keys.discard(cache_key)
+            if not user_keys:
+                del self._user_keys[cache_key[1]]
+
+    @staticmethod
+    def _normalize_key(key: Union[str, Iterable[str], None]) -> Tuple[str, ...]:
+        """키를 문자열 튜플로 변환합니다."""
+        if key is None:
+            return ()
+        if isinstance(key, str):
+            return (key,)
+        return tuple(str(part) for part in key)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    값이 차지하는 메모리 크기를 추정합니다. (중첩된 dict/list 포함)
+
+    Args:
+        value: 크기를 추정할 값
+
+    Returns:
+        int: 추정 크기(바이트)
+    """
+    size = 0
+    stack = [value]
+    seen = set()
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_storage_cache() -> StorageCache:
+    """
+    프로세스 전역 저장소 캐시를 반환합니다.
+
+    Returns:
+        StorageCache: 저장소 캐시 객체
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = StorageCache()
+    return _cache
@@ -1,4 +1,3 @@
-import boto3
 import json
 import uuid
 import hashlib
@@ -7,6 +6,7 @@ import logging
 from datetime import datetime
 from botocore.exceptions import ClientError
 from config import Config
+from app.services.storage_backend import create_storage_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +23,8 @@ class UserStorage:
         self.region = region or Config.AWS_REGION
         self.bucket_name = Config.DATA_BUCKET_NAME
         
-        # S3 클라이언트 생성
-        self.s3_client = boto3.client(
-            's3',
-            region_name=self.region,
-            aws_access_key_id=Config.AWS_ACCESS_KEY,
-            aws_secret_access_key=Config.AWS_SECRET_KEY
-        )
+        # 저장소 클라이언트 생성 (Config.STORAGE_BACKEND에 따라 S3 또는 로컬 저장소)
+        self.s3_client = create_storage_client(self.region)
     
     def _get_users_prefix(self):
         """사용자 정보 저장 경로 접두사"""
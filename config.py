@@ -18,6 +18,68 @@ AWS_REGION = os.environ.get('AWS_REGION') or "ap-northeast-2"
 # S3 버킷 이름
 DATA_BUCKET_NAME = os.environ.get('DATA_BUCKET_NAME') or 'saltware-console-data'
 
+# boto3 클라이언트 풀 설정
+AWS_CLIENT_MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_CLIENT_MAX_POOL_CONNECTIONS') or 50)
+AWS_CLIENT_IDLE_TIMEOUT = int(os.environ.get('AWS_CLIENT_IDLE_TIMEOUT') or 900)  # 15분
+
+# STS 역할 수임 자격 증명 캐시 설정
+STS_ASSUME_ROLE_DURATION = int(os.environ.get('STS_ASSUME_ROLE_DURATION') or 3600)  # 1시간
+STS_REFRESH_WINDOW = int(os.environ.get('STS_REFRESH_WINDOW') or 1200)  # 만료 20분 전 갱신
+
+# 계정별 활성 리전 목록 캐시 유지 시간
+REGION_CACHE_TTL = int(os.environ.get('REGION_CACHE_TTL') or 3600)  # 1시간
+
+# 리전 팬아웃 실행기 동시 실행 제한 (프로세스 전체 / 리전별 / 서비스별)
+REGION_FANOUT_MAX_WORKERS = int(os.environ.get('REGION_FANOUT_MAX_WORKERS') or 32)
+REGION_FANOUT_PER_REGION = int(os.environ.get('REGION_FANOUT_PER_REGION') or 8)
+REGION_FANOUT_PER_SERVICE = int(os.environ.get('REGION_FANOUT_PER_SERVICE') or 16)
+
+# 로컬 메트릭 시계열 저장소 (증분 메트릭 조회용)
+METRIC_STORE_DIR = os.environ.get('METRIC_STORE_DIR') or 'data/metric_store'
+METRIC_STORE_RETENTION_DAYS = int(os.environ.get('METRIC_STORE_RETENTION_DAYS') or 15)
+
+# 서비스 스캔 실행기 설정 (프로세스 전체 동시 검사 수 / 검사별 제한 시간 / 결과 저장 스레드 수)
+SCAN_MAX_CONCURRENT_CHECKS = int(os.environ.get('SCAN_MAX_CONCURRENT_CHECKS') or 8)
+SCAN_CHECK_TIMEOUT = int(os.environ.get('SCAN_CHECK_TIMEOUT') or 300)  # 5분
+SCAN_PERSIST_WORKERS = int(os.environ.get('SCAN_PERSIST_WORKERS') or 4)
+# 제한 시간을 넘기고도 실행 중인 검사를 대신할 예비 검사 스레드 수
+SCAN_MAX_STUCK_CHECKS = int(os.environ.get('SCAN_MAX_STUCK_CHECKS') or 8)
+
+# 비동기 작업 설정 (작업 저장소 경로 / 프로세스당 작업 스레드 수 / 종료된 작업 보관 기간)
+JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH') or 'data/jobs.sqlite3'
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS') or 4)
+JOB_RETENTION_DAYS = int(os.environ.get('JOB_RETENTION_DAYS') or 7)
+
+# S3 수집 데이터/검사 기록 압축 방식 (gzip, zstd, none)
+STORAGE_COMPRESSION = os.environ.get('STORAGE_COMPRESSION') or 'gzip'
+
+# 저장소 공용 메모리 캐시 설정 (항목 크기 합계 상한(바이트) / 기본 유지 시간(초))
+STORAGE_CACHE_MAX_BYTES = int(os.environ.get('STORAGE_CACHE_MAX_BYTES') or 256 * 1024 * 1024)
+STORAGE_CACHE_TTL = int(os.environ.get('STORAGE_CACHE_TTL') or 300)
+
+# 로컬 디스크 캐시 설정 (같은 호스트의 워커 프로세스가 공유, 크기 상한이 0이면 사용 안 함)
+DISK_CACHE_DIR = os.environ.get('DISK_CACHE_DIR') or 'data/blob_cache'
+DISK_CACHE_MAX_BYTES = int(os.environ.get('DISK_CACHE_MAX_BYTES') or 1024 * 1024 * 1024)
+
+# 리소스 수집 설정 (수집 작업 하나에서 동시에 수집하는 서비스 수)
+COLLECTION_MAX_CONCURRENT_SERVICES = int(os.environ.get('COLLECTION_MAX_CONCURRENT_SERVICES') or 4)
+# 리소스 수집 리전 (쉼표로 구분, 'all'이면 계정의 활성 리전 전체, 비우면 기본 리전만)
+COLLECTION_REGIONS = [region.strip() for region in (os.environ.get('COLLECTION_REGIONS') or '').split(',') if region.strip()]
+
+# 멀티 계정 플릿 설정 (실행 저장소 경로 / 프로세스 전체 동시 작업 수 / 계정별 동시 작업 수 / 실행당 최대 계정 수 / Organizations 멤버 역할 이름)
+FLEET_STORE_PATH = os.environ.get('FLEET_STORE_PATH') or 'data/fleet.sqlite3'
+FLEET_MAX_WORKERS = int(os.environ.get('FLEET_MAX_WORKERS') or 16)
+FLEET_PER_ACCOUNT_CONCURRENCY = int(os.environ.get('FLEET_PER_ACCOUNT_CONCURRENCY') or 2)
+FLEET_MAX_ACCOUNTS = int(os.environ.get('FLEET_MAX_ACCOUNTS') or 200)
+FLEET_MEMBER_ROLE_NAME = os.environ.get('FLEET_MEMBER_ROLE_NAME') or 'OrganizationAccountAccessRole'
+# 플릿 검사 전용 동시 검사 수 (대화형 서비스 스캔의 검사 슬롯을 차지하지 않도록 별도 실행기 사용)
+FLEET_SCAN_MAX_CONCURRENT_CHECKS = int(os.environ.get('FLEET_SCAN_MAX_CONCURRENT_CHECKS') or 8)
+
+# 저장소 백엔드 설정 (s3, filesystem, sqlite / 파일 시스템 백엔드 경로 / SQLite 백엔드 파일 경로)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND') or 's3'
+STORAGE_LOCAL_PATH = os.environ.get('STORAGE_LOCAL_PATH') or 'data/storage'
+STORAGE_SQLITE_PATH = os.environ.get('STORAGE_SQLITE_PATH') or 'data/storage.sqlite3'
+
 # Config 클래스 정의
 class Config:
     SECRET_KEY = SECRET_KEY
@@ -25,6 +87,39 @@ class Config:
     AWS_SECRET_KEY = AWS_SECRET_KEY
     AWS_REGION = AWS_REGION
     DATA_BUCKET_NAME = DATA_BUCKET_NAME
+    AWS_CLIENT_MAX_POOL_CONNECTIONS = AWS_CLIENT_MAX_POOL_CONNECTIONS
+    AWS_CLIENT_IDLE_TIMEOUT = AWS_CLIENT_IDLE_TIMEOUT
+    STS_ASSUME_ROLE_DURATION = STS_ASSUME_ROLE_DURATION
+    STS_REFRESH_WINDOW = STS_REFRESH_WINDOW
+    REGION_CACHE_TTL = REGION_CACHE_TTL
+    REGION_FANOUT_MAX_WORKERS = REGION_FANOUT_MAX_WORKERS
+    REGION_FANOUT_PER_REGION = REGION_FANOUT_PER_REGION
+    REGION_FANOUT_PER_SERVICE = REGION_FANOUT_PER_SERVICE
+    METRIC_STORE_DIR = METRIC_STORE_DIR
+    METRIC_STORE_RETENTION_DAYS = METRIC_STORE_RETENTION_DAYS
+    SCAN_MAX_CONCURRENT_CHECKS = SCAN_MAX_CONCURRENT_CHECKS
+    SCAN_CHECK_TIMEOUT = SCAN_CHECK_TIMEOUT
+    SCAN_PERSIST_WORKERS = SCAN_PERSIST_WORKERS
+    SCAN_MAX_STUCK_CHECKS = SCAN_MAX_STUCK_CHECKS
+    JOB_STORE_PATH = JOB_STORE_PATH
+    JOB_WORKERS = JOB_WORKERS
+    JOB_RETENTION_DAYS = JOB_RETENTION_DAYS
+    STORAGE_COMPRESSION = STORAGE_COMPRESSION
+    STORAGE_CACHE_MAX_BYTES = STORAGE_CACHE_MAX_BYTES
+    STORAGE_CACHE_TTL = STORAGE_CACHE_TTL
+    DISK_CACHE_DIR = DISK_CACHE_DIR
+    DISK_CACHE_MAX_BYTES = DISK_CACHE_MAX_BYTES
+    COLLECTION_MAX_CONCURRENT_SERVICES = COLLECTION_MAX_CONCURRENT_SERVICES
+    COLLECTION_REGIONS = COLLECTION_REGIONS
+    FLEET_STORE_PATH = FLEET_STORE_PATH
+    FLEET_MAX_WORKERS = FLEET_MAX_WORKERS
+    FLEET_PER_ACCOUNT_CONCURRENCY = FLEET_PER_ACCOUNT_CONCURRENCY
+    FLEET_MAX_ACCOUNTS = FLEET_MAX_ACCOUNTS
+    FLEET_MEMBER_ROLE_NAME = FLEET_MEMBER_ROLE_NAME
+    FLEET_SCAN_MAX_CONCURRENT_CHECKS = FLEET_SCAN_MAX_CONCURRENT_CHECKS
+    STORAGE_BACKEND = STORAGE_BACKEND
+    STORAGE_LOCAL_PATH = STORAGE_LOCAL_PATH
+    STORAGE_SQLITE_PATH = STORAGE_SQLITE_PATH
     
     # 세션 설정
     SESSION_TYPE = 'filesystem'
@@ -0,0 +1,14 @@
+# gunicorn 설정 파일
+# 실행: gunicorn -c gunicorn.conf.py run:app
+import os
+
+bind = os.environ.get('GUNICORN_BIND') or '0.0.0.0:5000'
+workers = int(os.environ.get('GUNICORN_WORKERS') or 2)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT') or 120)
+
+def post_fork(server, worker):
+    """워커 프로세스마다 작업 스레드 시작 (fork 이전 스레드는 자식 프로세스로 복사되지 않음)"""
+    # 작업 처리 함수가 모두 등록되도록 앱을 먼저 로드
+    import app  # noqa: F401
+    from app.services.job_manager import get_job_manager
+    get_job_manager().start()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+수집 카탈로그 재구성 스크립트
+
+카탈로그 도입 전에 저장된 수집 데이터를 색인합니다.
+사용자를 지정하지 않으면 버킷의 모든 사용자(users/ 아래 접두사)에 대해 실행합니다.
+
+사용 예:
+    python rebuild_collection_catalog.py
+    python rebuild_collection_catalog.py --user alice --user bob
+    python rebuild_collection_catalog.py --skip-services
+"""
+
+import argparse
+import logging
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.s3_storage import S3Storage
+from app.services.resource.common.data_storage import ResourceDataStorage
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+def list_users(s3_storage):
+    """버킷의 사용자 목록 조회"""
+    users = []
+    paginator = s3_storage.s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=s3_storage.bucket_name, Prefix='users/', Delimiter='/'):
+        for common_prefix in page.get('CommonPrefixes', []):
+            users.append(common_prefix['Prefix'].split('/')[-2])
+    return users
+
+def main():
+    parser = argparse.ArgumentParser(description='사용자별 수집 카탈로그를 다시 만듭니다.')
+    parser.add_argument('--user', action='append', help='재구성할 사용자 ID (여러 번 지정 가능, 기본값: 모든 사용자)')
+    parser.add_argument('--skip-services', action='store_true', help='서비스 데이터를 읽지 않고 메타데이터만으로 재구성')
+    args = parser.parse_args()
+
+    s3_storage = S3Storage()
+    resource_storage = ResourceDataStorage()
+    users = args.user or list_users(s3_storage)
+    print(f"카탈로그 재구성 대상 사용자: {len(users)}명")
+
+    failed = []
+    for user_id in users:
+        try:
+            dashboard_collections = s3_storage.rebuild_catalog(user_id, include_services=not args.skip_services)
+            resource_collections = resource_storage.rebuild_catalog(user_id, include_counts=not args.skip_services)
+            print(f"  {user_id}: 대시보드 수집 {len(dashboard_collections)}개, 리소스 수집 {len(resource_collections)}개")
+        except Exception as e:
+            failed.append(user_id)
+            print(f"  {user_id}: 오류 - {str(e)}")
+
+    if failed:
+        print(f"재구성 실패 사용자: {', '.join(failed)}")
+        return 1
+    print("카탈로그 재구성 완료")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,10 @@
+import os
 from app import app
+from app.services.job_manager import get_job_manager
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5002)
\ No newline at end of file
+    # 작업 처리 함수가 모두 등록된 뒤 작업 스레드 시작
+    # 디버그 모드에서는 리로더 부모 프로세스를 제외하고 실제로 요청을 처리하는 자식 프로세스에서만 시작
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        get_job_manager().start()
+    app.run(debug=True, host='0.0.0.0', port=5002)
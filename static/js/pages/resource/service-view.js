@@ -6,12 +6,15 @@
 const ServiceView = (function() {
     // 비공개 변수 및 함수
     let _allSectionsExpanded = true;
+    let _loadedData = {};      // 불러온 서비스 데이터 (서비스 이름 → 데이터)
+    let _pendingLoads = {};    // 불러오는 중인 서비스 (서비스 이름 → Promise)
     
     /**
      * 테이블 필터링 기능 초기화
+     * @param {Element} root - 초기화할 영역
      */
-    function _initTableFilters() {
-        const filterInputs = document.querySelectorAll('.filter-input');
+    function _initTableFilters(root) {
+        const filterInputs = root.querySelectorAll('.filter-input');
         
         filterInputs.forEach(input => {
             input.addEventListener('keyup', function() {
@@ -47,11 +50,10 @@ const ServiceView = (function() {
     
     /**
      * 서비스 섹션 토글 기능 초기화
+     * @param {Element} root - 초기화할 영역
      */
-    function _initSectionToggles() {
-        const sectionHeaders = document.querySelectorAll('.service-section-header');
-        const toggleAllBtn = document.getElementById('toggle-sections-btn');
-        const toggleBtnText = document.getElementById('toggle-btn-text');
+    function _initSectionToggles(root) {
+        const sectionHeaders = root.querySelectorAll('.service-section-header');
         
         // 개별 섹션 토글
         sectionHeaders.forEach(header => {
@@ -69,10 +71,24 @@ const ServiceView = (function() {
                         targetElement.classList.add('show');
                         this.setAttribute('aria-expanded', 'true');
                         toggleIcon.className = 'fas fa-chevron-up';
+                        
+                        // 아직 불러오지 않은 섹션은 펼칠 때 불러옴
+                        const section = this.closest('.lazy-service-section');
+                        if (section) {
+                            _loadSection(section);
+                        }
                     }
                 }
             });
         });
+    }
+    
+    /**
+     * 모든 섹션 토글 버튼 초기화
+     */
+    function _initToggleAll() {
+        const toggleAllBtn = document.getElementById('toggle-sections-btn');
+        const toggleBtnText = document.getElementById('toggle-btn-text');
         
         // 모든 섹션 토글
         if (toggleAllBtn) {
@@ -97,10 +113,11 @@ const ServiceView = (function() {
                     toggleBtnText.textContent = '모두 펼치기';
                     this.querySelector('i').className = 'fas fa-chevron-right';
                 } else {
-                    // 모든 섹션 펼치기
+                    // 모든 섹션 펼치기 (불러오지 않은 섹션도 불러옴)
                     sections.forEach(section => {
                         section.classList.add('show');
                     });
+                    document.querySelectorAll('.lazy-service-section').forEach(_loadSection);
                     
                     headers.forEach(header => {
                         header.setAttribute('aria-expanded', 'true');
@@ -121,9 +138,10 @@ const ServiceView = (function() {
     
     /**
      * 상세 정보 토글 기능 초기화
+     * @param {Element} root - 초기화할 영역
      */
-    function _initDetailToggles() {
-        const detailButtons = document.querySelectorAll('.detail-toggle');
+    function _initDetailToggles(root) {
+        const detailButtons = root.querySelectorAll('.detail-toggle');
         
         detailButtons.forEach(button => {
             button.addEventListener('click', function() {
@@ -146,9 +164,10 @@ const ServiceView = (function() {
     
     /**
      * 리소스 탭 기능 초기화
+     * @param {Element} root - 초기화할 영역
      */
-    function _initResourceTabs() {
-        const resourceTabs = document.querySelectorAll('.resource-tab');
+    function _initResourceTabs(root) {
+        const resourceTabs = root.querySelectorAll('.resource-tab');
         
         resourceTabs.forEach(tab => {
             tab.addEventListener('click', function() {
@@ -175,9 +194,10 @@ const ServiceView = (function() {
     
     /**
      * 테이블 정렬 기능 초기화
+     * @param {Element} root - 초기화할 영역
      */
-    function _initTableSorting() {
-        const sortableHeaders = document.querySelectorAll('th[data-sort]');
+    function _initTableSorting(root) {
+        const sortableHeaders = root.querySelectorAll('th[data-sort]');
         
         sortableHeaders.forEach(header => {
             header.addEventListener('click', function() {
@@ -258,17 +278,93 @@ const ServiceView = (function() {
         });
     }
     
+    /**
+     * 영역 안의 섹션 기능 초기화
+     * @param {Element} root - 초기화할 영역
+     */
+    function _initSections(root) {
+        _initTableFilters(root);
+        _initSectionToggles(root);
+        _initDetailToggles(root);
+        _initResourceTabs(root);
+        _initTableSorting(root);
+    }
+    
+    /**
+     * 불러오지 않은 서비스 섹션을 서버에서 불러와 교체
+     * @param {Element} section - 지연 로딩 섹션
+     * @returns {Promise} 서비스 데이터
+     */
+    function _loadSection(section) {
+        const serviceKey = section.getAttribute('data-service');
+        if (_loadedData[serviceKey] !== undefined) {
+            return Promise.resolve(_loadedData[serviceKey]);
+        }
+        if (_pendingLoads[serviceKey]) {
+            return _pendingLoads[serviceKey];
+        }
+        
+        _pendingLoads[serviceKey] = fetch(section.getAttribute('data-url'), { credentials: 'same-origin' })
+            .then(response => response.json().then(body => {
+                if (!response.ok || body.status !== 'success') {
+                    throw new Error(body.message || '서비스 데이터를 불러오지 못했습니다.');
+                }
+                return body;
+            }))
+            .then(body => {
+                _loadedData[serviceKey] = body.data;
+                
+                // 렌더링된 섹션으로 교체 (표시할 데이터가 없으면 섹션 제거)
+                const container = document.createElement('div');
+                container.innerHTML = body.html;
+                const loadedSection = container.querySelector('.service-section');
+                if (loadedSection) {
+                    section.replaceWith(loadedSection);
+                    _initSections(loadedSection);
+                } else {
+                    section.remove();
+                }
+                return body.data;
+            })
+            .catch(error => {
+                const status = section.querySelector('.lazy-section-status');
+                if (status) {
+                    status.innerHTML = `<i class="fas fa-exclamation-triangle me-2"></i>${error.message}`;
+                }
+                delete _pendingLoads[serviceKey];
+                throw error;
+            });
+        return _pendingLoads[serviceKey];
+    }
+    
     // 공개 API
     return {
         /**
          * 초기화 함수
+         * @param {Object} initialData - 페이지와 함께 전달된 서비스 데이터 (서비스 이름 → 데이터)
+         */
+        init: function(initialData) {
+            _loadedData = Object.assign({}, initialData || {});
+            _initSections(document);
+            _initToggleAll();
+        },
+        
+        /**
+         * 불러오지 않은 서비스 섹션을 모두 불러옴
+         * @returns {Promise<Object>} 전체 서비스 데이터
+         */
+        loadAllSections: function() {
+            const sections = Array.from(document.querySelectorAll('.lazy-service-section'));
+            return Promise.all(sections.map(section => _loadSection(section).catch(() => null)))
+                .then(() => Object.assign({}, _loadedData));
+        },
+        
+        /**
+         * 지금까지 불러온 서비스 데이터
+         * @returns {Object} 서비스 이름 → 데이터
          */
-        init: function() {
-            _initTableFilters();
-            _initSectionToggles();
-            _initDetailToggles();
-            _initResourceTabs();
-            _initTableSorting();
+        getLoadedData: function() {
+            return _loadedData;
         },
         
         /**